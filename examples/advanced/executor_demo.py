@@ -6,6 +6,7 @@ running synchronous handlers without blocking the UI:
 - Running sync handlers in executor
 - Preventing UI blocking with long operations
 - Thread pool configuration
+- Posting state writes from worker threads with state.post()
 
 Run with: python examples/advanced/executor_demo.py
 
@@ -45,12 +46,12 @@ def log_operation(operation, duration):
     duration : float
         Duration in seconds
     """
-    log = app.state.get("operation_log", [])
+    log = list(app.state.get("operation_log", []))
     log.append(f"{operation}: {duration:.2f}s")
 
-    # Keep last 10 operations
-    app.state["operation_log"] = log[-10:]
-    app.state["operation_count"] = len(log)
+    # Handlers run on worker threads, so post the writes to the event loop
+    # (keeping the last 10 operations)
+    app.state.post_many(operation_log=log[-10:], operation_count=len(log))
 
 
 @app.view("main", default=True)
@@ -170,7 +171,7 @@ def handle_quick_task(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Running quick task..."
+    app.state.post("status", "Running quick task...")
     start = time.time()
 
     # Simulate quick operation
@@ -178,7 +179,7 @@ def handle_quick_task(event):
 
     duration = time.time() - start
     log_operation("Quick Task", duration)
-    app.state["status"] = "Quick task complete"
+    app.state.post("status", "Quick task complete")
 
 
 @app.on_action("multi_quick")
@@ -190,7 +191,7 @@ def handle_multi_quick(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Running 5 quick tasks..."
+    app.state.post("status", "Running 5 quick tasks...")
 
     for i in range(5):
         start = time.time()
@@ -198,7 +199,7 @@ def handle_multi_quick(event):
         duration = time.time() - start
         log_operation(f"Quick Task {i+1}/5", duration)
 
-    app.state["status"] = "All quick tasks complete"
+    app.state.post("status", "All quick tasks complete")
 
 
 # Medium Tasks
@@ -211,7 +212,7 @@ def handle_medium_task(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Running medium task..."
+    app.state.post("status", "Running medium task...")
     start = time.time()
 
     # Simulate medium operation
@@ -219,7 +220,7 @@ def handle_medium_task(event):
 
     duration = time.time() - start
     log_operation("Medium Task", duration)
-    app.state["status"] = "Medium task complete"
+    app.state.post("status", "Medium task complete")
 
 
 @app.on_action("multi_medium")
@@ -231,7 +232,7 @@ def handle_multi_medium(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Running 3 medium tasks..."
+    app.state.post("status", "Running 3 medium tasks...")
 
     for i in range(3):
         start = time.time()
@@ -239,7 +240,7 @@ def handle_multi_medium(event):
         duration = time.time() - start
         log_operation(f"Medium Task {i+1}/3", duration)
 
-    app.state["status"] = "All medium tasks complete"
+    app.state.post("status", "All medium tasks complete")
 
 
 # Long Tasks
@@ -252,7 +253,7 @@ def handle_long_task(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Running long task..."
+    app.state.post("status", "Running long task...")
     start = time.time()
 
     # Simulate long operation
@@ -260,7 +261,7 @@ def handle_long_task(event):
 
     duration = time.time() - start
     log_operation("Long Task", duration)
-    app.state["status"] = "Long task complete"
+    app.state.post("status", "Long task complete")
 
 
 @app.on_action("multi_long")
@@ -272,7 +273,7 @@ def handle_multi_long(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Running 2 long tasks..."
+    app.state.post("status", "Running 2 long tasks...")
 
     for i in range(2):
         start = time.time()
@@ -280,7 +281,7 @@ def handle_multi_long(event):
         duration = time.time() - start
         log_operation(f"Long Task {i+1}/2", duration)
 
-    app.state["status"] = "All long tasks complete"
+    app.state.post("status", "All long tasks complete")
 
 
 # Simulated I/O Operations
@@ -293,7 +294,7 @@ def handle_file_io(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Simulating file I/O..."
+    app.state.post("status", "Simulating file I/O...")
     start = time.time()
 
     # Simulate file reading/writing
@@ -301,7 +302,7 @@ def handle_file_io(event):
 
     duration = time.time() - start
     log_operation("File I/O Operation", duration)
-    app.state["status"] = "File I/O complete"
+    app.state.post("status", "File I/O complete")
 
 
 @app.on_action("network_io")
@@ -313,7 +314,7 @@ def handle_network_io(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Simulating network request..."
+    app.state.post("status", "Simulating network request...")
     start = time.time()
 
     # Simulate network request
@@ -321,7 +322,7 @@ def handle_network_io(event):
 
     duration = time.time() - start
     log_operation("Network I/O Operation", duration)
-    app.state["status"] = "Network request complete"
+    app.state.post("status", "Network request complete")
 
 
 @app.on_action("database_io")
@@ -333,7 +334,7 @@ def handle_database_io(event):
     event : ActionEvent
         The action event
     """
-    app.state["status"] = "Simulating database query..."
+    app.state.post("status", "Simulating database query...")
     start = time.time()
 
     # Simulate database query
@@ -341,7 +342,7 @@ def handle_database_io(event):
 
     duration = time.time() - start
     log_operation("Database I/O Operation", duration)
-    app.state["status"] = "Database query complete"
+    app.state.post("status", "Database query complete")
 
 
 @app.on_action("clear_log")
@@ -353,9 +354,9 @@ def handle_clear_log(event):
     event : ActionEvent
         The action event
     """
-    app.state["operation_log"] = []
-    app.state["operation_count"] = 0
-    app.state["status"] = "Log cleared"
+    app.state.post("operation_log", [])
+    app.state.post("operation_count", 0)
+    app.state.post("status", "Log cleared")
 
 
 @app.on_action("quit")
@@ -2,143 +2,324 @@
 
 A declarative TUI framework using Jinja2 templates for building
 terminal user interfaces with familiar web development patterns.
+
+The names re-exported here are resolved lazily (PEP 562): ``import wijjit``
+only loads this module, and each submodule is imported the first time one
+of its names is accessed. This keeps short-lived tools that only need, say,
+``render_inline`` from paying for every element, Rich, Pygments and
+prompt_toolkit at startup.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-# Core components
-from wijjit.config import Config, DefaultConfig
-from wijjit.core.app import Wijjit
-from wijjit.core.events import (
-    ActionEvent,
-    ChangeEvent,
-    Event,
-    EventType,
-    FocusEvent,
-    Handler,
-    HandlerRegistry,
-    HandlerScope,
-    KeyEvent,
-)
-from wijjit.core.focus import FocusManager
-from wijjit.core.renderer import Renderer
-from wijjit.core.state import State
-from wijjit.core.templating import (
-    RenderedView,
-    render_template,
-    render_template_string,
-)
-from wijjit.core.view_router import ViewConfig
+if TYPE_CHECKING:
+    # Core components
+    from wijjit.config import Config, DefaultConfig
+    from wijjit.core.app import Wijjit
+    from wijjit.core.events import (
+        ActionEvent,
+        ChangeEvent,
+        Event,
+        EventType,
+        FocusEvent,
+        Handler,
+        HandlerRegistry,
+        HandlerScope,
+        KeyEvent,
+    )
+    from wijjit.core.focus import FocusManager
+    from wijjit.core.renderer import Renderer
+    from wijjit.core.state import State
+    from wijjit.core.templating import (
+        RenderedView,
+        render_template,
+        render_template_string,
+    )
+    from wijjit.core.view_router import ViewConfig
+
+    # Elements - base
+    from wijjit.elements.base import (
+        Container,
+        Element,
+        ElementType,
+        OverlayElement,
+        ScrollableElement,
+        TextElement,
+    )
+
+    # Elements - display
+    from wijjit.elements.display import (
+        BarChart,
+        ColumnChart,
+        ContentType,
+        ContentView,
+        Gauge,
+        HeatMap,
+        ImageView,
+        LineChart,
+        Link,
+        ListView,
+        LogView,
+        ModalElement,
+        NotificationElement,
+        NotificationSeverity,
+        Page,
+        Pager,
+        ProgressBar,
+        Sparkline,
+        Spinner,
+        StatusBar,
+        StatusIndicator,
+        TabbedPanel,
+        Table,
+        TabPosition,
+        Tree,
+        TreeIndicatorStyle,
+    )
 
-# Elements - base
-from wijjit.elements.base import (
-    Container,
-    Element,
-    ElementType,
-    OverlayElement,
-    ScrollableElement,
-    TextElement,
-)
+    # Elements - input
+    from wijjit.elements.input import (
+        Button,
+        Checkbox,
+        CheckboxGroup,
+        CodeEditor,
+        DataGrid,
+        InputStyle,
+        Radio,
+        RadioGroup,
+        Select,
+        Slider,
+        SyntaxHighlighter,
+        TextArea,
+        TextInput,
+        Toggle,
+    )
 
-# Elements - display
-from wijjit.elements.display import (
-    BarChart,
-    ColumnChart,
-    ContentType,
-    ContentView,
-    Gauge,
-    HeatMap,
-    ImageView,
-    LineChart,
-    Link,
-    ListView,
-    LogView,
-    ModalElement,
-    NotificationElement,
-    NotificationSeverity,
-    Page,
-    Pager,
-    ProgressBar,
-    Sparkline,
-    Spinner,
-    StatusBar,
-    StatusIndicator,
-    TabbedPanel,
-    Table,
-    TabPosition,
-    Tree,
-    TreeIndicatorStyle,
-)
+    # Elements - dialogs (ModalElement subclasses)
+    from wijjit.elements.modal import AlertDialog, ConfirmDialog, TextInputDialog
 
-# Elements - input
-from wijjit.elements.input import (
-    Button,
-    Checkbox,
-    CheckboxGroup,
-    CodeEditor,
-    DataGrid,
-    InputStyle,
-    Radio,
-    RadioGroup,
-    Select,
-    Slider,
-    SyntaxHighlighter,
-    TextArea,
-    TextInput,
-    Toggle,
-)
+    # Autocomplete (headline feature - re-exported for `from wijjit import ...`).
+    # Imported after the element packages: the autocomplete popup depends on the
+    # elements layer, so importing it earlier would trigger a circular import.
+    # ``isort: split`` keeps this import from being re-sorted above the elements.
+    # isort: split
+    from wijjit.autocomplete import (
+        AsyncCompleter,
+        CallbackCompleter,
+        Completer,
+        CompleterConfig,
+        StateCompleter,
+        WordCompleter,
+    )
 
-# Elements - dialogs (ModalElement subclasses)
-from wijjit.elements.modal import AlertDialog, ConfirmDialog, TextInputDialog
+    # Helpers
+    from wijjit.helpers import load_filesystem_tree
 
-# Autocomplete (headline feature - re-exported for `from wijjit import ...`).
-# Imported after the element packages: the autocomplete popup depends on the
-# elements layer, so importing it earlier would trigger a circular import.
-# ``isort: split`` keeps this import from being re-sorted above the elements.
-# isort: split
-from wijjit.autocomplete import (
-    AsyncCompleter,
-    CallbackCompleter,
-    Completer,
-    CompleterConfig,
-    StateCompleter,
-    WordCompleter,
-)
+    # Inline rendering
+    from wijjit.inline import InlineApp, render_inline
 
-# Helpers
-from wijjit.helpers import load_filesystem_tree
+    # Layout components
+    from wijjit.layout.bounds import Bounds, Size, parse_size
+    from wijjit.layout.frames import BorderStyle, Frame, FrameStyle
 
-# Inline rendering
-from wijjit.inline import InlineApp, render_inline
+    # Terminal utilities
+    from wijjit.terminal.ansi import (
+        ANSIColor,
+        ANSICursor,
+        ANSIScreen,
+        ANSIStyle,
+        clip_to_width,
+        colorize,
+        strip_ansi,
+        visible_length,
+    )
+    from wijjit.terminal.input import InputHandler, Key, Keys, KeyType
+    from wijjit.terminal.screen import ScreenManager, alternate_screen
 
-# Layout components
-from wijjit.layout.bounds import Bounds, Size, parse_size
-from wijjit.layout.frames import BorderStyle, Frame, FrameStyle
+    # Testing utilities (build an app from a bare template for tests/devtools)
+    from wijjit.testing.app_builder import app_from_template
 
-# Terminal utilities
-from wijjit.terminal.ansi import (
-    ANSIColor,
-    ANSICursor,
-    ANSIScreen,
-    ANSIStyle,
-    clip_to_width,
-    colorize,
-    strip_ansi,
-    visible_length,
-)
-from wijjit.terminal.input import InputHandler, Key, Keys, KeyType
-from wijjit.terminal.screen import ScreenManager, alternate_screen
+    Modal = ModalElement
+    Notification = NotificationElement
 
-# Testing utilities (build an app from a bare template for tests/devtools)
-from wijjit.testing.app_builder import app_from_template
+# Map of re-exported name -> module that defines it. Resolved on first
+# attribute access by ``__getattr__`` below and then cached in the module
+# globals, so subsequent lookups cost nothing.
+_LAZY_IMPORTS: dict[str, str] = {
+    # wijjit.config
+    "Config": "wijjit.config",
+    "DefaultConfig": "wijjit.config",
+    # wijjit.core.app
+    "Wijjit": "wijjit.core.app",
+    # wijjit.core.events
+    "ActionEvent": "wijjit.core.events",
+    "ChangeEvent": "wijjit.core.events",
+    "Event": "wijjit.core.events",
+    "EventType": "wijjit.core.events",
+    "FocusEvent": "wijjit.core.events",
+    "Handler": "wijjit.core.events",
+    "HandlerRegistry": "wijjit.core.events",
+    "HandlerScope": "wijjit.core.events",
+    "KeyEvent": "wijjit.core.events",
+    # wijjit.core.focus
+    "FocusManager": "wijjit.core.focus",
+    # wijjit.core.renderer
+    "Renderer": "wijjit.core.renderer",
+    # wijjit.core.state
+    "State": "wijjit.core.state",
+    # wijjit.core.templating
+    "RenderedView": "wijjit.core.templating",
+    "render_template": "wijjit.core.templating",
+    "render_template_string": "wijjit.core.templating",
+    # wijjit.core.view_router
+    "ViewConfig": "wijjit.core.view_router",
+    # wijjit.elements.base
+    "Container": "wijjit.elements.base",
+    "Element": "wijjit.elements.base",
+    "ElementType": "wijjit.elements.base",
+    "OverlayElement": "wijjit.elements.base",
+    "ScrollableElement": "wijjit.elements.base",
+    "TextElement": "wijjit.elements.base",
+    # wijjit.elements.display
+    "BarChart": "wijjit.elements.display",
+    "ColumnChart": "wijjit.elements.display",
+    "ContentType": "wijjit.elements.display",
+    "ContentView": "wijjit.elements.display",
+    "Gauge": "wijjit.elements.display",
+    "HeatMap": "wijjit.elements.display",
+    "ImageView": "wijjit.elements.display",
+    "LineChart": "wijjit.elements.display",
+    "Link": "wijjit.elements.display",
+    "ListView": "wijjit.elements.display",
+    "LogView": "wijjit.elements.display",
+    "ModalElement": "wijjit.elements.display",
+    "NotificationElement": "wijjit.elements.display",
+    "NotificationSeverity": "wijjit.elements.display",
+    "Page": "wijjit.elements.display",
+    "Pager": "wijjit.elements.display",
+    "ProgressBar": "wijjit.elements.display",
+    "Sparkline": "wijjit.elements.display",
+    "Spinner": "wijjit.elements.display",
+    "StatusBar": "wijjit.elements.display",
+    "StatusIndicator": "wijjit.elements.display",
+    "TabbedPanel": "wijjit.elements.display",
+    "Table": "wijjit.elements.display",
+    "TabPosition": "wijjit.elements.display",
+    "Tree": "wijjit.elements.display",
+    "TreeIndicatorStyle": "wijjit.elements.display",
+    # wijjit.elements.input
+    "Button": "wijjit.elements.input",
+    "Checkbox": "wijjit.elements.input",
+    "CheckboxGroup": "wijjit.elements.input",
+    "CodeEditor": "wijjit.elements.input",
+    "DataGrid": "wijjit.elements.input",
+    "InputStyle": "wijjit.elements.input",
+    "Radio": "wijjit.elements.input",
+    "RadioGroup": "wijjit.elements.input",
+    "Select": "wijjit.elements.input",
+    "Slider": "wijjit.elements.input",
+    "SyntaxHighlighter": "wijjit.elements.input",
+    "TextArea": "wijjit.elements.input",
+    "TextInput": "wijjit.elements.input",
+    "Toggle": "wijjit.elements.input",
+    # wijjit.elements.modal
+    "AlertDialog": "wijjit.elements.modal",
+    "ConfirmDialog": "wijjit.elements.modal",
+    "TextInputDialog": "wijjit.elements.modal",
+    # wijjit.autocomplete
+    "AsyncCompleter": "wijjit.autocomplete",
+    "CallbackCompleter": "wijjit.autocomplete",
+    "Completer": "wijjit.autocomplete",
+    "CompleterConfig": "wijjit.autocomplete",
+    "StateCompleter": "wijjit.autocomplete",
+    "WordCompleter": "wijjit.autocomplete",
+    # wijjit.helpers
+    "load_filesystem_tree": "wijjit.helpers",
+    # wijjit.inline
+    "InlineApp": "wijjit.inline",
+    "render_inline": "wijjit.inline",
+    # wijjit.layout.bounds
+    "Bounds": "wijjit.layout.bounds",
+    "Size": "wijjit.layout.bounds",
+    "parse_size": "wijjit.layout.bounds",
+    # wijjit.layout.frames
+    "BorderStyle": "wijjit.layout.frames",
+    "Frame": "wijjit.layout.frames",
+    "FrameStyle": "wijjit.layout.frames",
+    # wijjit.terminal.ansi
+    "ANSIColor": "wijjit.terminal.ansi",
+    "ANSICursor": "wijjit.terminal.ansi",
+    "ANSIScreen": "wijjit.terminal.ansi",
+    "ANSIStyle": "wijjit.terminal.ansi",
+    "clip_to_width": "wijjit.terminal.ansi",
+    "colorize": "wijjit.terminal.ansi",
+    "strip_ansi": "wijjit.terminal.ansi",
+    "visible_length": "wijjit.terminal.ansi",
+    # wijjit.terminal.input
+    "InputHandler": "wijjit.terminal.input",
+    "Key": "wijjit.terminal.input",
+    "Keys": "wijjit.terminal.input",
+    "KeyType": "wijjit.terminal.input",
+    # wijjit.terminal.screen
+    "ScreenManager": "wijjit.terminal.screen",
+    "alternate_screen": "wijjit.terminal.screen",
+    # wijjit.testing.app_builder
+    "app_from_template": "wijjit.testing.app_builder",
+}
 
 # Friendly aliases for the documented element names. The classes are
 # internally suffixed ``Element`` (ModalElement / NotificationElement) but the
 # docs, template tags, and registry refer to them as ``Modal`` / ``Notification``.
 # Both names point at the same class; the ``*Element`` names remain for
 # backward compatibility.
-Modal = ModalElement
-Notification = NotificationElement
+_LAZY_ALIASES: dict[str, str] = {
+    "Modal": "ModalElement",
+    "Notification": "NotificationElement",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute being looked up on the ``wijjit`` package
+
+    Returns
+    -------
+    Any
+        The object the name refers to
+
+    Raises
+    ------
+    AttributeError
+        If the name is not part of the lazily exported API
+    """
+    target = _LAZY_ALIASES.get(name, name)
+    module_name = _LAZY_IMPORTS.get(target)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), target)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including not-yet-imported exports.
+
+    Returns
+    -------
+    list of str
+        Sorted attribute names
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_ALIASES))
+
 
 __all__ = [
     # Version
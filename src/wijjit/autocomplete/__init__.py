@@ -18,6 +18,8 @@ AsyncCompleter
     Completer that calls an async function.
 StateCompleter
     Completer that reads word list from app.state.
+CompletionIndex
+    Incrementally updated prefix/substring/fuzzy index over a word list.
 AutocompleteState
     Tracks autocomplete popup state.
 
@@ -79,6 +81,7 @@ from wijjit.autocomplete.completer import (
     StateCompleter,
     WordCompleter,
 )
+from wijjit.autocomplete.index import CompletionIndex
 from wijjit.autocomplete.mixin import AutocompleteMixin
 from wijjit.autocomplete.popup import AutocompletePopup
 from wijjit.autocomplete.resolver import resolve_autocomplete
@@ -94,6 +97,8 @@ __all__ = [
     "CallbackCompleter",
     "AsyncCompleter",
     "StateCompleter",
+    # Search index used by WordCompleter and StateCompleter
+    "CompletionIndex",
     # Mixin for input elements
     "AutocompleteMixin",
     # Popup element
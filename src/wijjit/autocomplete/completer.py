@@ -21,11 +21,14 @@ StateCompleter
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from wijjit.autocomplete.index import CompletionIndex
 from wijjit.autocomplete.utils import filter_suggestions
 
 if TYPE_CHECKING:
@@ -53,12 +56,22 @@ class CompleterConfig:
     match_anywhere : bool
         If True, matches substring anywhere in word instead of just prefix.
         Default: False
+    fuzzy : bool
+        If True, matches words containing the typed characters in order,
+        with gaps, and ranks the best matches first. Takes precedence over
+        match_anywhere. Only used by WordCompleter and StateCompleter.
+        Default: False
     max_suggestions : int
         Maximum number of suggestions to display. Default: 10
     select_on_tab : bool
         Whether Tab key selects current suggestion. Default: True
     close_on_blur : bool
         Whether to close popup when input loses focus. Default: True
+    debounce : float
+        Seconds to wait after the last keystroke before an AsyncCompleter
+        is queried; typing again within the interval restarts the wait, so
+        a burst of keystrokes sends a single query. Cached results are
+        shown without waiting. Default: 0.0
     """
 
     trigger: str = "manual"
@@ -66,9 +79,11 @@ class CompleterConfig:
     trigger_key: str = "ctrl+/"
     case_sensitive: bool = False
     match_anywhere: bool = False
+    fuzzy: bool = False
     max_suggestions: int = 10
     select_on_tab: bool = True
     close_on_blur: bool = True
+    debounce: float = 0.0
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -82,6 +97,60 @@ class CompleterConfig:
             raise ValueError(
                 f"max_suggestions must be >= 1, got {self.max_suggestions}"
             )
+        if self.debounce < 0:
+            raise ValueError(f"debounce must be >= 0, got {self.debounce}")
+
+
+def _sync_index(
+    index: CompletionIndex | None, words: list[str], config: CompleterConfig
+) -> CompletionIndex:
+    """Return an index over ``words`` matching the config's case sensitivity.
+
+    Parameters
+    ----------
+    index : CompletionIndex or None
+        Previously built index, if any.
+    words : list of str
+        Current word list.
+    config : CompleterConfig
+        Completer configuration.
+
+    Returns
+    -------
+    CompletionIndex
+        ``index`` updated in place, or a new index.
+    """
+    if index is None or index.case_sensitive != config.case_sensitive:
+        return CompletionIndex(words, case_sensitive=config.case_sensitive)
+    index.sync(words)
+    return index
+
+
+def _search_index(
+    index: CompletionIndex, prefix: str, config: CompleterConfig
+) -> list[str]:
+    """Query an index with the config's matching options.
+
+    Parameters
+    ----------
+    index : CompletionIndex
+        Index to query.
+    prefix : str
+        The word/text to complete.
+    config : CompleterConfig
+        Completer configuration.
+
+    Returns
+    -------
+    list of str
+        Matching words, up to max_suggestions.
+    """
+    return index.search(
+        prefix,
+        match_anywhere=config.match_anywhere,
+        fuzzy=config.fuzzy,
+        limit=config.max_suggestions,
+    )
 
 
 class Completer(ABC):
@@ -185,11 +254,18 @@ class WordCompleter(Completer):
     >>> completer = WordCompleter(["Apple", "Apricot"], case_sensitive=False)
     >>> completer.get_suggestions("AP")
     ['Apple', 'Apricot']
+
+    Notes
+    -----
+    Suggestions come from a :class:`~wijjit.autocomplete.index.CompletionIndex`
+    built on the first query, so large word lists are not rescanned on every
+    keystroke. Words appended to ``words`` are indexed incrementally.
     """
 
     def __init__(self, words: list[str], **config_kwargs: Any) -> None:
         super().__init__(**config_kwargs)
         self.words = words
+        self._index: CompletionIndex | None = None
 
     def get_suggestions(
         self, prefix: str, context: dict[str, Any] | None = None
@@ -208,13 +284,10 @@ class WordCompleter(Completer):
         list of str
             Matching words, up to max_suggestions.
         """
-        return filter_suggestions(
-            self.words,
-            prefix,
-            case_sensitive=self.config.case_sensitive,
-            match_anywhere=self.config.match_anywhere,
-            max_suggestions=self.config.max_suggestions,
-        )
+        if not prefix:
+            return []
+        self._index = _sync_index(self._index, self.words, self.config)
+        return _search_index(self._index, prefix, self.config)
 
 
 class CallbackCompleter(Completer):
@@ -274,6 +347,14 @@ class CallbackCompleter(Completer):
         return results[: self.config.max_suggestions]
 
 
+@dataclass
+class _PendingQuery:
+    """A callback query shared by every caller asking for the same prefix."""
+
+    task: asyncio.Task[list[str]]
+    waiters: int = field(default=0)
+
+
 class AsyncCompleter(Completer):
     """Completer that calls an async function.
 
@@ -282,6 +363,16 @@ class AsyncCompleter(Completer):
     callback : async callable
         Async function to call for suggestions.
         Signature: async callback(prefix: str, context: dict | None) -> list[str]
+    cache_size : int, optional
+        Number of prefixes whose results are kept in an LRU cache. Unless
+        case_sensitive is set, prefixes differing only in case share an
+        entry. 0 (the default) disables caching.
+    monotonic : bool, optional
+        Declares that the callback returns every match for a prefix, so the
+        results for a longer prefix are a subset of those for a shorter one.
+        Cached results for a shorter prefix are then filtered locally, using
+        case_sensitive and match_anywhere, instead of calling the callback
+        again. Only used when cache_size > 0. Default: False
     **config_kwargs : Any
         Configuration options passed to CompleterConfig.
 
@@ -289,6 +380,10 @@ class AsyncCompleter(Completer):
     ----------
     callback : async callable
         The async callback function.
+    cache_size : int
+        Maximum number of cached prefixes.
+    monotonic : bool
+        Whether cached results may be narrowed for longer prefixes.
 
     Examples
     --------
@@ -300,19 +395,35 @@ class AsyncCompleter(Completer):
     ...     return ["alice", "bob"]
     >>> completer = AsyncCompleter(fetch_users)
 
+    Query once per pause in typing and reuse results while the word grows:
+
+    >>> completer = AsyncCompleter(
+    ...     fetch_users, cache_size=128, monotonic=True, debounce=0.15
+    ... )
+
     Notes
     -----
     The sync get_suggestions() method raises RuntimeError because
     AsyncCompleter requires an async context.
+
+    Concurrent requests for the same prefix share one callback call, which
+    is cancelled once every caller waiting on it has been cancelled. Caching
+    and sharing only apply to calls without a context.
     """
 
     def __init__(
         self,
         callback: Callable[[str, dict[str, Any] | None], Awaitable[list[str]]],
+        cache_size: int = 0,
+        monotonic: bool = False,
         **config_kwargs: Any,
     ) -> None:
         super().__init__(**config_kwargs)
         self.callback = callback
+        self.cache_size = cache_size
+        self.monotonic = monotonic
+        self._cache: OrderedDict[str, list[str]] = OrderedDict()
+        self._pending: dict[str, _PendingQuery] = {}
 
     def get_suggestions(
         self, prefix: str, context: dict[str, Any] | None = None
@@ -336,6 +447,73 @@ class AsyncCompleter(Completer):
             "Use get_suggestions_async() instead."
         )
 
+    def cached_suggestions(self, prefix: str) -> list[str] | None:
+        """Return suggestions for a prefix without calling the callback.
+
+        Parameters
+        ----------
+        prefix : str
+            The word/text to complete.
+
+        Returns
+        -------
+        list of str or None
+            Cached (or, for monotonic completers, narrowed) suggestions up
+            to max_suggestions, or None if the callback must be queried.
+        """
+        results = self._lookup(prefix)
+        if results is None:
+            return None
+        return results[: self.config.max_suggestions]
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
+    def _cache_key(self, prefix: str) -> str:
+        """Return the cache key for a prefix under the case setting."""
+        return prefix if self.config.case_sensitive else prefix.lower()
+
+    def _lookup(self, prefix: str) -> list[str] | None:
+        """Find full cached results for a prefix."""
+        if self.cache_size <= 0:
+            return None
+        key = self._cache_key(prefix)
+        results = self._cache.get(key)
+        if results is not None:
+            self._cache.move_to_end(key)
+            return results
+        if not self.monotonic:
+            return None
+        for length in range(len(key) - 1, 0, -1):
+            broader = self._cache.get(key[:length])
+            if broader is not None:
+                results = filter_suggestions(
+                    broader,
+                    prefix,
+                    case_sensitive=self.config.case_sensitive,
+                    match_anywhere=self.config.match_anywhere,
+                )
+                self._store(prefix, results)
+                return results
+        return None
+
+    def _store(self, prefix: str, results: list[str]) -> None:
+        """Cache the full results for a prefix."""
+        if self.cache_size <= 0:
+            return
+        key = self._cache_key(prefix)
+        self._cache[key] = results
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _query(self, prefix: str) -> list[str]:
+        """Call the callback and cache its results."""
+        results = list(await self.callback(prefix, None))
+        self._store(prefix, results)
+        return results
+
     async def get_suggestions_async(
         self, prefix: str, context: dict[str, Any] | None = None
     ) -> list[str]:
@@ -353,7 +531,30 @@ class AsyncCompleter(Completer):
         list of str
             Suggestions from async callback, up to max_suggestions.
         """
-        results = await self.callback(prefix, context)
+        if context is not None:
+            results = await self.callback(prefix, context)
+            return results[: self.config.max_suggestions]
+
+        cached = self.cached_suggestions(prefix)
+        if cached is not None:
+            return cached
+
+        key = self._cache_key(prefix)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingQuery(asyncio.ensure_future(self._query(prefix)))
+            self._pending[key] = pending
+        pending.waiters += 1
+        try:
+            # Shielded so one caller being cancelled does not cancel the
+            # query for the others
+            results = await asyncio.shield(pending.task)
+        finally:
+            pending.waiters -= 1
+            if pending.task.done() or pending.waiters == 0:
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+                pending.task.cancel()
         return results[: self.config.max_suggestions]
 
 
@@ -389,6 +590,10 @@ class StateCompleter(Completer):
     -----
     The bind_app() method must be called before using the completer.
     This is typically done automatically by the framework during wiring.
+
+    The word list is indexed on first use. When the state value changes, the
+    index is updated incrementally if the new list extends the old one and
+    rebuilt otherwise.
     """
 
     def __init__(self, state_key: str, **config_kwargs: Any) -> None:
@@ -400,6 +605,7 @@ class StateCompleter(Completer):
         super().__init__(**config_kwargs)
         self.state_key = state_key
         self._app: Wijjit | None = None
+        self._index: CompletionIndex | None = None
 
     def bind_app(self, app: Wijjit) -> None:
         """Bind to app instance.
@@ -445,13 +651,8 @@ class StateCompleter(Completer):
 
         # Get word list from state
         words = getattr(self._app.state, self.state_key, None)
-        if not words or not isinstance(words, list):
+        if not words or not isinstance(words, list) or not prefix:
             return []
 
-        return filter_suggestions(
-            words,
-            prefix,
-            case_sensitive=self.config.case_sensitive,
-            match_anywhere=self.config.match_anywhere,
-            max_suggestions=self.config.max_suggestions,
-        )
+        self._index = _sync_index(self._index, words, self.config)
+        return _search_index(self._index, prefix, self.config)
@@ -0,0 +1,366 @@
+"""Search index for large completion word lists.
+
+This module provides :class:`CompletionIndex`, which answers prefix,
+substring and fuzzy queries without rescanning and re-lowercasing the whole
+word list on every keystroke.
+
+Classes
+-------
+CompletionIndex
+    Incrementally updated index over a word list.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from typing import Any
+
+# Separates words in the search buffer; never part of a query
+_SEPARATOR = "\n"
+
+# Sorts after every character, so prefix + _MAX_CHAR bounds all words with it
+_MAX_CHAR = "\U0010ffff"
+
+
+class CompletionIndex:
+    """Incrementally updated index over a word list.
+
+    Prefix queries bisect a sorted array of the (lower-cased, unless case
+    sensitive) words. Substring and fuzzy queries search one buffer holding
+    every word, using ``str.find`` and a compiled regular expression, so the
+    per-word work happens in C rather than in a Python loop. Prefix and
+    substring results keep the order of the word list; fuzzy results are
+    ranked.
+
+    Both structures are built on first use. :meth:`sync` brings the index up
+    to date with a (possibly changed) word list, appending new trailing words
+    instead of rebuilding.
+
+    Parameters
+    ----------
+    words : iterable of str, optional
+        Initial words. Non-string items are ignored.
+    case_sensitive : bool, optional
+        Whether matching is case-sensitive (default: False).
+
+    Attributes
+    ----------
+    case_sensitive : bool
+        Whether matching is case-sensitive.
+
+    Examples
+    --------
+    >>> index = CompletionIndex(["web-01.prod", "db-01.prod", "web-02.dev"])
+    >>> index.prefix("web")
+    ['web-01.prod', 'web-02.dev']
+    >>> index.substring("prod")
+    ['web-01.prod', 'db-01.prod']
+    >>> index.fuzzy("wdev")
+    ['web-02.dev']
+    """
+
+    def __init__(self, words: Iterable[Any] = (), case_sensitive: bool = False) -> None:
+        self.case_sensitive = case_sensitive
+        self._source: list[Any] = []
+        self._words: list[str] = []
+        self._keys: list[str] = []
+        # Offset of each key in the search buffer
+        self._starts: list[int] = []
+        self._buffer_end = 1
+        self._buffer: str | None = None
+        self._sorted_keys: list[str] | None = None
+        self._sorted_ids: list[int] | None = None
+        self.extend(words)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def sync(self, words: Iterable[Any]) -> None:
+        """Bring the index up to date with ``words``.
+
+        Words appended after the indexed ones are added incrementally; any
+        other change rebuilds the index.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The current word list.
+        """
+        current = words if isinstance(words, list) else list(words)
+        indexed = len(self._source)
+        if len(current) >= indexed and current[:indexed] == self._source:
+            if len(current) > indexed:
+                self.extend(current[indexed:])
+            return
+        self.rebuild(current)
+
+    def rebuild(self, words: Iterable[Any]) -> None:
+        """Replace the indexed words.
+
+        Parameters
+        ----------
+        words : iterable of str
+            New word list.
+        """
+        self._source = []
+        self._words = []
+        self._keys = []
+        self._starts = []
+        self._buffer_end = 1
+        self._buffer = None
+        self._sorted_keys = None
+        self._sorted_ids = None
+        self.extend(words)
+
+    def extend(self, words: Iterable[Any]) -> None:
+        """Add words to the end of the index.
+
+        Parameters
+        ----------
+        words : iterable of str
+            Words to add. Non-string items are ignored.
+        """
+        added = list(words)
+        if not added:
+            return
+        self._source.extend(added)
+
+        first_new = len(self._keys)
+        for word in added:
+            if not isinstance(word, str):
+                continue
+            key = word if self.case_sensitive else word.lower()
+            key = key.replace(_SEPARATOR, " ")
+            self._words.append(word)
+            self._keys.append(key)
+            self._starts.append(self._buffer_end)
+            self._buffer_end += len(key) + 1
+        self._buffer = None
+
+        sorted_keys, sorted_ids = self._sorted_keys, self._sorted_ids
+        new_ids = range(first_new, len(self._keys))
+        if sorted_keys is None or sorted_ids is None:
+            return
+        if len(new_ids) > 64:
+            # Cheaper to re-sort than to insert one by one
+            self._sorted_keys = self._sorted_ids = None
+            return
+        for word_id in new_ids:
+            key = self._keys[word_id]
+            position = bisect_right(sorted_keys, key)
+            sorted_keys.insert(position, key)
+            sorted_ids.insert(position, word_id)
+
+    def search(
+        self,
+        query: str,
+        match_anywhere: bool = False,
+        fuzzy: bool = False,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Run a prefix, substring or fuzzy query.
+
+        Parameters
+        ----------
+        query : str
+            Text to match.
+        match_anywhere : bool, optional
+            Match the query anywhere in a word (default: False).
+        fuzzy : bool, optional
+            Match the query's characters in order with gaps, ranked by match
+            quality (default: False). Takes precedence over match_anywhere.
+        limit : int or None, optional
+            Maximum number of results. None means no limit.
+
+        Returns
+        -------
+        list of str
+            Matching words.
+        """
+        if fuzzy:
+            return self.fuzzy(query, limit)
+        if match_anywhere:
+            return self.substring(query, limit)
+        return self.prefix(query, limit)
+
+    def _normalize(self, query: str) -> str:
+        """Normalize a query the way keys are normalized."""
+        return query if self.case_sensitive else query.lower()
+
+    def prefix(self, query: str, limit: int | None = None) -> list[str]:
+        """Return words starting with ``query``, in word list order.
+
+        Parameters
+        ----------
+        query : str
+            Prefix to match.
+        limit : int or None, optional
+            Maximum number of results. None means no limit.
+
+        Returns
+        -------
+        list of str
+            Matching words.
+        """
+        if not query:
+            return []
+        sorted_ids, low, _, high = self._prefix_range(self._normalize(query))
+        ids = sorted(sorted_ids[low:high])
+        if limit is not None:
+            ids = ids[:limit]
+        return [self._words[i] for i in ids]
+
+    def _prefix_range(self, key: str) -> tuple[list[int], int, int, int]:
+        """Locate the words whose key starts with ``key``.
+
+        Returns the word ids in key order together with the slice bounds
+        ``low``, ``exact_end`` and ``high``: ids in ``[low, exact_end)`` are
+        exact matches and ids in ``[low, high)`` start with ``key``.
+        """
+        if self._sorted_keys is None or self._sorted_ids is None:
+            order = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+            self._sorted_keys = [self._keys[i] for i in order]
+            self._sorted_ids = order
+        sorted_keys = self._sorted_keys
+        low = bisect_left(sorted_keys, key)
+        high = bisect_left(sorted_keys, key + _MAX_CHAR, low)
+        exact_end = bisect_right(sorted_keys, key, low, high)
+        return self._sorted_ids, low, exact_end, high
+
+    def _search_buffer(self) -> str:
+        """Return the buffer of separator-delimited keys."""
+        if self._buffer is None:
+            self._buffer = _SEPARATOR + _SEPARATOR.join(self._keys) + _SEPARATOR
+        return self._buffer
+
+    def _word_at(self, offset: int) -> int:
+        """Return the id of the word covering a buffer offset."""
+        return bisect_right(self._starts, offset) - 1
+
+    def substring(self, query: str, limit: int | None = None) -> list[str]:
+        """Return words containing ``query``, in word list order.
+
+        Parameters
+        ----------
+        query : str
+            Text to find.
+        limit : int or None, optional
+            Maximum number of results. None means no limit.
+
+        Returns
+        -------
+        list of str
+            Matching words.
+        """
+        if not query or _SEPARATOR in query:
+            return []
+        key = self._normalize(query)
+        buffer = self._search_buffer()
+        results: list[str] = []
+        position = buffer.find(key)
+        while position != -1 and (limit is None or len(results) < limit):
+            word_id = self._word_at(position)
+            results.append(self._words[word_id])
+            # Continue with the next word
+            next_start = self._starts[word_id] + len(self._keys[word_id]) + 1
+            position = buffer.find(key, next_start)
+        return results
+
+    def fuzzy(self, query: str, limit: int | None = None) -> list[str]:
+        """Return words containing the characters of ``query`` in order.
+
+        Results are ranked in three tiers: words starting with the query
+        (exact matches first), then other words containing it, then words
+        containing its characters with gaps. The last tier is ordered by
+        fewest characters skipped, an earlier match and a shorter word. Ties
+        keep word list order. A tier is only searched when the tiers before
+        it return fewer than ``limit`` words.
+
+        Parameters
+        ----------
+        query : str
+            Characters to match.
+        limit : int or None, optional
+            Maximum number of results. None means no limit.
+
+        Returns
+        -------
+        list of str
+            Matching words, best first.
+
+        Examples
+        --------
+        >>> index = CompletionIndex(["data_grid", "grid_view", "datagrid"])
+        >>> index.fuzzy("grid")
+        ['grid_view', 'data_grid', 'datagrid']
+        >>> index.fuzzy("dgrid")
+        ['datagrid', 'data_grid']
+        """
+        if not query or _SEPARATOR in query:
+            return []
+        key = self._normalize(query)
+
+        # Exact matches sort first among the words starting with the key
+        sorted_ids, low, exact_end, high = self._prefix_range(key)
+        ids = sorted(sorted_ids[low:exact_end])
+        if limit is None or len(ids) < limit:
+            ids.extend(sorted(sorted_ids[exact_end:high]))
+        if limit is not None and len(ids) >= limit:
+            return [self._words[i] for i in ids[:limit]]
+
+        found = set(ids)
+        buffer = self._search_buffer()
+        position = buffer.find(key)
+        while position != -1 and (limit is None or len(ids) < limit):
+            word_id = self._word_at(position)
+            if word_id not in found:
+                ids.append(word_id)
+                found.add(word_id)
+            next_start = self._starts[word_id] + len(self._keys[word_id]) + 1
+            position = buffer.find(key, next_start)
+        if limit is not None and len(ids) >= limit:
+            return [self._words[i] for i in ids]
+
+        # Each gap skips to the next occurrence of the following character
+        # without backtracking, and the rest of the word is consumed so
+        # every word matches at most once
+        pattern = re.compile(
+            "("
+            + re.escape(key[0])
+            + "".join(
+                f"[^{_SEPARATOR}{re.escape(char)}]*+{re.escape(char)}"
+                for char in key[1:]
+            )
+            + f")[^{_SEPARATOR}]*"
+        )
+        starts = self._starts
+        leading = key[-2::-1]
+        gapped: list[tuple[int, int, int, int]] = []
+        for match in pattern.finditer(buffer):
+            start, end = match.span(1)
+            word_id = bisect_right(starts, start) - 1
+            if word_id in found:
+                continue
+            # Shrink the match to the shortest window ending where it ends
+            window = end - 1
+            for char in leading:
+                window = buffer.rfind(char, start, window)
+            word_start = starts[word_id]
+            gapped.append(
+                (
+                    end - window - len(key),
+                    start - word_start,
+                    match.end() - word_start,
+                    word_id,
+                )
+            )
+
+        if limit is not None:
+            gapped = heapq.nsmallest(limit - len(ids), gapped)
+        else:
+            gapped.sort()
+        ids.extend(entry[-1] for entry in gapped)
+        return [self._words[i] for i in ids]
@@ -16,14 +16,13 @@ import shutil
 from typing import TYPE_CHECKING
 
 from wijjit.autocomplete.completer import AsyncCompleter, Completer
-from wijjit.autocomplete.popup import AutocompletePopup
 from wijjit.autocomplete.state import AutocompleteState
 from wijjit.autocomplete.utils import get_word_at_cursor, replace_word_at_cursor
-from wijjit.core.overlay import LayerType
 from wijjit.logging_config import get_logger
 from wijjit.terminal.input import Key, Keys
 
 if TYPE_CHECKING:
+    from wijjit.autocomplete.popup import AutocompletePopup
     from wijjit.core.overlay import Overlay, OverlayManager
     from wijjit.layout.bounds import Bounds
 
@@ -277,11 +276,17 @@ class AutocompleteMixin:
         # Get suggestions (handle async case)
         if isinstance(self.completer, AsyncCompleter):
             # Cancel any prior in-flight fetch so a slow earlier request cannot
-            # overwrite the results of this newer keystroke, then schedule and
-            # retain a strong reference to the new task.
+            # overwrite the results of this newer keystroke. Cached results are
+            # shown at once; otherwise schedule and retain a strong reference
+            # to the new task.
             prior = self._suggestion_task
             if prior is not None and not prior.done():
                 prior.cancel()
+            self._suggestion_task = None
+            cached = self.completer.cached_suggestions(prefix)
+            if cached is not None:
+                self._show_suggestions(cached)
+                return
             try:
                 loop = asyncio.get_running_loop()
             except RuntimeError:
@@ -309,11 +314,17 @@ class AutocompleteMixin:
 
         Notes
         -----
+        Waits for the completer's debounce interval first; a newer keystroke
+        cancels this task during the wait, so only the last prefix of a burst
+        of typing is queried.
+
         Errors are caught and logged to prevent unhandled task exceptions.
         The autocomplete popup is closed on error to avoid stale state.
         """
         if not self.completer:
             return
+        if self.completer.config.debounce > 0:
+            await asyncio.sleep(self.completer.config.debounce)
         try:
             suggestions = await self.completer.get_suggestions_async(prefix)
             # Verify prefix hasn't changed while we were fetching
@@ -350,6 +361,11 @@ class AutocompleteMixin:
             # Popup references state directly, just sync scroll manager
             self._autocomplete_popup.sync_from_state()
         else:
+            # Imported here: the popup is an element and the overlay module
+            # imports elements, and elements import this mixin
+            from wijjit.autocomplete.popup import AutocompletePopup
+            from wijjit.core.overlay import LayerType
+
             # Create popup with reference to state
             self._autocomplete_popup = AutocompletePopup(state)
             # Wire mouse-click selection back to the input so clicking a
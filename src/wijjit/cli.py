@@ -7,6 +7,7 @@ Wijjit apps::
     wijjit validate examples/login.py        # lint a full example app
     wijjit tree app.wij --json               # dump the VNode "DOM" tree
     wijjit render examples/spinner.py --tick 5   # headless render
+    wijjit precompile templates/ --cache-dir .cache/wijjit   # warm bytecode
     wijjit run -k login tests/               # pass through to pytest
 
 ``validate`` and ``tree`` auto-detect their input: a ``.py`` file is loaded as a
@@ -18,6 +19,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -83,6 +85,40 @@ def _cmd_render(args: argparse.Namespace) -> int:
     return run_render(args.file, args.size, args.keys, args.tick, args.ansi)
 
 
+def _cmd_precompile(args: argparse.Namespace) -> int:
+    from wijjit.core.renderer import BYTECODE_CACHE_ENV, TEMPLATE_SUFFIXES, Renderer
+
+    cache_dir = args.cache_dir or os.environ.get(BYTECODE_CACHE_ENV)
+    if not cache_dir:
+        print(
+            f"No cache directory: pass --cache-dir or set {BYTECODE_CACHE_ENV}.",
+            file=sys.stderr,
+        )
+        return 2
+    if not args.template_dir.is_dir():
+        print(f"Not a directory: {args.template_dir}", file=sys.stderr)
+        return 2
+
+    renderer = Renderer(
+        template_dir=str(args.template_dir), bytecode_cache_dir=cache_dir
+    )
+    suffixes = tuple(args.ext) if args.ext else TEMPLATE_SUFFIXES
+    results = renderer.precompile_templates(None if args.all else suffixes)
+
+    failed = 0
+    for name, error in results:
+        if error is None:
+            if args.verbose:
+                print(f"compiled {name}")
+        else:
+            failed += 1
+            print(f"FAILED {name}: {type(error).__name__}: {error}", file=sys.stderr)
+    print(
+        f"Precompiled {len(results) - failed} of {len(results)} templates into {cache_dir}"
+    )
+    return 1 if failed else 0
+
+
 def _run_pytest(pytest_args: list[str]) -> int:
     """Forward ``pytest_args`` to pytest, or explain if pytest is missing."""
     try:
@@ -166,6 +202,30 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     pr.set_defaults(func=_cmd_render)
 
+    pc = sub.add_parser(
+        "precompile",
+        help="Compile file templates into the on-disk bytecode cache.",
+    )
+    pc.add_argument("template_dir", type=Path, help="Template directory to compile.")
+    pc.add_argument(
+        "--cache-dir",
+        help="Bytecode cache directory (default: $WIJJIT_TEMPLATE_BYTECODE_CACHE_DIR).",
+    )
+    pc.add_argument(
+        "--ext",
+        action="append",
+        metavar="SUFFIX",
+        help="Template file suffix to compile; repeatable "
+        "(default: .tui .wij .jinja .jinja2 .j2).",
+    )
+    pc.add_argument(
+        "--all", action="store_true", help="Compile every file, regardless of suffix."
+    )
+    pc.add_argument(
+        "-v", "--verbose", action="store_true", help="List each compiled template."
+    )
+    pc.set_defaults(func=_cmd_precompile)
+
     prun = sub.add_parser("run", help="Pass through to pytest (needs the dev extra).")
     prun.add_argument(
         "pytest_args",
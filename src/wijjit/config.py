@@ -391,6 +391,12 @@ class DefaultConfig:
     #: Minimum time between renders in milliseconds (throttling)
     RENDER_THROTTLE_MS = 0
 
+    #: Number of recently visited views whose element trees are kept alive
+    #: after navigating away, so going back reuses their elements (scroll
+    #: positions, cursors and selections included). 0 disables retention;
+    #: individual views opt out with ``@app.view(..., keep_alive=False)``.
+    VIEW_CACHE_SIZE = 4
+
     # ============================================================
     # NOTIFICATIONS
     # ============================================================
@@ -469,6 +475,15 @@ class DefaultConfig:
     #: development). Wired into the Jinja2 environment's ``auto_reload``.
     TEMPLATE_AUTO_RELOAD = False
 
+    #: Directory for the on-disk Jinja2 bytecode cache. Compiled templates
+    #: are reused across processes, so short-lived apps skip recompiling
+    #: them; warm it at deploy time with ``wijjit precompile``. ``None``
+    #: disables the disk cache.
+    TEMPLATE_BYTECODE_CACHE_DIR = None
+
+    #: Maximum number of compiled inline (string) templates kept in memory
+    STRING_TEMPLATE_CACHE_SIZE = 128
+
     # ============================================================
     # HTML CONTENT
     # ============================================================
@@ -289,6 +289,11 @@ class Wijjit:
         self.renderer = Renderer(
             template_dir=self.config["TEMPLATE_DIR"],
             auto_reload=bool(self.config.get("TEMPLATE_AUTO_RELOAD", False)),
+            view_cache_size=int(self.config.get("VIEW_CACHE_SIZE", 4)),
+            bytecode_cache_dir=self.config.get("TEMPLATE_BYTECODE_CACHE_DIR"),
+            string_template_cache_size=int(
+                self.config.get("STRING_TEMPLATE_CACHE_SIZE", 128)
+            ),
         )
 
         # Set global focus color override from config
@@ -654,6 +659,9 @@ class Wijjit:
         default: bool = False,
         on_enter: Callable[..., Any] | None = None,
         on_exit: Callable[..., Any] | None = None,
+        keep_alive: bool = True,
+        memoize: bool = False,
+        background: bool = False,
     ) -> Callable:
         """Decorator to register a view (delegates to ViewRouter).
 
@@ -684,6 +692,21 @@ class Wijjit:
         on_exit : callable, optional
             Hook called when navigating away from this view (sync or async).
             Takes precedence over an ``on_exit`` key in a legacy dict return.
+        keep_alive : bool
+            Keep this view's element tree alive after navigating away, so
+            returning to it reuses the elements and their scroll, cursor and
+            selection state (default: True). Retained views are bounded by the
+            ``VIEW_CACHE_SIZE`` config key.
+        memoize : bool
+            Call the view function only when its navigation params or one of
+            the ``state`` keys it read has changed, or after
+            :meth:`invalidate_view`, and reuse its last result otherwise
+            (default: False). For views that query databases or compute
+            aggregates.
+        background : bool
+            Memoize, and when the result goes stale re-evaluate the view on a
+            worker thread (the ``RUN_SYNC_IN_EXECUTOR`` pool if configured)
+            while frames keep rendering the last result (default: False).
 
         Returns
         -------
@@ -705,7 +728,13 @@ class Wijjit:
         ...     return render_template("dashboard.tui", stats=get_stats())
         """
         return self.view_router.view_decorator(
-            name, default, on_enter=on_enter, on_exit=on_exit
+            name,
+            default,
+            on_enter=on_enter,
+            on_exit=on_exit,
+            keep_alive=keep_alive,
+            memoize=memoize,
+            background=background,
         )
 
     def _initialize_view(self, view_config: ViewConfig) -> None:
@@ -740,6 +769,25 @@ class Wijjit:
         """
         self.view_router.navigate(view_name, params)
 
+    def invalidate_view(self, view_name: str | None = None) -> None:
+        """Discard memoized view results and re-render.
+
+        Memoized views only track their navigation params and the ``state``
+        keys they read; call this when other data they depend on changes.
+
+        Parameters
+        ----------
+        view_name : str, optional
+            View to invalidate; every view when omitted
+
+        Raises
+        ------
+        ValueError
+            If view_name doesn't exist
+        """
+        self.view_router.invalidate(view_name)
+        self.needs_render = True
+
     def on(
         self,
         event_type: EventType,
@@ -962,10 +1010,7 @@ class Wijjit:
             ``False`` otherwise (unknown id, not yet rendered, or the element
             is not focusable).
         """
-        element = self.get_element_by_id(element_id)
-        if element is None:
-            return False
-        return self.focus_manager.focus_element(element)
+        return self.focus_manager.focus_by_id(element_id)
 
     def bind_focus_key(
         self, key: str, element_id: str, priority: int = 0
@@ -1295,7 +1340,8 @@ class Wijjit:
         like ``{% frame %}`` *or* leaf elements like ``{% textinput %}``)
         must be routed through ``render_with_layout`` so the render context
         and implicit-root-frame wrapping are available. Plain Jinja2 (no
-        Wijjit tags) can still use ``render_string`` directly.
+        Wijjit tags) can still use ``render_string`` directly. The answer
+        comes from the renderer's cached per-template analysis.
 
         Parameters
         ----------
@@ -1307,10 +1353,7 @@ class Wijjit:
         bool
             ``True`` if the template references any Wijjit extension tag.
         """
-        for name in self.renderer.get_extension_tag_names():
-            if f"{{% {name}" in template or f"{{%- {name}" in template:
-                return True
-        return False
+        return self.renderer.analyze_template(template).uses_layout
 
     def _update_focus_manager(self, elements: list[Any]) -> None:
         """Update focus manager with positioned elements.
@@ -119,6 +119,9 @@ class EventLoop:
         """
         logger.info("Starting Wijjit application (async mode)")
 
+        # Writes posted to state from worker threads are applied on this loop
+        self.app.state.bind_loop(asyncio.get_running_loop())
+
         # Find default view if current_view not set
         if self.app.current_view is None:
             for name, view in self.app.views.items():
@@ -275,6 +278,8 @@ class EventLoop:
             # Close input handler to exit raw mode
             self.app.input_handler.close()
             logger.debug("Closed input handler")
+            # Later posts are applied immediately
+            self.app.state.bind_loop(None)
             # Shutdown executor if configured
             if self.executor:
                 logger.debug("Shutting down executor")
@@ -332,6 +337,9 @@ class EventLoop:
         # Track frame start time for FPS calculation
         frame_start = time.time()
 
+        # Apply state writes posted from other threads since the last frame
+        self.app.state.flush_posts()
+
         # Check if auto-refresh is needed (for animations like spinners or notification expiry)
         if self.app.refresh_interval is not None:
             current_time = time.time()
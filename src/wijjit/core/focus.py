@@ -64,6 +64,14 @@ class FocusManager:
         Index of currently focused element
     all_focusable : list
         All focusable elements including those with tab_index=-1
+
+    Notes
+    -----
+    The reconciler keeps element instances alive across renders, so
+    :meth:`set_elements` compares the new focusable elements and their
+    tab indices with the previous call and only re-sorts when an element
+    was mounted, unmounted or re-indexed. Element and id lookups go through
+    maps rebuilt together with the order.
     """
 
     def __init__(self) -> None:
@@ -71,6 +79,14 @@ class FocusManager:
         self.all_focusable: list[Element] = []
         self.current_index: int | None = None
         self.dirty_manager: DirtyRegionManager | None = None
+        # Tab indices of all_focusable at the last sort
+        self._tab_indices: tuple[int | None, ...] = ()
+        # id(element) -> position in self.elements
+        self._positions: dict[int, int] = {}
+        # element.id -> position in self.elements (first occurrence wins)
+        self._ids: dict[str, int] = {}
+        # The list the maps were built for; ``elements`` may be reassigned
+        self._indexed: list[Element] = self.elements
 
     def set_elements(self, elements: list[Element]) -> None:
         """Set the list of focusable elements.
@@ -86,6 +102,20 @@ class FocusManager:
         elements : list
             List of focusable elements
         """
+        # Filter to focusable elements
+        focusable = [elem for elem in elements if elem.focusable]
+        tab_indices = tuple(getattr(elem, "tab_index", None) for elem in focusable)
+
+        # Same mounted elements with the same tab indices: the order and the
+        # focused element are unchanged
+        previous = self.all_focusable
+        if (
+            tab_indices == self._tab_indices
+            and len(focusable) == len(previous)
+            and all(new is old for new, old in zip(focusable, previous, strict=True))
+        ):
+            return
+
         # Remember which element was focused (by ID if available)
         focused_id = None
         old_index = self.current_index
@@ -96,11 +126,9 @@ class FocusManager:
             if hasattr(old_elem, "id") and old_elem.id:
                 focused_id = old_elem.id
 
-        # Filter to focusable elements
-        focusable = [elem for elem in elements if elem.focusable]
-
         # Store all focusable elements (for click/programmatic focus)
         self.all_focusable = focusable
+        self._tab_indices = tab_indices
 
         # Sort by tab_index and filter out tab_index=-1 for Tab navigation
         indexed = list(enumerate(focusable))
@@ -111,15 +139,14 @@ class FocusManager:
             ti = getattr(elem, "tab_index", None)
             return ti is None or ti >= 0
 
-        self.elements = [elem for _, elem in indexed if _keep(elem)]
+        self._set_order([elem for _, elem in indexed if _keep(elem)])
 
-        # Try to restore focus
+        # Try to restore focus on the element with the same ID
         if focused_id:
-            # Try to find element with same ID
-            for i, elem in enumerate(self.elements):
-                if hasattr(elem, "id") and elem.id == focused_id:
-                    self._set_focus(i)
-                    return
+            index = self._ids.get(focused_id)
+            if index is not None:
+                self._set_focus(index)
+                return
 
         # If we had a focused index, try to focus the same index
         if old_index is not None and old_index < len(self.elements):
@@ -131,6 +158,41 @@ class FocusManager:
             # it was focused before bounds were calculated/rendered.
             self.current_index = None
 
+    def _set_order(self, elements: list[Element]) -> None:
+        """Replace the tab order and rebuild the lookup maps.
+
+        Parameters
+        ----------
+        elements : list
+            Focusable elements in tab order
+        """
+        self.elements = elements
+        self._indexed = elements
+        self._positions = {id(elem): i for i, elem in enumerate(elements)}
+        ids: dict[str, int] = {}
+        for i, elem in enumerate(elements):
+            elem_id = getattr(elem, "id", None)
+            if elem_id:
+                ids.setdefault(elem_id, i)
+        self._ids = ids
+
+    def index_of(self, element: Element) -> int | None:
+        """Return the tab-order position of an element.
+
+        Parameters
+        ----------
+        element : Element
+            Element to look up
+
+        Returns
+        -------
+        int or None
+            Position in :attr:`elements`, or None if it is not in the order
+        """
+        if self.elements is not self._indexed:
+            self._set_order(self.elements)
+        return self._positions.get(id(element))
+
     def get_focused_element(self) -> Element | None:
         """Get the currently focused element.
 
@@ -214,12 +276,32 @@ class FocusManager:
         bool
             True if element was focused, False if not found
         """
-        try:
-            index = self.elements.index(element)
-            self._set_focus(index)
-            return True
-        except ValueError:
+        index = self.index_of(element)
+        if index is None:
+            return False
+        self._set_focus(index)
+        return True
+
+    def focus_by_id(self, element_id: str) -> bool:
+        """Focus the element in the tab order with the given ``id``.
+
+        Parameters
+        ----------
+        element_id : str
+            ``id`` of the element to focus
+
+        Returns
+        -------
+        bool
+            True if element was focused, False if not found
+        """
+        if self.elements is not self._indexed:
+            self._set_order(self.elements)
+        index = self._ids.get(element_id)
+        if index is None:
             return False
+        self._set_focus(index)
+        return True
 
     def _set_focus(self, index: int) -> None:
         """Set focus to element at index.
@@ -309,8 +391,9 @@ class FocusManager:
         ):
             self.elements[self.current_index].on_blur()
 
-        self.elements = []
+        self._set_order([])
         self.all_focusable = []
+        self._tab_indices = ()
         self.current_index = None
 
     def set_focus_filter(self, allowed_elements: list[Element] | None) -> None:
@@ -340,7 +423,10 @@ class FocusManager:
         old_focused = self.get_focused_element()
 
         # Filter to only allowed elements
-        self.elements = [elem for elem in allowed_elements if elem.focusable]
+        self._set_order([elem for elem in allowed_elements if elem.focusable])
+        # The next set_elements() call must rebuild the full order
+        self.all_focusable = []
+        self._tab_indices = ()
 
         # Try to restore focus if the old element is still in the list
         if old_focused and old_focused in self.elements:
@@ -388,7 +474,9 @@ class FocusManager:
             self.elements[self.current_index].on_blur()
 
         # Restore elements and index
-        self.elements = elements
+        self._set_order(elements)
+        self.all_focusable = []
+        self._tab_indices = ()
         self.current_index = index
 
         # Focus the restored element
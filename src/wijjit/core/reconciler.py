@@ -204,7 +204,13 @@ class Reconciler:
             children_diffs = [self._diff(None, child) for child in new.children]
             return DiffResult(DiffType.REPLACE, old, new, {}, children_diffs)
 
-        # Case 5: Same type - diff props and children
+        # Case 5: Identical subtree (e.g. a frozen inactive tab) - nothing
+        # changed, but children are still walked to keep their elements
+        if old is new:
+            children_diffs = [self._diff(child, child) for child in old.children]
+            return DiffResult(DiffType.NONE, old, new, {}, children_diffs)
+
+        # Case 6: Same type - diff props and children
         prop_changes = self._diff_props(old.props, new.props)
         children_diffs = self._diff_children(old.children, new.children)
 
@@ -550,9 +556,14 @@ class Reconciler:
         """
         for prop_name, (_old_val, new_val) in changes.items():
             if hasattr(element, prop_name):
+                # Assigning a layout or wiring attribute invalidates the
+                # element's cached layout constraints or callback wiring
+                # (see Element.layout_attrs and Element.wiring_attrs)
                 setattr(element, prop_name, new_val)
             elif hasattr(element, "apply_props"):
                 element.apply_props({prop_name: new_val})
+                element.invalidate_layout()
+                element.invalidate_wiring()
 
     def _patch_children(
         self,
@@ -619,6 +630,35 @@ class Reconciler:
 
         self._element_cache.clear()
 
+    def detach_cache(self) -> dict[str, Element]:
+        """Take the element cache out of the reconciler without unmounting.
+
+        The reconciler starts over with an empty cache. The returned elements
+        stay mounted, so :meth:`attach_cache` can later put them back with
+        their ephemeral state (scroll offsets, cursors, selections) intact.
+
+        Returns
+        -------
+        dict[str, Element]
+            The detached element cache, keyed by VNode key
+        """
+        cache = self._element_cache
+        self._element_cache = {}
+        return cache
+
+    def attach_cache(self, cache: dict[str, Element]) -> None:
+        """Replace the element cache with one from :meth:`detach_cache`.
+
+        Elements in the current cache are unmounted first.
+
+        Parameters
+        ----------
+        cache : dict[str, Element]
+            Element cache to reuse for the next reconcile pass
+        """
+        self.clear_cache()
+        self._element_cache = cache
+
     def get_cached_element(self, key: str) -> Element | None:
         """Get an element from the cache by key.
 
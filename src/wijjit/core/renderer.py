@@ -4,16 +4,18 @@ This module provides a renderer that processes Jinja2 templates with
 custom extensions and filters for terminal UI rendering.
 """
 
+import hashlib
 import os
 import shutil
+from collections import OrderedDict
 from collections.abc import Callable
 from copy import copy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from jinja2 import (
     BaseLoader,
     DictLoader,
-    Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     Template,
     TemplateNotFound,
@@ -28,7 +30,13 @@ if TYPE_CHECKING:
 from wijjit.core.element_registry import ElementRegistry
 from wijjit.core.reconciler import Reconciler
 from wijjit.core.render_context import render_context_scope
-from wijjit.core.vdom import VNode
+from wijjit.core.template_analysis import (
+    StaticSubtreeExtension,
+    TemplateAnalysis,
+    WijjitEnvironment,
+    analyze_template,
+)
+from wijjit.core.vdom import VNode, retain_deferred_children
 from wijjit.elements.base import Element
 from wijjit.layout.engine import (
     Container,
@@ -110,6 +118,26 @@ from wijjit.terminal.screen_buffer import DiffRenderer, ScreenBuffer
 # Get logger for this module
 logger = get_logger(__name__)
 
+#: Environment variable naming the on-disk template bytecode cache directory,
+#: used when a Renderer is created without an explicit ``bytecode_cache_dir``
+BYTECODE_CACHE_ENV = "WIJJIT_TEMPLATE_BYTECODE_CACHE_DIR"
+
+#: File suffixes compiled by :meth:`Renderer.precompile_templates` by default
+TEMPLATE_SUFFIXES = (".tui", ".wij", ".jinja", ".jinja2", ".j2")
+
+
+def _unmount_elements(cache: dict[str, Element]) -> None:
+    """Call ``on_unmount`` on every element of a detached element cache.
+
+    Parameters
+    ----------
+    cache : dict[str, Element]
+        Element cache taken from the reconciler
+    """
+    for element in cache.values():
+        if hasattr(element, "on_unmount"):
+            element.on_unmount()
+
 
 class Renderer:
     """Template renderer using Jinja2.
@@ -120,20 +148,44 @@ class Renderer:
     Parameters
     ----------
     template_dir : str, optional
-        Directory containing template files
+        Directory containing template files. It is resolved to an absolute
+        path, so bytecode cache entries match across spellings of it.
     autoescape : bool, optional
         Whether to enable autoescaping (default: False for terminal output)
     auto_reload : bool, optional
         Whether Jinja2 reloads file templates when they change on disk
         (default: False). Useful during development; maps to the
         ``TEMPLATE_AUTO_RELOAD`` config key.
+    view_cache_size : int, optional
+        Number of views whose element trees are kept alive after navigating
+        away, so returning to them reuses the existing elements (default: 4).
+        0 disables retention. Maps to the ``VIEW_CACHE_SIZE`` config key. The
+        limit counts views, not memory: a retained view holds its whole
+        element tree, however large.
+    bytecode_cache_dir : str, optional
+        Directory for Jinja2's on-disk bytecode cache, shared across processes
+        so templates are compiled once rather than on every start. Defaults to
+        the ``WIJJIT_TEMPLATE_BYTECODE_CACHE_DIR`` environment variable; no
+        disk cache is used when neither is set. Maps to the
+        ``TEMPLATE_BYTECODE_CACHE_DIR`` config key.
+    string_template_cache_size : int, optional
+        Maximum number of compiled inline string templates kept in memory;
+        the least recently used one is dropped beyond it (default: 128).
+        Maps to the ``STRING_TEMPLATE_CACHE_SIZE`` config key. The same
+        limit applies to the cache of template analyses.
+    static_subtree_cache_size : int, optional
+        Maximum number of static tag subtrees whose frozen VNodes are kept
+        for reuse (default: 256). 0 rebuilds them on every render. See
+        :mod:`wijjit.core.template_analysis`.
 
     Attributes
     ----------
-    env : jinja2.Environment
+    env : WijjitEnvironment
         The Jinja2 environment
-    _string_templates : dict
-        Cache of string templates
+    _string_templates : OrderedDict
+        LRU cache of compiled string templates
+    _template_analyses : OrderedDict
+        LRU cache of template analyses, keyed by source
     """
 
     def __init__(
@@ -141,6 +193,10 @@ class Renderer:
         template_dir: str | None = None,
         autoescape: bool = False,
         auto_reload: bool = False,
+        view_cache_size: int = 4,
+        bytecode_cache_dir: str | None = None,
+        string_template_cache_size: int = 128,
+        static_subtree_cache_size: int = 256,
     ) -> None:
         # Store template_dir for introspection
         self.template_dir = template_dir
@@ -155,7 +211,10 @@ class Renderer:
                     f"Please create the directory or use inline template strings instead. "
                     f"To use inline templates, don't pass template_dir to Wijjit()."
                 )
-            loader = FileSystemLoader(template_dir)
+            # Jinja's bytecode cache keys on the loader's filenames, so an
+            # absolute search path lets `wijjit precompile` entries be found
+            # however the app spells the directory.
+            loader = FileSystemLoader(os.path.abspath(template_dir))
             self.using_file_loader = True
             logger.info(f"Using FileSystemLoader for templates from: {template_dir}")
         else:
@@ -165,7 +224,7 @@ class Renderer:
             logger.debug("Using DictLoader for inline string templates")
 
         # Create Jinja2 environment with custom extensions
-        self.env = Environment(
+        self.env = WijjitEnvironment(
             loader=loader,
             autoescape=autoescape,
             auto_reload=auto_reload,
@@ -228,11 +287,34 @@ class Renderer:
                 DataGridExtension,
                 # Status indicator
                 StatusIndicatorExtension,
+                # Reuse of static tag subtrees
+                StaticSubtreeExtension,
             ],
         )
 
-        # Cache for string templates
-        self._string_templates: dict[str, Template] = {}
+        # On-disk bytecode cache. Cache files are namespaced by the Wijjit
+        # version and extension set, since compiled templates call into the
+        # tag extensions by name.
+        if bytecode_cache_dir is None:
+            bytecode_cache_dir = os.environ.get(BYTECODE_CACHE_ENV) or None
+        self.bytecode_cache_dir = bytecode_cache_dir
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            self.env.bytecode_cache = FileSystemBytecodeCache(
+                bytecode_cache_dir,
+                pattern=f"__wijjit_{self._environment_fingerprint()}_%s.cache",
+            )
+            logger.debug(f"Using template bytecode cache in {bytecode_cache_dir}")
+
+        # LRU cache for compiled string templates
+        self.string_template_cache_size = string_template_cache_size
+        self._string_templates: OrderedDict[str, Template] = OrderedDict()
+        self._template_analyses: OrderedDict[str, TemplateAnalysis] = OrderedDict()
+        self._static_subtrees = cast(
+            StaticSubtreeExtension,
+            self.env.extensions[StaticSubtreeExtension.identifier],
+        )
+        self._static_subtrees.cache_size = static_subtree_cache_size
 
         # Theme management for cell-based rendering
         self.theme_manager = ThemeManager()
@@ -267,6 +349,13 @@ class Renderer:
         self._reconciler = Reconciler(ElementRegistry())
         self._last_vnode_tree: VNode | None = None
 
+        # Element trees of recently left views, least recently visited first.
+        # Each entry is (detached element cache, last VNode tree).
+        self.view_cache_size = view_cache_size
+        self._retained_views: OrderedDict[
+            str, tuple[dict[str, Element], VNode | None]
+        ] = OrderedDict()
+
         # Add custom filters
         self._setup_filters()
 
@@ -323,16 +412,148 @@ class Renderer:
             The rendered template output
         """
         context = context or {}
+        template = self._get_string_template(template_string)
+        return template.render(**context)
 
-        # Check cache first
-        if template_string in self._string_templates:
-            template = self._string_templates[template_string]
-        else:
-            # Compile and cache
-            template = self.env.from_string(template_string)
+    def analyze_template(self, template_string: str) -> TemplateAnalysis:
+        """Return the (cached) analysis of an inline template.
+
+        Parameters
+        ----------
+        template_string : str
+            Template source
+
+        Returns
+        -------
+        TemplateAnalysis
+            Whether the template needs the layout pipeline, which variables
+            and state keys it reads, and how many static subtrees it has
+
+        Raises
+        ------
+        jinja2.TemplateSyntaxError
+            If the template does not parse
+        """
+        analysis = self._template_analyses.get(template_string)
+        if analysis is not None:
+            self._template_analyses.move_to_end(template_string)
+            return analysis
+
+        analysis = analyze_template(self.env, template_string)
+        if self.string_template_cache_size > 0:
+            self._template_analyses[template_string] = analysis
+            while len(self._template_analyses) > self.string_template_cache_size:
+                self._template_analyses.popitem(last=False)
+        return analysis
+
+    def _environment_fingerprint(self) -> str:
+        """Identify the Wijjit version and extension set of this environment.
+
+        Returns
+        -------
+        str
+            Short hex digest used to namespace bytecode cache files
+        """
+        from wijjit import __version__
+
+        ident = ",".join([__version__, *sorted(self.env.extensions)])
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()[:12]
+
+    def _get_string_template(self, template_string: str) -> Template:
+        """Return the compiled template for an inline string, using the LRU.
+
+        Parameters
+        ----------
+        template_string : str
+            Template source
+
+        Returns
+        -------
+        jinja2.Template
+            Compiled template
+        """
+        template = self._string_templates.get(template_string)
+        if template is not None:
+            self._string_templates.move_to_end(template_string)
+            return template
+
+        template = self._compile_string_template(template_string)
+        if self.string_template_cache_size > 0:
             self._string_templates[template_string] = template
+            while len(self._string_templates) > self.string_template_cache_size:
+                self._string_templates.popitem(last=False)
+        return template
 
-        return template.render(**context)
+    def _compile_string_template(self, source: str) -> Template:
+        """Compile an inline template, through the bytecode cache if enabled.
+
+        Jinja2 only consults the bytecode cache for loader templates, so inline
+        templates are looked up here by the hash of their source.
+
+        Parameters
+        ----------
+        source : str
+            Template source
+
+        Returns
+        -------
+        jinja2.Template
+            Compiled template
+        """
+        bcc = self.env.bytecode_cache
+        if bcc is None:
+            return self.env.from_string(source)
+
+        name = "<string:" + hashlib.sha1(source.encode("utf-8")).hexdigest() + ">"
+        bucket = bcc.get_bucket(self.env, name, None, source)
+        code = bucket.code
+        if code is None:
+            code = self.env.compile(source)
+            bucket.code = code
+            bcc.set_bucket(bucket)
+        return self.env.template_class.from_code(
+            self.env, code, self.env.make_globals(None)
+        )
+
+    def precompile_templates(
+        self, suffixes: tuple[str, ...] | None = TEMPLATE_SUFFIXES
+    ) -> list[tuple[str, Exception | None]]:
+        """Compile every file template so the bytecode cache is warm.
+
+        Parameters
+        ----------
+        suffixes : tuple of str or None, optional
+            Only compile files with these suffixes (default:
+            :data:`TEMPLATE_SUFFIXES`); None compiles every file
+
+        Returns
+        -------
+        list of (str, Exception or None)
+            Each template name with the error raised while compiling it, or
+            None on success
+
+        Raises
+        ------
+        RuntimeError
+            If the renderer has no template directory
+        """
+        if not self.using_file_loader:
+            raise RuntimeError("precompile_templates() needs a template directory")
+
+        names = self.env.list_templates(
+            filter_func=(
+                None if suffixes is None else lambda name: name.endswith(suffixes)
+            )
+        )
+        results: list[tuple[str, Exception | None]] = []
+        for name in names:
+            try:
+                self.env.get_template(name)
+            except Exception as e:  # noqa: BLE001 - reported per template
+                results.append((name, e))
+            else:
+                results.append((name, None))
+        return results
 
     def render_file(
         self, template_name: str, context: dict[str, Any] | None = None
@@ -489,13 +710,9 @@ class Renderer:
                 # Load template from file (via FileSystemLoader), with friendly
                 # errors when no template dir is set or the file is missing.
                 template = self._get_file_template(template_name)
-            elif template_string in self._string_templates:
-                # Use cached string template
-                template = self._string_templates[template_string]
             else:
-                # Compile and cache new string template
-                template = self.env.from_string(template_string)
-                self._string_templates[template_string] = template
+                # Compile (or reuse the cached) string template
+                template = self._get_string_template(template_string)
 
             # Render template (this builds the layout tree)
             # Capture output in case there are no layout tags (to avoid double-rendering)
@@ -521,6 +738,10 @@ class Renderer:
 
         # Reconcile with previous VNode tree to reuse elements
         old_tree = self._last_vnode_tree
+
+        # Inactive tab/page bodies were skipped; keep their previous subtrees
+        if layout_ctx.has_deferred_content and frozen_vnode_tree is not None:
+            frozen_vnode_tree = retain_deferred_children(old_tree, frozen_vnode_tree)
         new_tree = frozen_vnode_tree
 
         if new_tree is not None:
@@ -1048,6 +1269,7 @@ class Renderer:
                 frame_height = element_height - 2
 
             # Process each TabContent child to create tabs
+            deferred_tabs: set[int] = set()
             for tab_index, tab_vnode in enumerate(vnode.children):
                 if tab_vnode.type != "TabContent":
                     continue
@@ -1074,9 +1296,14 @@ class Renderer:
                 if state_dict is not None:
                     frame._state_dict = state_dict
 
-                # Build content from TabContent's VNode children
+                # Build content from TabContent's VNode children. Deferred
+                # (inactive) tabs keep their elements in the reconciler cache
+                # but are not laid out until they become active.
+                deferred = tab_props.get("deferred", False)
+                if deferred:
+                    deferred_tabs.add(len(tabbed_panel.tabs))
                 content_children = []
-                for child_vnode in tab_vnode.children:
+                for child_vnode in () if deferred else tab_vnode.children:
                     child_node = self._build_layout_tree_from_vnode(
                         child_vnode,
                         reconciled_map,
@@ -1108,6 +1335,11 @@ class Renderer:
 
                 tabbed_panel.add_tab(label, frame_node)
 
+            # The template evaluated only the tab it resolved as active; never
+            # show a deferred (unevaluated) body if the element disagrees.
+            if tabbed_panel.active_tab_index in deferred_tabs:
+                tabbed_panel.active_tab_index = active_tab_index
+
             logger.debug(
                 f"Built TabbedPanel from VNode: {vnode.key} with {len(tabbed_panel.tabs)} tabs"
             )
@@ -1198,6 +1430,7 @@ class Renderer:
                 pager._state_dict = state_dict
 
             # Process each PageContent child to create pages
+            deferred_pages: set[int] = set()
             for page_index, page_vnode in enumerate(vnode.children):
                 if page_vnode.type != "PageContent":
                     continue
@@ -1206,8 +1439,13 @@ class Renderer:
                 title = page_props.get("title", "")
                 content = page_props.get("content", "")
 
+                # Deferred (inactive) pages keep their elements in the
+                # reconciler cache but are not laid out until shown
+                if page_props.get("deferred", False):
+                    deferred_pages.add(len(pager.pages))
+                    pager.add_page(Page(title=title, content=""))
                 # Check if PageContent has VNode children (complex content)
-                if page_vnode.children:
+                elif page_vnode.children:
                     # Build content from PageContent's VNode children
                     # Create a Frame to hold the content
                     scroll_state_key = (
@@ -1276,6 +1514,11 @@ class Renderer:
                     # Simple text content
                     pager.add_page(Page(title=title, content=content))
 
+            # The template evaluated only the page it resolved as current;
+            # never show a deferred (unevaluated) page if the element disagrees.
+            if pager.current_page in deferred_pages:
+                pager.current_page = current_page
+
             logger.debug(
                 f"Built Pager from VNode: {vnode.key} with {len(pager.pages)} pages"
             )
@@ -1983,8 +2226,10 @@ class Renderer:
         return base_output
 
     def clear_cache(self) -> None:
-        """Clear the template cache."""
+        """Clear the template, template analysis and static subtree caches."""
         self._string_templates.clear()
+        self._template_analyses.clear()
+        self._static_subtrees.clear()
 
     def clear_element_cache(self) -> None:
         """Clear the reconciler element cache and VNode tree.
@@ -1994,3 +2239,78 @@ class Renderer:
         """
         self._reconciler.clear_cache()
         self._last_vnode_tree = None
+
+    def retain_view(self, view_name: str) -> None:
+        """Park the current element tree so ``view_name`` can be restored.
+
+        The reconciler's element cache and the last VNode tree are moved into
+        a per-view LRU instead of being discarded, and the renderer starts the
+        next view from scratch. When more than ``view_cache_size`` views are
+        retained, the least recently visited one is evicted and its elements
+        are unmounted.
+
+        Parameters
+        ----------
+        view_name : str
+            Name of the view whose elements are currently rendered
+        """
+        if self.view_cache_size <= 0:
+            self.clear_element_cache()
+            return
+        self.discard_view(view_name)
+        self._retained_views[view_name] = (
+            self._reconciler.detach_cache(),
+            self._last_vnode_tree,
+        )
+        self._last_vnode_tree = None
+        while len(self._retained_views) > self.view_cache_size:
+            evicted, (cache, _tree) = self._retained_views.popitem(last=False)
+            logger.debug(f"Evicting retained elements of view '{evicted}'")
+            _unmount_elements(cache)
+
+    def restore_view(self, view_name: str) -> bool:
+        """Reuse the element tree retained for ``view_name``, if any.
+
+        Elements currently in the reconciler are unmounted. Restored elements
+        are re-wired on the next render because view-scoped handlers (such as
+        menu shortcuts) were cleared when the view was left.
+
+        Parameters
+        ----------
+        view_name : str
+            Name of the view being entered
+
+        Returns
+        -------
+        bool
+            True if a retained tree was restored, False if the view will be
+            rendered from scratch
+        """
+        retained = self._retained_views.pop(view_name, None)
+        if retained is None:
+            self.clear_element_cache()
+            return False
+        cache, tree = retained
+        for element in cache.values():
+            element.invalidate_wiring()
+        self._reconciler.attach_cache(cache)
+        self._last_vnode_tree = tree
+        return True
+
+    def discard_view(self, view_name: str) -> None:
+        """Drop the retained element tree of ``view_name`` and unmount it.
+
+        Parameters
+        ----------
+        view_name : str
+            Name of the view to forget
+        """
+        retained = self._retained_views.pop(view_name, None)
+        if retained is not None:
+            _unmount_elements(retained[0])
+
+    def clear_retained_views(self) -> None:
+        """Unmount and forget every retained view element tree."""
+        while self._retained_views:
+            _view_name, (cache, _tree) = self._retained_views.popitem(last=False)
+            _unmount_elements(cache)
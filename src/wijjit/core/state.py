@@ -6,8 +6,11 @@ Supports both synchronous and asynchronous callbacks.
 """
 
 import asyncio
+import threading
 from collections import UserDict
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, Literal
 
 from wijjit.logging_config import get_logger
@@ -23,6 +26,14 @@ logger = get_logger(__name__)
 # hang into a diagnosable error.
 _MAX_NOTIFY_DEPTH = 50
 
+#: Placeholder recorded by :meth:`State.track_reads` for keys read while absent.
+MISSING = object()
+
+# (state, reads) of the innermost active State.track_reads() in this context
+_read_tracking: ContextVar[tuple["State", dict[str, Any]] | None] = ContextVar(
+    "wijjit_state_read_tracking", default=None
+)
+
 
 class State(UserDict[str, Any]):
     """Application state with change detection.
@@ -92,6 +103,16 @@ class State(UserDict[str, Any]):
         object.__setattr__(
             self, "_notify_depth", 0
         )  # Re-entrant notification depth guard (see _MAX_NOTIFY_DEPTH)
+        object.__setattr__(
+            self, "_post_lock", threading.Lock()
+        )  # Guards _posted / _post_scheduled (written from any thread)
+        object.__setattr__(
+            self, "_posted", {}
+        )  # Writes from post()/post_many() awaiting flush_posts(), last wins
+        # Whether a flush_posts() call is queued on the loop. Assigned normally
+        # (private names bypass the state-key __setattr__) so that type
+        # checkers see the declaration that post() and flush_posts() use.
+        self._post_scheduled: bool = False
 
         # Validate keys don't conflict with dict methods
         if data:
@@ -136,6 +157,93 @@ class State(UserDict[str, Any]):
         memo[id(self)] = result
         return result
 
+    def __getitem__(self, key: str) -> Any:
+        """Get an item, recording the read if tracking is active.
+
+        Parameters
+        ----------
+        key : str
+            The state key
+
+        Returns
+        -------
+        Any
+            The state value
+        """
+        self._record_read(key)
+        return self.data[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a key, recording the read if tracking is active.
+
+        Parameters
+        ----------
+        key : object
+            The state key
+
+        Returns
+        -------
+        bool
+            True if the key is present
+        """
+        if isinstance(key, str):
+            self._record_read(key)
+        return key in self.data
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over keys, recording all of them if tracking is active.
+
+        Returns
+        -------
+        iterator of str
+            The state keys
+        """
+        if _read_tracking.get() is not None:
+            for key in self.data:
+                self._record_read(key)
+        return iter(self.data)
+
+    def _record_read(self, key: str) -> None:
+        """Record ``key`` and its current value in the active read tracking.
+
+        Parameters
+        ----------
+        key : str
+            The state key that was read
+        """
+        tracking = _read_tracking.get()
+        if tracking is not None and tracking[0] is self:
+            tracking[1].setdefault(key, self.data.get(key, MISSING))
+
+    @contextmanager
+    def track_reads(self) -> Iterator[dict[str, Any]]:
+        """Record which keys are read from this state inside the block.
+
+        Item, attribute and ``in`` access are recorded, as is iteration (as
+        reads of every current key). Tracking is per thread and per task, so
+        reads made elsewhere at the same time are not mixed in.
+
+        Yields
+        ------
+        dict
+            Filled in as the block runs: each key read, mapped to its value
+            at the time of the first read (:data:`MISSING` if absent)
+
+        Examples
+        --------
+        >>> state = State({"a": 1, "b": 2})
+        >>> with state.track_reads() as reads:
+        ...     _ = state.a + state.get("c", 0)
+        >>> sorted(reads)
+        ['a', 'c']
+        """
+        reads: dict[str, Any] = {}
+        token = _read_tracking.set((self, reads))
+        try:
+            yield reads
+        finally:
+            _read_tracking.reset(token)
+
     def __setitem__(self, key: str, value: Any) -> None:
         """Set an item and trigger change callbacks.
 
@@ -167,6 +275,106 @@ class State(UserDict[str, Any]):
             logger.debug(f"State change: {key} = {value} (was {old_value})")
             self._trigger_change(key, old_value, value)
 
+    def post(self, key: str, value: Any) -> None:
+        """Set a value from any thread, applied on the event loop.
+
+        The write is queued and applied by :meth:`flush_posts` on the loop
+        thread, so change callbacks never run on the posting thread and never
+        race with rendering. Writes to the same key before the flush are
+        coalesced (the last one wins), and callbacks fire once per key per
+        flush. Without a running event loop the write is applied immediately.
+
+        Parameters
+        ----------
+        key : str
+            The state key
+        value : Any
+            The new value
+
+        Raises
+        ------
+        ValueError
+            If key is a reserved dict method name
+
+        Examples
+        --------
+        >>> def ingest(state, readings):  # runs on a worker thread
+        ...     for reading in readings:
+        ...         state.post("latest", reading)
+        """
+        self.post_many({key: value})
+
+    def post_many(self, other: dict[str, Any] | None = None, /, **kwargs: Any) -> None:
+        """Set several values from any thread, applied on the event loop.
+
+        See :meth:`post`.
+
+        Parameters
+        ----------
+        other : dict, optional
+            Values to set
+        **kwargs : Any
+            Additional key-value pairs to set
+
+        Raises
+        ------
+        ValueError
+            If any key is a reserved dict method name
+        """
+        values = {**(other or {}), **kwargs}
+        reserved = values.keys() & self._RESERVED_NAMES
+        if reserved:
+            raise ValueError(
+                f"State keys cannot use reserved dict method names: {sorted(reserved)}."
+            )
+        if not values:
+            return
+
+        with self._post_lock:
+            self._posted.update(values)
+            if self._post_scheduled:
+                return
+            self._post_scheduled = True
+
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                loop.call_soon_threadsafe(self.flush_posts)
+                return
+            except RuntimeError:
+                pass  # Loop closed in the meantime
+        self.flush_posts()
+
+    def flush_posts(self) -> None:
+        """Apply the writes queued by :meth:`post` / :meth:`post_many`.
+
+        Called on the event loop after a post and at the start of each frame;
+        call it directly to apply pending writes synchronously.
+        """
+        with self._post_lock:
+            posted = self._posted
+            if not posted:
+                self._post_scheduled = False
+                return
+            object.__setattr__(self, "_posted", {})
+            self._post_scheduled = False
+
+        for key, value in posted.items():
+            self[key] = value
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Set the event loop that posts and cross-thread callbacks go to.
+
+        The loop is otherwise captured the first time an async callback is
+        scheduled from it. The app binds its loop on start.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop or None
+            The event loop, or None to unbind
+        """
+        object.__setattr__(self, "_loop", loop)
+
     def __getattr__(self, name: str) -> Any:
         """Get state value via attribute access.
 
@@ -189,6 +397,7 @@ class State(UserDict[str, Any]):
             # Access to private attributes
             return super().__getattribute__(name)
 
+        self._record_read(name)
         try:
             return self.data[name]
         except KeyError as e:
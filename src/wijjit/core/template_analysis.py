@@ -0,0 +1,374 @@
+"""Per-template analysis and static-subtree hoisting.
+
+Two things are worked out once per template source instead of on every frame:
+
+- :func:`analyze_template` records what a template needs: whether it uses any
+  Wijjit tag (and so must go through the layout pipeline), which context
+  variables it reads and which ``state`` keys it references. The
+  :class:`~wijjit.core.renderer.Renderer` caches the result per source.
+- :class:`WijjitEnvironment` rewrites every parsed template so tag subtrees
+  whose arguments are all literals - static frames, stacks, fixed text - are
+  wrapped in a call to :class:`StaticSubtreeExtension`. That extension builds
+  the subtree's VNodes once, freezes them, and hands back the same frozen
+  subtree on later frames. The reconciler recognises the identical subtree and
+  skips diffing it, so a mostly static screen only pays for its dynamic parts.
+
+A subtree qualifies when its tag only reads the layout context (the layout
+containers, ``{% text %}`` and ``{% status %}``), every attribute is a
+constant, and its body is plain text or other qualifying tags. Tags that read
+``state`` or focus, and anything with ``{{ }}`` expressions, control flow or
+includes, are always evaluated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from jinja2 import Environment, nodes
+from jinja2.ext import Extension
+from jinja2.meta import find_undeclared_variables
+
+from wijjit.core.render_context import get_render_context
+from wijjit.core.vdom import FrozenVNodeBuilder, VNode
+from wijjit.tags.display import StatusIndicatorExtension, TextExtension
+from wijjit.tags.layout import (
+    ColspanExtension,
+    FrameExtension,
+    GridExtension,
+    HStackExtension,
+    RowspanExtension,
+    SplitPanelExtension,
+    VStackExtension,
+    get_element_marker,
+)
+
+# Extensions whose output depends only on their attributes, their body and
+# the layout context's ID counters - never on state or focus.
+HOISTABLE_EXTENSIONS = frozenset(
+    ext.identifier
+    for ext in (
+        FrameExtension,
+        VStackExtension,
+        HStackExtension,
+        GridExtension,
+        ColspanExtension,
+        RowspanExtension,
+        SplitPanelExtension,
+        TextExtension,
+        StatusIndicatorExtension,
+    )
+)
+
+
+@dataclass(frozen=True)
+class TemplateAnalysis:
+    """What a template needs in order to be rendered.
+
+    Attributes
+    ----------
+    uses_layout : bool
+        Whether the template uses any Wijjit tag and must therefore be
+        rendered through the layout pipeline
+    variables : frozenset of str
+        Context variables the template reads
+    state_keys : frozenset of str
+        Keys read as ``state.key`` or ``state["key"]``
+    static_subtrees : int
+        Number of tag subtrees hoisted by :class:`WijjitEnvironment`
+    """
+
+    uses_layout: bool
+    variables: frozenset[str]
+    state_keys: frozenset[str]
+    static_subtrees: int
+
+
+def analyze_template(env: Environment, source: str) -> TemplateAnalysis:
+    """Analyze a template source.
+
+    Parameters
+    ----------
+    env : jinja2.Environment
+        Environment with the Wijjit extensions loaded
+    source : str
+        Template source
+
+    Returns
+    -------
+    TemplateAnalysis
+        Analysis of the template
+
+    Raises
+    ------
+    jinja2.TemplateSyntaxError
+        If the template does not parse
+    """
+    ast = env.parse(source)
+
+    uses_layout = False
+    static_subtrees = 0
+    for attr in ast.find_all(nodes.ExtensionAttribute):
+        if attr.identifier == StaticSubtreeExtension.identifier:
+            static_subtrees += 1
+            continue
+        ext = env.extensions.get(attr.identifier)
+        if ext is not None and ext.tags:
+            uses_layout = True
+
+    state_keys: set[str] = set()
+    for node in ast.find_all((nodes.Getattr, nodes.Getitem)):
+        # find_all is typed as yielding plain Nodes; narrow before reading
+        if isinstance(node, nodes.Getattr):
+            if _is_state_name(node.node):
+                state_keys.add(node.attr)
+        elif isinstance(node, nodes.Getitem) and _is_state_name(node.node):
+            key = node.arg
+            if isinstance(key, nodes.Const) and isinstance(key.value, str):
+                state_keys.add(key.value)
+
+    return TemplateAnalysis(
+        uses_layout=uses_layout,
+        variables=frozenset(find_undeclared_variables(ast)),
+        state_keys=frozenset(state_keys),
+        static_subtrees=static_subtrees,
+    )
+
+
+def _is_state_name(node: nodes.Node) -> bool:
+    """Check whether an expression is the bare name ``state``.
+
+    Parameters
+    ----------
+    node : jinja2.nodes.Node
+        Expression node
+
+    Returns
+    -------
+    bool
+        True for a ``state`` name reference
+    """
+    return isinstance(node, nodes.Name) and node.name == "state"
+
+
+def _is_literal(node: nodes.Expr) -> bool:
+    """Check whether an attribute value is a constant.
+
+    Parameters
+    ----------
+    node : jinja2.nodes.Expr
+        Attribute value expression
+
+    Returns
+    -------
+    bool
+        True for constants and tuples of constants
+    """
+    if isinstance(node, nodes.Const):
+        return True
+    if isinstance(node, nodes.Tuple):
+        return all(_is_literal(item) for item in node.items)
+    return False
+
+
+def _is_static(node: nodes.Node) -> bool:
+    """Check whether a tag subtree can be built once and reused.
+
+    Parameters
+    ----------
+    node : jinja2.nodes.Node
+        Template node
+
+    Returns
+    -------
+    bool
+        True if ``node`` is a hoistable tag with only literal attributes and
+        a body of plain text and other static tags
+    """
+    if not isinstance(node, nodes.CallBlock) or node.args:
+        return False
+    call = node.call
+    if not (
+        isinstance(call, nodes.Call)
+        and isinstance(call.node, nodes.ExtensionAttribute)
+        and call.node.identifier in HOISTABLE_EXTENSIONS
+    ):
+        return False
+    if call.args or call.dyn_args or call.dyn_kwargs:
+        return False
+    if not all(_is_literal(kwarg.value) for kwarg in call.kwargs):
+        return False
+
+    for child in node.body:
+        if isinstance(child, nodes.Output):
+            if not all(isinstance(item, nodes.TemplateData) for item in child.nodes):
+                return False
+        elif not _is_static(child):
+            return False
+    return True
+
+
+def hoist_static_subtrees(node: nodes.Node, site_prefix: str) -> int:
+    """Wrap every maximal static tag subtree in a static-subtree call.
+
+    Parameters
+    ----------
+    node : jinja2.nodes.Node
+        Template AST, modified in place
+    site_prefix : str
+        Prefix for the site keys; must identify the template source
+
+    Returns
+    -------
+    int
+        Number of subtrees wrapped
+    """
+    sites = 0
+
+    def visit(parent: nodes.Node) -> None:
+        nonlocal sites
+        for _, value in parent.iter_fields():
+            if not isinstance(value, list):
+                continue
+            for index, child in enumerate(value):
+                if not isinstance(child, nodes.Node):
+                    continue
+                if not _is_static(child):
+                    visit(child)
+                    continue
+                call = nodes.Call(
+                    nodes.ExtensionAttribute(
+                        StaticSubtreeExtension.identifier, "_render_static"
+                    ),
+                    [nodes.Const(f"{site_prefix}:{sites}")],
+                    [],
+                    None,
+                    None,
+                )
+                value[index] = nodes.CallBlock(call, [], [], [child]).set_lineno(
+                    child.lineno
+                )
+                sites += 1
+
+    visit(node)
+    return sites
+
+
+class WijjitEnvironment(Environment):
+    """Jinja2 environment that hoists static tag subtrees.
+
+    Every template parsed by this environment - inline strings, files, and
+    bytecode-cached templates alike, since the rewrite happens before
+    compilation - gets its static subtrees wrapped for
+    :class:`StaticSubtreeExtension`, when that extension is loaded.
+    """
+
+    def _parse(
+        self, source: str, name: str | None, filename: str | None
+    ) -> nodes.Template:
+        ast = super()._parse(source, name, filename)
+        if StaticSubtreeExtension.identifier in self.extensions:
+            digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+            hoist_static_subtrees(ast, digest)
+        return ast
+
+
+class StaticSubtreeExtension(Extension):
+    """Build static tag subtrees once and reuse their frozen VNodes.
+
+    This extension registers no tags; :class:`WijjitEnvironment` inserts the
+    calls to it. A subtree's generated IDs (``frame_1``, ``text_3``, ...)
+    depend on what was rendered before it, so cached subtrees are keyed by
+    their site together with the layout context's ID counters. On reuse the
+    counters are advanced exactly as building the subtree would have.
+
+    Attributes
+    ----------
+    cache_size : int
+        Maximum number of cached subtrees; 0 disables reuse
+    """
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        self.cache_size = 256
+        self._subtrees: OrderedDict[
+            tuple[Any, ...], tuple[VNode, dict[str, int], int]
+        ] = OrderedDict()
+
+    def clear(self) -> None:
+        """Drop every cached subtree."""
+        self._subtrees.clear()
+
+    def _render_static(self, site: str, caller: Callable[[], str]) -> str:
+        """Add a static subtree, reusing its frozen VNodes when possible.
+
+        Parameters
+        ----------
+        site : str
+            Key identifying the subtree in its template
+        caller : callable
+            Renders the subtree's tag
+
+        Returns
+        -------
+        str
+            The tag's element marker
+        """
+        if self.cache_size <= 0:
+            return caller()
+
+        render_ctx = get_render_context()
+        layout_context = render_ctx.layout_context
+        key = (
+            site,
+            tuple(sorted(layout_context.element_counters.items())),
+            render_ctx.frame_counter,
+        )
+
+        entry = self._subtrees.get(key)
+        if entry is not None:
+            self._subtrees.move_to_end(key)
+            vnode, counters, frame_counter = entry
+            layout_context.element_counters.update(counters)
+            render_ctx.frame_counter = frame_counter
+            layout_context.add_vnode(FrozenVNodeBuilder(vnode))
+            return get_element_marker(layout_context)
+
+        parent = layout_context.vnode_stack[-1] if layout_context.vnode_stack else None
+        child_count = len(parent.children) if parent is not None else 0
+        had_root = layout_context.vnode_root is not None
+
+        output = caller()
+
+        # Only cache the usual shape: the tag added exactly one subtree and
+        # returned nothing but its marker
+        if parent is not None:
+            if len(parent.children) != child_count + 1:
+                return output
+            builder = parent.children[-1]
+        elif had_root or layout_context.vnode_root is None:
+            return output
+        else:
+            builder = layout_context.vnode_root
+        if output != get_element_marker(layout_context):
+            return output
+
+        frozen = FrozenVNodeBuilder(builder.freeze())
+        if parent is not None:
+            parent.children[-1] = frozen
+        else:
+            layout_context.vnode_root = frozen
+        if frozen.key:
+            layout_context.element_vnodes[frozen.key] = frozen
+
+        self._subtrees[key] = (
+            frozen.vnode,
+            dict(layout_context.element_counters),
+            render_ctx.frame_counter,
+        )
+        while len(self._subtrees) > self.cache_size:
+            self._subtrees.popitem(last=False)
+        return output
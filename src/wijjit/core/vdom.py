@@ -6,7 +6,7 @@ to diff and patch UI element trees efficiently.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
 # Ephemeral props that should NOT be synced from template during reconciliation.
@@ -336,6 +336,113 @@ class VNodeBuilder:
         return f"VNodeBuilder({self.type!r}, key={self.key!r}, children={len(self.children)})"
 
 
+class FrozenVNodeBuilder:
+    """Stand-in for a VNodeBuilder whose subtree is already frozen.
+
+    Static template subtrees are built once and then reused; this wrapper lets
+    such a subtree sit among mutable builders. ``freeze()`` returns the very
+    same VNode every time, so the reconciler can skip it by identity.
+
+    Parameters
+    ----------
+    vnode : VNode
+        Frozen subtree
+
+    Attributes
+    ----------
+    vnode : VNode
+        Frozen subtree
+    """
+
+    __slots__ = ("vnode",)
+
+    def __init__(self, vnode: VNode) -> None:
+        self.vnode = vnode
+
+    @property
+    def type(self) -> str:
+        """Element type name of the subtree root."""
+        return self.vnode.type
+
+    @property
+    def key(self) -> str | None:
+        """Reconciliation key of the subtree root."""
+        return self.vnode.key
+
+    def freeze(self) -> VNode:
+        """Return the wrapped VNode.
+
+        Returns
+        -------
+        VNode
+            The frozen subtree, unchanged
+        """
+        return self.vnode
+
+    def __repr__(self) -> str:
+        return f"FrozenVNodeBuilder({self.vnode.type!r}, key={self.vnode.key!r})"
+
+
+def retain_deferred_children(old: VNode | None, new: VNode) -> VNode:
+    """Give deferred VNodes in ``new`` the children they had in ``old``.
+
+    Inactive ``{% tab %}`` / ``{% page %}`` bodies are not evaluated; their
+    VNodes carry a ``deferred`` prop and no children. Copying the previous
+    children over keeps the subtree frozen: the reconciler sees no change, so
+    its elements (and their ephemeral state) are kept instead of deleted.
+    Children are matched the same way the reconciler matches them, by key
+    and then by position for keyless nodes.
+
+    Parameters
+    ----------
+    old : VNode or None
+        Previous VNode tree
+    new : VNode
+        Freshly built VNode tree
+
+    Returns
+    -------
+    VNode
+        ``new`` itself when nothing was carried over, otherwise a copy with
+        the deferred subtrees filled in
+    """
+    if old is None or old.type != new.type:
+        return new
+    if new.get_prop("deferred"):
+        if new.children or not old.children:
+            return new
+        return replace(new, children=old.children)
+    if not new.children or not old.children:
+        return new
+
+    old_by_key: dict[str, VNode] = {}
+    old_keyless: list[VNode] = []
+    for child in old.children:
+        if child.key:
+            old_by_key[child.key] = child
+        else:
+            old_keyless.append(child)
+
+    children: list[VNode] = []
+    keyless_index = 0
+    changed = False
+    for child in new.children:
+        if child.key:
+            match = old_by_key.get(child.key)
+        elif keyless_index < len(old_keyless):
+            match = old_keyless[keyless_index]
+            keyless_index += 1
+        else:
+            match = None
+        updated = retain_deferred_children(match, child)
+        changed = changed or updated is not child
+        children.append(updated)
+
+    if not changed:
+        return new
+    return replace(new, children=tuple(children))
+
+
 def is_ephemeral_prop(prop_name: str) -> bool:
     """Check if a property name is ephemeral (should not be synced from template).
 
@@ -9,10 +9,14 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import threading
 from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
+from wijjit.core.state import MISSING
 from wijjit.core.templating import RenderedView
 from wijjit.logging_config import get_logger
 
@@ -48,6 +52,14 @@ class ViewConfig:
         The original view function (used for lazy initialization, sync or async)
     initialized : bool
         Whether this view has been initialized
+    keep_alive : bool
+        Whether the view's element tree is retained after navigating away
+    memoize : bool
+        Whether the view function's result is reused until its navigation
+        params or the state keys it read change
+    background : bool
+        Whether stale memoized results are re-evaluated on a worker thread
+        while the last result keeps being rendered
 
     Attributes
     ----------
@@ -69,6 +81,12 @@ class ViewConfig:
         The original view function (for lazy initialization, sync or async)
     initialized : bool
         Whether this view has been initialized
+    keep_alive : bool
+        Whether the view's element tree is retained after navigating away
+    memoize : bool
+        Whether the view function's result is memoized
+    background : bool
+        Whether stale results are re-evaluated on a worker thread
     """
 
     name: str
@@ -82,6 +100,9 @@ class ViewConfig:
         default=None, repr=False
     )
     initialized: bool = False
+    keep_alive: bool = True
+    memoize: bool = False
+    background: bool = False
     # True when view_func is a coroutine function. Such views are resolved once
     # (their async body cannot be awaited from the synchronous render path); use
     # a ``data`` callable for per-render liveness. Synchronous views are instead
@@ -92,6 +113,55 @@ class ViewConfig:
     hooks_from_decorator: dict[str, bool] = field(default_factory=dict)
 
 
+@dataclass
+class _ViewMemo:
+    """Memoized result of a synchronous view function.
+
+    Attributes
+    ----------
+    params : dict
+        Navigation params the function was called with
+    reads : dict
+        State keys the function read, with the values it saw
+    rendered : RenderedView
+        The normalized result
+    generation : int
+        The view's invalidation generation when evaluation started
+    """
+
+    params: dict[str, Any]
+    reads: dict[str, Any]
+    rendered: RenderedView
+    generation: int
+
+
+def _reads_unchanged(reads: dict[str, Any], data: dict[str, Any]) -> bool:
+    """Check whether state still holds the values a view function read.
+
+    Parameters
+    ----------
+    reads : dict
+        Keys read and the values seen, from :meth:`State.track_reads`
+    data : dict
+        Current state data
+
+    Returns
+    -------
+    bool
+        True if every key still holds an equal value
+    """
+    for key, seen in reads.items():
+        current = data.get(key, MISSING)
+        if current is seen:
+            continue
+        try:
+            if current != seen:
+                return False
+        except Exception:  # noqa: BLE001 - e.g. arrays with ambiguous ==
+            return False
+    return True
+
+
 class ViewRouter:
     """Manages view registration and navigation.
 
@@ -132,12 +202,24 @@ class ViewRouter:
         self.current_view: str | None = None
         self.default_view: str | None = None
 
+        # Memoized view results (memoize=True / background=True views).
+        # Worker threads store results, so these are guarded by _memo_lock.
+        self._memo_lock = threading.Lock()
+        self._memos: dict[str, _ViewMemo] = {}
+        self._generations: dict[str, int] = {}
+        self._refreshing: set[str] = set()
+        self._refresh_errors: dict[str, Exception] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
     def view_decorator(
         self,
         name: str,
         default: bool = False,
         on_enter: Callable[..., Any] | None = None,
         on_exit: Callable[..., Any] | None = None,
+        keep_alive: bool = True,
+        memoize: bool = False,
+        background: bool = False,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         """Create a decorator to register a view.
 
@@ -160,6 +242,16 @@ class ViewRouter:
         on_exit : callable, optional
             Hook called when navigating away from this view. Takes precedence
             over an ``on_exit`` key in a legacy dict return.
+        keep_alive : bool
+            Retain the view's element tree after navigating away so returning
+            reuses it (default: True)
+        memoize : bool
+            Reuse the view function's last result instead of calling it every
+            render, until the navigation params or a state key it read
+            changes, or :meth:`invalidate` is called (default: False)
+        background : bool
+            Memoize, and re-evaluate a stale result on a worker thread while
+            the last result keeps being rendered (default: False)
 
         Returns
         -------
@@ -195,6 +287,9 @@ class ViewRouter:
                 is_default=default,
                 view_func=func,  # Store the original function
                 initialized=False,
+                keep_alive=keep_alive,
+                memoize=memoize or background,
+                background=background,
             )
             # Remember which hooks came from the decorator so lazy init does
             # not overwrite them from the returned dict.
@@ -356,6 +451,8 @@ class ViewRouter:
         call_params = params or {}
 
         if view_config.view_func is not None and not view_config.is_async:
+            if view_config.memoize:
+                return self._evaluate_memoized(view_config, call_params)
             result = view_config.view_func(**call_params)
             return self._normalize_render(result, call_params)
 
@@ -369,6 +466,168 @@ class ViewRouter:
             context=context,
         )
 
+    def _evaluate_memoized(
+        self, view_config: ViewConfig, params: dict[str, Any]
+    ) -> RenderedView:
+        """Evaluate a memoized view, reusing its last result when still valid.
+
+        A result is valid while the view is called with equal params, every
+        state key it read still holds an equal value, and :meth:`invalidate`
+        has not been called since. A ``background`` view whose result went
+        stale keeps returning it while a worker thread re-evaluates the view;
+        the app re-renders once the new result is stored. Without a running
+        event loop, or when the params changed, the view is evaluated inline.
+
+        Parameters
+        ----------
+        view_config : ViewConfig
+            A memoized synchronous view
+        params : dict
+            Navigation parameters
+
+        Returns
+        -------
+        RenderedView
+            The memoized or freshly evaluated result
+
+        Raises
+        ------
+        Exception
+            Whatever the last background evaluation raised
+        """
+        name = view_config.name
+        with self._memo_lock:
+            error = self._refresh_errors.pop(name, None)
+            memo = self._memos.get(name)
+            generation = self._generations.get(name, 0)
+        if error is not None:
+            raise error
+
+        if memo is not None and memo.params == params:
+            if memo.generation == generation and _reads_unchanged(
+                memo.reads, self.app.state.data
+            ):
+                return memo.rendered
+            if view_config.background and self._refresh_in_background(
+                view_config, params
+            ):
+                return memo.rendered
+
+        memo = self._evaluate_tracked(view_config, params)
+        with self._memo_lock:
+            self._memos[name] = memo
+        return memo.rendered
+
+    def _evaluate_tracked(
+        self, view_config: ViewConfig, params: dict[str, Any]
+    ) -> _ViewMemo:
+        """Call a view function, recording the state keys it reads.
+
+        Parameters
+        ----------
+        view_config : ViewConfig
+            A synchronous view
+        params : dict
+            Navigation parameters
+
+        Returns
+        -------
+        _ViewMemo
+            The result and the reads it depends on
+        """
+        assert view_config.view_func is not None
+        with self._memo_lock:
+            generation = self._generations.get(view_config.name, 0)
+        with self.app.state.track_reads() as reads:
+            result = view_config.view_func(**params)
+            rendered = self._normalize_render(result, params)
+        return _ViewMemo(dict(params), reads, rendered, generation)
+
+    def _refresh_in_background(
+        self, view_config: ViewConfig, params: dict[str, Any]
+    ) -> bool:
+        """Start re-evaluating a view on a worker thread.
+
+        Parameters
+        ----------
+        view_config : ViewConfig
+            A memoized synchronous view
+        params : dict
+            Navigation parameters
+
+        Returns
+        -------
+        bool
+            False when there is no running event loop to pick up the result
+            (the caller then evaluates inline), True otherwise - including
+            when a re-evaluation is already in flight
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        name = view_config.name
+        with self._memo_lock:
+            if name in self._refreshing:
+                return True
+            self._refreshing.add(name)
+            if self.app._executor is not None:
+                executor = self.app._executor
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="wijjit-view"
+                    )
+                executor = self._executor
+
+        logger.debug(f"Re-evaluating view '{name}' in the background")
+        future = executor.submit(self._evaluate_tracked, view_config, dict(params))
+        future.add_done_callback(partial(self._finish_refresh, name))
+        return True
+
+    def _finish_refresh(self, view_name: str, future: Future[_ViewMemo]) -> None:
+        """Store a background evaluation and request a render.
+
+        Parameters
+        ----------
+        view_name : str
+            The re-evaluated view
+        future : Future
+            The finished evaluation
+        """
+        with self._memo_lock:
+            self._refreshing.discard(view_name)
+            try:
+                self._memos[view_name] = future.result()
+            except Exception as e:
+                # Re-raised on the UI thread by the next render
+                self._refresh_errors[view_name] = e
+        self.app.needs_render = True
+
+    def invalidate(self, view_name: str | None = None) -> None:
+        """Mark memoized view results as stale.
+
+        Use this when a memoized view depends on data outside ``state``, such
+        as a database, that has changed.
+
+        Parameters
+        ----------
+        view_name : str, optional
+            View to invalidate; every view when omitted
+
+        Raises
+        ------
+        ValueError
+            If view_name doesn't exist
+        """
+        if view_name is not None and view_name not in self.views:
+            raise ValueError(f"View '{view_name}' not found")
+        names = list(self.views) if view_name is None else [view_name]
+        with self._memo_lock:
+            for name in names:
+                self._generations[name] = self._generations.get(name, 0) + 1
+
     def _normalize_render(self, result: Any, params: dict[str, Any]) -> RenderedView:
         """Coerce a view function's return value into a :class:`RenderedView`.
 
@@ -464,6 +723,38 @@ class ViewRouter:
                 label=f"navigation to view '{view_name}'",
             )
 
+    def _swap_element_cache(self, old_view: str, new_view: str) -> None:
+        """Retain the old view's element tree and restore the new view's.
+
+        Views declared with ``keep_alive=False`` (and re-navigation to the
+        same view) start from a fresh element cache, so no ephemeral state
+        carries over.
+
+        Parameters
+        ----------
+        old_view : str
+            Name of the view being left
+        new_view : str
+            Name of the view being entered
+        """
+        renderer = self.app.renderer
+        if old_view == new_view:
+            renderer.discard_view(new_view)
+            renderer.clear_element_cache()
+            return
+
+        if self.views[old_view].keep_alive:
+            renderer.retain_view(old_view)
+        else:
+            renderer.clear_element_cache()
+
+        if self.views[new_view].keep_alive:
+            if renderer.restore_view(new_view):
+                logger.debug(f"Restored retained elements of view '{new_view}'")
+        else:
+            renderer.discard_view(new_view)
+            renderer.clear_element_cache()
+
     def _navigate_sync_impl(
         self,
         view_name: str,
@@ -522,8 +813,7 @@ class ViewRouter:
             # Clear view-specific shortcuts
             self.app.wiring_manager.clear_view_shortcuts()
 
-            # Clear element cache and reconciler state to prevent state bleed between views
-            self.app.renderer.clear_element_cache()
+            self._swap_element_cache(self.current_view, view_name)
 
         # Switch to new view
         self.current_view = view_name
@@ -606,8 +896,7 @@ class ViewRouter:
             # Clear view-specific shortcuts
             self.app.wiring_manager.clear_view_shortcuts()
 
-            # Clear element cache and reconciler state to prevent state bleed between views
-            self.app.renderer.clear_element_cache()
+            self._swap_element_cache(self.current_view, view_name)
 
         # Switch to new view
         self.current_view = view_name
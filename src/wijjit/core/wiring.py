@@ -6,25 +6,26 @@ callbacks for interactive elements, state bindings, and menu shortcuts.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from wijjit.autocomplete.resolver import resolve_autocomplete
 from wijjit.core.events import HandlerScope
-from wijjit.elements.display.link import Link
-from wijjit.elements.display.tree import Tree
-from wijjit.elements.input.button import Button
-from wijjit.elements.input.checkbox import Checkbox, CheckboxGroup
-from wijjit.elements.input.code_editor import CodeEditor
-from wijjit.elements.input.radio import Radio, RadioGroup
-from wijjit.elements.input.select import Select
-from wijjit.elements.input.text import TextArea, TextInput
-from wijjit.elements.menu import ContextMenu, DropdownMenu, MenuElement
 from wijjit.logging_config import get_logger
 
 if TYPE_CHECKING:
     from wijjit.core.app import Wijjit
     from wijjit.core.state import State
     from wijjit.elements.base import Element, ScrollableElement
+    from wijjit.elements.display.image import ImageView
+    from wijjit.elements.display.tree import Tree
+    from wijjit.elements.input.checkbox import Checkbox, CheckboxGroup
+    from wijjit.elements.input.code_editor import CodeEditor
+    from wijjit.elements.input.radio import Radio, RadioGroup
+    from wijjit.elements.input.select import Select
+    from wijjit.elements.input.text import TextArea, TextInput
+    from wijjit.elements.menu import MenuElement
 
 logger = get_logger(__name__)
 
@@ -39,6 +40,11 @@ class ElementWiringManager:
     - Managing scroll position persistence
     - Managing highlight state for selectable elements
 
+    Callbacks are wired once per element: the reconciler keeps element
+    instances alive across renders, and each element records the wiring
+    generation it was wired at (see ``Element.wiring_attrs``). Later renders
+    only push bound state values into already-wired elements.
+
     Parameters
     ----------
     app : Wijjit
@@ -65,6 +71,9 @@ class ElementWiringManager:
         self.app = app
         self._registered_menuitem_shortcuts: set[str] = set()
         self._registered_menu_shortcuts: set[str] = set()
+        # Named radios from the last render, used to skip regrouping when
+        # the set of radios has not changed
+        self._grouped_radios: list[tuple[Radio, str]] = []
 
     def clear_view_shortcuts(self) -> None:
         """Clear shortcut tracking sets when navigating away from view.
@@ -86,8 +95,10 @@ class ElementWiringManager:
     ) -> None:
         """Wire callbacks for all elements.
 
-        This method wires up action callbacks, state bindings, and
-        menu shortcuts for all positioned elements.
+        New elements and elements whose wiring attributes changed since they
+        were last wired get their action callbacks and state bindings
+        (re)wired. Already-wired elements only have their bound value synced
+        from state.
 
         Parameters
         ----------
@@ -96,13 +107,27 @@ class ElementWiringManager:
         state : State
             Application state for bindings
         """
+        from wijjit.elements.input.radio import Radio
+
+        radios: list[tuple[Radio, str]] = []
         for elem in elements:
             self._wire_element(elem, state)
+            if isinstance(elem, Radio) and elem.name:
+                radios.append((elem, elem.name))
 
         # Group standalone radios by name so each knows its siblings. This
         # drives mutual exclusion (select() deselects same-group siblings) and
         # Up/Down arrow navigation, both of which rely on Radio.radio_group.
-        self._wire_radio_groups(elements)
+        # Groups only change when a radio is added, removed or renamed.
+        previous = self._grouped_radios
+        if len(radios) != len(previous) or any(
+            radio is not old_radio or name != old_name
+            for (radio, name), (old_radio, old_name) in zip(
+                radios, previous, strict=True
+            )
+        ):
+            self._wire_radio_groups([radio for radio, _name in radios])
+        self._grouped_radios = radios
 
     def _wire_radio_groups(self, elements: list[Element]) -> None:
         """Link standalone radios that share a ``name`` into a group.
@@ -112,6 +137,8 @@ class ElementWiringManager:
         elements : list[Element]
             Flat list of positioned elements for the current render.
         """
+        from wijjit.elements.input.radio import Radio
+
         groups: dict[str, list[Radio]] = {}
         for elem in elements:
             if isinstance(elem, Radio) and elem.name:
@@ -122,7 +149,7 @@ class ElementWiringManager:
                 radio.radio_group = siblings
 
     def _wire_element(self, elem: Element, state: State) -> None:
-        """Wire callbacks for a single element.
+        """Wire callbacks for a single element, or sync it if already wired.
 
         Parameters
         ----------
@@ -131,6 +158,83 @@ class ElementWiringManager:
         state : State
             Application state
         """
+        wiring = getattr(elem, "_wiring", None)
+        if (
+            wiring is not None
+            and wiring[0] == getattr(elem, "_wiring_generation", None)
+            and wiring[1] is state
+        ):
+            sync = wiring[2]
+            if sync is not None:
+                sync(elem, state)
+            return
+
+        # Sync before wiring so the initial value does not fire the new
+        # on_change callback back into state
+        sync = self._state_sync_for(elem)
+        if sync is not None:
+            sync(elem, state)
+        self._wire_callbacks(elem, state)
+
+        # Read the generation after wiring: resolving autocomplete assigns
+        # ``completer``, which bumps it
+        elem._wiring = (elem._wiring_generation, state, sync)
+
+    def _state_sync_for(self, elem: Element) -> Callable[[Any, State], None] | None:
+        """Select the function that pushes bound state into an element.
+
+        Parameters
+        ----------
+        elem : Element
+            Element being wired
+
+        Returns
+        -------
+        callable or None
+            ``sync(elem, state)`` for state-bound inputs, None otherwise
+        """
+        if not getattr(elem, "bind", False):
+            return None
+
+        from wijjit.elements.input.checkbox import Checkbox, CheckboxGroup
+        from wijjit.elements.input.radio import Radio, RadioGroup
+        from wijjit.elements.input.select import Select
+        from wijjit.elements.input.text import TextInput
+
+        if isinstance(elem, TextInput) and elem.id:
+            return self._sync_textinput
+        if isinstance(elem, Select) and elem.id:
+            return self._sync_select
+        if isinstance(elem, Checkbox) and elem.id:
+            return self._sync_checkbox
+        if isinstance(elem, Radio) and elem.name:
+            return self._sync_radio
+        if isinstance(elem, CheckboxGroup) and elem.id:
+            return self._sync_checkbox_group
+        if isinstance(elem, RadioGroup) and elem.name:
+            return self._sync_radio_group
+        return None
+
+    def _wire_callbacks(self, elem: Element, state: State) -> None:
+        """Attach action and state-binding callbacks to an element.
+
+        Parameters
+        ----------
+        elem : Element
+            Element to wire
+        state : State
+            Application state
+        """
+        from wijjit.elements.base import ScrollableElement
+        from wijjit.elements.display.link import Link
+        from wijjit.elements.display.tree import Tree
+        from wijjit.elements.input.button import Button
+        from wijjit.elements.input.checkbox import Checkbox, CheckboxGroup
+        from wijjit.elements.input.code_editor import CodeEditor
+        from wijjit.elements.input.radio import Radio, RadioGroup
+        from wijjit.elements.input.select import Select
+        from wijjit.elements.input.text import TextArea, TextInput
+
         # Wire up action callbacks for buttons
         if isinstance(elem, Button) and elem.action:
             action_id = elem.action
@@ -162,8 +266,6 @@ class ElementWiringManager:
             self._wire_select(elem, state)
 
         # Wire up scroll position persistence for all ScrollableElement elements
-        from wijjit.elements.base import ScrollableElement
-
         if isinstance(elem, ScrollableElement):
             self._wire_scrollable(elem, state)
 
@@ -171,6 +273,12 @@ class ElementWiringManager:
         if isinstance(elem, Tree):
             self._wire_tree(elem, state)
 
+        # Wire up ImageView render callback. The image module imports PIL, so
+        # it is only consulted once loaded (which any ImageView implies)
+        image_module = sys.modules.get("wijjit.elements.display.image")
+        if image_module is not None and isinstance(elem, image_module.ImageView):
+            self._wire_image_view(elem)
+
         # Wire up Checkbox callbacks
         if isinstance(elem, Checkbox):
             self._wire_checkbox(elem, state)
@@ -204,11 +312,6 @@ class ElementWiringManager:
 
         # Wire up state binding if enabled
         if elem.bind and elem.id:
-            # Initialize element value from state if key exists
-            # Note: cursor_pos is now preserved by reconciliation (ephemeral state)
-            if elem.id in state:
-                elem.value = str(state[elem.id])
-
             # Set up two-way binding
             elem_id = elem.id
 
@@ -232,6 +335,20 @@ class ElementWiringManager:
         if elem.completer is not None:
             elem._overlay_manager = self.app.overlay_manager
 
+    def _sync_textinput(self, elem: TextInput, state: State) -> None:
+        """Initialize a bound TextInput's value from state if the key exists.
+
+        Parameters
+        ----------
+        elem : TextInput
+            Bound TextInput element
+        state : State
+            Application state
+        """
+        # Note: cursor_pos is now preserved by reconciliation (ephemeral state)
+        if elem.id and elem.id in state:
+            elem.value = str(state[elem.id])
+
     def _wire_textarea(self, elem: TextArea, state: State) -> None:
         """Wire TextArea callbacks.
 
@@ -282,6 +399,25 @@ class ElementWiringManager:
 
         elem._request_render = request_render
 
+    def _wire_image_view(self, elem: ImageView) -> None:
+        """Wire ImageView render callback.
+
+        Parameters
+        ----------
+        elem : ImageView
+            ImageView element to wire
+
+        Notes
+        -----
+        Images are decoded and resized on worker threads; this callback makes
+        the app re-render once a background render lands in the cache.
+        """
+
+        def request_render():
+            self.app.needs_render = True
+
+        elem._request_render = request_render
+
     def _wire_select(self, elem: Select, state: State) -> None:
         """Wire Select callbacks.
 
@@ -301,13 +437,6 @@ class ElementWiringManager:
         if elem.bind and elem.id:
             if elem.multiple:
                 # Multi-select mode: state holds a list
-                if elem.id in state:
-                    state_value = state[elem.id]
-                    if isinstance(state_value, (list, set, tuple)):
-                        elem.selected_values = set(state_value)
-                    elif state_value is not None:
-                        elem.selected_values = {str(state_value)}
-
                 # Set up two-way binding for multi-select
                 elem_id = elem.id
 
@@ -318,11 +447,6 @@ class ElementWiringManager:
                 elem.on_change = on_change_handler_multi
             else:
                 # Single-select mode: state holds a single value
-                if elem.id in state:
-                    elem.value = state[elem.id]
-                    # Update selected_index to match the value
-                    elem.selected_index = elem._find_option_index(elem.value)
-
                 # Set up two-way binding for single-select
                 elem_id = elem.id
 
@@ -342,6 +466,31 @@ class ElementWiringManager:
 
             elem.on_highlight_change = on_highlight_handler
 
+    def _sync_select(self, elem: Select, state: State) -> None:
+        """Initialize a bound Select's selection from state if the key exists.
+
+        Parameters
+        ----------
+        elem : Select
+            Bound Select element
+        state : State
+            Application state
+        """
+        if not elem.id or elem.id not in state:
+            return
+        state_value = state[elem.id]
+        if elem.multiple:
+            # Multi-select mode: state holds a list
+            if isinstance(state_value, (list, set, tuple)):
+                elem.selected_values = set(state_value)
+            elif state_value is not None:
+                elem.selected_values = {str(state_value)}
+        else:
+            # Single-select mode: state holds a single value
+            elem.value = state_value
+            # Update selected_index to match the value
+            elem.selected_index = elem._find_option_index(elem.value)
+
     def _wire_scrollable(self, elem: ScrollableElement, state: State) -> None:
         """Wire scroll position persistence for ScrollableElement elements.
 
@@ -402,6 +551,19 @@ class ElementWiringManager:
 
             elem.on_select = on_select_handler
 
+        # Re-render when lazily loaded children arrive between frames
+        def request_render():
+            self.app.needs_render = True
+
+        elem._request_render = request_render
+
+        # Persist expansion to state and restore it for a new element; lazy
+        # nodes among the restored ids start loading from here
+        elem._state_dict = state
+        expand_key = elem.expand_state_key
+        if expand_key and expand_key in state:
+            elem.restore_expanded(list(state[expand_key] or []))
+
     def _wire_checkbox(self, elem: Checkbox, state: State) -> None:
         """Wire Checkbox callbacks.
 
@@ -419,10 +581,6 @@ class ElementWiringManager:
 
         # Wire up state binding if enabled
         if elem.bind and elem.id:
-            # Initialize element checked state from state if key exists
-            if elem.id in state:
-                elem.checked = bool(state[elem.id])
-
             # Set up two-way binding
             elem_id = elem.id
 
@@ -432,6 +590,19 @@ class ElementWiringManager:
 
             elem.on_change = on_change_handler
 
+    def _sync_checkbox(self, elem: Checkbox, state: State) -> None:
+        """Initialize a bound Checkbox's checked state from state.
+
+        Parameters
+        ----------
+        elem : Checkbox
+            Bound Checkbox element
+        state : State
+            Application state
+        """
+        if elem.id and elem.id in state:
+            elem.checked = bool(state[elem.id])
+
     def _wire_radio(self, elem: Radio, state: State) -> None:
         """Wire Radio callbacks.
 
@@ -449,21 +620,30 @@ class ElementWiringManager:
 
         # Wire up state binding if enabled (bind to group name, not id)
         if elem.bind and elem.name:
-            # Initialize element checked state from state[name]
-            if elem.name in state:
-                elem.checked = state[elem.name] == elem.value
-
-            # Set up two-way binding
+            # Set up two-way binding. The value is read when the radio is
+            # selected because it is not a wiring attribute.
             radio_name = elem.name
-            radio_value = elem.value
 
-            def on_change_handler(old_val, new_val, rname=radio_name, rval=radio_value):
+            def on_change_handler(old_val, new_val, rname=radio_name, radio=elem):
                 # Update state when radio is selected
                 if new_val:  # Only update state when radio is selected (not deselected)
-                    state[rname] = rval
+                    state[rname] = radio.value
 
             elem.on_change = on_change_handler
 
+    def _sync_radio(self, elem: Radio, state: State) -> None:
+        """Initialize a bound Radio's checked state from ``state[name]``.
+
+        Parameters
+        ----------
+        elem : Radio
+            Bound Radio element
+        state : State
+            Application state
+        """
+        if elem.name in state:
+            elem.checked = state[elem.name] == elem.value
+
     def _wire_checkbox_group(self, elem: CheckboxGroup, state: State) -> None:
         """Wire CheckboxGroup callbacks.
 
@@ -481,10 +661,6 @@ class ElementWiringManager:
 
         # Wire up state binding if enabled
         if elem.bind and elem.id:
-            # Initialize element selected values from state if key exists
-            if elem.id in state:
-                elem.selected_values = set(state[elem.id])
-
             # Set up two-way binding
             elem_id = elem.id
 
@@ -504,6 +680,19 @@ class ElementWiringManager:
 
             elem.on_highlight_change = on_highlight_handler
 
+    def _sync_checkbox_group(self, elem: CheckboxGroup, state: State) -> None:
+        """Initialize a bound CheckboxGroup's selection from state.
+
+        Parameters
+        ----------
+        elem : CheckboxGroup
+            Bound CheckboxGroup element
+        state : State
+            Application state
+        """
+        if elem.id and elem.id in state:
+            elem.selected_values = set(state[elem.id])
+
     def _wire_radio_group(self, elem: RadioGroup, state: State) -> None:
         """Wire RadioGroup callbacks.
 
@@ -521,11 +710,6 @@ class ElementWiringManager:
 
         # Wire up state binding if enabled (bind to group name)
         if elem.bind and elem.name:
-            # Initialize element selected value from state[name]
-            if elem.name in state:
-                elem.selected_value = state[elem.name]
-                elem.selected_index = elem._find_option_index(elem.selected_value)
-
             # Set up two-way binding
             group_name = elem.name
 
@@ -545,6 +729,20 @@ class ElementWiringManager:
 
             elem.on_highlight_change = on_highlight_handler
 
+    def _sync_radio_group(self, elem: RadioGroup, state: State) -> None:
+        """Initialize a bound RadioGroup's selection from ``state[name]``.
+
+        Parameters
+        ----------
+        elem : RadioGroup
+            Bound RadioGroup element
+        state : State
+            Application state
+        """
+        if elem.name in state:
+            elem.selected_value = state[elem.name]
+            elem.selected_index = elem._find_option_index(elem.selected_value)
+
     def wire_menu_elements(
         self,
         menu_elements: list[tuple[MenuElement, dict[str, Any]]],
@@ -571,6 +769,9 @@ class ElementWiringManager:
         handler_scope : HandlerScope
             HandlerScope.GLOBAL for shortcut registration
         """
+        from wijjit.elements.input.button import Button
+        from wijjit.elements.menu import ContextMenu, DropdownMenu
+
         for elem, overlay_info in menu_elements:
             # Wire up menu item selection callback
             def on_item_select_handler(action_id: str, item):
@@ -4,60 +4,175 @@ Re-exports the canonical element classes from :mod:`wijjit.elements.input`
 and :mod:`wijjit.elements.display` so callers can write
 ``from wijjit.elements import Button`` without knowing which submodule a
 given element lives in.
+
+The re-exports are resolved lazily (PEP 562), like those of :mod:`wijjit`.
+Importing one element module (``wijjit.elements.base``, say) then does not
+load every other element, which also keeps modules that element modules
+import, such as :mod:`wijjit.layout.frames`, free of import cycles.
 """
 
-from wijjit.elements.base import (
-    Container,
-    Element,
-    ElementType,
-    OverlayElement,
-    ScrollableElement,
-    TextElement,
-)
-from wijjit.elements.display import (
-    BarChart,
-    ColumnChart,
-    ContentType,
-    ContentView,
-    Gauge,
-    HeatMap,
-    ImageView,
-    LineChart,
-    Link,
-    ListView,
-    LogView,
-    ModalElement,
-    NotificationElement,
-    NotificationSeverity,
-    Page,
-    Pager,
-    ProgressBar,
-    Sparkline,
-    Spinner,
-    StatusBar,
-    StatusIndicator,
-    TabbedPanel,
-    Table,
-    TabPosition,
-    Tree,
-    TreeIndicatorStyle,
-)
-from wijjit.elements.input import (
-    Button,
-    Checkbox,
-    CheckboxGroup,
-    CodeEditor,
-    DataGrid,
-    InputStyle,
-    Radio,
-    RadioGroup,
-    Select,
-    Slider,
-    SyntaxHighlighter,
-    TextArea,
-    TextInput,
-    Toggle,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wijjit.elements.base import (
+        Container,
+        Element,
+        ElementType,
+        OverlayElement,
+        ScrollableElement,
+        TextElement,
+    )
+    from wijjit.elements.data_source import (
+        ArrowSource,
+        DataFrameSource,
+        DataSource,
+        NumpySource,
+        as_data_source,
+    )
+    from wijjit.elements.display import (
+        BarChart,
+        ColumnChart,
+        ContentType,
+        ContentView,
+        Gauge,
+        HeatMap,
+        ImageView,
+        LineChart,
+        Link,
+        ListView,
+        LogView,
+        ModalElement,
+        NotificationElement,
+        NotificationSeverity,
+        Page,
+        Pager,
+        ProgressBar,
+        Sparkline,
+        Spinner,
+        StatusBar,
+        StatusIndicator,
+        TabbedPanel,
+        Table,
+        TabPosition,
+        Tree,
+        TreeIndicatorStyle,
+    )
+    from wijjit.elements.input import (
+        Button,
+        Checkbox,
+        CheckboxGroup,
+        CodeEditor,
+        DataGrid,
+        InputStyle,
+        Radio,
+        RadioGroup,
+        Select,
+        Slider,
+        SyntaxHighlighter,
+        TextArea,
+        TextInput,
+        Toggle,
+    )
+
+# Map of re-exported name -> module that defines it, resolved on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    # wijjit.elements.base
+    "Container": "wijjit.elements.base",
+    "Element": "wijjit.elements.base",
+    "ElementType": "wijjit.elements.base",
+    "OverlayElement": "wijjit.elements.base",
+    "ScrollableElement": "wijjit.elements.base",
+    "TextElement": "wijjit.elements.base",
+    # wijjit.elements.data_source
+    "ArrowSource": "wijjit.elements.data_source",
+    "DataFrameSource": "wijjit.elements.data_source",
+    "DataSource": "wijjit.elements.data_source",
+    "NumpySource": "wijjit.elements.data_source",
+    "as_data_source": "wijjit.elements.data_source",
+    # wijjit.elements.display
+    "BarChart": "wijjit.elements.display",
+    "ColumnChart": "wijjit.elements.display",
+    "ContentType": "wijjit.elements.display",
+    "ContentView": "wijjit.elements.display",
+    "Gauge": "wijjit.elements.display",
+    "HeatMap": "wijjit.elements.display",
+    "ImageView": "wijjit.elements.display",
+    "LineChart": "wijjit.elements.display",
+    "Link": "wijjit.elements.display",
+    "ListView": "wijjit.elements.display",
+    "LogView": "wijjit.elements.display",
+    "ModalElement": "wijjit.elements.display",
+    "NotificationElement": "wijjit.elements.display",
+    "NotificationSeverity": "wijjit.elements.display",
+    "Page": "wijjit.elements.display",
+    "Pager": "wijjit.elements.display",
+    "ProgressBar": "wijjit.elements.display",
+    "Sparkline": "wijjit.elements.display",
+    "Spinner": "wijjit.elements.display",
+    "StatusBar": "wijjit.elements.display",
+    "StatusIndicator": "wijjit.elements.display",
+    "TabbedPanel": "wijjit.elements.display",
+    "Table": "wijjit.elements.display",
+    "TabPosition": "wijjit.elements.display",
+    "Tree": "wijjit.elements.display",
+    "TreeIndicatorStyle": "wijjit.elements.display",
+    # wijjit.elements.input
+    "Button": "wijjit.elements.input",
+    "Checkbox": "wijjit.elements.input",
+    "CheckboxGroup": "wijjit.elements.input",
+    "CodeEditor": "wijjit.elements.input",
+    "DataGrid": "wijjit.elements.input",
+    "InputStyle": "wijjit.elements.input",
+    "Radio": "wijjit.elements.input",
+    "RadioGroup": "wijjit.elements.input",
+    "Select": "wijjit.elements.input",
+    "Slider": "wijjit.elements.input",
+    "SyntaxHighlighter": "wijjit.elements.input",
+    "TextArea": "wijjit.elements.input",
+    "TextInput": "wijjit.elements.input",
+    "Toggle": "wijjit.elements.input",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name
+
+    Returns
+    -------
+    Any
+        The re-exported object
+
+    Raises
+    ------
+    AttributeError
+        If ``name`` is not re-exported
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported names.
+
+    Returns
+    -------
+    list of str
+        Attribute names
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Base
@@ -67,6 +182,12 @@ __all__ = [
     "OverlayElement",
     "ScrollableElement",
     "TextElement",
+    # Data sources
+    "ArrowSource",
+    "DataFrameSource",
+    "DataSource",
+    "NumpySource",
+    "as_data_source",
     # Input
     "Button",
     "Checkbox",
@@ -31,9 +31,9 @@ from __future__ import annotations
 import asyncio
 import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from wijjit.logging_config import get_logger
 from wijjit.terminal.input import Key, Keys
@@ -236,8 +236,59 @@ class Element(ABC):
     on_drop : callable or None
         Callback when something is dropped on this element.
         Signature: on_drop(event: MouseEvent, drag_data: Any, source_element: Element) -> bool
+    layout_attrs : frozenset of str or None
+        Class-level set of attributes ``get_intrinsic_size`` depends on.
+        Assigning one invalidates the element's cached layout constraints.
+        ``None`` means the intrinsic size is not cacheable and is measured on
+        every layout pass.
+    wiring_attrs : frozenset of str
+        Class-level set of attributes the app's callback wiring depends on
+        (action ids, state keys, ...). Assigning one makes the element be
+        re-wired on the next render.
     """
 
+    # The default intrinsic size is a constant, so nothing invalidates it.
+    # Subclasses that override get_intrinsic_size without declaring their own
+    # layout_attrs are treated as uncacheable (see __init_subclass__).
+    layout_attrs: ClassVar[frozenset[str] | None] = frozenset()
+
+    # Bumped whenever a layout attribute changes or invalidate_layout() is
+    # called; the layout engine keys its cached constraints on it.
+    _layout_generation: int = 0
+    _layout_cache: tuple[Any, Any] | None = None
+
+    wiring_attrs: ClassVar[frozenset[str]] = frozenset(
+        {
+            "id",
+            "action",
+            "bind",
+            "name",
+            "multiple",
+            "completer",
+            "scroll_state_key",
+            "scroll_state_key_x",
+            "highlight_state_key",
+        }
+    )
+
+    # Bumped whenever a wiring attribute changes or invalidate_wiring() is
+    # called; ElementWiringManager records the generation it wired in _wiring.
+    _wiring_generation: int = 0
+    _wiring: tuple[Any, ...] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "get_intrinsic_size" in cls.__dict__ and "layout_attrs" not in cls.__dict__:
+            cls.layout_attrs = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        layout_attrs = self.layout_attrs
+        if layout_attrs and name in layout_attrs:
+            object.__setattr__(self, "_layout_generation", self._layout_generation + 1)
+        if name in self.wiring_attrs:
+            object.__setattr__(self, "_wiring_generation", self._wiring_generation + 1)
+
     def __init__(
         self,
         id: str | None = None,
@@ -485,6 +536,49 @@ class Element(ABC):
         """
         return (1, 1)
 
+    @property
+    def layout_cacheable(self) -> bool:
+        """Whether the layout engine may reuse this element's constraints.
+
+        Returns
+        -------
+        bool
+            True if the intrinsic size only changes through ``layout_attrs``
+            assignments or :meth:`invalidate_layout`
+        """
+        return self.layout_attrs is not None
+
+    def layout_key(self) -> Hashable:
+        """Return the value cached layout constraints are keyed on.
+
+        Override this to add inputs to ``get_intrinsic_size`` that are not
+        element attributes (e.g. a terminal capability that picks glyphs).
+
+        Returns
+        -------
+        Hashable
+            The element's layout generation by default
+        """
+        return self._layout_generation
+
+    def invalidate_layout(self) -> None:
+        """Discard cached layout constraints for this element.
+
+        Call this after changing state that ``get_intrinsic_size`` depends on
+        without assigning one of ``layout_attrs`` (e.g. mutating a list in
+        place). The next layout pass re-measures the element and its
+        ancestors pick up the new size.
+        """
+        self._layout_generation += 1
+
+    def invalidate_wiring(self) -> None:
+        """Make the app re-wire this element's callbacks on the next render.
+
+        Call this after changing configuration the wiring depends on without
+        assigning one of ``wiring_attrs``.
+        """
+        self._wiring_generation += 1
+
     @property
     def parent_frame(self) -> Any:
         """Get the parent Frame if this element is inside a scrollable frame.
@@ -1171,6 +1265,8 @@ class TextElement(Element):
         Horizontal alignment (``"left"``, ``"center"``, or ``"right"``).
     """
 
+    layout_attrs = frozenset({"text", "html"})
+
     def __init__(
         self,
         text: str,
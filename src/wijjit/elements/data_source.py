@@ -0,0 +1,515 @@
+"""Columnar data sources for Table and DataGrid.
+
+A :class:`DataSource` gives tabular elements random access to rows without
+converting the whole dataset to strings up front. Elements ask only for the
+rows they display, and the source formats those cells once and keeps them in
+a bounded row cache. Adapters wrap pandas DataFrames, NumPy arrays and Arrow
+tables in place; none of those libraries is imported by this module.
+
+Examples
+--------
+Pass a DataFrame straight to a grid; only visible rows are formatted:
+
+>>> grid = DataGrid(data=df)  # doctest: +SKIP
+
+Or wrap it explicitly to control formatting:
+
+>>> source = DataFrameSource(df, formatter=lambda v: f"{v:,}")  # doctest: +SKIP
+>>> table = Table(data=source)  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+
+# Formatted rows kept per source by default
+DEFAULT_CACHE_ROWS = 1024
+
+
+class DataSource(ABC):
+    """Read-only tabular data addressed by row and column index.
+
+    Subclasses implement :attr:`row_count`, :attr:`columns` and
+    :meth:`get_value`; overriding :meth:`_fetch_rows` and :meth:`argsort`
+    with batched/vectorized versions is optional.
+
+    Parameters
+    ----------
+    formatter : callable, optional
+        ``formatter(value) -> str`` used to display cells (default: ``str``)
+    cache_rows : int, optional
+        Number of formatted rows to cache (default: 1024)
+    """
+
+    def __init__(
+        self,
+        formatter: Callable[[Any], str] | None = None,
+        cache_rows: int = DEFAULT_CACHE_ROWS,
+    ) -> None:
+        self.formatter = formatter or str
+        self.cache_rows = max(0, cache_rows)
+        self._row_cache: OrderedDict[int, list[str]] = OrderedDict()
+        self._column_index: dict[str, int] | None = None
+
+    @property
+    @abstractmethod
+    def row_count(self) -> int:
+        """Number of rows."""
+
+    @property
+    @abstractmethod
+    def columns(self) -> list[str]:
+        """Column keys, in column order."""
+
+    @abstractmethod
+    def get_value(self, row: int, col: int) -> Any:
+        """Get the raw value of one cell.
+
+        Parameters
+        ----------
+        row : int
+            Row index (0-based)
+        col : int
+            Column index (0-based)
+
+        Returns
+        -------
+        Any
+            Unformatted cell value
+        """
+
+    def _fetch_rows(self, start: int, stop: int) -> list[Sequence[Any]]:
+        """Get the raw values of a contiguous range of rows.
+
+        Parameters
+        ----------
+        start : int
+            First row index
+        stop : int
+            Row index after the last row
+
+        Returns
+        -------
+        list of sequence
+            One sequence of raw values per row
+        """
+        ncols = len(self.columns)
+        return [
+            [self.get_value(row, col) for col in range(ncols)]
+            for row in range(start, stop)
+        ]
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def column_index(self, key: str) -> int | None:
+        """Look up a column by key.
+
+        Parameters
+        ----------
+        key : str
+            Column key
+
+        Returns
+        -------
+        int or None
+            Column index, or None if there is no such column
+        """
+        if self._column_index is None:
+            self._column_index = {}
+            for i, name in enumerate(self.columns):
+                self._column_index.setdefault(name, i)
+        return self._column_index.get(key)
+
+    def get_cell(self, row: int, col: int) -> str:
+        """Get the formatted value of one cell.
+
+        Parameters
+        ----------
+        row : int
+            Row index (0-based)
+        col : int
+            Column index (0-based)
+
+        Returns
+        -------
+        str
+            Formatted value
+        """
+        cached = self._row_cache.get(row)
+        if cached is not None:
+            return cached[col]
+        return self.formatter(self.get_value(row, col))
+
+    def get_rows(self, start: int, stop: int) -> list[list[str]]:
+        """Get formatted rows, fetching uncached ones in one batch.
+
+        Parameters
+        ----------
+        start : int
+            First row index
+        stop : int
+            Row index after the last row (clamped to :attr:`row_count`)
+
+        Returns
+        -------
+        list of list of str
+            Formatted cells per row; the lists are shared with the cache
+            and must not be modified
+        """
+        start = max(0, start)
+        stop = min(stop, self.row_count)
+        if start >= stop:
+            return []
+
+        cache = self._row_cache
+        missing = [row for row in range(start, stop) if row not in cache]
+        if missing:
+            fmt = self.formatter
+            first = missing[0]
+            fetched = self._fetch_rows(first, missing[-1] + 1)
+            for offset, values in enumerate(fetched):
+                cache[first + offset] = [fmt(value) for value in values]
+
+        rows = []
+        for row in range(start, stop):
+            cache.move_to_end(row)
+            rows.append(cache[row])
+
+        # Never evict the rows being returned
+        limit = max(self.cache_rows, stop - start)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+        return rows
+
+    def get_row(self, row: int) -> list[str]:
+        """Get one formatted row.
+
+        Parameters
+        ----------
+        row : int
+            Row index (0-based)
+
+        Returns
+        -------
+        list of str
+            Formatted cells (shared with the cache; do not modify)
+        """
+        rows = self.get_rows(row, row + 1)
+        return rows[0] if rows else []
+
+    def iter_rows(self, chunk_size: int = 4096) -> Iterator[list[str]]:
+        """Iterate over every formatted row without filling the cache.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Rows fetched per batch (default: 4096)
+
+        Yields
+        ------
+        list of str
+            Formatted cells of each row, in order
+        """
+        fmt = self.formatter
+        total = self.row_count
+        for start in range(0, total, chunk_size):
+            for values in self._fetch_rows(start, min(start + chunk_size, total)):
+                yield [fmt(value) for value in values]
+
+    def get_record(self, row: int) -> dict[str, Any]:
+        """Get one row as a dict of raw values keyed by column.
+
+        Parameters
+        ----------
+        row : int
+            Row index (0-based)
+
+        Returns
+        -------
+        dict
+            Column key to raw value
+        """
+        values = self._fetch_rows(row, row + 1)[0]
+        return dict(zip(self.columns, values, strict=False))
+
+    def argsort(self, col: int, descending: bool = False) -> list[int]:
+        """Get the row order that sorts the source by one column.
+
+        Values of mixed, unorderable types are compared as strings.
+
+        Parameters
+        ----------
+        col : int
+            Column index to sort by
+        descending : bool, optional
+            Sort in descending order (default: False)
+
+        Returns
+        -------
+        list of int
+            Row indices in sorted order
+        """
+        values = [self.get_value(row, col) for row in range(self.row_count)]
+        order = list(range(len(values)))
+        try:
+            order.sort(key=values.__getitem__, reverse=descending)
+        except TypeError:
+            order.sort(key=lambda row: str(values[row]), reverse=descending)
+        return order
+
+    def invalidate(self) -> None:
+        """Drop cached formatted rows after the underlying data changed."""
+        self._row_cache.clear()
+        self._column_index = None
+
+
+class _WrappedSource(DataSource):
+    """Base for adapters over a third-party container.
+
+    Two adapters compare equal when they wrap the same object, so re-rendering
+    a template with the same DataFrame does not count as a data change.
+
+    Parameters
+    ----------
+    data : Any
+        Wrapped container
+    formatter : callable, optional
+        Cell formatter (default: ``str``)
+    cache_rows : int, optional
+        Number of formatted rows to cache (default: 1024)
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        formatter: Callable[[Any], str] | None = None,
+        cache_rows: int = DEFAULT_CACHE_ROWS,
+    ) -> None:
+        super().__init__(formatter=formatter, cache_rows=cache_rows)
+        self.data = data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _WrappedSource) or type(other) is not type(self):
+            return NotImplemented
+        return other.data is self.data and other.formatter is self.formatter
+
+    def __hash__(self) -> int:
+        return hash((type(self), id(self.data)))
+
+
+class DataFrameSource(_WrappedSource):
+    """Data source over a pandas DataFrame.
+
+    Rows are read positionally with ``iloc`` slices, so the frame's index is
+    ignored and nothing is copied.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        Frame to display
+    formatter : callable, optional
+        Cell formatter (default: ``str``)
+    cache_rows : int, optional
+        Number of formatted rows to cache (default: 1024)
+    """
+
+    @property
+    def row_count(self) -> int:
+        return len(self.data.index)
+
+    @property
+    def columns(self) -> list[str]:
+        return [str(name) for name in self.data.columns]
+
+    def get_value(self, row: int, col: int) -> Any:
+        return self.data.iat[row, col]
+
+    def _fetch_rows(self, start: int, stop: int) -> list[Sequence[Any]]:
+        window = self.data.iloc[start:stop]
+        return list(window.itertuples(index=False, name=None))
+
+    def argsort(self, col: int, descending: bool = False) -> list[int]:
+        series = self.data.iloc[:, col].reset_index(drop=True)
+        try:
+            ordered = series.sort_values(ascending=not descending, kind="stable")
+        except TypeError:
+            ordered = series.astype(str).sort_values(
+                ascending=not descending, kind="stable"
+            )
+        order: list[int] = ordered.index.tolist()
+        return order
+
+
+class NumpySource(_WrappedSource):
+    """Data source over a NumPy structured array or 2-D array.
+
+    Structured arrays use their field names as columns; plain 2-D arrays use
+    the column numbers ("0", "1", ...).
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Structured 1-D array or 2-D array
+    formatter : callable, optional
+        Cell formatter (default: ``str``)
+    cache_rows : int, optional
+        Number of formatted rows to cache (default: 1024)
+    """
+
+    @property
+    def row_count(self) -> int:
+        return int(self.data.shape[0])
+
+    @property
+    def columns(self) -> list[str]:
+        names = self.data.dtype.names
+        if names is not None:
+            return list(names)
+        return [str(i) for i in range(self.data.shape[1])]
+
+    def get_value(self, row: int, col: int) -> Any:
+        names = self.data.dtype.names
+        if names is not None:
+            return self.data[row][names[col]].item()
+        return self.data[row, col].item()
+
+    def _fetch_rows(self, start: int, stop: int) -> list[Sequence[Any]]:
+        # tolist() converts to Python scalars: tuples for structured rows,
+        # lists for 2-D rows
+        rows: list[Sequence[Any]] = self.data[start:stop].tolist()
+        return rows
+
+    def argsort(self, col: int, descending: bool = False) -> list[int]:
+        names = self.data.dtype.names
+        column = self.data[names[col]] if names is not None else self.data[:, col]
+        order: list[int]
+        try:
+            if not descending:
+                order = column.argsort(kind="stable").tolist()
+            else:
+                # Sort the reversed column and map back, so equal values keep
+                # their original order when descending
+                last = len(column) - 1
+                order = (last - column[::-1].argsort(kind="stable"))[::-1].tolist()
+        except TypeError:
+            return super().argsort(col, descending)
+        return order
+
+
+class ArrowSource(_WrappedSource):
+    """Data source over a PyArrow ``Table`` (or ``RecordBatch``).
+
+    Visible rows are taken with zero-copy ``slice()`` and converted to Python
+    values column by column.
+
+    Parameters
+    ----------
+    data : pyarrow.Table or pyarrow.RecordBatch
+        Table to display
+    formatter : callable, optional
+        Cell formatter (default: ``str``)
+    cache_rows : int, optional
+        Number of formatted rows to cache (default: 1024)
+    """
+
+    @property
+    def row_count(self) -> int:
+        return int(self.data.num_rows)
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.data.column_names)
+
+    def get_value(self, row: int, col: int) -> Any:
+        return self.data.column(col)[row].as_py()
+
+    def _fetch_rows(self, start: int, stop: int) -> list[Sequence[Any]]:
+        window = self.data.slice(start, stop - start)
+        columns = [column.to_pylist() for column in window.columns]
+        return list(zip(*columns, strict=True)) if columns else []
+
+
+def _is_numpy_table(obj: Any) -> bool:
+    """Check for a NumPy array usable as a table, without importing NumPy.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to check
+
+    Returns
+    -------
+    bool
+        True for structured 1-D arrays and 2-D arrays
+    """
+    cls = type(obj)
+    if cls.__name__ != "ndarray" or not cls.__module__.startswith("numpy"):
+        return False
+    if obj.dtype.names is not None:
+        return bool(obj.ndim == 1)
+    return bool(obj.ndim == 2)
+
+
+def _is_arrow_table(obj: Any) -> bool:
+    """Check for a PyArrow Table or RecordBatch, without importing PyArrow.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to check
+
+    Returns
+    -------
+    bool
+        True if obj is a PyArrow Table or RecordBatch
+    """
+    cls = type(obj)
+    return cls.__name__ in ("Table", "RecordBatch") and cls.__module__.startswith(
+        "pyarrow"
+    )
+
+
+def _is_dataframe(obj: Any) -> bool:
+    """Check for a pandas DataFrame, without importing pandas.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to check
+
+    Returns
+    -------
+    bool
+        True if obj is a pandas DataFrame
+    """
+    return type(obj).__name__ == "DataFrame" and hasattr(obj, "iterrows")
+
+
+def as_data_source(data: Any) -> DataSource | None:
+    """Wrap a DataFrame, NumPy array or Arrow table in a data source.
+
+    Parameters
+    ----------
+    data : Any
+        Candidate data
+
+    Returns
+    -------
+    DataSource or None
+        ``data`` itself if it already is a DataSource, an adapter for
+        pandas/NumPy/Arrow containers, or None for anything else (lists are
+        left to the element's own handling)
+    """
+    if isinstance(data, DataSource):
+        return data
+    if _is_dataframe(data):
+        return DataFrameSource(data)
+    if _is_numpy_table(data):
+        return NumpySource(data)
+    if _is_arrow_table(data):
+        return ArrowSource(data)
+    return None
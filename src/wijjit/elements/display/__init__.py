@@ -1,32 +1,111 @@
 """Display UI elements for Wijjit applications.
 
 This module provides display-oriented elements like tables, lists, and charts.
+
+The re-exports are resolved lazily (PEP 562), like those of
+:mod:`wijjit.elements`, so importing one display module does not load the
+others. In particular :class:`ImageView`, whose module imports Pillow, is
+only loaded when it is used.
 """
 
-from wijjit.elements.display.barchart import BarChart
-from wijjit.elements.display.columnchart import ColumnChart
-from wijjit.elements.display.contentview import ContentType, ContentView
-from wijjit.elements.display.gauge import Gauge
-from wijjit.elements.display.heatmap import HeatMap
-from wijjit.elements.display.image import ImageView
-from wijjit.elements.display.linechart import LineChart
-from wijjit.elements.display.link import Link
-from wijjit.elements.display.list import ListView
-from wijjit.elements.display.logview import LogView
-from wijjit.elements.display.modal import ModalElement
-from wijjit.elements.display.notification import (
-    NotificationElement,
-    NotificationSeverity,
-)
-from wijjit.elements.display.pager import Page, Pager
-from wijjit.elements.display.progress import ProgressBar
-from wijjit.elements.display.sparkline import Sparkline
-from wijjit.elements.display.spinner import Spinner
-from wijjit.elements.display.status_indicator import StatusIndicator
-from wijjit.elements.display.statusbar import StatusBar
-from wijjit.elements.display.tabbed_panel import TabbedPanel, TabPosition
-from wijjit.elements.display.table import Table
-from wijjit.elements.display.tree import Tree, TreeIndicatorStyle
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wijjit.elements.display.barchart import BarChart
+    from wijjit.elements.display.columnchart import ColumnChart
+    from wijjit.elements.display.contentview import ContentType, ContentView
+    from wijjit.elements.display.gauge import Gauge
+    from wijjit.elements.display.heatmap import HeatMap
+    from wijjit.elements.display.image import ImageView
+    from wijjit.elements.display.linechart import LineChart
+    from wijjit.elements.display.link import Link
+    from wijjit.elements.display.list import ListView
+    from wijjit.elements.display.logview import LogView
+    from wijjit.elements.display.modal import ModalElement
+    from wijjit.elements.display.notification import (
+        NotificationElement,
+        NotificationSeverity,
+    )
+    from wijjit.elements.display.pager import Page, Pager
+    from wijjit.elements.display.progress import ProgressBar
+    from wijjit.elements.display.sparkline import Sparkline
+    from wijjit.elements.display.spinner import Spinner
+    from wijjit.elements.display.status_indicator import StatusIndicator
+    from wijjit.elements.display.statusbar import StatusBar
+    from wijjit.elements.display.tabbed_panel import TabbedPanel, TabPosition
+    from wijjit.elements.display.table import Table
+    from wijjit.elements.display.tree import Tree, TreeIndicatorStyle
+
+# Re-exported name -> module that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "BarChart": "wijjit.elements.display.barchart",
+    "ColumnChart": "wijjit.elements.display.columnchart",
+    "ContentType": "wijjit.elements.display.contentview",
+    "ContentView": "wijjit.elements.display.contentview",
+    "Gauge": "wijjit.elements.display.gauge",
+    "HeatMap": "wijjit.elements.display.heatmap",
+    "ImageView": "wijjit.elements.display.image",
+    "LineChart": "wijjit.elements.display.linechart",
+    "Link": "wijjit.elements.display.link",
+    "ListView": "wijjit.elements.display.list",
+    "LogView": "wijjit.elements.display.logview",
+    "ModalElement": "wijjit.elements.display.modal",
+    "NotificationElement": "wijjit.elements.display.notification",
+    "NotificationSeverity": "wijjit.elements.display.notification",
+    "Page": "wijjit.elements.display.pager",
+    "Pager": "wijjit.elements.display.pager",
+    "ProgressBar": "wijjit.elements.display.progress",
+    "Sparkline": "wijjit.elements.display.sparkline",
+    "Spinner": "wijjit.elements.display.spinner",
+    "StatusBar": "wijjit.elements.display.statusbar",
+    "StatusIndicator": "wijjit.elements.display.status_indicator",
+    "TabPosition": "wijjit.elements.display.tabbed_panel",
+    "TabbedPanel": "wijjit.elements.display.tabbed_panel",
+    "Table": "wijjit.elements.display.table",
+    "Tree": "wijjit.elements.display.tree",
+    "TreeIndicatorStyle": "wijjit.elements.display.tree",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name
+
+    Returns
+    -------
+    Any
+        The re-exported object
+
+    Raises
+    ------
+    AttributeError
+        If ``name`` is not re-exported
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported names.
+
+    Returns
+    -------
+    list of str
+        Attribute names
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "BarChart",
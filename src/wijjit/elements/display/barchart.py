@@ -6,14 +6,16 @@ horizontal bars with optional labels, values, and color gradients.
 
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING, Any, Literal
 
 from wijjit.elements.base import ElementType, ScrollableElement, invoke_callback
 from wijjit.elements.display.chart_utils import (
+    RingBuffer,
     extract_values,
     get_gradient_color,
     get_threshold_color,
-    normalize_data,
+    value_range,
 )
 from wijjit.layout.frames import (
     BORDER_THICKNESS,
@@ -70,14 +72,17 @@ class BarChart(ScrollableElement):
     border : str, optional
         Border style: "single", "double", "rounded", or "none"
         (default: "single")
+    capacity : int, optional
+        Keep at most this many bars in a :class:`RingBuffer`, evicting the
+        oldest on :meth:`append` (default: None, unbounded list)
 
     Attributes
     ----------
     data : list
         Raw data
-    values : list of float
+    values : list of float or RingBuffer
         Extracted numeric values
-    labels : list of str
+    labels : list of str or deque of str
         Extracted labels
     width : int
         Display width
@@ -106,6 +111,8 @@ class BarChart(ScrollableElement):
     >>> barchart = BarChart(data=[10, 50, 90], color="gradient")
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -124,14 +131,19 @@ class BarChart(ScrollableElement):
         show_scrollbar: bool = True,
         border: str = "single",
         tab_index: int | None = None,
+        capacity: int | None = None,
     ) -> None:
         super().__init__(id=id, classes=classes, tab_index=tab_index)
         self.element_type = ElementType.DISPLAY
         self.focusable = True  # For keyboard scrolling
 
         # Data
+        self.capacity = capacity
         self._raw_data = data or []
-        self.values, self.labels = extract_values(self._raw_data)
+        self.values: list[float] | RingBuffer = []
+        self.labels: list[str] | deque[str] = []
+        self._label_count = 0
+        self._store_values(self._raw_data)
 
         # Display properties
         self.width = width
@@ -147,6 +159,7 @@ class BarChart(ScrollableElement):
         self.border = border
 
         # Auto-calculate label width if not specified
+        self._auto_label_width = label_width is None
         if label_width is None and show_labels and self.labels:
             self.label_width = min(15, max(len(label) for label in self.labels) + 1)
         else:
@@ -200,7 +213,7 @@ class BarChart(ScrollableElement):
             New data values
         """
         self._raw_data = data
-        self.values, self.labels = extract_values(data)
+        self._store_values(data)
 
         # Recalculate label width
         if self.show_labels and self.labels:
@@ -210,6 +223,55 @@ class BarChart(ScrollableElement):
         content_height = len(self.values) * self.bar_height
         self.scroll_manager.update_content_size(content_height)
 
+    def _store_values(self, data: list[Any]) -> None:
+        """Extract values and labels, bounded by ``capacity`` if set.
+
+        Parameters
+        ----------
+        data : list
+            Raw data values
+        """
+        values, labels = extract_values(data)
+        self._label_count = len(labels)
+        if self.capacity is None:
+            self.values, self.labels = values, labels
+        else:
+            self.values = RingBuffer(self.capacity, values)
+            self.labels = deque(labels, maxlen=self.capacity)
+
+    def append(self, value: float, label: str | None = None) -> None:
+        """Append one bar to the end of the chart.
+
+        With a ``capacity``, the oldest bar is evicted once the buffer is
+        full. Appended bars are not reflected in :attr:`data`.
+
+        Parameters
+        ----------
+        value : float
+            Bar value
+        label : str, optional
+            Bar label (default: the bar's running index)
+        """
+        label = str(self._label_count) if label is None else str(label)
+        self._label_count += 1
+        self.values.append(float(value))
+        self.labels.append(label)
+
+        if self.show_labels and self._auto_label_width:
+            self.label_width = max(self.label_width, min(15, len(label) + 1))
+        self.scroll_manager.update_content_size(len(self.values) * self.bar_height)
+
+    def extend(self, values: list[float]) -> None:
+        """Append several unlabeled bars to the end of the chart.
+
+        Parameters
+        ----------
+        values : list of float
+            Bar values, oldest first
+        """
+        for value in values:
+            self.append(value)
+
     @property
     def scroll_position(self) -> int:
         """Get the current scroll position.
@@ -463,8 +525,9 @@ class BarChart(ScrollableElement):
 
         bar_width = max(1, bar_end_x - bar_start_x)
 
-        # Normalize data
-        normalized, min_val, max_val = normalize_data(self.values)
+        # Scale against the full data range; only visible bars are normalized
+        min_val, max_val = value_range(self.values)
+        value_span = max_val - min_val
 
         # Get visible range
         scroll_offset = self.scroll_manager.state.scroll_position
@@ -500,7 +563,7 @@ class BarChart(ScrollableElement):
                 break
 
             value = self.values[bar_idx]
-            norm_val = normalized[bar_idx]
+            norm_val = (value - min_val) / value_span if value_span else 0.5
             label = self.labels[bar_idx] if bar_idx < len(self.labels) else ""
 
             # Calculate bar fill width
@@ -5,11 +5,17 @@ This module provides common utilities for data visualization elements including:
 - Axis calculation and scaling
 - Color gradient helpers
 - Data normalization functions
+- Ring buffers and decimation for streaming data
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal
+import functools
+import importlib
+import itertools
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from wijjit.layout.frames import (
     BORDER_THICKNESS,
@@ -301,6 +307,41 @@ class BrailleCanvas:
         for fill_y in range(y, self.pixel_height):
             self.set_pixel(x, fill_y)
 
+    def set_pixels(self, points: Iterable[tuple[int, int]]) -> None:
+        """Set many pixels at once.
+
+        Parameters
+        ----------
+        points : iterable of (int, int)
+            Pixel coordinates; out-of-bounds points are ignored
+        """
+        for x, y in points:
+            self.set_pixel(x, y)
+
+    def draw_polyline(self, points: Sequence[tuple[int, int]]) -> None:
+        """Draw connected line segments through consecutive points.
+
+        Parameters
+        ----------
+        points : sequence of (int, int)
+            Vertices in drawing order; a single point is plotted as a dot
+        """
+        if len(points) == 1:
+            self.set_pixel(*points[0])
+        for (x0, y0), (x1, y1) in itertools.pairwise(points):
+            self.draw_line(x0, y0, x1, y1)
+
+    def fill_below_points(self, points: Iterable[tuple[int, int]]) -> None:
+        """Fill from each point down to the bottom of the canvas.
+
+        Parameters
+        ----------
+        points : iterable of (int, int)
+            Points whose columns are filled
+        """
+        for x, y in points:
+            self.fill_below(x, y)
+
     def to_lines(self) -> list[str]:
         """Convert the canvas to a list of braille character strings.
 
@@ -316,6 +357,228 @@ class BrailleCanvas:
         return lines
 
 
+@functools.cache
+def get_numpy() -> Any:
+    """Import NumPy on first use.
+
+    NumPy is optional; it is imported lazily so that charts which never
+    draw do not pay its import cost.
+
+    Returns
+    -------
+    module or None
+        The ``numpy`` module, or None when it is not installed
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def numpy_available() -> bool:
+    """Check whether the NumPy canvas backend can be used.
+
+    Returns
+    -------
+    bool
+        True if NumPy is importable
+    """
+    return get_numpy() is not None
+
+
+def pack_braille(mask: Any) -> list[str]:
+    """Pack a boolean pixel mask into braille lines in one pass.
+
+    Requires NumPy. Each 2x4 block of the mask becomes one braille
+    character; the mask is zero-padded to a multiple of the block size.
+
+    Parameters
+    ----------
+    mask : numpy.ndarray
+        2-D boolean array of shape ``(pixel_height, pixel_width)``
+
+    Returns
+    -------
+    list of str
+        One string per character row
+    """
+    np = get_numpy()
+    mask = np.asarray(mask, dtype=bool)
+    pixel_height, pixel_width = mask.shape
+    height = -(-pixel_height // 4)
+    width = -(-pixel_width // 2)
+    if (height * 4, width * 2) != mask.shape:
+        padded = np.zeros((height * 4, width * 2), dtype=bool)
+        padded[:pixel_height, :pixel_width] = mask
+        mask = padded
+    weights = np.zeros((4, 2), dtype=np.uint32)
+    for (dot_y, dot_x), bit in BRAILLE_DOTS.items():
+        weights[dot_y, dot_x] = bit
+    blocks = mask.reshape(height, 4, width, 2)
+    codes = (blocks * weights[None, :, None, :]).sum(axis=(1, 3), dtype=np.uint32)
+    codes += BRAILLE_BASE
+    # UTF-32 code units are the codepoints themselves, so a row decodes as-is
+    return [row.astype("<u4").tobytes().decode("utf-32-le") for row in codes]
+
+
+class NumpyBrailleCanvas(BrailleCanvas):
+    """BrailleCanvas backed by a NumPy pixel array.
+
+    Drawing whole polylines, fills and point sets is vectorized, and
+    :meth:`to_lines` packs 2x4 blocks into braille codepoints in one pass.
+    Segments set exactly the pixels :class:`BrailleCanvas` does. Use
+    :func:`create_braille_canvas` to get this backend when NumPy is
+    installed.
+
+    Parameters
+    ----------
+    width : int
+        Width in terminal characters
+    height : int
+        Height in terminal characters
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        np = get_numpy()
+        if np is None:
+            raise ImportError("NumpyBrailleCanvas requires numpy")
+        self._np = np
+        self.width = width
+        self.height = height
+        self.pixel_width = width * 2
+        self.pixel_height = height * 4
+        self._pixels = np.zeros((self.pixel_height, self.pixel_width), dtype=bool)
+
+    def clear(self) -> None:
+        """Clear the canvas."""
+        self._pixels[:] = False
+
+    def _in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.pixel_width and 0 <= y < self.pixel_height
+
+    def set_pixel(self, x: int, y: int) -> None:
+        """Set a pixel; out-of-bounds coordinates are ignored."""
+        if self._in_bounds(x, y):
+            self._pixels[y, x] = True
+
+    def unset_pixel(self, x: int, y: int) -> None:
+        """Unset a pixel; out-of-bounds coordinates are ignored."""
+        if self._in_bounds(x, y):
+            self._pixels[y, x] = False
+
+    def get_pixel(self, x: int, y: int) -> bool:
+        """Check if a pixel is set."""
+        return self._in_bounds(x, y) and bool(self._pixels[y, x])
+
+    def _set_arrays(self, xs: Any, ys: Any) -> None:
+        """Set the pixels at coordinate arrays, dropping out-of-bounds ones."""
+        keep = (xs >= 0) & (xs < self.pixel_width) & (ys >= 0)
+        keep &= ys < self.pixel_height
+        self._pixels[ys[keep], xs[keep]] = True
+
+    def set_pixels(self, points: Iterable[tuple[int, int]]) -> None:
+        """Set many pixels at once."""
+        pts = self._np.asarray(list(points), dtype=self._np.int64).reshape(-1, 2)
+        self._set_arrays(pts[:, 0], pts[:, 1])
+
+    def draw_line(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Draw a line between two points."""
+        self.draw_polyline([(x0, y0), (x1, y1)])
+
+    def draw_polyline(self, points: Sequence[tuple[int, int]]) -> None:
+        """Rasterize every segment of a polyline in one vectorized pass."""
+        np = self._np
+        pts = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        if len(pts) < 2:
+            self._set_arrays(pts[:, 0], pts[:, 1])
+            return
+        start = pts[:-1]
+        delta = pts[1:] - start
+        dist = np.abs(delta)
+        steps = dist.max(axis=1)
+        counts = steps + 1
+        segment = np.repeat(np.arange(len(steps)), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        # Closed form of draw_line's Bresenham loop: the major axis advances
+        # every pixel and the minor axis after floor((2*k*minor + major - 1)
+        # / (2*major)) pixels, which reproduces its tie-breaking exactly.
+        major = steps[segment]
+        minor = dist.min(axis=1)[segment]
+        m = (2 * k * minor + np.maximum(major - 1, 0)) // np.maximum(2 * major, 1)
+        x_major = (dist[:, 0] >= dist[:, 1])[segment]
+        sign = np.sign(delta)[segment]
+        xs = start[segment, 0] + sign[:, 0] * np.where(x_major, k, m)
+        ys = start[segment, 1] + sign[:, 1] * np.where(x_major, m, k)
+        self._set_arrays(xs, ys)
+
+    def fill_below(self, x: int, y: int) -> None:
+        """Fill all pixels below the given point to the bottom."""
+        if 0 <= x < self.pixel_width:
+            self._pixels[max(0, y) :, x] = True
+
+    def fill_below_points(self, points: Iterable[tuple[int, int]]) -> None:
+        """Fill below many points with one column-wise mask."""
+        np = self._np
+        pts = np.asarray(list(points), dtype=np.int64).reshape(-1, 2)
+        xs, ys = pts[:, 0], pts[:, 1]
+        keep = (xs >= 0) & (xs < self.pixel_width)
+        top = np.full(self.pixel_width, self.pixel_height, dtype=np.int64)
+        np.minimum.at(top, xs[keep], np.maximum(ys[keep], 0))
+        rows = np.arange(self.pixel_height)[:, None]
+        self._pixels |= rows >= top[None, :]
+
+    def set_mask(self, mask: Any) -> None:
+        """Set every pixel that is True in a boolean mask.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray
+            Boolean array of shape ``(pixel_height, pixel_width)``
+        """
+        self._pixels |= self._np.asarray(mask, dtype=bool)
+
+    def to_lines(self) -> list[str]:
+        """Convert the canvas to braille strings via :func:`pack_braille`."""
+        return pack_braille(self._pixels)
+
+
+def create_braille_canvas(
+    width: int,
+    height: int,
+    backend: Literal["auto", "numpy", "python"] = "auto",
+) -> BrailleCanvas:
+    """Create a braille canvas using the fastest available backend.
+
+    Parameters
+    ----------
+    width : int
+        Width in terminal characters
+    height : int
+        Height in terminal characters
+    backend : {"auto", "numpy", "python"}, optional
+        ``"auto"`` uses :class:`NumpyBrailleCanvas` when NumPy is installed
+        and :class:`BrailleCanvas` otherwise (default: "auto")
+
+    Returns
+    -------
+    BrailleCanvas
+        A canvas of the requested size
+
+    Raises
+    ------
+    ImportError
+        If ``backend="numpy"`` and NumPy is not installed
+    """
+    if backend == "numpy" or (backend == "auto" and numpy_available()):
+        return NumpyBrailleCanvas(width, height)
+    return BrailleCanvas(width, height)
+
+
 def normalize_data(
     data: list[float | int],
     min_val: float | None = None,
@@ -655,3 +918,422 @@ def extract_values(
             labels.append(str(i))
 
     return values, labels
+
+
+Decimation = Literal["minmax", "lttb", "none"]
+
+
+class RingBuffer(Sequence[float]):
+    """Fixed-capacity buffer of floats for streaming chart data.
+
+    Appending past ``capacity`` evicts the oldest value. Values live in a
+    circular array of physical slots indexed by a min/max segment tree, so
+    appends and range min/max queries cost O(log capacity) and the running
+    minimum/maximum of the whole buffer is available in O(1). This keeps a
+    streaming chart's per-frame work proportional to its width rather than
+    to the number of buffered points. It is a read-only sequence; slices
+    return lists.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of values retained
+    values : iterable of float, optional
+        Initial values (default: empty)
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of values retained
+
+    Raises
+    ------
+    ValueError
+        If ``capacity`` is less than 1
+
+    Examples
+    --------
+    >>> buf = RingBuffer(3, [1, 5, 2])
+    >>> buf.append(4)
+    >>> buf.to_list()
+    [5.0, 2.0, 4.0]
+    >>> buf.min(), buf.max()
+    (2.0, 5.0)
+    """
+
+    def __init__(self, capacity: int, values: Iterable[float] = ()) -> None:
+        if capacity < 1:
+            raise ValueError(f"RingBuffer capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        size = 1
+        while size < capacity:
+            size *= 2
+        self._size = size
+        # Segment trees over physical slots; unused slots hold neutral values
+        self._mins = [math.inf] * (2 * size)
+        self._maxs = [-math.inf] * (2 * size)
+        self._start = 0
+        self._len = 0
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[float]:
+        leaves = self._mins
+        size = self._size
+        capacity = self.capacity
+        for i in range(self._len):
+            yield leaves[size + (self._start + i) % capacity]
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[float]: ...
+
+    def __getitem__(self, index: int | slice) -> float | list[float]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RingBuffer index out of range")
+        return self._mins[self._size + (self._start + index) % self.capacity]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self.capacity}, len={self._len})"
+
+    def _update(self, slot: int) -> None:
+        """Recompute the tree nodes above a physical slot."""
+        mins = self._mins
+        maxs = self._maxs
+        i = (slot + self._size) // 2
+        while i:
+            left = 2 * i
+            mins[i] = min(mins[left], mins[left + 1])
+            maxs[i] = max(maxs[left], maxs[left + 1])
+            i //= 2
+
+    def _rebuild(self) -> None:
+        """Recompute every internal tree node from the leaves."""
+        mins = self._mins
+        maxs = self._maxs
+        for i in range(self._size - 1, 0, -1):
+            left = 2 * i
+            mins[i] = min(mins[left], mins[left + 1])
+            maxs[i] = max(maxs[left], maxs[left + 1])
+
+    def _write(self, value: float) -> int:
+        """Store a value in the next slot without updating the tree."""
+        if self._len < self.capacity:
+            slot = (self._start + self._len) % self.capacity
+            self._len += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+        leaf = self._size + slot
+        self._mins[leaf] = value
+        self._maxs[leaf] = value
+        return slot
+
+    def append(self, value: float) -> None:
+        """Append a value, evicting the oldest one when full.
+
+        Parameters
+        ----------
+        value : float
+            Value to append
+        """
+        self._update(self._write(float(value)))
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Append several values.
+
+        Large batches write the leaves first and rebuild the tree once.
+
+        Parameters
+        ----------
+        values : iterable of float
+            Values to append, oldest first
+        """
+        if not isinstance(values, Sequence):
+            values = list(values)
+        if len(values) > self.capacity:
+            values = values[-self.capacity :]
+        if len(values) * 4 < self.capacity:
+            for value in values:
+                self.append(value)
+            return
+        for value in values:
+            self._write(float(value))
+        self._rebuild()
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._mins = [math.inf] * (2 * self._size)
+        self._maxs = [-math.inf] * (2 * self._size)
+        self._start = 0
+        self._len = 0
+
+    def to_list(self) -> list[float]:
+        """Return the buffered values, oldest first.
+
+        Returns
+        -------
+        list of float
+            Copy of the buffer contents
+        """
+        return list(self)
+
+    def min(self) -> float:
+        """Return the smallest buffered value.
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty
+        """
+        if not self._len:
+            raise ValueError("min() of empty RingBuffer")
+        return self._mins[1]
+
+    def max(self) -> float:
+        """Return the largest buffered value.
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty
+        """
+        if not self._len:
+            raise ValueError("max() of empty RingBuffer")
+        return self._maxs[1]
+
+    def _query(self, lo: int, hi: int) -> tuple[float, float]:
+        """Min/max over physical slots ``[lo, hi)``."""
+        mins = self._mins
+        maxs = self._maxs
+        lo_val = math.inf
+        hi_val = -math.inf
+        lo += self._size
+        hi += self._size
+        while lo < hi:
+            if lo & 1:
+                lo_val = min(lo_val, mins[lo])
+                hi_val = max(hi_val, maxs[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                lo_val = min(lo_val, mins[hi])
+                hi_val = max(hi_val, maxs[hi])
+            lo //= 2
+            hi //= 2
+        return lo_val, hi_val
+
+    def range_minmax(self, start: int, stop: int) -> tuple[float, float]:
+        """Return the min and max of the logical range ``[start, stop)``.
+
+        Parameters
+        ----------
+        start : int
+            First logical index (0 is the oldest value)
+        stop : int
+            One past the last logical index
+
+        Returns
+        -------
+        tuple of (float, float)
+            ``(min, max)`` of the range
+
+        Raises
+        ------
+        ValueError
+            If the range is empty or out of bounds
+        """
+        if not 0 <= start < stop <= self._len:
+            raise ValueError(f"invalid RingBuffer range [{start}, {stop})")
+        lo = (self._start + start) % self.capacity
+        hi = lo + (stop - start)
+        if hi <= self.capacity:
+            return self._query(lo, hi)
+        # Range wraps around the end of the physical array
+        min_a, max_a = self._query(lo, self.capacity)
+        min_b, max_b = self._query(0, hi - self.capacity)
+        return min(min_a, min_b), max(max_a, max_b)
+
+
+def value_range(values: Sequence[float]) -> tuple[float, float]:
+    """Return the min and max of a non-empty series.
+
+    Uses the running extremes of a :class:`RingBuffer` instead of scanning.
+
+    Parameters
+    ----------
+    values : sequence of float
+        List or :class:`RingBuffer` of values
+
+    Returns
+    -------
+    tuple of (float, float)
+        ``(min, max)``
+    """
+    if isinstance(values, RingBuffer):
+        return values.min(), values.max()
+    return min(values), max(values)
+
+
+def decimate_minmax(
+    values: Sequence[float], buckets: int
+) -> list[tuple[float, float, float, float]]:
+    """Reduce a series to per-bucket first/min/max/last values.
+
+    The series is split into ``buckets`` contiguous, near-equal index ranges
+    (one per pixel column). Keeping each bucket's extremes preserves spikes
+    that plain subsampling would drop, and drawing first → min → max → last
+    keeps the line connected between columns.
+
+    Parameters
+    ----------
+    values : sequence of float
+        List or :class:`RingBuffer` with at least ``buckets`` values
+    buckets : int
+        Number of output buckets
+
+    Returns
+    -------
+    list of tuple
+        ``(first, min, max, last)`` per bucket
+    """
+    n = len(values)
+    buckets = max(1, min(buckets, n))
+    result = []
+    for b in range(buckets):
+        start = b * n // buckets
+        stop = (b + 1) * n // buckets
+        if isinstance(values, RingBuffer):
+            lo, hi = values.range_minmax(start, stop)
+        else:
+            chunk = values[start:stop]
+            lo, hi = min(chunk), max(chunk)
+        result.append((values[start], lo, hi, values[stop - 1]))
+    return result
+
+
+def lttb(values: Sequence[float], threshold: int) -> list[tuple[int, float]]:
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    LTTB keeps the first and last points and, for every bucket in between,
+    the point forming the largest triangle with the previously kept point
+    and the average of the next bucket. It preserves the visual shape of a
+    line better than uniform subsampling.
+
+    Parameters
+    ----------
+    values : sequence of float
+        Series values; x is the index
+    threshold : int
+        Number of points to keep
+
+    Returns
+    -------
+    list of tuple of (int, float)
+        Kept ``(index, value)`` pairs in index order
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(enumerate(values))
+
+    sampled = [(0, values[0])]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket (or the last point for the final bucket)
+        next_start = int((i + 1) * every) + 1
+        next_stop = min(int((i + 2) * every) + 1, n)
+        if next_start >= next_stop:
+            avg_x, avg_y = float(n - 1), values[n - 1]
+        else:
+            avg_x = (next_start + next_stop - 1) / 2
+            avg_y = sum(values[j] for j in range(next_start, next_stop)) / (
+                next_stop - next_start
+            )
+
+        start = int(i * every) + 1
+        stop = int((i + 1) * every) + 1
+        ax, ay = a, values[a]
+        best_area = -1.0
+        best = start
+        for j in range(start, stop):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        sampled.append((best, values[best]))
+        a = best
+
+    sampled.append((n - 1, values[n - 1]))
+    return sampled
+
+
+def plot_points(
+    values: Sequence[float],
+    pixel_width: int,
+    pixel_height: int,
+    min_val: float,
+    max_val: float,
+    decimation: Decimation = "minmax",
+) -> list[tuple[int, int]]:
+    """Map a series onto canvas pixel coordinates, decimating if dense.
+
+    Series with at most twice as many points as pixel columns are mapped
+    point by point. Denser series are reduced first so the returned list is
+    proportional to ``pixel_width``: ``"minmax"`` emits each column's
+    first/min/max/last values and ``"lttb"`` keeps ``pixel_width`` points
+    chosen by :func:`lttb`. ``"none"`` always maps every point.
+
+    Parameters
+    ----------
+    values : sequence of float
+        List or :class:`RingBuffer` of values
+    pixel_width : int
+        Canvas width in pixels
+    pixel_height : int
+        Canvas height in pixels
+    min_val : float
+        Value mapped to the bottom row
+    max_val : float
+        Value mapped to the top row
+    decimation : {"minmax", "lttb", "none"}, optional
+        Reduction strategy for dense series (default: "minmax")
+
+    Returns
+    -------
+    list of tuple of (int, int)
+        ``(x, y)`` pixel coordinates in drawing order
+    """
+    num_points = len(values)
+    if not num_points:
+        return []
+
+    value_span = max_val - min_val
+
+    def to_y(val: float) -> int:
+        normalized = (val - min_val) / value_span if value_span else 0.5
+        y = int((1 - normalized) * (pixel_height - 1))
+        return max(0, min(pixel_height - 1, y))
+
+    def to_x(i: int) -> int:
+        if num_points > 1:
+            return int((i / (num_points - 1)) * (pixel_width - 1))
+        return pixel_width // 2
+
+    dense = num_points > 2 * pixel_width > 0
+    if dense and decimation == "minmax":
+        points: list[tuple[int, int]] = []
+        for x, column in enumerate(decimate_minmax(values, pixel_width)):
+            points.extend((x, to_y(val)) for val in column)
+        return points
+    if dense and decimation == "lttb":
+        return [(to_x(i), to_y(val)) for i, val in lttb(values, pixel_width)]
+    return [(to_x(i), to_y(val)) for i, val in enumerate(values)]
@@ -97,6 +97,8 @@ class ColumnChart(Element):
     >>> chart = ColumnChart(data=[10, 50, 90], color="gradient")
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
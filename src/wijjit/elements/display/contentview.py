@@ -118,6 +118,8 @@ class ContentView(ScrollableElement):
         Cached rendered cells (for cell-based content types like HTML)
     """
 
+    layout_attrs = frozenset({"width", "height", "border_style"})
+
     def __init__(
         self,
         id: str | None = None,
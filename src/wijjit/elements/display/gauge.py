@@ -102,6 +102,8 @@ class Gauge(Element):
     ... ])
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -90,6 +90,8 @@ class HeatMap(Element):
     ... )
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
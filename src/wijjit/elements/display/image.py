@@ -1,16 +1,26 @@
 """Image display element for rendering images in the terminal.
 
 This module provides the ImageView element which converts images to ANSI
-colored characters for display in terminal user interfaces.
+colored characters for display in terminal user interfaces, and the shared
+:class:`ImageRenderCache` that decodes and resizes images off the UI thread.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Union
 
 from wijjit.elements.base import Element, ElementType
+from wijjit.elements.display.chart_utils import get_numpy, pack_braille
 from wijjit.logging_config import get_logger
 from wijjit.terminal.cell import Cell
 
@@ -33,6 +43,525 @@ except ImportError:
 # Type alias for image sources
 ImageSource = Union[str, bytes, "os.PathLike[str]", "Image.Image", None]
 
+# Rendered images are stored as rows of prebuilt cells, ready to blit
+CellRows = list[list[Cell]]
+
+# Maximum number of rendered (source, size, mode) entries kept process-wide
+IMAGE_CACHE_SIZE = 64
+
+# Worker threads used to decode and resize images
+IMAGE_CACHE_WORKERS = 2
+
+# Half-block character for color mode (upper half filled)
+HALF_BLOCK = "\u2580"
+
+# Braille base character (empty braille pattern)
+BRAILLE_BASE = 0x2800
+
+# Braille dot positions: (dx, dy, bit_index)
+# Each braille char represents 2x4 pixels
+BRAILLE_DOTS = [
+    (0, 0, 0),
+    (0, 1, 1),
+    (0, 2, 2),
+    (1, 0, 3),
+    (1, 1, 4),
+    (1, 2, 5),
+    (0, 3, 6),
+    (1, 3, 7),
+]
+
+
+def image_source_key(src: ImageSource) -> Hashable | None:
+    """Build a cache key identifying an image source.
+
+    Files are identified by absolute path, modification time and size, byte
+    strings by a digest of their content, and in-memory images by identity.
+
+    Parameters
+    ----------
+    src : ImageSource
+        Image source
+
+    Returns
+    -------
+    hashable or None
+        Key for :class:`ImageRenderCache`, or None for no source
+    """
+    if src is None:
+        return None
+    if isinstance(src, bytes):
+        return ("bytes", hashlib.blake2b(src, digest_size=16).digest())
+    if isinstance(src, (str, os.PathLike)):
+        path = os.path.abspath(os.fspath(src))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ("path", path, None, None)
+        return ("path", path, stat.st_mtime_ns, stat.st_size)
+    return ("image", id(src))
+
+
+def open_image(src: ImageSource) -> Any:
+    """Open an image source as a PIL image.
+
+    Files and byte strings are opened lazily (only the header is read until
+    pixels are needed). PIL images are returned as-is, without copying.
+
+    Parameters
+    ----------
+    src : ImageSource
+        Image source
+
+    Returns
+    -------
+    PIL.Image.Image or None
+        Opened image, or None for an unsupported source type
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read or decoded
+    """
+    if hasattr(src, "copy") and hasattr(src, "convert"):
+        return src
+    if isinstance(src, bytes):
+        return Image.open(BytesIO(src))
+    if isinstance(src, (str, os.PathLike)):
+        return Image.open(src)
+    return None
+
+
+def _box_resample() -> Any:
+    """Get the BOX resampling filter across Pillow versions."""
+    try:
+        return Image.Resampling.BOX
+    except AttributeError:
+        return Image.BOX  # type: ignore
+
+
+def otsu_threshold(img: Any) -> int:
+    """Calculate Otsu's threshold for binarization.
+
+    Parameters
+    ----------
+    img : PIL.Image.Image
+        Grayscale image
+
+    Returns
+    -------
+    int
+        Optimal threshold value (0-255)
+    """
+    # Build histogram
+    histogram = img.histogram()
+    total_pixels = img.width * img.height
+
+    if total_pixels == 0:
+        return 128
+
+    # Compute Otsu's threshold
+    sum_total = sum(i * histogram[i] for i in range(256))
+    sum_background = 0
+    weight_background = 0
+    max_variance = 0
+    threshold = 128
+
+    for i in range(256):
+        weight_background += histogram[i]
+        if weight_background == 0:
+            continue
+        weight_foreground = total_pixels - weight_background
+        if weight_foreground == 0:
+            break
+
+        sum_background += i * histogram[i]
+        mean_background = sum_background / weight_background
+        mean_foreground = (sum_total - sum_background) / weight_foreground
+
+        variance = (
+            weight_background
+            * weight_foreground
+            * (mean_background - mean_foreground) ** 2
+        )
+
+        if variance > max_variance:
+            max_variance = variance
+            threshold = i
+
+    return threshold
+
+
+def render_color_grid(
+    img: Any, cols: int, rows: int, background: tuple[int, int, int]
+) -> list[list[tuple[str, tuple, tuple]]]:
+    """Render an image as half-block characters with fg/bg colors.
+
+    Parameters
+    ----------
+    img : PIL.Image.Image
+        Source image
+    cols : int
+        Number of character columns
+    rows : int
+        Number of terminal rows
+    background : tuple of int
+        RGB color composited under transparent pixels
+
+    Returns
+    -------
+    list of list of tuple
+        2D grid of (char, fg_color, bg_color) tuples
+    """
+    # Convert to RGBA for transparency handling
+    img = img.convert("RGBA")
+
+    # Composite over background
+    bg = Image.new("RGBA", img.size, (*background, 255))
+    img = Image.alpha_composite(bg, img).convert("RGB")
+
+    # Resize: width = cols, height = rows * 2 (2 pixels per row)
+    target_size = (cols, rows * 2)
+    down = img.resize(target_size, _box_resample())
+    px = down.load()
+
+    cells = []
+    for y in range(rows):
+        row_cells = []
+        for x in range(cols):
+            top = px[x, 2 * y]  # Upper pixel -> fg
+            bottom = px[x, 2 * y + 1]  # Lower pixel -> bg
+            row_cells.append((HALF_BLOCK, top, bottom))
+        cells.append(row_cells)
+
+    return cells
+
+
+def render_braille_grid(
+    img: Any, cols: int, rows: int, invert: bool
+) -> list[list[tuple[str, tuple, None]]]:
+    """Render an image as braille characters (2x4 pixels per char).
+
+    Parameters
+    ----------
+    img : PIL.Image.Image
+        Source image
+    cols : int
+        Number of character columns
+    rows : int
+        Number of terminal rows
+    invert : bool
+        If True, dark pixels become dots instead of light ones
+
+    Returns
+    -------
+    list of list of tuple
+        2D grid of (char, fg_color, None) tuples
+    """
+    # Convert to grayscale
+    gray = img.convert("L")
+
+    # Apply Otsu's threshold
+    threshold = otsu_threshold(gray)
+
+    # Resize: width = cols * 2, height = rows * 4 (2x4 pixels per char)
+    target_size = (cols * 2, rows * 4)
+    down = gray.resize(target_size, _box_resample())
+
+    np = get_numpy()
+    if np is not None:
+        # Threshold and bit-pack the whole image in one vectorized pass
+        pixels = np.asarray(down)
+        mask = pixels <= threshold if invert else pixels > threshold
+        return [
+            [(char, (255, 255, 255), None) for char in line]
+            for line in pack_braille(mask)
+        ]
+
+    px = down.load()
+
+    cells = []
+    for y in range(rows):
+        row_cells = []
+        for x in range(cols):
+            pattern = 0
+            for dx, dy, bit in BRAILLE_DOTS:
+                px_x = x * 2 + dx
+                px_y = y * 4 + dy
+                # Check if pixel should be a dot
+                # Normal: white pixels (above threshold) become dots
+                # Invert: dark pixels (below threshold) become dots
+                pixel_value = px[px_x, px_y]
+                if invert:
+                    is_dot = pixel_value <= threshold
+                else:
+                    is_dot = pixel_value > threshold
+                if is_dot:
+                    pattern |= 1 << bit
+
+            char = chr(BRAILLE_BASE + pattern)
+            # Use white foreground for braille dots
+            row_cells.append((char, (255, 255, 255), None))
+        cells.append(row_cells)
+
+    return cells
+
+
+def render_image_cells(
+    src: ImageSource,
+    cols: int,
+    rows: int,
+    braille: bool = False,
+    invert: bool = False,
+    background: tuple[int, int, int] = (0, 0, 0),
+) -> CellRows:
+    """Decode, resize and convert an image source into rows of cells.
+
+    Safe to call from a worker thread: files and byte strings are decoded
+    into a fresh image object on every call.
+
+    Parameters
+    ----------
+    src : ImageSource
+        Image source
+    cols : int
+        Number of character columns
+    rows : int
+        Number of terminal rows
+    braille : bool, optional
+        Render braille instead of colored half blocks (default: False)
+    invert : bool, optional
+        Invert the braille threshold (default: False)
+    background : tuple of int, optional
+        RGB color under transparent pixels in color mode (default: black)
+
+    Returns
+    -------
+    list of list of Cell
+        Cell rows, or an empty list if the image could not be rendered
+    """
+    try:
+        img = open_image(src)
+        if img is None:
+            return []
+        if braille:
+            grid = render_braille_grid(img, cols, rows, invert)
+        else:
+            grid = render_color_grid(img, cols, rows, background)
+    except Exception as e:
+        logger.warning(f"Failed to render image: {e}")
+        return []
+    return [
+        [Cell(char=char, fg_color=fg, bg_color=bg) for char, fg, bg in row]
+        for row in grid
+    ]
+
+
+class ImageRenderCache:
+    """Process-wide LRU of rendered images, filled by a thread pool.
+
+    Entries are keyed on ``(source key, cols, rows, braille, invert,
+    background)`` and hold prebuilt :class:`Cell` rows, so every view showing
+    the same image at the same size shares one decode/resize and blits the
+    cells directly. While an asyncio loop is running, misses are rendered on
+    worker threads and the caller is notified when the entry is ready; with
+    no loop (tests, inline rendering) misses are rendered synchronously.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of cached renders (default: IMAGE_CACHE_SIZE)
+    max_workers : int, optional
+        Worker threads for decoding (default: IMAGE_CACHE_WORKERS)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = IMAGE_CACHE_SIZE,
+        max_workers: int = IMAGE_CACHE_WORKERS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self._entries: OrderedDict[Hashable, CellRows] = OrderedDict()
+        self._pending: dict[Hashable, list[Callable[[], None]]] = {}
+        self._tracked: set[int] = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CellRows | None:
+        """Return a cached render and mark it recently used.
+
+        Parameters
+        ----------
+        key : hashable
+            Render key
+
+        Returns
+        -------
+        list of list of Cell or None
+            Cached cell rows, or None on a miss
+        """
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is not None:
+                self._entries.move_to_end(key)
+            return rows
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Check whether a render for ``key`` is in progress.
+
+        Parameters
+        ----------
+        key : hashable
+            Render key
+
+        Returns
+        -------
+        bool
+            True if a worker is rendering this key
+        """
+        with self._lock:
+            return key in self._pending
+
+    def request(
+        self,
+        key: Hashable,
+        render: Callable[[], CellRows],
+        on_ready: Callable[[], None] | None = None,
+    ) -> CellRows | None:
+        """Get a render, starting it in the background on a miss.
+
+        Parameters
+        ----------
+        key : hashable
+            Render key
+        render : callable
+            Produces the cell rows; runs on a worker thread when a loop is
+            running
+        on_ready : callable, optional
+            Called (from the worker thread) once a background render is stored
+
+        Returns
+        -------
+        list of list of Cell or None
+            Cell rows, or None while a background render is in progress
+        """
+        rows = self.get(key)
+        if rows is not None:
+            return rows
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            rows = render()
+            self._store(key, rows)
+            return rows
+
+        with self._lock:
+            waiters = self._pending.get(key)
+            if waiters is None:
+                waiters = self._pending[key] = []
+                start = True
+            else:
+                start = False
+            if on_ready is not None:
+                waiters.append(on_ready)
+        if start:
+            future = self._get_executor().submit(render)
+            future.add_done_callback(partial(self._finish, key))
+        return None
+
+    def track_source(self, src: Any, source_key: Hashable) -> None:
+        """Drop renders of an in-memory image once it is garbage collected.
+
+        Identity keys could otherwise be reused by a new object at the same
+        address and serve a stale render.
+
+        Parameters
+        ----------
+        src : PIL.Image.Image
+            In-memory image
+        source_key : hashable
+            Key from :func:`image_source_key`
+        """
+        with self._lock:
+            if id(src) in self._tracked:
+                return
+            self._tracked.add(id(src))
+        try:
+            weakref.finalize(src, self._forget_source, source_key, id(src))
+        except TypeError:
+            with self._lock:
+                self._tracked.discard(id(src))
+
+    def _forget_source(self, source_key: Hashable, obj_id: int) -> None:
+        """Remove every render of a collected in-memory image."""
+        with self._lock:
+            self._tracked.discard(obj_id)
+            for key in [k for k in self._entries if k[0] == source_key]:
+                del self._entries[key]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="wijjit-image",
+                )
+            return self._executor
+
+    def _store(self, key: Hashable, rows: CellRows) -> None:
+        """Insert a render, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = rows
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _finish(self, key: Hashable, future: Future[CellRows]) -> None:
+        """Store a finished background render and notify waiters."""
+        try:
+            rows = future.result()
+        except Exception as e:
+            logger.warning(f"Image render failed: {e}")
+            rows = []
+        self._store(key, rows)
+        with self._lock:
+            waiters = self._pending.pop(key, [])
+        for callback in waiters:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Image ready callback failed: {e}")
+
+    def clear(self) -> None:
+        """Drop every cached render."""
+        with self._lock:
+            self._entries.clear()
+
+
+_image_cache = ImageRenderCache()
+
+
+def get_image_cache() -> ImageRenderCache:
+    """Get the process-wide image render cache.
+
+    Returns
+    -------
+    ImageRenderCache
+        Cache shared by every :class:`ImageView`
+    """
+    return _image_cache
+
+
+def clear_image_cache() -> None:
+    """Drop every render in the process-wide image cache."""
+    _image_cache.clear()
+
 
 class ImageView(Element):
     """Element for displaying images in the terminal.
@@ -48,6 +577,11 @@ class ImageView(Element):
       then renders using braille characters (U+2800-U+28FF) for 2x4
       pixel resolution per character.
 
+    Rendered cells are shared through the process-wide
+    :class:`ImageRenderCache`. While the app is running, decoding and
+    resizing happen on worker threads and a "Loading" placeholder is shown
+    until the image is ready.
+
     Parameters
     ----------
     id : str, optional
@@ -86,24 +620,9 @@ class ImageView(Element):
         Background color for transparency
     """
 
-    # Half-block character for color mode (upper half filled)
-    HALF_BLOCK = "\u2580"
-
-    # Braille base character (empty braille pattern)
-    BRAILLE_BASE = 0x2800
-
-    # Braille dot positions: (dx, dy, bit_index)
-    # Each braille char represents 2x4 pixels
-    BRAILLE_DOTS = [
-        (0, 0, 0),
-        (0, 1, 1),
-        (0, 2, 2),
-        (1, 0, 3),
-        (1, 1, 4),
-        (1, 2, 5),
-        (0, 3, 6),
-        (1, 3, 7),
-    ]
+    HALF_BLOCK = HALF_BLOCK
+    BRAILLE_BASE = BRAILLE_BASE
+    BRAILLE_DOTS = BRAILLE_DOTS
 
     def __init__(
         self,
@@ -133,8 +652,12 @@ class ImageView(Element):
 
         # Cache
         self._cached_image: Any = None  # PIL.Image.Image
-        self._cached_render: list[list[tuple[str, tuple, tuple | None]]] | None = None
-        self._last_render_size: tuple[int, int] | None = None
+        self._cached_render: CellRows | None = None
+        self._last_render_size: tuple[Any, ...] | None = None
+        self._source_key: Hashable | None = None
+
+        # Called when a background render finishes (wired by the app)
+        self._request_render: Callable[[], None] | None = None
 
         if not PIL_AVAILABLE and src is not None:
             logger.warning(
@@ -145,6 +668,10 @@ class ImageView(Element):
     def _load_image(self) -> Any:
         """Load image from source with error handling.
 
+        Files and bytes are opened lazily, so only the header (and thus the
+        size) is read here; pixels are decoded by the render cache. PIL
+        images are used as-is.
+
         Returns
         -------
         PIL.Image.Image or None
@@ -160,17 +687,9 @@ class ImageView(Element):
             return None
 
         try:
-            if hasattr(self.src, "copy") and hasattr(self.src, "convert"):
-                # It's a PIL Image
-                self._cached_image = self.src.copy()
-            elif isinstance(self.src, bytes):
-                self._cached_image = Image.open(BytesIO(self.src))
-            elif isinstance(self.src, (str, os.PathLike)):
-                self._cached_image = Image.open(self.src)
-            else:
+            self._cached_image = open_image(self.src)
+            if self._cached_image is None:
                 logger.warning(f"Unsupported image source type: {type(self.src)}")
-                return None
-
             return self._cached_image
 
         except FileNotFoundError:
@@ -277,43 +796,7 @@ class ImageView(Element):
         int
             Optimal threshold value (0-255)
         """
-        # Build histogram
-        histogram = img.histogram()
-        total_pixels = img.width * img.height
-
-        if total_pixels == 0:
-            return 128
-
-        # Compute Otsu's threshold
-        sum_total = sum(i * histogram[i] for i in range(256))
-        sum_background = 0
-        weight_background = 0
-        max_variance = 0
-        threshold = 128
-
-        for i in range(256):
-            weight_background += histogram[i]
-            if weight_background == 0:
-                continue
-            weight_foreground = total_pixels - weight_background
-            if weight_foreground == 0:
-                break
-
-            sum_background += i * histogram[i]
-            mean_background = sum_background / weight_background
-            mean_foreground = (sum_total - sum_background) / weight_foreground
-
-            variance = (
-                weight_background
-                * weight_foreground
-                * (mean_background - mean_foreground) ** 2
-            )
-
-            if variance > max_variance:
-                max_variance = variance
-                threshold = i
-
-        return threshold
+        return otsu_threshold(img)
 
     def _render_color_mode(
         self, cols: int, rows: int
@@ -335,35 +818,7 @@ class ImageView(Element):
         img = self._load_image()
         if img is None:
             return []
-
-        # Convert to RGBA for transparency handling
-        img = img.convert("RGBA")
-
-        # Composite over background
-        bg = Image.new("RGBA", img.size, (*self.background, 255))
-        img = Image.alpha_composite(bg, img).convert("RGB")
-
-        # Choose resampling method
-        try:
-            resample = Image.Resampling.BOX
-        except AttributeError:
-            resample = Image.BOX  # type: ignore
-
-        # Resize: width = cols, height = rows * 2 (2 pixels per row)
-        target_size = (cols, rows * 2)
-        down = img.resize(target_size, resample)
-        px = down.load()
-
-        cells = []
-        for y in range(rows):
-            row_cells = []
-            for x in range(cols):
-                top = px[x, 2 * y]  # Upper pixel -> fg
-                bottom = px[x, 2 * y + 1]  # Lower pixel -> bg
-                row_cells.append((self.HALF_BLOCK, top, bottom))
-            cells.append(row_cells)
-
-        return cells
+        return render_color_grid(img, cols, rows, self.background)
 
     def _render_braille_mode(
         self, cols: int, rows: int
@@ -385,49 +840,7 @@ class ImageView(Element):
         img = self._load_image()
         if img is None:
             return []
-
-        # Convert to grayscale
-        gray = img.convert("L")
-
-        # Apply Otsu's threshold
-        threshold = self._otsu_threshold(gray)
-
-        # Choose resampling method
-        try:
-            resample = Image.Resampling.BOX
-        except AttributeError:
-            resample = Image.BOX  # type: ignore
-
-        # Resize: width = cols * 2, height = rows * 4 (2x4 pixels per char)
-        target_size = (cols * 2, rows * 4)
-        down = gray.resize(target_size, resample)
-        px = down.load()
-
-        cells = []
-        for y in range(rows):
-            row_cells = []
-            for x in range(cols):
-                pattern = 0
-                for dx, dy, bit in self.BRAILLE_DOTS:
-                    px_x = x * 2 + dx
-                    px_y = y * 4 + dy
-                    # Check if pixel should be a dot
-                    # Normal: white pixels (above threshold) become dots
-                    # Invert: dark pixels (below threshold) become dots
-                    pixel_value = px[px_x, px_y]
-                    if self.invert:
-                        is_dot = pixel_value <= threshold
-                    else:
-                        is_dot = pixel_value > threshold
-                    if is_dot:
-                        pattern |= 1 << bit
-
-                char = chr(self.BRAILLE_BASE + pattern)
-                # Use white foreground for braille dots
-                row_cells.append((char, (255, 255, 255), None))
-            cells.append(row_cells)
-
-        return cells
+        return render_braille_grid(img, cols, rows, self.invert)
 
     def _render_placeholder(self, ctx: PaintContext, message: str) -> None:
         """Render a placeholder when image cannot be displayed.
@@ -549,30 +962,74 @@ class ImageView(Element):
         width = min(width, ctx.bounds.width)
         height = min(height, ctx.bounds.height)
 
-        # Check cache
-        render_size = (width, height, self.braille, self.invert)
-        if self._cached_render is not None and self._last_render_size == render_size:
+        # Reuse this view's last render, else ask the shared cache
+        render_key = self._render_key(width, height)
+        if self._cached_render is not None and self._last_render_size == render_key:
             cells = self._cached_render
         else:
-            # Render image to cells
-            if self.braille:
-                cells = self._render_braille_mode(width, height)
-            else:
-                cells = self._render_color_mode(width, height)
+            cells = get_image_cache().request(
+                render_key,
+                partial(
+                    render_image_cells,
+                    self.src,
+                    width,
+                    height,
+                    self.braille,
+                    self.invert,
+                    self.background,
+                ),
+                on_ready=self._request_render,
+            )
+            if cells is None:
+                self._render_placeholder(ctx, "Loading")
+                return
             self._cached_render = cells
-            self._last_render_size = render_size
+            self._last_render_size = render_key
 
         if not cells:
             self._render_placeholder(ctx, "Render failed")
             return
 
-        # Write cells to paint context
-        for y, row in enumerate(cells):
-            for x, (char, fg, bg) in enumerate(row):
-                if x < ctx.bounds.width and y < ctx.bounds.height:
-                    # Write cell with true color
-                    cell = Cell(char=char, fg_color=fg, bg_color=bg)
-                    ctx.write_cell(x, y, cell)
+        # Blit prebuilt cell rows, clipped to the bounds and clip region
+        clip = ctx.clip_region
+        x0 = max(ctx.bounds.x, clip.x)
+        x1 = min(ctx.bounds.x + ctx.bounds.width, clip.x + clip.width)
+        for y, row in enumerate(cells[: ctx.bounds.height]):
+            abs_y = ctx.bounds.y + y
+            if not clip.y <= abs_y < clip.y + clip.height:
+                continue
+            start = x0 - ctx.bounds.x
+            stop = min(len(row), x1 - ctx.bounds.x)
+            if start < stop:
+                ctx.buffer.set_cells_horizontal(x0, abs_y, row[start:stop])
+
+    def _render_key(self, width: int, height: int) -> tuple[Any, ...]:
+        """Build the shared cache key for rendering at a size.
+
+        Parameters
+        ----------
+        width : int
+            Render width in columns
+        height : int
+            Render height in rows
+
+        Returns
+        -------
+        tuple
+            Key identifying source, size and rendering mode
+        """
+        if self._source_key is None:
+            self._source_key = image_source_key(self.src)
+            if self._source_key is not None and self._source_key[0] == "image":
+                get_image_cache().track_source(self.src, self._source_key)
+        return (
+            self._source_key,
+            width,
+            height,
+            self.braille,
+            self.invert,
+            tuple(self.background),
+        )
 
     def set_src(self, src: ImageSource) -> None:
         """Update image source and invalidate cache.
@@ -587,9 +1044,16 @@ class ImageView(Element):
             self._cached_image = None
             self._cached_render = None
             self._last_render_size = None
+            self._source_key = None
 
     def invalidate_cache(self) -> None:
-        """Force cache invalidation for next render."""
+        """Force cache invalidation for next render.
+
+        The source is re-identified, so an edited file (new mtime) or a
+        mutated in-memory image is rendered again. Renders of the old
+        content stay in the shared cache until evicted.
+        """
         self._cached_image = None
         self._cached_render = None
         self._last_render_size = None
+        self._source_key = None
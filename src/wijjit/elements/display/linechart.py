@@ -6,15 +6,21 @@ using braille characters for high-resolution rendering.
 
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING, Any, Literal
 
 from wijjit.elements.base import Element, ElementType
 from wijjit.elements.display.chart_utils import (
     BrailleCanvas,
+    Decimation,
+    RingBuffer,
     begin_chart_border,
     calculate_axis_ticks,
+    create_braille_canvas,
     extract_values,
     format_axis_value,
+    plot_points,
+    value_range,
 )
 
 if TYPE_CHECKING:
@@ -60,12 +66,18 @@ class LineChart(Element):
         Border style drawn within the chart's dimensions: "single",
         "double", "rounded", "heavy", "ascii", or "none" (default: "single").
         When a visible border is present, all content is inset one cell.
+    capacity : int, optional
+        Keep at most this many values per series in a :class:`RingBuffer`,
+        evicting the oldest on :meth:`append` (default: None, unbounded)
+    decimation : str, optional
+        How series denser than the canvas are reduced before drawing:
+        "minmax", "lttb", or "none" (default: "minmax")
 
     Attributes
     ----------
     data : list or dict
         Raw data
-    series : dict of list
+    series : dict of list or RingBuffer
         Normalized series data {name: [values]}
     width : int
         Display width
@@ -88,8 +100,15 @@ class LineChart(Element):
     ...     "Sales": [10, 20, 30],
     ...     "Costs": [5, 10, 15]
     ... })
+
+    Streaming into a bounded window:
+
+    >>> chart = LineChart(capacity=10_000)
+    >>> chart.append(3.5)
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -106,6 +125,8 @@ class LineChart(Element):
         color: str | None = None,
         series_colors: dict[str, str] | None = None,
         border: str = "single",
+        capacity: int | None = None,
+        decimation: Decimation = "minmax",
     ) -> None:
         super().__init__(id=id, classes=classes)
         self.element_type = ElementType.DISPLAY
@@ -123,11 +144,16 @@ class LineChart(Element):
         self.color = color
         self.series_colors = series_colors or {}
         self.border = border
+        self.capacity = capacity
+        self.decimation = decimation
 
         # Parse data into series format
         self._raw_data = data
-        self.series: dict[str, list[float]] = {}
-        self.labels: list[str] = []
+        self.series: dict[str, list[float] | RingBuffer] = {}
+        self.labels: list[str] | deque[str] = []
+        # Number of values ever added to the first series; names the labels
+        # of appended points that have no explicit label
+        self._label_count = 0
         self._parse_data(data)
 
         # Template metadata
@@ -165,23 +191,115 @@ class LineChart(Element):
             Input data in various formats
         """
         self.series = {}
-        self.labels = []
-
-        if data is None:
-            return
+        labels: list[str] = []
 
         if isinstance(data, dict):
             # Multi-series format: {name: [values]}
             for name, series_data in data.items():
-                values, labels = extract_values(series_data)
-                self.series[str(name)] = values
-                if not self.labels and labels:
-                    self.labels = labels
-        else:
+                values, series_labels = extract_values(series_data)
+                self.series[str(name)] = self._make_series(values)
+                if not labels and series_labels:
+                    labels = series_labels
+        elif data is not None:
             # Single series
             values, labels = extract_values(data)
-            self.series["data"] = values
+            self.series["data"] = self._make_series(values)
+
+        self._label_count = len(labels)
+        if self.capacity is None:
             self.labels = labels
+        else:
+            self.labels = deque(labels, maxlen=self.capacity)
+
+    def _make_series(self, values: list[float]) -> list[float] | RingBuffer:
+        """Wrap series values in a ring buffer when a capacity is set.
+
+        Parameters
+        ----------
+        values : list of float
+            Series values
+
+        Returns
+        -------
+        list of float or RingBuffer
+            Storage for the series
+        """
+        if self.capacity is None:
+            return values
+        return RingBuffer(self.capacity, values)
+
+    def append(
+        self, value: float, series: str | None = None, label: str | None = None
+    ) -> None:
+        """Append one value to the end of a series.
+
+        With a ``capacity``, the oldest value of the series is evicted once
+        its buffer is full. Appended values are not reflected in
+        :attr:`data`.
+
+        Parameters
+        ----------
+        value : float
+            Value to append
+        series : str, optional
+            Series name; created if missing (default: the first series, or
+            "data" when the chart is empty)
+        label : str, optional
+            X-axis label for the point when appending to the first series
+            (default: the point's running index)
+        """
+        name = self._series_name(series)
+        self.series[name].append(float(value))
+        if name == next(iter(self.series)):
+            self._append_label(label)
+
+    def extend(self, values: list[float], series: str | None = None) -> None:
+        """Append several values to the end of a series.
+
+        Parameters
+        ----------
+        values : list of float
+            Values to append, oldest first
+        series : str, optional
+            Series name, as for :meth:`append`
+        """
+        name = self._series_name(series)
+        values = [float(v) for v in values]
+        self.series[name].extend(values)
+        if name == next(iter(self.series)):
+            start = self._label_count
+            self._label_count += len(values)
+            self.labels.extend(str(i) for i in range(start, self._label_count))
+
+    def _series_name(self, series: str | None) -> str:
+        """Resolve (and create if needed) the series targeted by an append.
+
+        Parameters
+        ----------
+        series : str or None
+            Requested series name
+
+        Returns
+        -------
+        str
+            Name of an existing series
+        """
+        if series is None:
+            series = next(iter(self.series), "data")
+        if series not in self.series:
+            self.series[series] = self._make_series([])
+        return series
+
+    def _append_label(self, label: str | None) -> None:
+        """Record the x-axis label of a point appended to the first series.
+
+        Parameters
+        ----------
+        label : str or None
+            Explicit label, or None to use the running index
+        """
+        self.labels.append(str(self._label_count) if label is None else str(label))
+        self._label_count += 1
 
     def set_data(self, data: list[Any] | dict[str, list[Any]]) -> None:
         """Update chart data.
@@ -212,15 +330,30 @@ class LineChart(Element):
         list of float
             All values
         """
-        all_values = []
+        all_values: list[float] = []
         for values in self.series.values():
             all_values.extend(values)
         return all_values
 
+    def _value_range(self) -> tuple[float, float] | None:
+        """Get the value range across all series for scaling.
+
+        Ring-buffered series contribute their running min/max without a scan.
+
+        Returns
+        -------
+        tuple of (float, float) or None
+            ``(min, max)``, or None when every series is empty
+        """
+        ranges = [value_range(values) for values in self.series.values() if values]
+        if not ranges:
+            return None
+        return min(lo for lo, _ in ranges), max(hi for _, hi in ranges)
+
     def _render_series(
         self,
         canvas: BrailleCanvas,
-        values: list[float],
+        values: list[float] | RingBuffer,
         min_val: float,
         max_val: float,
         fill: bool = False,
@@ -231,7 +364,7 @@ class LineChart(Element):
         ----------
         canvas : BrailleCanvas
             Target canvas
-        values : list of float
+        values : list of float or RingBuffer
             Series values
         min_val : float
             Minimum value for scaling
@@ -243,60 +376,36 @@ class LineChart(Element):
         if not values:
             return
 
-        num_points = len(values)
-        pixel_width = canvas.pixel_width
-        pixel_height = canvas.pixel_height
-
-        # Map values to pixel coordinates
-        points = []
-        for i, val in enumerate(values):
-            # X position
-            if num_points > 1:
-                x = int((i / (num_points - 1)) * (pixel_width - 1))
-            else:
-                x = pixel_width // 2
-
-            # Y position (inverted, higher values at top)
-            if max_val != min_val:
-                normalized = (val - min_val) / (max_val - min_val)
-            else:
-                normalized = 0.5
-            y = int((1 - normalized) * (pixel_height - 1))
-            y = max(0, min(pixel_height - 1, y))
-
-            points.append((x, y))
-
-        # Draw based on style
+        # Map values (decimated when dense) to pixel coordinates
+        points = plot_points(
+            values,
+            canvas.pixel_width,
+            canvas.pixel_height,
+            min_val,
+            max_val,
+            self.decimation,
+        )
+
+        # Draw based on style (whole point sets at once so a vectorized
+        # canvas can rasterize them in bulk)
         if self.style == "dots":
-            # Just plot points
-            for x, y in points:
-                canvas.set_pixel(x, y)
-                # Make points more visible
-                if x > 0:
-                    canvas.set_pixel(x - 1, y)
-                if x < pixel_width - 1:
-                    canvas.set_pixel(x + 1, y)
+            # Plot points, widened horizontally to be more visible
+            canvas.set_pixels((x + dx, y) for x, y in points for dx in (-1, 0, 1))
         else:
-            # Draw lines between points
-            for i in range(len(points) - 1):
-                x0, y0 = points[i]
-                x1, y1 = points[i + 1]
-                canvas.draw_line(x0, y0, x1, y1)
+            canvas.draw_polyline(points)
 
             # Fill area below if area style
             if fill:
-                for x, y in points:
-                    canvas.fill_below(x, y)
+                canvas.fill_below_points(points)
 
-        # Highlight points if requested
+        # Highlight points if requested with a small square at each point
         if self.show_points:
-            for x, y in points:
-                # Create a small cross at each point
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        px, py = x + dx, y + dy
-                        if 0 <= px < pixel_width and 0 <= py < pixel_height:
-                            canvas.set_pixel(px, py)
+            canvas.set_pixels(
+                (x + dx, y + dy)
+                for x, y in points
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+            )
 
     def render_to(self, ctx: PaintContext) -> None:
         """Render the line chart using cell-based rendering.
@@ -320,8 +429,8 @@ class LineChart(Element):
         from wijjit.terminal.ansi import supports_unicode
         from wijjit.terminal.cell import Cell
 
-        all_values = self._get_all_values()
-        if not all_values:
+        data_range = self._value_range()
+        if data_range is None:
             empty_style = ctx.style_resolver.resolve_style(self, "linechart")
             ctx.write_text(0, 0, "No data", empty_style)
             return
@@ -351,8 +460,7 @@ class LineChart(Element):
             return
 
         # Get data range
-        min_val = min(all_values)
-        max_val = max(all_values)
+        min_val, max_val = data_range
 
         # Add some padding to range
         if min_val == max_val:
@@ -360,7 +468,7 @@ class LineChart(Element):
             max_val += 1
 
         # Create braille canvas for chart area
-        canvas = BrailleCanvas(chart_width, chart_height)
+        canvas = create_braille_canvas(chart_width, chart_height)
 
         # Render each series
         fill = self.style == "area"
@@ -65,6 +65,8 @@ class Link(Element):
     >>> link = Link("Danger!", action="delete", classes="text-danger")
     """
 
+    layout_attrs = frozenset({"text"})
+
     def __init__(
         self,
         text: str,
@@ -5,6 +5,8 @@ bullet styles, numbers, or detailed items with descriptions. Supports scrolling,
 borders, dividers, and keyboard/mouse interaction.
 """
 
+from bisect import bisect_left
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 from wijjit.elements.base import ElementType, ScrollableElement, invoke_callback
@@ -14,9 +16,14 @@ from wijjit.terminal.input import Key, Keys
 from wijjit.terminal.mouse import MouseButton, MouseEvent
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from wijjit.rendering.paint_context import PaintContext
     from wijjit.styling.style import Style
 
+# Number of items whose rendered lines are kept between frames
+ITEM_CACHE_SIZE = 1024
+
 
 class ListView(ScrollableElement):
     """ListView element for displaying lists with bullets, numbers, or details.
@@ -81,7 +88,7 @@ class ListView(ScrollableElement):
     scroll_manager : ScrollManager
         Manages scrolling of content
     rendered_lines : list of str
-        Cached rendered content lines
+        All content lines, built on access
 
     Notes
     -----
@@ -93,6 +100,11 @@ class ListView(ScrollableElement):
     Details can be multi-line (separated by newlines) and will be
     indented and optionally dimmed.
 
+    Only the rows inside the viewport are rendered. Item heights come from an
+    index over the items that have details, so showing, scrolling or
+    replacing a list of 100k plain items costs about the same as a short one.
+    The rendered lines of recently shown items are cached.
+
     Examples
     --------
     Simple bulleted list:
@@ -131,7 +143,6 @@ class ListView(ScrollableElement):
 
         # Content and display properties
         self._raw_items = items or []
-        self._items = self._normalize_items(self._raw_items)
         self.width = width
         self.height = height
         self.bullet = bullet
@@ -142,15 +153,19 @@ class ListView(ScrollableElement):
         self.indent_details = indent_details
         self.dim_details = dim_details
 
-        # Rendered content cache
-        self.rendered_lines: list[str] = []
-
-        # Render initial content
-        self._render_content()
+        # Normalized items, built when the items property is read
+        self._items: list[dict[str, Any]] | None = None
+        # Ids of items with details and the running total of their lines
+        self._detail_ids: list[int] = []
+        self._detail_lines: list[int] = []
+        # Rendered (kind, text) lines per item, valid for _line_cache_key
+        self._line_cache: OrderedDict[int, list[tuple[str, str]]] = OrderedDict()
+        self._line_cache_key: tuple[Any, ...] | None = None
+        self._index_items()
 
         # Scroll management
         self.scroll_manager = ScrollManager(
-            content_size=len(self.rendered_lines),
+            content_size=self._count_lines(),
             viewport_size=self._get_content_height(),
         )
 
@@ -224,28 +239,35 @@ class ListView(ScrollableElement):
         - 2-tuples: [("Label", "Details"), ...]
         - Dicts: [{"label": "Label", "details": "Details"}, ...]
         """
-        normalized = []
-        for item in items:
-            if isinstance(item, dict):
-                # Dict format
-                normalized.append(
-                    {
-                        "label": str(item.get("label", "")),
-                        "details": (
-                            str(item.get("details", ""))
-                            if item.get("details")
-                            else None
-                        ),
-                    }
-                )
-            elif isinstance(item, tuple) and len(item) == 2:
-                # 2-tuple format
-                normalized.append({"label": str(item[0]), "details": str(item[1])})
-            else:
-                # String or other format - use as label
-                normalized.append({"label": str(item), "details": None})
+        return [self._normalize_item(item) for item in items]
+
+    @staticmethod
+    def _normalize_item(item: Any) -> dict[str, Any]:
+        """Normalize one item to internal format.
+
+        Parameters
+        ----------
+        item : Any
+            Raw item (string, tuple, or dict)
 
-        return normalized
+        Returns
+        -------
+        dict
+            Normalized item with 'label' and 'details' keys
+        """
+        if isinstance(item, dict):
+            # Dict format
+            return {
+                "label": str(item.get("label", "")),
+                "details": (
+                    str(item.get("details", "")) if item.get("details") else None
+                ),
+            }
+        if isinstance(item, tuple) and len(item) == 2:
+            # 2-tuple format
+            return {"label": str(item[0]), "details": str(item[1])}
+        # String or other format - use as label
+        return {"label": str(item), "details": None}
 
     @property
     def items(self) -> list[dict[str, Any]]:
@@ -256,6 +278,8 @@ class ListView(ScrollableElement):
         list of dict
             Normalized items with 'label' and 'details' keys
         """
+        if self._items is None:
+            self._items = self._normalize_items(self._raw_items)
         return self._items
 
     @items.setter
@@ -272,14 +296,11 @@ class ListView(ScrollableElement):
             New items (strings, tuples, or dicts)
         """
         self._raw_items = value or []
-        self._items = self._normalize_items(self._raw_items)
-
-        # Re-render content with new items
-        self._render_content()
+        self._index_items()
 
         # Update scroll manager content size if it exists
         if hasattr(self, "scroll_manager"):
-            self.scroll_manager.update_content_size(len(self.rendered_lines))
+            self.scroll_manager.update_content_size(self._count_lines())
 
     def _get_bullet_char(self, index: int) -> str:
         """Get bullet character for an item.
@@ -310,69 +331,240 @@ class ListView(ScrollableElement):
             # Ensure it has a space after if it's not empty
             return f"{self.bullet} " if self.bullet else ""
 
-    def _render_content(self) -> None:
-        """Render list items to ANSI strings.
+    def _item(self, index: int) -> dict[str, Any]:
+        """Return one normalized item without normalizing the whole list.
+
+        Parameters
+        ----------
+        index : int
+            Item index
+
+        Returns
+        -------
+        dict
+            Normalized item with 'label' and 'details' keys
+        """
+        if self._items is not None:
+            return self._items[index]
+        return self._normalize_item(self._raw_items[index])
+
+    def _index_items(self) -> None:
+        """Index the line counts of items with details.
 
-        Updates the rendered_lines cache with the current items.
+        Called whenever the items change. Plain items take one line (plus a
+        divider), so only items that can have details are normalized here.
         """
-        from wijjit.terminal.ansi import ANSIStyle, supports_unicode
+        self._items = None
+        self._line_cache.clear()
+        self._detail_ids = []
+        self._detail_lines = []
+        # Lists of plain labels are the common case; rule them out in C
+        item_types = set(map(type, self._raw_items))
+        if not any(issubclass(t, (dict, tuple)) for t in item_types):
+            return
+        total = 0
+        for index, item in enumerate(self._raw_items):
+            if not isinstance(item, (dict, tuple)):
+                continue
+            details = self._item(index)["details"]
+            if details:
+                total += details.count("\n") + 1
+                self._detail_ids.append(index)
+                self._detail_lines.append(total)
+
+    def _item_start(self, index: int) -> int:
+        """Return the content line on which an item starts.
 
-        self.rendered_lines = []
-        content_width = self._get_content_width()
+        Parameters
+        ----------
+        index : int
+            Item index
+
+        Returns
+        -------
+        int
+            Line offset of the item's label
+        """
+        stride = 2 if self.show_dividers else 1
+        before = bisect_left(self._detail_ids, index)
+        details = self._detail_lines[before - 1] if before else 0
+        return index * stride + details
+
+    def _count_lines(self) -> int:
+        """Return the total number of content lines.
+
+        Returns
+        -------
+        int
+            Line count; an empty list still has one blank line
+        """
+        count = len(self._raw_items)
+        if count == 0:
+            return 1
+        stride = 2 if self.show_dividers else 1
+        details = self._detail_lines[-1] if self._detail_lines else 0
+        return count * stride - (stride - 1) + details
 
-        for i, item in enumerate(self.items):
-            # Render main label with bullet
-            bullet = self._get_bullet_char(i)
-            label = item["label"]
+    def _locate_line(self, line: int) -> tuple[int, int]:
+        """Find the item covering a content line.
 
-            # Calculate available width for label (account for bullet)
-            bullet_width = visible_length(bullet)
-            label_width = content_width - bullet_width
+        Parameters
+        ----------
+        line : int
+            Content line offset
+
+        Returns
+        -------
+        tuple of int
+            Item index and the line's offset within the item
+        """
+        last = len(self._raw_items) - 1
+        if not self._detail_ids:
+            stride = 2 if self.show_dividers else 1
+            index = min(line // stride, last)
+            return index, line - index * stride
+
+        # Binary search for the last item starting at or before the line
+        low, high = 0, last
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._item_start(mid) <= line:
+                low = mid
+            else:
+                high = mid - 1
+        return low, line - self._item_start(low)
+
+    def _item_lines(self, index: int, content_width: int) -> list[tuple[str, str]]:
+        """Render one item to lines.
+
+        Parameters
+        ----------
+        index : int
+            Item index
+        content_width : int
+            Content area width
 
-            # Clip label if too long
-            if visible_length(label) > label_width:
-                label = clip_to_width(label, label_width, ellipsis="...")
+        Returns
+        -------
+        list of tuple
+            ``(kind, text)`` per line, where kind is "label", "details" or
+            "divider" and text is plain (no ANSI codes)
+        """
+        from wijjit.terminal.ansi import strip_ansi, supports_unicode
+
+        cached = self._line_cache.get(index)
+        if cached is not None:
+            self._line_cache.move_to_end(index)
+            return cached
+
+        item = self._item(index)
+
+        # Render main label with bullet
+        bullet = self._get_bullet_char(index)
+        label = item["label"]
+
+        # Calculate available width for label (account for bullet)
+        label_width = content_width - visible_length(bullet)
+
+        # Clip label if too long
+        if visible_length(label) > label_width:
+            label = clip_to_width(label, label_width, ellipsis="...")
+        lines = [("label", strip_ansi(bullet + label))]
+
+        # Render details if present, one line per newline-separated part
+        if item["details"]:
+            indent = " " * self.indent_details
+            detail_width = content_width - self.indent_details
+            for detail_line in item["details"].split("\n"):
+                # Clip detail if too long
+                if visible_length(detail_line) > detail_width:
+                    detail_line = clip_to_width(
+                        detail_line, detail_width, ellipsis="..."
+                    )
+                lines.append(("details", indent + strip_ansi(detail_line)))
 
-            # Build label line
-            label_line = bullet + label
-            self.rendered_lines.append(label_line)
+        # Add divider if requested and not last item
+        if self.show_dividers and index < len(self._raw_items) - 1:
+            # Horizontal line divider with unicode support fallback
+            divider_char = "─" if supports_unicode() else "-"
+            lines.append(("divider", divider_char * content_width))
 
-            # Render details if present
-            if item["details"]:
-                details = item["details"]
-                indent = " " * self.indent_details
+        self._line_cache[index] = lines
+        while len(self._line_cache) > ITEM_CACHE_SIZE:
+            self._line_cache.popitem(last=False)
+        return lines
 
-                # Split details into multiple lines
-                detail_lines = details.split("\n")
+    def _iter_lines(
+        self, start: int, end: int, content_width: int
+    ) -> "Iterator[tuple[str, str]]":
+        """Yield the content lines in ``[start, end)``.
 
-                for detail_line in detail_lines:
-                    # Calculate available width for details (account for indent)
-                    detail_width = content_width - self.indent_details
+        Parameters
+        ----------
+        start : int
+            First content line
+        end : int
+            Line after the last one to yield
+        content_width : int
+            Content area width
 
-                    # Clip detail if too long
-                    if visible_length(detail_line) > detail_width:
-                        detail_line = clip_to_width(
-                            detail_line, detail_width, ellipsis="..."
-                        )
+        Yields
+        ------
+        tuple of str
+            ``(kind, text)`` for each line, as returned by _item_lines
+        """
+        # Cached lines are only valid for the settings they were built with
+        key = (
+            content_width,
+            self.bullet,
+            self.show_dividers,
+            self.indent_details,
+        )
+        if key != self._line_cache_key:
+            self._line_cache.clear()
+            self._line_cache_key = key
+
+        count = len(self._raw_items)
+        if count == 0:
+            if start < end:
+                yield ("label", "")
+            return
+
+        index, offset = self._locate_line(start)
+        line = start
+        while line < end and index < count:
+            item_lines = self._item_lines(index, content_width)
+            for item_line in item_lines[offset:]:
+                if line >= end:
+                    return
+                yield item_line
+                line += 1
+            index += 1
+            offset = 0
 
-                    # Apply dim styling if enabled
-                    if self.dim_details:
-                        detail_line = f"{ANSIStyle.DIM}{detail_line}{ANSIStyle.RESET}"
+    @property
+    def rendered_lines(self) -> list[str]:
+        """Get every content line as an ANSI string.
 
-                    # Build detail line with indent
-                    full_detail_line = indent + detail_line
-                    self.rendered_lines.append(full_detail_line)
+        Painting only renders the visible rows; this builds all of them and
+        is meant for inspection.
 
-            # Add divider if requested and not last item
-            if self.show_dividers and i < len(self.items) - 1:
-                # Horizontal line divider with unicode support fallback
-                divider_char = "─" if supports_unicode() else "-"
-                divider = divider_char * content_width
-                self.rendered_lines.append(divider)
+        Returns
+        -------
+        list of str
+            Content lines, with details dimmed if dim_details is set
+        """
+        from wijjit.terminal.ansi import ANSIStyle
 
-        # Ensure at least one line
-        if not self.rendered_lines:
-            self.rendered_lines = [""]
+        lines = []
+        indent = self.indent_details
+        for kind, text in self._iter_lines(
+            0, self._count_lines(), self._get_content_width()
+        ):
+            if kind == "details" and self.dim_details:
+                text = f"{text[:indent]}{ANSIStyle.DIM}{text[indent:]}{ANSIStyle.RESET}"
+            lines.append(text)
+        return lines
 
     def set_items(self, items: list[Any]) -> None:
         """Update list items and re-render.
@@ -382,12 +574,7 @@ class ListView(ScrollableElement):
         items : list
             New list items (strings, tuples, or dicts)
         """
-        self._raw_items = items
-        self.items = self._normalize_items(items)
-        self._render_content()
-
-        # Update scroll manager with new content size
-        self.scroll_manager.update_content_size(len(self.rendered_lines))
+        self.items = items
 
     def restore_scroll_position(self, position: int) -> None:
         """Restore scroll position from saved state.
@@ -469,9 +656,6 @@ class ListView(ScrollableElement):
         bool
             True if key was handled
         """
-        if not self.rendered_lines:
-            return False
-
         # Up arrow - scroll up one row
         if key == Keys.UP:
             old_pos = self.scroll_manager.state.scroll_position
@@ -686,6 +870,10 @@ class ListView(ScrollableElement):
         content_height = self._get_content_height()
         if self.scroll_manager.state.viewport_size != content_height:
             self.scroll_manager.update_viewport_size(content_height)
+        # Dividers can be toggled after the items were indexed
+        line_count = self._count_lines()
+        if self.scroll_manager.state.content_size != line_count:
+            self.scroll_manager.update_content_size(line_count)
 
         # Resolve styles
         if self.focused:
@@ -939,29 +1127,18 @@ class ListView(ScrollableElement):
 
         # Render visible content lines
         current_y = start_y
-        for line_idx in range(
-            visible_start, min(visible_end, len(self.rendered_lines))
+        for kind, clean_line in self._iter_lines(
+            visible_start, visible_end, content_width
         ):
             if current_y >= start_y + content_height:
                 break
 
-            line = self.rendered_lines[line_idx]
-
-            # Strip ANSI codes and render to cells
-            from wijjit.terminal.ansi import strip_ansi
-
-            clean_line = strip_ansi(line)
-
-            # Determine if this is a detail line (starts with spaces)
-            is_detail = (
-                clean_line.startswith(" " * self.indent_details) and self.dim_details
-            )
-            line_style = details_style if is_detail else label_style
-
-            # Check if this is a divider line
-            is_divider = "─" in clean_line or "-" * 3 in clean_line
-            if is_divider:
+            if kind == "divider":
                 line_style = divider_style
+            elif kind == "details" and self.dim_details:
+                line_style = details_style
+            else:
+                line_style = label_style
 
             # Write line content
             line_attrs = line_style.to_cell_attrs()
@@ -135,6 +135,8 @@ class LogView(ScrollableElement):
     ... )
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -1119,7 +1121,7 @@ class LogView(ScrollableElement):
             rendered_line = self.rendered_lines[rendered_line_idx]
 
             # Check if original line has ANSI codes for passthrough
-            from wijjit.terminal.ansi import parse_ansi_text, strip_ansi
+            from wijjit.terminal.ansi import parse_ansi_spans, strip_ansi
 
             original_line_idx = (
                 self._rendered_line_origins[rendered_line_idx]
@@ -1134,13 +1136,13 @@ class LogView(ScrollableElement):
             has_ansi = "\x1b[" in original_line
 
             if has_ansi:
-                # ANSI passthrough mode - parse and preserve colors
-                parsed_chars = parse_ansi_text(rendered_line)
-                clean_line = "".join(char for char, _ in parsed_chars)
+                # ANSI passthrough mode - parse (cached per line) and preserve colors
+                parsed = parse_ansi_spans(rendered_line)
+                clean_line = parsed.text
             else:
                 # No ANSI in source - strip any internally-added codes
                 clean_line = strip_ansi(rendered_line)
-                parsed_chars = None
+                parsed = None
 
             # Determine fallback style from log level (used when no ANSI passthrough)
             if not has_ansi:
@@ -1173,18 +1175,18 @@ class LogView(ScrollableElement):
 
                 # Write content with ANSI passthrough if available
                 content_width_remaining = content_width - line_num_width
-                if has_ansi and parsed_chars:
-                    # Skip line number chars in parsed list
-                    content_chars = parsed_chars[line_num_width:]
-                    for i, (char, attrs) in enumerate(
-                        content_chars[:content_width_remaining]
-                    ):
+                if has_ansi and parsed and parsed.text:
+                    # Skip line number chars in parsed line
+                    content_cells = parsed.to_cells(
+                        line_num_width, line_num_width + content_width_remaining
+                    )
+                    for i, cell in enumerate(content_cells):
                         ctx.buffer.set_cell(
                             ctx.bounds.x + x_offset + i,
                             ctx.bounds.y + current_y,
-                            Cell(char=char, **attrs),
+                            cell,
                         )
-                    rendered_count = len(content_chars[:content_width_remaining])
+                    rendered_count = len(content_cells)
                 else:
                     content_part = clean_line[line_num_width:]
                     for i, char in enumerate(content_part[:content_width_remaining]):
@@ -1204,15 +1206,16 @@ class LogView(ScrollableElement):
                     )
             else:
                 # No line numbers - render full line
-                if has_ansi and parsed_chars:
+                if has_ansi and parsed and parsed.text:
                     # ANSI passthrough
-                    for i, (char, attrs) in enumerate(parsed_chars[:content_width]):
+                    content_cells = parsed.to_cells(0, content_width)
+                    for i, cell in enumerate(content_cells):
                         ctx.buffer.set_cell(
                             ctx.bounds.x + i,
                             ctx.bounds.y + current_y,
-                            Cell(char=char, **attrs),
+                            cell,
                         )
-                    rendered_count = len(parsed_chars[:content_width])
+                    rendered_count = len(content_cells)
                 else:
                     for i, char in enumerate(clean_line[:content_width]):
                         ctx.buffer.set_cell(
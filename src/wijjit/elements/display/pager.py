@@ -119,6 +119,8 @@ class Pager(Container):
     - Mouse click on Prev/Next buttons
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -10,11 +10,15 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from wijjit.elements.base import Element, ElementType
 from wijjit.elements.display.chart_utils import (
-    BrailleCanvas,
+    Decimation,
+    RingBuffer,
     begin_chart_border,
+    create_braille_canvas,
+    decimate_minmax,
     extract_values,
     get_block_char,
-    normalize_data,
+    plot_points,
+    value_range,
 )
 
 if TYPE_CHECKING:
@@ -47,12 +51,18 @@ class Sparkline(Element):
         Show current (last) value text (default: False)
     color : str, optional
         Color name for the sparkline (default: None)
+    capacity : int, optional
+        Keep at most this many values in a :class:`RingBuffer`, evicting the
+        oldest on :meth:`append` (default: None, unbounded list)
+    decimation : str, optional
+        How line and dot styles reduce series denser than the canvas:
+        "minmax", "lttb", or "none" (default: "minmax")
 
     Attributes
     ----------
     data : list
         Raw data values
-    values : list of float
+    values : list of float or RingBuffer
         Extracted numeric values
     width : int
         Display width
@@ -80,6 +90,11 @@ class Sparkline(Element):
     With current value display:
 
     >>> sparkline = Sparkline(data=[10, 20, 30], show_current=True)
+
+    Streaming the last 1000 samples:
+
+    >>> sparkline = Sparkline(capacity=1000)
+    >>> sparkline.append(42.0)
     """
 
     def __init__(
@@ -94,14 +109,19 @@ class Sparkline(Element):
         show_current: bool = False,
         color: str | None = None,
         border: str = "none",
+        capacity: int | None = None,
+        decimation: Decimation = "minmax",
     ) -> None:
         super().__init__(id=id, classes=classes)
         self.element_type = ElementType.DISPLAY
         self.focusable = False
 
         # Data
+        self.capacity = capacity
+        self.decimation = decimation
         self._raw_data = data or []
-        self.values, self._labels = extract_values(self._raw_data)
+        self.values: list[float] | RingBuffer = []
+        self._store_values(self._raw_data)
 
         # Display properties
         self.width = width
@@ -147,7 +167,44 @@ class Sparkline(Element):
             New data values
         """
         self._raw_data = data
-        self.values, self._labels = extract_values(data)
+        self._store_values(data)
+
+    def _store_values(self, data: list[Any]) -> None:
+        """Extract values into a list or, with a capacity, a ring buffer.
+
+        Parameters
+        ----------
+        data : list
+            Raw data values
+        """
+        values, self._labels = extract_values(data)
+        if self.capacity is None:
+            self.values = values
+        else:
+            self.values = RingBuffer(self.capacity, values)
+
+    def append(self, value: float) -> None:
+        """Append one value to the end of the series.
+
+        With a ``capacity``, the oldest value is evicted once the buffer is
+        full. Appended values are not reflected in :attr:`data`.
+
+        Parameters
+        ----------
+        value : float
+            Value to append
+        """
+        self.values.append(float(value))
+
+    def extend(self, values: list[float]) -> None:
+        """Append several values to the end of the series.
+
+        Parameters
+        ----------
+        values : list of float
+            Values to append, oldest first
+        """
+        self.values.extend(float(v) for v in values)
 
     def get_intrinsic_size(self) -> tuple[int, int]:
         """Get the intrinsic size of the sparkline.
@@ -184,34 +241,21 @@ class Sparkline(Element):
             return [" " * chart_width] * chart_height
 
         # Create braille canvas
-        canvas = BrailleCanvas(chart_width, chart_height)
-
-        # Normalize data
-        normalized, min_val, max_val = normalize_data(self.values)
-
-        # Calculate x and y positions for each data point
-        num_points = len(normalized)
-        pixel_width = canvas.pixel_width
-        pixel_height = canvas.pixel_height
-
-        # Map data points to pixel coordinates
-        points = []
-        for i, val in enumerate(normalized):
-            # X: distribute points across width
-            x = (
-                int((i / max(1, num_points - 1)) * (pixel_width - 1))
-                if num_points > 1
-                else pixel_width // 2
-            )
-            # Y: invert so higher values are at top (y=0)
-            y = int((1 - val) * (pixel_height - 1))
-            points.append((x, y))
+        canvas = create_braille_canvas(chart_width, chart_height)
+
+        # Map data points (decimated when dense) to pixel coordinates
+        min_val, max_val = value_range(self.values)
+        points = plot_points(
+            self.values,
+            canvas.pixel_width,
+            canvas.pixel_height,
+            min_val,
+            max_val,
+            self.decimation,
+        )
 
         # Draw lines between consecutive points
-        for i in range(len(points) - 1):
-            x0, y0 = points[i]
-            x1, y1 = points[i + 1]
-            canvas.draw_line(x0, y0, x1, y1)
+        canvas.draw_polyline(points)
 
         return canvas.to_lines()
 
@@ -237,35 +281,23 @@ class Sparkline(Element):
 
         use_unicode = supports_unicode()
 
-        # Normalize data
-        normalized, _, _ = normalize_data(self.values)
+        # One bar per column: the column's largest value (so spikes survive
+        # when several values share a column), scaled to the series range
+        min_val, max_val = value_range(self.values)
+        span = max_val - min_val
+        heights = [
+            (high - min_val) / span if span else 0.5
+            for _, _, high, _ in decimate_minmax(self.values, chart_width)
+        ]
 
         # For single-row bar chart, use block characters
         if chart_height == 1:
-            # Calculate how many values per character (may need to aggregate)
-            values_per_char = max(1, len(normalized) // chart_width)
-            chars = []
-
-            for i in range(chart_width):
-                # Get values for this character
-                start_idx = i * values_per_char
-                end_idx = min(start_idx + values_per_char, len(normalized))
-
-                if start_idx < len(normalized):
-                    # Average the values for this column
-                    chunk_vals = normalized[start_idx:end_idx]
-                    avg_val = sum(chunk_vals) / len(chunk_vals) if chunk_vals else 0
-                    char = get_block_char(avg_val, "vertical", use_unicode)
-                else:
-                    char = " "
-
-                chars.append(char)
-
+            chars = [get_block_char(h, "vertical", use_unicode) for h in heights]
+            chars.extend(" " * (chart_width - len(heights)))
             return ["".join(chars)]
 
         # Multi-row bar chart
         lines = []
-        values_per_char = max(1, len(normalized) // chart_width)
 
         for row in range(chart_height):
             row_chars = []
@@ -273,19 +305,15 @@ class Sparkline(Element):
             threshold = 1 - (row / chart_height)
 
             for col in range(chart_width):
-                start_idx = col * values_per_char
-                end_idx = min(start_idx + values_per_char, len(normalized))
+                if col < len(heights):
+                    height = heights[col]
 
-                if start_idx < len(normalized):
-                    chunk_vals = normalized[start_idx:end_idx]
-                    avg_val = sum(chunk_vals) / len(chunk_vals) if chunk_vals else 0
-
-                    if avg_val >= threshold:
+                    if height >= threshold:
                         row_chars.append("\u2588" if use_unicode else "#")
-                    elif avg_val >= threshold - (1 / chart_height):
+                    elif height >= threshold - (1 / chart_height):
                         # Partial fill
                         partial = (
-                            avg_val - (threshold - 1 / chart_height)
+                            height - (threshold - 1 / chart_height)
                         ) * chart_height
                         row_chars.append(
                             get_block_char(partial, "vertical", use_unicode)
@@ -318,24 +346,20 @@ class Sparkline(Element):
             return [" " * chart_width] * chart_height
 
         # Create braille canvas
-        canvas = BrailleCanvas(chart_width, chart_height)
-
-        # Normalize data
-        normalized, _, _ = normalize_data(self.values)
-
-        num_points = len(normalized)
-        pixel_width = canvas.pixel_width
-        pixel_height = canvas.pixel_height
-
-        # Plot individual dots
-        for i, val in enumerate(normalized):
-            x = (
-                int((i / max(1, num_points - 1)) * (pixel_width - 1))
-                if num_points > 1
-                else pixel_width // 2
+        canvas = create_braille_canvas(chart_width, chart_height)
+
+        # Plot individual dots (decimated when dense)
+        min_val, max_val = value_range(self.values)
+        canvas.set_pixels(
+            plot_points(
+                self.values,
+                canvas.pixel_width,
+                canvas.pixel_height,
+                min_val,
+                max_val,
+                self.decimation,
             )
-            y = int((1 - val) * (pixel_height - 1))
-            canvas.set_pixel(x, y)
+        )
 
         return canvas.to_lines()
 
@@ -405,15 +429,18 @@ class Sparkline(Element):
 
         # Render min/max markers if enabled
         if self.show_minmax and self.values and len(self.values) > 1:
-            min_val = min(self.values)
-            max_val = max(self.values)
-            min_idx = self.values.index(min_val)
-            max_idx = self.values.index(max_val)
+            # Locate the extremes among the per-column buckets rather than
+            # scanning the whole series; a sparse series has one value per
+            # bucket, so the column is the value's own index
+            min_val, max_val = value_range(self.values)
+            columns = decimate_minmax(self.values, chart_width)
+            min_idx = next(i for i, col in enumerate(columns) if col[1] == min_val)
+            max_idx = next(i for i, col in enumerate(columns) if col[2] == max_val)
 
             # Calculate x positions for markers
-            num_points = len(self.values)
-            min_x = int((min_idx / max(1, num_points - 1)) * (chart_width - 1))
-            max_x = int((max_idx / max(1, num_points - 1)) * (chart_width - 1))
+            last = max(1, len(columns) - 1)
+            min_x = int((min_idx / last) * (chart_width - 1))
+            max_x = int((max_idx / last) * (chart_width - 1))
 
             min_style = ctx.style_resolver.resolve_style(self, "sparkline.min")
             max_style = ctx.style_resolver.resolve_style(self, "sparkline.max")
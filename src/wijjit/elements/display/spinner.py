@@ -5,6 +5,7 @@ indicators in terminal user interfaces. Supports multiple animation styles
 including dots, lines, bouncing, and various other patterns.
 """
 
+from collections.abc import Hashable
 from typing import TYPE_CHECKING, Literal
 
 from wijjit.elements.base import Element, ElementType
@@ -100,6 +101,8 @@ class Spinner(Element):
         Current frame index
     """
 
+    layout_attrs = frozenset({"style", "label"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -178,6 +181,18 @@ class Spinner(Element):
         frame_idx = self.frame_index % len(frames)
         return frames[frame_idx]
 
+    def layout_key(self) -> Hashable:
+        """Return the layout cache key, including the frame set choice.
+
+        Returns
+        -------
+        Hashable
+            Layout generation and whether Unicode frames are used
+        """
+        from wijjit.terminal.ansi import supports_unicode
+
+        return (self._layout_generation, supports_unicode())
+
     def get_intrinsic_size(self) -> tuple[int, int]:
         """Get the intrinsic size of the spinner.
 
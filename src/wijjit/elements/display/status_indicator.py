@@ -83,6 +83,8 @@ class StatusIndicator(Element):
     - Runtime: indicator.register_status("custom", "magenta")
     """
 
+    layout_attrs = frozenset({"label"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -107,6 +107,8 @@ class TabbedPanel(Container):
     - Tab state is restored on render
     """
 
+    layout_attrs = frozenset({"width", "height"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -9,11 +9,8 @@ from collections.abc import Callable
 from io import StringIO
 from typing import TYPE_CHECKING, Any, Literal
 
-import rich.box
-from rich.console import Console
-from rich.table import Table as RichTable
-
 from wijjit.elements.base import ElementType, ScrollableElement, invoke_callback
+from wijjit.elements.data_source import DataSource, as_data_source
 from wijjit.layout.scroll import ScrollManager, render_vertical_scrollbar
 from wijjit.terminal.input import Key, Keys
 from wijjit.terminal.mouse import MouseButton, MouseEvent, MouseEventType
@@ -21,16 +18,19 @@ from wijjit.terminal.mouse import MouseButton, MouseEvent, MouseEventType
 if TYPE_CHECKING:
     from wijjit.rendering.paint_context import PaintContext
 
+# Border style -> name of the ``rich.box`` constant. Rich is imported on the
+# first table render rather than at module import, so the boxes are looked
+# up by name.
 BOX_STYLES = {
     "none": None,
-    "ascii": rich.box.ASCII,
-    "square": rich.box.SQUARE,
-    "minimal": rich.box.MINIMAL,
-    "simple": rich.box.SIMPLE,
-    "rounded": rich.box.ROUNDED,
-    "heavy": rich.box.HEAVY,
-    "double": rich.box.DOUBLE,
-    "single": rich.box.SQUARE,  # Map 'single' to SQUARE for consistency
+    "ascii": "ASCII",
+    "square": "SQUARE",
+    "minimal": "MINIMAL",
+    "simple": "SIMPLE",
+    "rounded": "ROUNDED",
+    "heavy": "HEAVY",
+    "double": "DOUBLE",
+    "single": "SQUARE",  # Map 'single' to SQUARE for consistency
 }
 
 
@@ -47,10 +47,14 @@ class Table(ScrollableElement):
     ----------
     id : str, optional
         Element identifier
-    data : list of dict, optional
-        Table data as list of row dictionaries
+    data : list of dict, DataFrame, or DataSource, optional
+        Table data as list of row dictionaries, or a pandas DataFrame, NumPy
+        structured array, PyArrow Table or
+        :class:`~wijjit.elements.data_source.DataSource`, which is read
+        lazily: only visible rows are formatted
     columns : list of str or list of dict, optional
-        Column definitions. Can be simple strings or dicts with 'key', 'label', 'width'
+        Column definitions. Can be simple strings or dicts with 'key', 'label', 'width'.
+        Defaults to the source's columns for DataFrame/DataSource data
     width : int, optional
         Display width in columns (default: 60)
     height : int, optional
@@ -66,8 +70,8 @@ class Table(ScrollableElement):
 
     Attributes
     ----------
-    data : list of dict
-        Table data
+    data : list of dict or DataSource
+        Table data (the source itself for source-backed tables)
     columns : list of dict
         Normalized column definitions
     width : int
@@ -104,7 +108,7 @@ class Table(ScrollableElement):
         self,
         id: str | None = None,
         classes: str | list[str] | set[str] | None = None,
-        data: list[dict] | None = None,
+        data: list[dict] | DataSource | Any | None = None,
         columns: list[str] | list[dict] | None = None,
         width: int = 60,
         height: int = 10,
@@ -118,9 +122,16 @@ class Table(ScrollableElement):
         self.element_type = ElementType.DISPLAY
         self.focusable = True  # Focusable for keyboard scrolling
 
-        # Data and columns
-        self._raw_data = data or []
-        self._raw_columns = columns or []
+        # Data and columns. DataFrames, arrays and tables are read through a
+        # DataSource; sorting one stores a row order instead of a copy.
+        self._source: DataSource | None = (
+            None if isinstance(data, list) else as_data_source(data)
+        )
+        self._order: list[int] | None = None
+        self._raw_data: list[dict] = data if isinstance(data, list) else []
+        self._raw_columns = columns or (
+            self._source.columns if self._source is not None else []
+        )
         self._data = self._raw_data.copy()  # Working copy (can be sorted)
         self.columns = self._normalize_columns(self._raw_columns)
 
@@ -157,7 +168,7 @@ class Table(ScrollableElement):
 
         # Scroll management for rows
         self.scroll_manager = ScrollManager(
-            content_size=len(self.data), viewport_size=viewport_height
+            content_size=self._row_count(), viewport_size=viewport_height
         )
 
         # Scroll position persistence (will be set by template extension)
@@ -325,20 +336,27 @@ class Table(ScrollableElement):
         return "left"
 
     @property
-    def data(self) -> list[dict]:
+    def data(self) -> list[dict] | DataSource:
         """Table rows (the working copy, which may be sorted).
 
         Assignment refreshes the raw backing copy, re-applies any active sort,
         and re-clamps scroll state -- so ``table.data = rows`` stays in sync
         the same way :meth:`set_data` does, instead of desyncing ``_raw_data``
-        and the scroll manager.
+        and the scroll manager. Source-backed tables return the source, in
+        its original order.
         """
+        if self._source is not None:
+            return self._source
         return self._data
 
     @data.setter
-    def data(self, rows: list[dict]) -> None:
-        self._raw_data = rows or []
+    def data(self, rows: list[dict] | DataSource | Any) -> None:
+        self._source = None if isinstance(rows, list) else as_data_source(rows)
+        self._order = None
+        self._raw_data = rows if isinstance(rows, list) else []
         self._data = self._raw_data.copy()
+        if self._source is not None and not self.columns:
+            self.columns = self._normalize_columns(self._source.columns)
 
         # Re-apply sort if active
         if self.sort_column:
@@ -347,14 +365,88 @@ class Table(ScrollableElement):
         # Update scroll manager with new content size (absent during __init__)
         scroll_manager = getattr(self, "scroll_manager", None)
         if scroll_manager is not None:
-            scroll_manager.update_content_size(len(self._data))
+            scroll_manager.update_content_size(self._row_count())
+
+    def _row_count(self) -> int:
+        """Get the number of rows without reading a source.
+
+        Returns
+        -------
+        int
+            Number of rows
+        """
+        if self._source is not None:
+            return self._source.row_count
+        return len(self._data)
+
+    def _source_row(self, index: int) -> int:
+        """Map a displayed row index to a row of the source.
+
+        Parameters
+        ----------
+        index : int
+            Displayed (possibly sorted) row index
+
+        Returns
+        -------
+        int
+            Row index within the source
+        """
+        return self._order[index] if self._order is not None else index
+
+    def _row_record(self, index: int) -> dict:
+        """Get a displayed row as a dict.
+
+        Parameters
+        ----------
+        index : int
+            Displayed (possibly sorted) row index
+
+        Returns
+        -------
+        dict
+            Row data keyed by column (raw values for source-backed tables)
+        """
+        if self._source is not None:
+            return self._source.get_record(self._source_row(index))
+        return self._data[index]
 
-    def set_data(self, data: list[dict]) -> None:
+    def _visible_values(self, start: int, stop: int) -> list[list[str]]:
+        """Format the cells of the visible rows, in column order.
+
+        Parameters
+        ----------
+        start : int
+            First displayed row index
+        stop : int
+            Displayed row index after the last row
+
+        Returns
+        -------
+        list of list of str
+            One list of cell strings per row
+        """
+        if self._source is None:
+            return [
+                [str(row_data.get(col["key"], "")) for col in self.columns]
+                for row_data in self._data[start:stop]
+            ]
+
+        source = self._source
+        if self._order is None:
+            rows = source.get_rows(start, stop)
+        else:
+            stop = min(stop, len(self._order))
+            rows = [source.get_row(self._order[i]) for i in range(start, stop)]
+        indices = [source.column_index(col["key"]) for col in self.columns]
+        return [[row[i] if i is not None else "" for i in indices] for row in rows]
+
+    def set_data(self, data: list[dict] | DataSource | Any) -> None:
         """Update table data and refresh scroll state.
 
         Parameters
         ----------
-        data : list of dict
+        data : list of dict, DataFrame, or DataSource
             New table data
         """
         self.data = data
@@ -391,6 +483,15 @@ class Table(ScrollableElement):
         # Sort data by column
         reverse = self.sort_direction == "desc"
 
+        if self._source is not None:
+            col = self._source.column_index(self.sort_column)
+            self._order = (
+                self._source.argsort(col, descending=reverse)
+                if col is not None
+                else None
+            )
+            return
+
         try:
             self._data.sort(
                 key=lambda row: row.get(self.sort_column, ""), reverse=reverse
@@ -414,7 +515,7 @@ class Table(ScrollableElement):
         bool
             True if key was handled
         """
-        if not self.data:
+        if not self._row_count():
             return False
 
         # Up arrow - scroll up one row
@@ -562,8 +663,8 @@ class Table(ScrollableElement):
                 )
 
                 # Validate row index is within data bounds
-                if 0 <= actual_row_index < len(self.data):
-                    row_data = self.data[actual_row_index]
+                if 0 <= actual_row_index < self._row_count():
+                    row_data = self._row_record(actual_row_index)
 
                     # Handle double-click
                     if is_double:
@@ -733,11 +834,16 @@ class Table(ScrollableElement):
         )
         table_width = self.width - 1 if needs_scrollbar else self.width
 
+        import rich.box
+        from rich.console import Console
+        from rich.table import Table as RichTable
+
         # Create Rich table with focus-based border style
         if self.focused:
-            box_style = rich.box.DOUBLE
+            box_name = "DOUBLE"
         else:
-            box_style = BOX_STYLES.get(self.border_style, rich.box.SQUARE)
+            box_name = BOX_STYLES.get(self.border_style, "SQUARE")
+        box_style = getattr(rich.box, box_name) if box_name else None
 
         table = RichTable(
             show_header=self.show_header,
@@ -764,16 +870,8 @@ class Table(ScrollableElement):
 
         # Get visible rows
         visible_start, visible_end = self.scroll_manager.get_visible_range()
-        visible_data = self.data[visible_start:visible_end]
-
         # Add rows
-        for row_data in visible_data:
-            row_values = []
-            for col in self.columns:
-                value = row_data.get(col["key"], "")
-                value_str = str(value)
-                row_values.append(value_str)
-
+        for row_values in self._visible_values(visible_start, visible_end):
             table.add_row(*row_values)
 
         # Render table using Rich
@@ -5,12 +5,16 @@ with expandable/collapsible nodes. Supports multiple indicator styles, keyboard
 navigation, mouse interaction, and customizable rendering.
 """
 
-from collections.abc import Callable
+import asyncio
+import inspect
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, MutableMapping
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
 from wijjit.elements.base import ElementType, ScrollableElement, invoke_callback
 from wijjit.layout.scroll import ScrollManager, render_vertical_scrollbar
+from wijjit.logging_config import get_logger
 from wijjit.terminal.ansi import clip_to_width, visible_length
 from wijjit.terminal.input import Key, Keys
 from wijjit.terminal.mouse import MouseButton, MouseEvent, MouseEventType
@@ -19,6 +23,8 @@ if TYPE_CHECKING:
     from wijjit.rendering.paint_context import PaintContext
     from wijjit.styling.style import Style
 
+logger = get_logger(__name__)
+
 
 class TreeIndicatorStyle(Enum):
     """Visual styles for tree expand/collapse indicators.
@@ -86,6 +92,23 @@ class Tree(ScrollableElement):
         Border style: "single", "double", "rounded", or "none" (default: "none")
     title : str, optional
         Title to display in top border (default: None)
+    children_loader : callable, optional
+        ``loader(node) -> list[dict]`` called the first time a node marked
+        ``has_children`` (but without ``children``) is expanded. The loader
+        may be a coroutine function or return an awaitable. While an event
+        loop is running, plain functions run in a worker thread and a
+        "Loading…" row is shown until the load finishes (default: None)
+    expanded : str or list, optional
+        State key the expanded node ids are persisted to (overrides the
+        default "{id}:expanded"), or a list of node ids expanded initially
+        (default: None)
+    max_concurrent_loads : int, optional
+        Maximum number of ``children_loader`` calls in flight at once
+        (default: 4)
+    children_cache_size : int, optional
+        Number of loaded child lists kept so collapsed or re-rendered
+        nodes do not hit the loader again; 0 disables the cache
+        (default: 256)
 
     Attributes
     ----------
@@ -128,6 +151,10 @@ class Tree(ScrollableElement):
     - Nested dict: {"label": "Root", "value": "1", "children": [...]}
     - Flat list: [{"id": "1", "label": "Root", "parent_id": None}, ...]
 
+    With a ``children_loader``, nodes may instead set ``"has_children": True``
+    and omit ``children``; they are loaded when expanded (see
+    :class:`wijjit.helpers.FilesystemTreeLoader`).
+
     Navigation:
     - Up/Down: Navigate nodes
     - Left: Collapse node or move to parent
@@ -137,6 +164,9 @@ class Tree(ScrollableElement):
     - PageUp/PageDown: Scroll by page
     """
 
+    # The app restores and persists expansion under expand_state_key
+    wiring_attrs = ScrollableElement.wiring_attrs | {"expand_state_key"}
+
     def __init__(
         self,
         id: str | None = None,
@@ -154,11 +184,31 @@ class Tree(ScrollableElement):
         title: str | None = None,
         action: str | None = None,
         tab_index: int | None = None,
+        children_loader: (
+            Callable[[dict], list[dict] | Awaitable[list[dict]]] | None
+        ) = None,
+        expanded: str | list[str] | None = None,
+        max_concurrent_loads: int = 4,
+        children_cache_size: int = 256,
     ) -> None:
         super().__init__(id=id, classes=classes, tab_index=tab_index)
         self.element_type = ElementType.DISPLAY
         self.focusable = True
 
+        # Lazy children: node id -> in-flight load task, nodes found
+        # expanded but unloaded during the last flatten, and an LRU of raw
+        # loader results by node id
+        self.children_loader = children_loader
+        self.max_concurrent_loads = max(1, max_concurrent_loads)
+        self.children_cache_size = max(0, children_cache_size)
+        self._loading: dict[str, asyncio.Task[None]] = {}
+        self._pending_loads: list[dict] = []
+        self._children_cache: OrderedDict[str, list[dict]] = OrderedDict()
+        self._load_semaphore: asyncio.Semaphore | None = None
+        self._load_semaphore_loop: asyncio.AbstractEventLoop | None = None
+        # Render request callback (set by app) for loads finishing off-frame
+        self._request_render: Callable[[], None] | None = None
+
         # Display properties
         self.width = width
         self.height = height
@@ -169,15 +219,21 @@ class Tree(ScrollableElement):
         self.border_style = border_style
         self.title = title
 
-        # Tree data
+        # Tree data, plus an id -> node index and a node -> parent index
+        # (keyed by object id) over the normalized tree
+        self._node_index: dict[str, dict] = {}
+        self._parent_index: dict[int, dict] = {}
         self._raw_data = data
         self._data = self._normalize_data(data) if data else {}
+        self._reindex()
 
         # Multi-select mode
         self.multiple = multiple
 
         # Tree state
-        self.expanded_nodes: set[str] = set()
+        self.expanded_nodes: set[str] = (
+            set(expanded) if isinstance(expanded, list) else set()
+        )
         self.selected_node_id: str | None = None
         self.selected_node_ids: set[str] = set(selected_ids or [])
         self.highlighted_index: int = 0
@@ -203,12 +259,14 @@ class Tree(ScrollableElement):
 
         # State persistence keys - auto-generated from id
         # scroll_state_key provided by ScrollableElement (auto-generates to "{id}:scroll")
-        self._expand_state_key_override: str | None = None
+        self._expand_state_key_override: str | None = (
+            expanded if isinstance(expanded, str) else None
+        )
         self._highlight_state_key_override: str | None = None
         self._selected_state_key_override: str | None = None
 
         # State save callback (set by app/template)
-        self._state_dict: dict[str, Any] | None = None
+        self._state_dict: MutableMapping[str, Any] | None = None
 
         # Re-sync the scroll viewport to the border-adjusted content height now
         # that border_style is known (the initial ScrollManager above used the
@@ -437,34 +495,100 @@ class Tree(ScrollableElement):
         value : dict or list or None
             New tree data (nested dict or flat list)
         """
+        # Loaded children belong to the old tree; node ids may be reused by
+        # the new data, so neither cached nor in-flight results may apply
+        self._cancel_loads()
+        self._pending_loads = []
+        self._children_cache.clear()
+
         self._raw_data = value
         self._data = self._normalize_data(value) if value else {}
+        self._reindex()
 
         # Rebuild flattened nodes list (this also updates scroll_manager)
         if hasattr(self, "scroll_manager"):
             self._rebuild_nodes()
 
+    def _reindex(self) -> None:
+        """Rebuild the id and parent indexes over the normalized tree."""
+        self._node_index = {}
+        self._parent_index = {}
+        if self._data:
+            self._index_subtree(self._data, None)
+
+    def _index_subtree(self, node: dict, parent: dict | None) -> None:
+        """Add a node and its descendants to the indexes.
+
+        Parameters
+        ----------
+        node : dict
+            Normalized node
+        parent : dict or None
+            Parent node, or None for the root
+        """
+        stack = [(node, parent)]
+        while stack:
+            current, current_parent = stack.pop()
+            # First node in document order wins for duplicate ids, matching
+            # a depth-first search
+            self._node_index.setdefault(current["id"], current)
+            if current_parent is not None:
+                self._parent_index[id(current)] = current_parent
+            children = current.get("children", [])
+            stack.extend((child, current) for child in reversed(children))
+
     def _rebuild_nodes(self) -> None:
         """Rebuild flattened nodes list based on current expansion state.
 
         This method flattens the tree into a linear list of visible nodes,
         respecting the expanded/collapsed state of each node. The result is
-        stored in self.nodes for rendering and navigation.
+        stored in self.nodes for rendering and navigation. Expanding or
+        collapsing a single node splices its rows instead (see
+        :meth:`_refresh_rows`).
         """
+        rows: list[dict] = []
+        if self.data:
+            # Start from root
+            if self.show_root:
+                self._flatten_node(self.data, 0, rows)
+            else:
+                # Show children of root directly
+                self._flatten_children(self.data, 0, rows)
+        self.nodes = rows
+        self._rows_changed()
+
+    def _refresh_rows(self, node_id: str) -> None:
+        """Re-flatten the rows below one node after it expanded or collapsed.
 
-        self.nodes = []
-        if not self.data:
+        The node's visible descendants are removed and, if it is expanded,
+        its subtree is flattened and spliced back in. Nothing changes when
+        the node is not visible.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node whose expansion changed
+        """
+        index = self._row_index(node_id)
+        if index is None:
             return
 
-        # Start from root
-        if self.show_root:
-            self._flatten_node(self.data, depth=0, parent_lines=[])
-        else:
-            # Show children of root directly
-            for i, child in enumerate(self.data.get("children", [])):
-                is_last = i == len(self.data["children"]) - 1
-                self._flatten_node(child, depth=0, parent_lines=[], is_last=is_last)
+        row = self.nodes[index]
+        node = row["node"]
+        depth = row["depth"]
 
+        # Find the end of the node's visible subtree
+        end = index + 1
+        while end < len(self.nodes) and self.nodes[end]["depth"] > depth:
+            end += 1
+
+        new_rows: list[dict] = []
+        self._flatten_node(node, depth, new_rows, row["parent"], row["is_last"])
+        self.nodes[index:end] = new_rows
+        self._rows_changed()
+
+    def _rows_changed(self) -> None:
+        """Update scrolling and start lazy loads after the rows changed."""
         # Update scroll manager
         self.scroll_manager.update_content_size(len(self.nodes))
 
@@ -472,10 +596,47 @@ class Tree(ScrollableElement):
         if self.highlighted_index >= len(self.nodes):
             self.highlighted_index = max(0, len(self.nodes) - 1)
 
+        # Load children of expanded lazy nodes; synchronous loads change the
+        # visible rows immediately
+        if self._pending_loads:
+            pending, self._pending_loads = self._pending_loads, []
+            for node in self._load_children(pending):
+                self._refresh_rows(node["id"])
+
+    def _row_index(self, node_id: str) -> int | None:
+        """Find the visible row of a node.
+
+        Parameters
+        ----------
+        node_id : str
+            Node ID
+
+        Returns
+        -------
+        int or None
+            Index into :attr:`nodes`, or None if the node is not visible
+        """
+        # Toggled nodes are almost always the highlighted one
+        highlighted = self.highlighted_index
+        if (
+            0 <= highlighted < len(self.nodes)
+            and self.nodes[highlighted]["node"]["id"] == node_id
+        ):
+            return highlighted
+        for i, row in enumerate(self.nodes):
+            if row["node"]["id"] == node_id:
+                return i
+        return None
+
     def _flatten_node(
-        self, node: dict, depth: int, parent_lines: list[bool], is_last: bool = True
+        self,
+        node: dict,
+        depth: int,
+        rows: list[dict],
+        parent: dict | None = None,
+        is_last: bool = True,
     ) -> None:
-        """Recursively flatten a node and its children.
+        """Flatten a node and, if expanded, its visible descendants.
 
         Parameters
         ----------
@@ -483,36 +644,384 @@ class Tree(ScrollableElement):
             Node to flatten
         depth : int
             Depth level of this node
-        parent_lines : list of bool
-            List indicating which parent levels need vertical lines
+        rows : list of dict
+            List the rows are appended to
+        parent : dict, optional
+            Parent node (None for the root)
         is_last : bool, optional
             Whether this is the last child of its parent (default: True)
         """
-        node_id = node["id"]
-        has_children = len(node.get("children", [])) > 0
-        is_expanded = node_id in self.expanded_nodes
+        is_lazy = self._is_lazy(node)
+        has_children = bool(node.get("children")) or is_lazy
+        is_expanded = node["id"] in self.expanded_nodes
 
-        # Add this node to the flattened list
-        self.nodes.append(
+        # Tree-drawing prefixes are derived from ``parent`` when the row is
+        # rendered (see _get_tree_prefix), so rows stay small
+        rows.append(
             {
                 "node": node,
                 "depth": depth,
                 "is_last": is_last,
-                "parent_lines": parent_lines.copy(),
+                "parent": parent,
                 "has_children": has_children,
                 "is_expanded": is_expanded,
             }
         )
 
-        # If expanded, add children
         if is_expanded and has_children:
-            children = node.get("children", [])
-            # Update parent_lines for children
-            new_parent_lines = parent_lines + [not is_last]
+            self._flatten_children(node, depth + 1, rows)
 
-            for i, child in enumerate(children):
-                child_is_last = i == len(children) - 1
-                self._flatten_node(child, depth + 1, new_parent_lines, child_is_last)
+    def _flatten_children(self, node: dict, depth: int, rows: list[dict]) -> None:
+        """Flatten the children of an expanded node.
+
+        Parameters
+        ----------
+        node : dict
+            Expanded node
+        depth : int
+            Depth level of the children
+        rows : list of dict
+            List the rows are appended to
+        """
+        children = node.get("children", [])
+        if not children and self._is_lazy(node):
+            cached = self._cached_children(node["id"])
+            if cached is not None:
+                self._set_children(node, cached)
+                children = node["children"]
+        if not children and self._is_lazy(node):
+            if node["id"] not in self._loading:
+                self._pending_loads.append(node)
+            children = [self._loading_placeholder(node["id"])]
+
+        last = len(children) - 1
+        for i, child in enumerate(children):
+            self._flatten_node(child, depth, rows, node, i == last)
+
+    def _is_lazy(self, node: dict) -> bool:
+        """Check whether a node's children still have to be loaded.
+
+        Parameters
+        ----------
+        node : dict
+            Normalized node
+
+        Returns
+        -------
+        bool
+            True if the node is marked ``has_children``, has no children yet
+            and a ``children_loader`` is set
+        """
+        return (
+            self.children_loader is not None
+            and bool(node.get("has_children"))
+            and not node.get("children")
+        )
+
+    def _loading_placeholder(self, node_id: str) -> dict:
+        """Build the row shown while a node's children are loading.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node being loaded
+
+        Returns
+        -------
+        dict
+            Placeholder node without children
+        """
+        return {
+            "id": f"{node_id}:loading",
+            "label": "Loading\u2026",
+            "value": None,
+            "children": [],
+            "placeholder": True,
+        }
+
+    def _load_children(self, nodes: list[dict]) -> list[dict]:
+        """Start loading the children of expanded lazy nodes.
+
+        With a running event loop each load runs as a task, at most
+        ``max_concurrent_loads`` at a time, and splices the result in when
+        it finishes. Without one (e.g. in tests or inline rendering) loads
+        run inline.
+
+        Parameters
+        ----------
+        nodes : list of dict
+            Expanded lazy nodes
+
+        Returns
+        -------
+        list of dict
+            Nodes whose children were loaded synchronously
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        loaded = []
+        for node in nodes:
+            node_id = node["id"]
+            if node_id in self._loading:
+                continue
+            if loop is None:
+                children = self._call_loader(node)
+                if inspect.isawaitable(children):
+                    children = asyncio.run(self._await_children(node, children))
+                self._store_children(node, children)
+                loaded.append(node)
+            else:
+                self._loading[node_id] = loop.create_task(
+                    self._load_children_async(node)
+                )
+        return loaded
+
+    async def _load_children_async(self, node: dict) -> None:
+        """Load a node's children and refresh the tree.
+
+        Coroutine loaders are awaited on the event loop; plain functions run
+        in the default thread pool. Cancellation (see :meth:`_cancel_loads`)
+        leaves the node unloaded so expanding it again retries.
+
+        Parameters
+        ----------
+        node : dict
+            Lazy node to load
+        """
+        node_id = node["id"]
+        task = asyncio.current_task()
+        try:
+            async with self._get_load_semaphore():
+                if inspect.iscoroutinefunction(self.children_loader):
+                    children = self._call_loader(node)
+                else:
+                    loop = asyncio.get_running_loop()
+                    children = await loop.run_in_executor(None, self._call_loader, node)
+                if inspect.isawaitable(children):
+                    children = await self._await_children(node, children)
+        except asyncio.CancelledError:
+            return
+        finally:
+            # A cancelled load may already have been replaced by a new one
+            if self._loading.get(node_id) is task:
+                del self._loading[node_id]
+        self._store_children(node, children)
+        self._refresh_rows(node_id)
+        if self._request_render is not None:
+            self._request_render()
+
+    def _get_load_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent loads on the running loop.
+
+        Returns
+        -------
+        asyncio.Semaphore
+            Semaphore with ``max_concurrent_loads`` slots
+        """
+        loop = asyncio.get_running_loop()
+        if self._load_semaphore is None or self._load_semaphore_loop is not loop:
+            self._load_semaphore = asyncio.Semaphore(self.max_concurrent_loads)
+            self._load_semaphore_loop = loop
+        return self._load_semaphore
+
+    def _call_loader(self, node: dict) -> list[dict] | Awaitable[Any] | None:
+        """Call ``children_loader``, treating failures as no children.
+
+        Parameters
+        ----------
+        node : dict
+            Node whose children to load
+
+        Returns
+        -------
+        list of dict or awaitable or None
+            Raw child nodes, an awaitable resolving to them, or None if the
+            loader failed
+        """
+        loader = self.children_loader
+        if loader is None:
+            return []
+        try:
+            result = loader(node)
+            if inspect.isawaitable(result):
+                return result
+            return list(result or [])
+        except Exception:
+            logger.exception("children_loader failed for tree node %r", node["id"])
+            return None
+
+    async def _await_children(
+        self, node: dict, awaitable: Awaitable[Any]
+    ) -> list[dict] | None:
+        """Await an asynchronous loader result.
+
+        Parameters
+        ----------
+        node : dict
+            Node whose children are loading
+        awaitable : awaitable
+            Result of ``children_loader``
+
+        Returns
+        -------
+        list of dict or None
+            Raw child nodes, or None if the loader failed
+        """
+        try:
+            return list(await awaitable or [])
+        except Exception:
+            logger.exception("children_loader failed for tree node %r", node["id"])
+            return None
+
+    def _store_children(self, node: dict, children: list[dict] | None) -> None:
+        """Attach loaded children to a node and cache them.
+
+        Failed loads (``None``) leave the node without children and are not
+        cached, so :meth:`refresh_node` can retry them.
+
+        Parameters
+        ----------
+        node : dict
+            Node the children belong to
+        children : list of dict or None
+            Raw child nodes, or None if the loader failed
+        """
+        if children is not None and self.children_cache_size:
+            self._children_cache[node["id"]] = children
+            self._children_cache.move_to_end(node["id"])
+            while len(self._children_cache) > self.children_cache_size:
+                self._children_cache.popitem(last=False)
+        self._set_children(node, children or [])
+
+    def _cached_children(self, node_id: str) -> list[dict] | None:
+        """Look up a node's previously loaded children.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node
+
+        Returns
+        -------
+        list of dict or None
+            Raw child nodes, or None if not cached
+        """
+        children = self._children_cache.get(node_id)
+        if children is not None:
+            self._children_cache.move_to_end(node_id)
+        return children
+
+    def _cancel_loads(self, node_id: str | None = None) -> None:
+        """Cancel in-flight loads for a node and its descendants.
+
+        Parameters
+        ----------
+        node_id : str or None, optional
+            ID of the collapsed node, or None to cancel every load
+        """
+        for loading_id in list(self._loading):
+            if node_id is None or self._is_within(loading_id, node_id):
+                self._loading.pop(loading_id).cancel()
+
+    def _is_within(self, node_id: str, ancestor_id: str) -> bool:
+        """Check whether a node is, or descends from, another node.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of the node to check
+        ancestor_id : str
+            ID of the possible ancestor
+
+        Returns
+        -------
+        bool
+            True if ``node_id`` is ``ancestor_id`` or one of its descendants
+        """
+        node = self._node_index.get(node_id)
+        while node is not None:
+            if node["id"] == ancestor_id:
+                return True
+            node = self._parent_index.get(id(node))
+        return False
+
+    def refresh_node(self, node_id: str) -> None:
+        """Discard a lazy node's loaded children and load them again.
+
+        The node is reloaded immediately if it is expanded and visible,
+        otherwise the next time it is expanded.
+
+        Parameters
+        ----------
+        node_id : str
+            ID of a node marked ``has_children``
+        """
+        node = self._node_index.get(node_id)
+        if node is None:
+            return
+        self._cancel_loads(node_id)
+        self._children_cache.pop(node_id, None)
+
+        # Forget the old subtree so stale ids do not resolve
+        stack: list[dict] = list(node.get("children", []))
+        while stack:
+            child = stack.pop()
+            if self._node_index.get(child["id"]) is child:
+                del self._node_index[child["id"]]
+            self._parent_index.pop(id(child), None)
+            self._children_cache.pop(child["id"], None)
+            stack.extend(child.get("children", []))
+
+        node["children"] = []
+        node["has_children"] = True
+        self._refresh_rows(node_id)
+
+    def restore_expanded(self, node_ids: list[str]) -> None:
+        """Expand exactly the given nodes, e.g. from persisted state.
+
+        Lazy nodes among them load their children, and expanded lazy
+        descendants load in turn as their parents arrive.
+
+        Parameters
+        ----------
+        node_ids : list of str
+            IDs of the nodes to expand
+        """
+        expanded = set(node_ids)
+        if expanded == self.expanded_nodes:
+            return
+        for node_id in self.expanded_nodes - expanded:
+            self._cancel_loads(node_id)
+        self.expanded_nodes = expanded
+        self._rebuild_nodes()
+
+    def on_unmount(self) -> None:
+        """Cancel in-flight loads when the tree leaves the element tree."""
+        self._cancel_loads()
+        super().on_unmount()
+
+    def _set_children(self, node: dict, children: list[dict]) -> None:
+        """Normalize loaded children and attach them to a node.
+
+        Parameters
+        ----------
+        node : dict
+            Node the children belong to
+        children : list of dict
+            Raw child nodes returned by the loader
+        """
+        node_id = node["id"]
+        node["children"] = [
+            self._normalize_node(child, f"{node_id}_child_{i}")
+            for i, child in enumerate(children)
+        ]
+        # An empty result turns the node into a leaf
+        node["has_children"] = bool(node["children"])
+        for child in node["children"]:
+            self._index_subtree(child, node)
 
     def set_data(self, data: dict[str, Any] | list) -> None:
         """Update tree data and refresh display.
@@ -596,6 +1105,7 @@ class Tree(ScrollableElement):
         if node_id in self.expanded_nodes:
             # Collapse
             self.expanded_nodes.remove(node_id)
+            self._cancel_loads(node_id)
             if self.on_collapse:
                 invoke_callback(self.on_collapse, node_id)
         else:
@@ -604,8 +1114,8 @@ class Tree(ScrollableElement):
             if self.on_expand:
                 invoke_callback(self.on_expand, node_id)
 
-        # Rebuild flattened nodes
-        self._rebuild_nodes()
+        # Splice the node's subtree rows in or out
+        self._refresh_rows(node_id)
         self._save_expand_state()
 
     def expand_node(self, node_id: str) -> None:
@@ -620,7 +1130,7 @@ class Tree(ScrollableElement):
             self.expanded_nodes.add(node_id)
             if self.on_expand:
                 invoke_callback(self.on_expand, node_id)
-            self._rebuild_nodes()
+            self._refresh_rows(node_id)
             self._save_expand_state()
 
     def collapse_node(self, node_id: str) -> None:
@@ -633,9 +1143,10 @@ class Tree(ScrollableElement):
         """
         if node_id in self.expanded_nodes:
             self.expanded_nodes.remove(node_id)
+            self._cancel_loads(node_id)
             if self.on_collapse:
                 invoke_callback(self.on_collapse, node_id)
-            self._rebuild_nodes()
+            self._refresh_rows(node_id)
             self._save_expand_state()
 
     def select_node(self, node_id: str) -> None:
@@ -652,11 +1163,10 @@ class Tree(ScrollableElement):
         self._save_selected_state()
 
         # Find node in flattened list and update highlighted index
-        for i, node_info in enumerate(self.nodes):
-            if node_info["node"]["id"] == node_id:
-                self.highlighted_index = i
-                self._save_highlight_state()
-                break
+        index = self._row_index(node_id)
+        if index is not None:
+            self.highlighted_index = index
+            self._save_highlight_state()
 
         # Emit callback
         if self.on_select:
@@ -754,6 +1264,9 @@ class Tree(ScrollableElement):
         dict or None
             Found node or None
         """
+        if tree is self._data:
+            return self._node_index.get(node_id)
+
         if tree["id"] == node_id:
             return tree
 
@@ -779,11 +1292,12 @@ class Tree(ScrollableElement):
         """
         depth = node_info["depth"]
         is_last = node_info["is_last"]
-        parent_lines = node_info["parent_lines"]
 
         if depth == 0:
             return ""
 
+        parent_lines = self._parent_lines(node_info)
+
         prefix = ""
 
         # Determine the starting index for parent_lines
@@ -809,6 +1323,33 @@ class Tree(ScrollableElement):
 
         return prefix
 
+    def _parent_lines(self, node_info: dict[str, Any]) -> list[bool]:
+        """Work out which ancestor levels of a row continue below it.
+
+        Parameters
+        ----------
+        node_info : dict
+            Node information from flattened list
+
+        Returns
+        -------
+        list of bool
+            One entry per displayed ancestor level, True where that ancestor
+            has further siblings (so a vertical line is drawn)
+        """
+        depth = node_info["depth"]
+        lines = [False] * depth
+        ancestor = node_info["parent"]
+        for level in range(depth - 1, -1, -1):
+            if ancestor is None:
+                break
+            grandparent = self._parent_index.get(id(ancestor))
+            lines[level] = (
+                grandparent is not None and grandparent["children"][-1] is not ancestor
+            )
+            ancestor = grandparent
+        return lines
+
     def _get_expand_indicator(self, node_info: dict[str, Any]) -> str:
         """Get expand/collapse indicator for a node.
 
@@ -74,6 +74,8 @@ class Button(Element):
     >>> btn = Button("Cancel", style=ButtonStyle.MINIMAL)
     """
 
+    layout_attrs = frozenset({"label", "style"})
+
     def __init__(
         self,
         label: str,
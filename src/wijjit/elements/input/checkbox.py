@@ -5,7 +5,7 @@ single checkboxes and grouped checkbox selections in terminal user interfaces.
 Supports keyboard and mouse interaction, custom styling, and change callbacks.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from typing import TYPE_CHECKING, Any, Literal
 
 from wijjit.elements.base import Element, ElementType, invoke_callback
@@ -63,6 +63,8 @@ class Checkbox(Element):
     - Click: Toggle checkbox
     """
 
+    layout_attrs = frozenset({"label"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -179,6 +181,16 @@ class Checkbox(Element):
 
         return False
 
+    def layout_key(self) -> Hashable:
+        """Return the layout cache key, including the box glyph choice.
+
+        Returns
+        -------
+        Hashable
+            Layout generation and whether the 1-column Unicode box is used
+        """
+        return (self._layout_generation, supports_unicode())
+
     def get_intrinsic_size(self) -> tuple[int, int]:
         """Get the intrinsic (preferred) size of the checkbox.
 
@@ -17,13 +17,6 @@ import asyncio
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Literal
 
-from pygments.lexers import (
-    get_lexer_by_name,
-    guess_lexer,
-    guess_lexer_for_filename,
-)
-from pygments.util import ClassNotFound
-
 from wijjit.elements.input.highlighting import (
     DEFAULT_THEME,
     get_available_themes,
@@ -182,6 +175,11 @@ class SyntaxHighlighter:
         bool
             True if lexer was initialized successfully
         """
+        # Pygments' lexer registry is imported on first use so that merely
+        # importing wijjit does not pay for it.
+        from pygments.lexers import get_lexer_by_name
+        from pygments.util import ClassNotFound
+
         try:
             self.lexer = get_lexer_by_name(language)
             self.language = language
@@ -209,6 +207,9 @@ class SyntaxHighlighter:
         Filename-based detection is more reliable for short code snippets.
         Content-based detection works best with substantial code (50+ lines).
         """
+        from pygments.lexers import guess_lexer, guess_lexer_for_filename
+        from pygments.util import ClassNotFound
+
         # Try filename-based detection first (more reliable)
         if self.filename_hint:
             try:
@@ -7,15 +7,17 @@ it uses an "entry line" pattern for editing rather than inline cell editing.
 The DataGrid supports multiple input formats:
 - List of lists (native format)
 - List of dicts (auto-infers columns from keys)
-- pandas DataFrame (optional, auto-infers columns)
+- pandas DataFrame, NumPy array or Arrow table (read lazily through a
+  :class:`~wijjit.elements.data_source.DataSource`)
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, overload
 
 from wijjit.elements.base import ElementType, ScrollableElement, invoke_callback
+from wijjit.elements.data_source import DataSource, _is_dataframe, as_data_source
 from wijjit.layout.frames import BORDER_CHARS, BorderStyle
 from wijjit.layout.scroll import (
     ScrollManager,
@@ -33,23 +35,6 @@ if TYPE_CHECKING:
 DataInput = list[list[str]] | list[dict[str, Any]] | Any  # Native format: list of lists
 
 
-def _is_dataframe(obj: Any) -> bool:
-    """Check if object is a pandas DataFrame without importing pandas.
-
-    Parameters
-    ----------
-    obj : Any
-        Object to check
-
-    Returns
-    -------
-    bool
-        True if obj is a pandas DataFrame
-    """
-    # Check by class name to avoid importing pandas
-    return type(obj).__name__ == "DataFrame" and hasattr(obj, "iterrows")
-
-
 def _is_list_of_dicts(obj: Any) -> bool:
     """Check if object is a list of dicts.
 
@@ -88,6 +73,53 @@ def _col_letter(col: int) -> str:
     return result
 
 
+class _GridRows(Sequence[list[str]]):
+    """Read-only view of a source-backed grid's rows, including edits.
+
+    Passed to ``on_data_change`` so that a grid over a large DataSource is
+    not converted to a list on every edit. Rows are read on access, so the
+    view reflects the grid's current contents rather than a snapshot.
+
+    Parameters
+    ----------
+    grid : DataGrid
+        Grid whose rows are viewed
+    """
+
+    # Rows fetched per batch while iterating
+    CHUNK = 256
+
+    def __init__(self, grid: DataGrid) -> None:
+        self._grid = grid
+
+    def __len__(self) -> int:
+        return self._grid._row_count()
+
+    @overload
+    def __getitem__(self, index: int) -> list[str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[list[str]]: ...
+
+    def __getitem__(self, index: int | slice) -> list[str] | list[list[str]]:
+        count = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(count)
+            if step == 1:
+                return self._grid._get_rows(start, max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("grid row index out of range")
+        return self._grid._get_rows(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[list[str]]:
+        count = len(self)
+        for start in range(0, count, self.CHUNK):
+            yield from self._grid._get_rows(start, min(start + self.CHUNK, count))
+
+
 class DataGrid(ScrollableElement):
     """Spreadsheet-like data entry grid with entry line editing.
 
@@ -101,12 +133,16 @@ class DataGrid(ScrollableElement):
         Element identifier
     classes : str or list of str, optional
         CSS class names for styling
-    data : list of list, list of dict, or pandas DataFrame, optional
+    data : list of list, list of dict, DataFrame, or DataSource, optional
         Grid data in one of these formats:
         - List of lists: [["Alice", "30"], ["Bob", "25"]]
         - List of dicts: [{"name": "Alice", "age": 30}, ...]
         - pandas DataFrame: pd.DataFrame({"name": [...], "age": [...]})
+        - NumPy structured/2-D array or PyArrow Table
+        - Any :class:`~wijjit.elements.data_source.DataSource`
         Columns are auto-inferred from dicts/DataFrame if not provided.
+        DataFrames, arrays, tables and sources are not copied: only visible
+        rows are formatted.
     columns : list of str or list of dict, optional
         Column definitions. Can be simple strings (headers) or dicts with:
         - "key": Column identifier
@@ -127,7 +163,8 @@ class DataGrid(ScrollableElement):
     Attributes
     ----------
     data : list of list of str
-        Grid data as 2D list (normalized from any input format)
+        Grid data as 2D list (normalized from any input format). Reading it
+        from a source-backed grid converts the whole source to strings.
     columns : list of dict
         Column definitions with "key", "label", "width"
     cursor_row : int
@@ -159,6 +196,12 @@ class DataGrid(ScrollableElement):
     - Header row: 1 row
     - Data rows: height - 4 (entry line + header + borders)
 
+    Source-backed grids read rows on demand and keep edited rows in an
+    overlay. Structural edits (adding/removing rows or columns) and the
+    ``data`` attribute first convert the source to a list of lists.
+    ``on_data_change`` receives a lazy read-only view of their rows instead;
+    call ``get_data()`` from the callback if a full copy is needed.
+
     Data Format Conversion:
     - Use `get_data()` to get list of lists
     - Use `get_data_as_dicts()` to get list of dicts
@@ -191,6 +234,8 @@ class DataGrid(ScrollableElement):
     >>> df_out = grid.get_data_as_dataframe()
     """
 
+    layout_attrs = frozenset({"width_spec", "height_spec"})
+
     # Track column keys for dict/DataFrame export
     _column_keys: list[str]
 
@@ -212,12 +257,21 @@ class DataGrid(ScrollableElement):
         self.element_type = ElementType.INPUT
         self.focusable = True
 
-        # Normalize data and potentially infer columns
-        self.data, inferred_columns = self._normalize_data(data)
+        # Normalize data and potentially infer columns. DataFrames, arrays,
+        # tables and DataSources are kept as a source and read on demand;
+        # edited rows of a source are copied into an overlay.
+        self._source: DataSource | None = as_data_source(data)
+        self._edited_rows: dict[int, list[str]] = {}
+        inferred_columns: list[str] | None
+        if self._source is not None:
+            self._rows: list[list[str]] = []
+            inferred_columns = self._source.columns
+        else:
+            self._rows, inferred_columns = self._normalize_data(data)
         self._column_keys: list[str] = []
 
         # Use inferred columns if none provided
-        if columns is None and inferred_columns:
+        if not columns and inferred_columns:
             columns = inferred_columns
 
         # Normalize columns
@@ -246,7 +300,7 @@ class DataGrid(ScrollableElement):
             1, height - 5
         )  # Entry line(2) + header(1) + borders(2)
         self.scroll_manager = ScrollManager(
-            content_size=len(self.data),
+            content_size=self._row_count(),
             viewport_size=self._visible_rows,
         )
 
@@ -261,7 +315,7 @@ class DataGrid(ScrollableElement):
         # Callbacks
         self.on_cell_change: Callable[[int, int, str, str], None] | None = None
         self.on_cell_select: Callable[[int, int], None] | None = None
-        self.on_data_change: Callable[[list[list[str]]], None] | None = None
+        self.on_data_change: Callable[[Sequence[list[str]]], None] | None = None
 
         # State keys for persistence
         self._cursor_state_key_override: str | None = None
@@ -269,6 +323,85 @@ class DataGrid(ScrollableElement):
         # Template attributes
         self.bind: bool = True
 
+    @property
+    def data(self) -> list[list[str]]:
+        """Grid data as a list of lists of strings.
+
+        A source-backed grid is converted to a list first (see
+        :meth:`_materialize`); rendering and navigation never need this.
+        """
+        if self._source is not None:
+            self._materialize()
+        return self._rows
+
+    @data.setter
+    def data(self, value: list[list[str]] | DataSource | Any) -> None:
+        source = None if isinstance(value, list) else as_data_source(value)
+        self._source = source
+        self._edited_rows = {}
+        self._rows = [] if source is not None else value
+        # Absent during __init__
+        if hasattr(self, "scroll_manager"):
+            self._update_scroll_managers()
+
+    def _materialize(self) -> None:
+        """Convert a source-backed grid to an editable list of lists."""
+        source = self._source
+        if source is None:
+            return
+        edited = self._edited_rows
+        self._rows = [edited.get(i) or row for i, row in enumerate(source.iter_rows())]
+        self._source = None
+        self._edited_rows = {}
+
+    def _data_view(self) -> Sequence[list[str]]:
+        """Get the rows passed to ``on_data_change``.
+
+        Returns
+        -------
+        Sequence of list of str
+            The row list itself, or a lazy :class:`_GridRows` view for a
+            source-backed grid (call :meth:`get_data` for a full copy)
+        """
+        if self._source is None:
+            return self._rows
+        return _GridRows(self)
+
+    def _row_count(self) -> int:
+        """Get the number of data rows without converting a source.
+
+        Returns
+        -------
+        int
+            Number of rows
+        """
+        if self._source is not None:
+            return self._source.row_count
+        return len(self._rows)
+
+    def _get_rows(self, start: int, stop: int) -> list[list[str]]:
+        """Get a range of rows without converting a source.
+
+        Parameters
+        ----------
+        start : int
+            First row index
+        stop : int
+            Row index after the last row
+
+        Returns
+        -------
+        list of list of str
+            Rows in range (read-only views for source-backed grids)
+        """
+        if self._source is None:
+            return self._rows[start:stop]
+        rows = self._source.get_rows(start, stop)
+        if self._edited_rows:
+            edited = self._edited_rows
+            rows = [edited.get(start + i, row) for i, row in enumerate(rows)]
+        return rows
+
     def _normalize_data(
         self, data: DataInput | None
     ) -> tuple[list[list[str]], list[str] | None]:
@@ -480,7 +613,7 @@ class DataGrid(ScrollableElement):
         vertical and horizontal scrollbars (each affects the other's space).
         """
         # Calculate total content sizes
-        total_rows = len(self.data)
+        total_rows = self._row_count()
         self._total_columns_width = self._calculate_total_columns_width()
 
         # Base viewport sizes (without scrollbars)
@@ -577,7 +710,7 @@ class DataGrid(ScrollableElement):
             return self.scroll_manager.state.scroll_position > 0
         else:  # Down
             return self.scroll_manager.state.scroll_position < (
-                len(self.data) - self._visible_rows
+                self._row_count() - self._visible_rows
             )
 
     def _row_number_width(self) -> int:
@@ -591,7 +724,7 @@ class DataGrid(ScrollableElement):
         if not self.show_row_numbers:
             return 0
         # Width of largest row number + space
-        max_row = max(len(self.data), 1)
+        max_row = max(self._row_count(), 1)
         return len(str(max_row)) + 2
 
     def _get_cell_ref(self) -> str:
@@ -633,8 +766,15 @@ class DataGrid(ScrollableElement):
         str
             Cell value or empty string if out of bounds
         """
-        if 0 <= row < len(self.data) and 0 <= col < len(self.data[row]):
-            return self.data[row][col]
+        if not 0 <= row < self._row_count():
+            return ""
+        if self._source is not None and row not in self._edited_rows:
+            if 0 <= col < len(self._source.columns):
+                return self._source.get_cell(row, col)
+            return ""
+        values = self._edited_rows.get(row) if self._source else self._rows[row]
+        if values is not None and 0 <= col < len(values):
+            return values[col]
         return ""
 
     def set_cell(self, row: int, col: int, value: str) -> None:
@@ -649,6 +789,13 @@ class DataGrid(ScrollableElement):
         value : str
             New cell value
         """
+        if self._source is not None:
+            if row < self._source.row_count:
+                self._set_source_cell(row, col, value)
+                return
+            # Appending rows needs a real list
+            self._materialize()
+
         # Ensure row exists
         while len(self.data) <= row:
             self.data.append([""] * len(self.columns))
@@ -663,7 +810,35 @@ class DataGrid(ScrollableElement):
             if self.on_cell_change:
                 self.on_cell_change(row, col, old_value, value)
             if self.on_data_change:
-                self.on_data_change(self.data)
+                self.on_data_change(self._data_view())
+
+    def _set_source_cell(self, row: int, col: int, value: str) -> None:
+        """Set a cell of a source-backed grid through the edit overlay.
+
+        Parameters
+        ----------
+        row : int
+            Row index within the source
+        col : int
+            Column index (0-based)
+        value : str
+            New cell value
+        """
+        assert self._source is not None
+        values = self._edited_rows.get(row)
+        if values is None:
+            values = list(self._source.get_row(row))
+        while len(values) <= col:
+            values.append("")
+
+        old_value = values[col]
+        if old_value != value:
+            values[col] = value
+            self._edited_rows[row] = values
+            if self.on_cell_change:
+                self.on_cell_change(row, col, old_value, value)
+            if self.on_data_change:
+                self.on_data_change(self._data_view())
 
     def get_data(self) -> list[list[str]]:
         """Get all data as 2D list.
@@ -771,8 +946,13 @@ class DataGrid(ScrollableElement):
             If True and data is dict/DataFrame format, also update columns
             from the new data. Default is False (preserve existing columns).
         """
-        normalized, inferred_columns = self._normalize_data(data)
-        self.data = normalized
+        source = as_data_source(data)
+        if source is not None:
+            self.data = source
+            inferred_columns: list[str] | None = source.columns
+        else:
+            normalized, inferred_columns = self._normalize_data(data)
+            self.data = normalized
 
         # Optionally update columns from new data
         if update_columns and inferred_columns:
@@ -782,10 +962,11 @@ class DataGrid(ScrollableElement):
         self._update_scroll_managers()
 
         # Reset cursor if needed
-        if self.cursor_row >= len(self.data):
-            self.cursor_row = max(0, len(self.data) - 1)
+        row_count = self._row_count()
+        if self.cursor_row >= row_count:
+            self.cursor_row = max(0, row_count - 1)
         if self.on_data_change:
-            self.on_data_change(self.data)
+            self.on_data_change(self._data_view())
 
     def add_row(self, values: list[str] | None = None) -> None:
         """Add row at end.
@@ -800,7 +981,7 @@ class DataGrid(ScrollableElement):
         self.data.append(values[:])
         self._update_scroll_managers()
         if self.on_data_change:
-            self.on_data_change(self.data)
+            self.on_data_change(self._data_view())
 
     def insert_row(self, index: int, values: list[str] | None = None) -> None:
         """Insert row at index.
@@ -818,7 +999,7 @@ class DataGrid(ScrollableElement):
         self.data.insert(index, values[:])
         self._update_scroll_managers()
         if self.on_data_change:
-            self.on_data_change(self.data)
+            self.on_data_change(self._data_view())
 
     def delete_row(self, index: int) -> None:
         """Delete row at index.
@@ -835,7 +1016,7 @@ class DataGrid(ScrollableElement):
             if self.cursor_row >= len(self.data):
                 self.cursor_row = max(0, len(self.data) - 1)
             if self.on_data_change:
-                self.on_data_change(self.data)
+                self.on_data_change(self._data_view())
 
     def add_column(self, header: str, values: list[str] | None = None) -> None:
         """Add column at end.
@@ -859,7 +1040,7 @@ class DataGrid(ScrollableElement):
             val = values[i] if values and i < len(values) else ""
             row.append(val)
         if self.on_data_change:
-            self.on_data_change(self.data)
+            self.on_data_change(self._data_view())
 
     def delete_column(self, index: int) -> None:
         """Delete column at index.
@@ -878,7 +1059,7 @@ class DataGrid(ScrollableElement):
             if self.cursor_col >= len(self.columns):
                 self.cursor_col = max(0, len(self.columns) - 1)
             if self.on_data_change:
-                self.on_data_change(self.data)
+                self.on_data_change(self._data_view())
 
     def _start_editing(self, clear: bool = False) -> None:
         """Enter edit mode for current cell.
@@ -934,8 +1115,9 @@ class DataGrid(ScrollableElement):
         new_col = self.cursor_col + d_col
 
         # Clamp to valid range
-        if self.data:
-            new_row = max(0, min(new_row, len(self.data) - 1))
+        row_count = self._row_count()
+        if row_count:
+            new_row = max(0, min(new_row, row_count - 1))
         else:
             new_row = 0
         if self.columns:
@@ -1040,7 +1222,7 @@ class DataGrid(ScrollableElement):
         elif key == Keys.TAB:
             if self.cursor_col < len(self.columns) - 1:
                 self._move_cursor(0, 1)
-            elif self.cursor_row < len(self.data) - 1:
+            elif self.cursor_row < self._row_count() - 1:
                 # Wrap to first column of the next row in a single move so the
                 # full position change drives on_cell_select and scrolling.
                 self._move_cursor(1, -self.cursor_col)
@@ -1083,8 +1265,8 @@ class DataGrid(ScrollableElement):
 
         # Ctrl+End - go to last cell with data
         elif key.name == "ctrl+end":
-            if self.data:
-                self.cursor_row = len(self.data) - 1
+            if self._row_count():
+                self.cursor_row = self._row_count() - 1
             if self.columns:
                 self.cursor_col = len(self.columns) - 1
             self._ensure_cursor_visible()
@@ -1106,7 +1288,7 @@ class DataGrid(ScrollableElement):
             self.scroll_manager.page_down()
             # Move cursor to bottom of visible area
             _, visible_end = self.scroll_manager.get_visible_range()
-            self.cursor_row = min(visible_end - 1, len(self.data) - 1)
+            self.cursor_row = min(visible_end - 1, self._row_count() - 1)
             if self.on_cell_select:
                 self.on_cell_select(self.cursor_row, self.cursor_col)
             return True
@@ -1162,7 +1344,7 @@ class DataGrid(ScrollableElement):
         elif key == Keys.TAB:
             if self.cursor_col < len(self.columns) - 1:
                 self._move_cursor(0, 1)
-            elif self.cursor_row < len(self.data) - 1:
+            elif self.cursor_row < self._row_count() - 1:
                 # Single move to first column of next row (commits the edit,
                 # drives on_cell_select for the full position change).
                 self._move_cursor(1, -self.cursor_col)
@@ -1290,7 +1472,7 @@ class DataGrid(ScrollableElement):
                 clicked_col = self._x_to_column(x_in_grid)
 
                 # Validate and update cursor
-                if 0 <= clicked_row < len(self.data) and 0 <= clicked_col < len(
+                if 0 <= clicked_row < self._row_count() and 0 <= clicked_col < len(
                     self.columns
                 ):
                     # Commit any pending edit first
@@ -1648,6 +1830,9 @@ class DataGrid(ScrollableElement):
             ctx.bounds.height - 5
         )  # Entry(2) + sep(1) + header(1) + bottom(1)
 
+        # Fetch the visible rows in one batch (sources format only these)
+        visible_rows = self._get_rows(visible_start, visible_start + max_data_rows)
+
         for i in range(max_data_rows):
             data_row_idx = visible_start + i
             row_y = 4 + i  # Start after entry(2) + sep(1) + header(1)
@@ -1655,8 +1840,8 @@ class DataGrid(ScrollableElement):
             if row_y >= ctx.bounds.height - 1:
                 break
 
-            if data_row_idx < len(self.data):
-                row_data = self.data[data_row_idx]
+            if i < len(visible_rows):
+                row_data = visible_rows[i]
 
                 # Build row content
                 row_content = ""
@@ -1942,7 +2127,7 @@ class DataGrid(ScrollableElement):
             State from get_ephemeral_state()
         """
         if "cursor_row" in state:
-            max_row = len(self.data) - 1 if self.data else 0
+            max_row = max(0, self._row_count() - 1)
             self.cursor_row = min(state["cursor_row"], max_row)
         if "cursor_col" in state:
             max_col = len(self.columns) - 1 if self.columns else 0
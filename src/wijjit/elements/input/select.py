@@ -5,7 +5,11 @@ selection lists in terminal user interfaces. Supports keyboard navigation,
 mouse interaction, search filtering, and customizable styling.
 """
 
-from collections.abc import Callable
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Collection, Iterator, Sequence
+from itertools import accumulate, compress, count
+from operator import itemgetter, not_
 from typing import Any, Literal
 
 from wijjit.elements.base import ElementType, ScrollableElement, invoke_callback
@@ -16,6 +20,139 @@ from wijjit.terminal.ansi import ANSIStyle, clip_to_width, visible_length
 from wijjit.terminal.input import Key, Keys
 from wijjit.terminal.mouse import MouseButton, MouseEvent, MouseEventType
 
+# Typed characters further apart than this (in seconds) start a new
+# type-ahead query
+TYPE_AHEAD_TIMEOUT = 1.0
+
+
+class _OptionIndex:
+    """Lookup structures over a normalized options list.
+
+    Every structure is built on first use and lives as long as the options
+    list, so :class:`Select` creates a new index only when its options
+    change. Value lookups use a dict of first positions; label searches use
+    one newline-joined buffer of case-folded labels, searched with
+    ``str.find`` so the per-option work happens in C; enabled positions are
+    cached per set of disabled values.
+
+    Parameters
+    ----------
+    options : list of dict
+        Normalized options with 'value' and 'label' keys
+    """
+
+    def __init__(self, options: list[dict[str, Any]]) -> None:
+        self._options = options
+        self._values_list: list[Any] | None = None
+        self._positions: dict[Any, int] | None = None
+        self._all_hashable = True
+        self._buffer: str | None = None
+        self._starts: list[int] = []
+        self._disabled: frozenset[Any] | None = None
+        self._enabled: list[int] = []
+
+    def _values(self) -> list[Any]:
+        """Return the option values."""
+        if self._values_list is None:
+            self._values_list = list(map(itemgetter("value"), self._options))
+        return self._values_list
+
+    def position(self, value: Any) -> int:
+        """Return the index of the first option with ``value``, or -1."""
+        if self._positions is None:
+            values = self._values()
+            try:
+                # Reversed, so the first occurrence of a value wins
+                self._positions = dict(
+                    zip(reversed(values), range(len(values) - 1, -1, -1), strict=True)
+                )
+            except TypeError:
+                self._all_hashable = False
+                self._positions = {}
+                for i, opt_value in enumerate(values):
+                    try:
+                        self._positions.setdefault(opt_value, i)
+                    except TypeError:
+                        continue
+        try:
+            return self._positions[value]
+        except KeyError:
+            if self._all_hashable:
+                return -1
+        except TypeError:
+            pass
+        # Unhashable values can only be found by comparison
+        for i, opt in enumerate(self._options):
+            if opt["value"] == value:
+                return i
+        return -1
+
+    def enabled(self, disabled: Collection[Any]) -> Sequence[int]:
+        """Return the ascending indices of options not in ``disabled``."""
+        if not disabled:
+            return range(len(self._options))
+        if self._disabled is None or self._disabled != disabled:
+            self._disabled = frozenset(disabled)
+            is_disabled = map(self._disabled.__contains__, self._values())
+            self._enabled = list(compress(count(), map(not_, is_disabled)))
+        return self._enabled
+
+    def _search_buffer(self) -> str:
+        """Return the newline-delimited buffer of case-folded labels."""
+        if self._buffer is None:
+            labels = list(map(str, map(itemgetter("label"), self._options)))
+            text = "\n".join(labels)
+            folded = text.casefold()
+            if len(folded) != len(text) or text.count("\n") >= len(labels):
+                # Folding changed some label's length, or a label contains a
+                # separator: fold the labels one by one
+                labels = [label.casefold().replace("\n", " ") for label in labels]
+                folded = "\n".join(labels)
+            # Each label is followed by one separator
+            lengths = map((1).__add__, map(len, labels))
+            self._starts = list(accumulate(lengths, initial=1))
+            self._buffer = "\n" + folded + "\n"
+        return self._buffer
+
+    def prefix(self, query: str, start: int = 0) -> Iterator[int]:
+        """Yield the indices of options whose label starts with ``query``.
+
+        Indices are yielded in order from ``start``, wrapping around to the
+        options before it.
+        """
+        if not query or "\n" in query:
+            return
+        buffer = self._search_buffer()
+        starts = self._starts
+        key = "\n" + query.casefold()
+        # Each label is preceded by a separator, so a match of the separator
+        # and the query is a label starting with the query
+        begin = starts[start] - 1 if 0 <= start < len(self._options) else 0
+        position = buffer.find(key, begin)
+        while position != -1:
+            yield bisect_left(starts, position + 1)
+            position = buffer.find(key, position + 1)
+        position = buffer.find(key, 0, begin + len(key) - 1)
+        while position != -1:
+            yield bisect_left(starts, position + 1)
+            position = buffer.find(key, position + 1, begin + len(key) - 1)
+
+    def substring(self, query: str) -> list[int]:
+        """Return the indices of options whose label contains ``query``."""
+        if not query or "\n" in query:
+            return []
+        buffer = self._search_buffer()
+        starts = self._starts
+        key = query.casefold()
+        results: list[int] = []
+        position = buffer.find(key)
+        while position != -1:
+            index = bisect_right(starts, position) - 1
+            results.append(index)
+            # Continue with the next label
+            position = buffer.find(key, starts[index + 1])
+        return results
+
 
 class Select(ScrollableElement):
     """Select list element for choosing from a scrollable list of options.
@@ -55,6 +192,8 @@ class Select(ScrollableElement):
         Can also accept BorderStyle enum values.
     title : str, optional
         Title to display in the top border (only shown when border_style is not None)
+    type_ahead : bool, optional
+        Jump to options by typing the start of their label (default: False)
 
     Attributes
     ----------
@@ -86,6 +225,8 @@ class Select(ScrollableElement):
         Border style for rendering
     title : str or None
         Title displayed in top border (when borders are enabled)
+    type_ahead : bool
+        Whether typed characters move the highlight to a matching option
 
     Notes
     -----
@@ -99,6 +240,14 @@ class Select(ScrollableElement):
     - Enter/Space: Select highlighted option (single) or toggle selection (multiple)
     - Home/End: Jump to first/last option
     - PageUp/PageDown: Scroll by page
+    - Letters and digits (with type_ahead): Jump to the next enabled option
+      whose label starts with the typed text. Keys typed within
+      TYPE_AHEAD_TIMEOUT seconds extend the text; repeating one character
+      cycles through the options starting with it.
+
+    Value lookups, label searches (:meth:`find_options`) and skipping
+    disabled options use an index that is rebuilt only when ``options``
+    changes, so they stay fast with tens of thousands of options.
     """
 
     def __init__(
@@ -120,6 +269,7 @@ class Select(ScrollableElement):
             BorderStyle | Literal["single", "double", "rounded"] | None
         ) = None,
         title: str | None = None,
+        type_ahead: bool = False,
     ):
         super().__init__(id=id, classes=classes, tab_index=tab_index)
         self.element_type = ElementType.SELECTABLE
@@ -128,6 +278,7 @@ class Select(ScrollableElement):
         # Normalize options to internal format
         self._raw_options = options or []
         self._options = self._normalize_options(self._raw_options)
+        self._index = _OptionIndex(self._options)
 
         # Multi-select mode
         self.multiple = multiple
@@ -141,10 +292,13 @@ class Select(ScrollableElement):
             # Start highlight at first selected item, or 0
             self.highlighted_index = 0
             if self.selected_values and self.options:
-                for i, opt in enumerate(self.options):
-                    if opt["value"] in self.selected_values:
-                        self.highlighted_index = i
-                        break
+                positions = [
+                    position
+                    for position in map(self._find_option_index, self.selected_values)
+                    if position >= 0
+                ]
+                if positions:
+                    self.highlighted_index = min(positions)
         else:
             # Single-select: use single value
             self.selected_values = set()
@@ -157,7 +311,7 @@ class Select(ScrollableElement):
         self.visible_rows = visible_rows
 
         # Disabled options
-        self.disabled_values = set(disabled_values) if disabled_values else set()
+        self.disabled_values = disabled_values
 
         # Placeholder text for empty state
         self.placeholder = placeholder
@@ -171,6 +325,11 @@ class Select(ScrollableElement):
         # Title for border display
         self.title = title
 
+        # Type-ahead navigation
+        self.type_ahead = type_ahead
+        self._type_ahead_query = ""
+        self._type_ahead_time = 0.0
+
         # Scroll management for long lists
         self.scroll_manager = ScrollManager(
             content_size=len(self.options), viewport_size=visible_rows
@@ -268,6 +427,8 @@ class Select(ScrollableElement):
         """
         self._raw_options = value or []
         self._options = self._normalize_options(self._raw_options)
+        self._index = _OptionIndex(self._options)
+        self._type_ahead_query = ""
 
         # Update scroll manager content size if it exists
         if hasattr(self, "scroll_manager"):
@@ -286,6 +447,28 @@ class Select(ScrollableElement):
             if self.scroll_manager.state.scroll_position > max_scroll:
                 self.scroll_manager.scroll_to(max_scroll)
 
+    @property
+    def disabled_values(self) -> set[Any]:
+        """Get the set of disabled option values.
+
+        Returns
+        -------
+        set
+            Values of options that cannot be selected
+        """
+        return self._disabled_values
+
+    @disabled_values.setter
+    def disabled_values(self, value: Collection[Any] | None) -> None:
+        """Set the disabled option values.
+
+        Parameters
+        ----------
+        value : collection or None
+            Values of options that cannot be selected
+        """
+        self._disabled_values = set(value) if value else set()
+
     def _normalize_border_style(
         self, style: BorderStyle | Literal["single", "double", "rounded"] | None
     ) -> BorderStyle | None:
@@ -356,11 +539,7 @@ class Select(ScrollableElement):
         """
         if value is None:
             return -1
-
-        for i, opt in enumerate(self.options):
-            if opt["value"] == value:
-                return i
-        return -1
+        return self._index.position(value)
 
     def _skip_disabled_options(self, start_index: int, direction: int) -> int:
         """Find next enabled option in given direction.
@@ -388,17 +567,102 @@ class Select(ScrollableElement):
             if opt_value not in self.disabled_values:
                 return start_index
 
-        # Start_index is disabled or invalid, search for next enabled option
-        current = start_index
-        for _ in range(options_count):
-            current = (current + direction) % options_count
-            opt_value = self.options[current]["value"]
-            if opt_value not in self.disabled_values:
-                return current
-
-        # All options disabled
+        enabled = self._index.enabled(self.disabled_values)
+        if not enabled:
+            # All options disabled
+            return start_index
+
+        # Start_index is disabled or invalid, find the nearest enabled option
+        # after it in the given direction, wrapping around the ends
+        current = (start_index + direction) % options_count
+        if direction > 0:
+            position = bisect_left(enabled, current)
+            return enabled[position] if position < len(enabled) else enabled[0]
+        if direction < 0:
+            position = bisect_right(enabled, current) - 1
+            return enabled[position] if position >= 0 else enabled[-1]
+        if self.options[current]["value"] not in self.disabled_values:
+            return current
         return start_index
 
+    def find_options(self, query: str, match_anywhere: bool = False) -> list[int]:
+        """Find options whose label matches a query.
+
+        Matching ignores case and uses an index of the labels, so repeated
+        queries against a large options list do not rescan it.
+
+        Parameters
+        ----------
+        query : str
+            Text to match
+        match_anywhere : bool, optional
+            Match the query anywhere in a label rather than only at its start
+            (default: False)
+
+        Returns
+        -------
+        list of int
+            Indices of matching options (including disabled ones), in option
+            order. Empty for an empty query.
+        """
+        if match_anywhere:
+            return self._index.substring(query)
+        return list(self._index.prefix(query))
+
+    def _type_ahead_key(self, char: str) -> None:
+        """Move the highlight to the next option matching typed text.
+
+        Parameters
+        ----------
+        char : str
+            Typed character
+        """
+        now = time.monotonic()
+        if now - self._type_ahead_time > TYPE_AHEAD_TIMEOUT:
+            self._type_ahead_query = ""
+        self._type_ahead_time = now
+        self._type_ahead_query += char
+
+        query = self._type_ahead_query
+        if len(set(query.casefold())) == 1:
+            # A new query, or one character repeated: cycle through the
+            # options starting with that character
+            query = char
+            start = self.highlighted_index + 1
+        else:
+            # A longer query keeps the current option if it still matches
+            start = self.highlighted_index
+
+        for index in self._index.prefix(query, start):
+            if self.options[index]["value"] not in self.disabled_values:
+                self._move_highlight(index)
+                return
+
+    def _move_highlight(self, index: int) -> None:
+        """Highlight an option and scroll it into view with margin.
+
+        Parameters
+        ----------
+        index : int
+            Index of the option to highlight
+        """
+        if index == self.highlighted_index:
+            return
+        self.highlighted_index = index
+        self._emit_highlight_change(index)
+
+        visible_start, visible_end = self.scroll_manager.get_visible_range()
+        margin = self._scroll_margin
+        if index < visible_start + margin:
+            target = index - margin
+        elif index > visible_end - 1 - margin:
+            target = index - self.visible_rows + margin + 1
+        else:
+            return
+        position = self.scroll_manager.state.scroll_position
+        if self.scroll_manager.scroll_to(target) != position:
+            self._emit_scroll_change()
+
     def on_focus(self) -> None:
         """Called when element gains focus.
 
@@ -615,6 +879,17 @@ class Select(ScrollableElement):
             self._emit_highlight_change(self.highlighted_index)
             return True
 
+        # Type-ahead - jump to the next option starting with the typed text
+        elif (
+            self.type_ahead
+            and key.is_char
+            and key.char
+            and key.char.isprintable()
+            and not key.modifiers
+        ):
+            self._type_ahead_key(key.char)
+            return True
+
         return False
 
     async def handle_mouse(self, event: MouseEvent) -> bool:
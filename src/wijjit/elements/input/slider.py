@@ -83,6 +83,8 @@ class Slider(Element):
     - Drag handle: Smooth value adjustment
     """
 
+    layout_attrs = frozenset({"width", "label", "show_value", "float_mode", "max_val"})
+
     # Track characters for Unicode
     TRACK_CHAR = "\u2500"  # Horizontal line
     HANDLE_CHAR = "\u2588"  # Full block
@@ -103,6 +103,8 @@ class TextInput(AutocompleteMixin, Element):
     >>> inp = TextInput(value="Default", style=InputStyle.UNDERLINE)
     """
 
+    layout_attrs = frozenset({"width", "style"})
+
     def __init__(
         self,
         id: str | None = None,
@@ -681,6 +683,10 @@ class TextArea(Element):
         Border style for rendering
     """
 
+    layout_attrs = frozenset(
+        {"width", "height", "border_style", "autosize", "max_height"}
+    )
+
     def __init__(
         self,
         id: str | None = None,
@@ -787,6 +793,18 @@ class TextArea(Element):
         """
         return self._dynamic_sizing
 
+    @property
+    def layout_cacheable(self) -> bool:
+        """Whether the layout engine may reuse this element's constraints.
+
+        Returns
+        -------
+        bool
+            False when ``autosize`` is enabled: the height then follows the
+            wrapped content, which is edited in place.
+        """
+        return not self.autosize
+
     def get_intrinsic_size(self) -> tuple[int, int]:
         """Get the intrinsic size of the text area, including borders.
 
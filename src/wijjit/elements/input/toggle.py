@@ -85,6 +85,8 @@ class Toggle(Element):
     - On:  [O  ] or OFF [O  ] ON
     """
 
+    layout_attrs = frozenset({"label", "label_mode", "on_label", "off_label"})
+
     # Unicode block characters
     TRACK_CHAR = "\u2591"  # Light shade block for track
     KNOB_CHAR = "\u2588"  # Full block for knob
@@ -4,11 +4,18 @@ This module provides utility functions for common tasks like loading
 filesystem trees, converting data formats, etc.
 """
 
+from __future__ import annotations
+
 import fnmatch
+import os
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+# (name, path, is_dir, formatted size or None)
+_DirEntry = tuple[str, str, bool, str | None]
+
 
 def load_filesystem_tree(
     root_path: str | Path,
@@ -22,7 +29,9 @@ def load_filesystem_tree(
     """Load a filesystem directory structure as a tree.
 
     Recursively scans a directory and returns a nested dictionary structure
-    suitable for use with the Tree display element.
+    suitable for use with the Tree display element. For large directories
+    use :class:`FilesystemTreeLoader`, which loads folders only when they
+    are expanded.
 
     Parameters
     ----------
@@ -75,94 +84,272 @@ def load_filesystem_tree(
             "expanded_nodes": [],
         })
     """
-    root = Path(root_path).resolve()
+    loader = FilesystemTreeLoader(
+        show_hidden=show_hidden,
+        include_files=include_files,
+        include_metadata=include_metadata,
+        exclude=exclude,
+        filter_func=filter_func,
+    )
+    root = loader.root_node(root_path)
+    del root["has_children"]
+
+    def _build_children(node: dict[str, Any], depth: int) -> None:
+        """Recursively attach loaded children to a folder node."""
+        # Check depth limit
+        if max_depth is not None and depth >= max_depth:
+            return
+
+        children = loader.list_children(node["value"])
+        for child in children:
+            if child.pop("has_children", False):
+                _build_children(child, depth + 1)
+
+        if children:
+            node["children"] = children
+
+    _build_children(root, 0)
+    return root
+
+
+class FilesystemTreeLoader:
+    """Load directory contents on demand for a lazily expanded Tree.
+
+    Instances are callable with a tree node and return that directory's
+    children, so they can be passed directly as a ``Tree`` element's
+    ``children_loader``. Folders are returned without children and marked
+    ``has_children``; the Tree loads them (in a worker thread when an event
+    loop is running) only when the user expands them.
+
+    Directories are read with :func:`os.scandir`, whose entries carry the
+    file type, so each entry costs at most one ``stat()`` (for file sizes).
+    Results are cached per directory and reused until the directory's
+    modification time changes.
 
-    if not root.exists():
-        raise FileNotFoundError(f"Path does not exist: {root_path}")
+    Parameters
+    ----------
+    show_hidden : bool
+        Include hidden files and directories (default: False)
+    include_files : bool
+        Include files in the tree (default: True)
+    include_metadata : bool
+        Include the human-readable file size (default: True)
+    exclude : list of str, optional
+        List of glob patterns to exclude (e.g., ``["*.pyc", "__pycache__"]``)
+    filter_func : callable, optional
+        Custom filter function that takes a Path and returns True to include
 
-    if not root.is_dir():
-        raise NotADirectoryError(f"Path is not a directory: {root_path}")
+    Notes
+    -----
+    A directory's mtime changes when entries are added, removed or renamed,
+    not when a file inside it is modified, so cached file sizes can be stale.
+    Call :meth:`invalidate` to force a re-read.
 
-    def _should_include(path: Path) -> bool:
-        """Check if path should be included based on filters."""
+    Examples
+    --------
+    Browse a large directory without walking it up front::
+
+        loader = FilesystemTreeLoader(exclude=[".git", "node_modules"])
+        tree = Tree(data=loader.root_node("/srv/monorepo"), children_loader=loader)
+    """
+
+    def __init__(
+        self,
+        show_hidden: bool = False,
+        include_files: bool = True,
+        include_metadata: bool = True,
+        exclude: list[str] | None = None,
+        filter_func: Callable[[Path], bool] | None = None,
+    ) -> None:
+        self.show_hidden = show_hidden
+        self.include_files = include_files
+        self.include_metadata = include_metadata
+        self.exclude = list(exclude) if exclude else []
+        self.filter_func = filter_func
+
+        # path -> (st_mtime_ns, entries); guarded by _lock because the Tree
+        # calls the loader from worker threads
+        self._cache: dict[str, tuple[int, list[_DirEntry]]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, node: dict[str, Any]) -> list[dict[str, Any]]:
+        """Load the children of a folder node.
+
+        Parameters
+        ----------
+        node : dict
+            Tree node whose ``value`` is the directory path
+
+        Returns
+        -------
+        list of dict
+            Child nodes (see :meth:`list_children`)
+        """
+        return self.list_children(str(node["value"]))
+
+    def root_node(self, root_path: str | Path) -> dict[str, Any]:
+        """Build the unexpanded root node for a directory.
+
+        Parameters
+        ----------
+        root_path : str or Path
+            Root directory
+
+        Returns
+        -------
+        dict
+            Folder node with ``has_children`` set and no children loaded
+
+        Raises
+        ------
+        FileNotFoundError
+            If the path does not exist
+        NotADirectoryError
+            If the path is not a directory
+        """
+        root = Path(root_path).resolve()
+
+        if not root.exists():
+            raise FileNotFoundError(f"Path does not exist: {root_path}")
+
+        if not root.is_dir():
+            raise NotADirectoryError(f"Path is not a directory: {root_path}")
+
+        return {
+            "label": root.name or str(root),
+            "value": str(root),
+            "type": "folder",
+            "has_children": True,
+        }
+
+    def list_children(self, path: str) -> list[dict[str, Any]]:
+        """List the filtered, sorted children of a directory.
+
+        Parameters
+        ----------
+        path : str
+            Directory path
+
+        Returns
+        -------
+        list of dict
+            New node dicts, folders first then files, each sorted
+            case-insensitively. Folders have ``has_children`` set; files have
+            a ``size`` when ``include_metadata`` is enabled. Unreadable
+            directories have no children.
+        """
+        nodes = []
+        for name, entry_path, is_dir, size in self._scan(path):
+            node: dict[str, Any] = {
+                "label": name,
+                "value": entry_path,
+                "type": "folder" if is_dir else "file",
+            }
+            if is_dir:
+                node["has_children"] = True
+            elif size is not None:
+                node["size"] = size
+            nodes.append(node)
+        return nodes
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Drop cached directory listings.
+
+        Parameters
+        ----------
+        path : str, optional
+            Directory to forget; all directories when omitted
+        """
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(path, None)
+
+    def _scan(self, path: str) -> list[_DirEntry]:
+        """Read a directory, reusing the cached listing if it is unchanged.
+
+        Parameters
+        ----------
+        path : str
+            Directory path
+
+        Returns
+        -------
+        list of _DirEntry
+            Filtered entries in display order
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self.invalidate(path)
+            return []
+
+        with self._lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        entries: list[_DirEntry] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if not self._should_include(entry):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    size = None
+                    if not is_dir:
+                        try:
+                            is_file = entry.is_file()
+                        except OSError:
+                            is_file = False
+                        # Skip files if not including them
+                        if is_file and not self.include_files:
+                            continue
+                        if is_file and self.include_metadata:
+                            try:
+                                size = _format_size(entry.stat().st_size)
+                            except OSError:
+                                # Skip metadata if we can't access it
+                                pass
+                    entries.append((entry.name, entry.path, is_dir, size))
+        except PermissionError:
+            # Can't read directory, skip children
+            pass
+
+        entries.sort(key=lambda e: (not e[2], e[0].lower()))
+        with self._lock:
+            self._cache[path] = (mtime, entries)
+        return entries
+
+    def _should_include(self, entry: os.DirEntry[str]) -> bool:
+        """Check if a directory entry passes the name and custom filters."""
         # Check hidden files
-        if not show_hidden and path.name.startswith("."):
+        if not self.show_hidden and entry.name.startswith("."):
             return False
 
         # Check exclude patterns
-        if exclude:
-            for pattern in exclude:
-                if fnmatch.fnmatch(path.name, pattern):
-                    return False
+        for pattern in self.exclude:
+            if fnmatch.fnmatch(entry.name, pattern):
+                return False
 
         # Check custom filter
-        if filter_func and not filter_func(path):
+        if self.filter_func and not self.filter_func(Path(entry.path)):
             return False
 
         return True
 
-    def _format_size(size_bytes: int) -> str:
-        """Format file size in human-readable format."""
-        size_float: float = float(size_bytes)
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_float < 1024.0:
-                if unit == "B":
-                    return f"{int(size_float)} {unit}"
-                return f"{size_float:.1f} {unit}"
-            size_float /= 1024.0
-        return f"{size_float:.1f} PB"
-
-    def _build_tree(path: Path, depth: int = 0) -> dict[str, Any]:
-        """Recursively build tree structure."""
-        node: dict[str, Any] = {
-            "label": path.name if path != root else path.name or str(path),
-            "value": str(path),
-            "type": "folder" if path.is_dir() else "file",
-        }
-
-        # Add metadata if requested
-        if include_metadata:
-            try:
-                stat = path.stat()
-                if path.is_file():
-                    node["size"] = _format_size(stat.st_size)
-            except (OSError, PermissionError):
-                # Skip metadata if we can't access it
-                pass
-
-        # Recursively process children if this is a directory
-        if path.is_dir():
-            # Check depth limit
-            if max_depth is not None and depth >= max_depth:
-                return node
-
-            children = []
-            try:
-                # Get all items in directory
-                items = sorted(
-                    path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())
-                )
-
-                for item in items:
-                    # Apply filters
-                    if not _should_include(item):
-                        continue
-
-                    # Skip files if not including them
-                    if item.is_file() and not include_files:
-                        continue
-
-                    # Recursively build child node
-                    child_node = _build_tree(item, depth + 1)
-                    children.append(child_node)
-
-            except PermissionError:
-                # Can't read directory, skip children
-                pass
-
-            if children:
-                node["children"] = children
-
-        return node
 
-    return _build_tree(root)
+def _format_size(size_bytes: int) -> str:
+    """Format file size in human-readable format."""
+    size_float: float = float(size_bytes)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size_float < 1024.0:
+            if unit == "B":
+                return f"{int(size_float)} {unit}"
+            return f"{size_float:.1f} {unit}"
+        size_float /= 1024.0
+    return f"{size_float:.1f} PB"
@@ -223,10 +223,35 @@ class ElementNode(LayoutNode):
         -------
         SizeConstraints
             Calculated constraints
+
+        Notes
+        -----
+        Constraints are cached on the element, keyed by its ``layout_key()``
+        (its layout generation by default) and this node's size specs.
+        Elements persist across frames through reconciliation, so an element
+        whose layout attributes did not change is not re-measured on the next
+        frame.
         """
+        element = self.element
         # Check if element supports dynamic sizing
         # Dynamic sizing elements use minimal constraints to avoid inflating parent
-        supports_dynamic_sizing = self.element.supports_dynamic_sizing
+        supports_dynamic_sizing = element.supports_dynamic_sizing
+
+        cacheable = element.layout_cacheable
+        if cacheable:
+            cache_key = (
+                element.layout_key(),
+                self.width_spec,
+                self.height_spec,
+                supports_dynamic_sizing,
+            )
+            cached = element._layout_cache
+            if cached is not None and cached[0] == cache_key:
+                self.constraints = cached[1]
+                return self.constraints
+
+        # Intrinsic size is measured at most once per pass
+        intrinsic: tuple[int, int] | None = None
 
         # Apply width/height specs if fixed
         if self.width_spec.is_fixed:
@@ -239,7 +264,8 @@ class ElementNode(LayoutNode):
             preferred_width = 10  # Keep preferred same as min to avoid inflating parent
         else:
             # Auto or other - get intrinsic size from element
-            content_width, _ = self.element.get_intrinsic_size()
+            intrinsic = element.get_intrinsic_size()
+            content_width = intrinsic[0]
             min_width = content_width
             preferred_width = content_width
 
@@ -253,7 +279,9 @@ class ElementNode(LayoutNode):
             preferred_height = 5  # Keep preferred same as min to avoid inflating parent
         else:
             # Auto or other - get intrinsic size from element
-            _, content_height = self.element.get_intrinsic_size()
+            if intrinsic is None:
+                intrinsic = element.get_intrinsic_size()
+            content_height = intrinsic[1]
             min_height = content_height
             preferred_height = content_height
 
@@ -263,6 +291,8 @@ class ElementNode(LayoutNode):
             preferred_width=preferred_width,
             preferred_height=preferred_height,
         )
+        if cacheable:
+            element._layout_cache = (cache_key, self.constraints)
         return self.constraints
 
     def assign_bounds(self, x: int, y: int, width: int, height: int) -> None:
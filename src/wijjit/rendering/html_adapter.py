@@ -13,8 +13,6 @@ import re
 import xml.parsers.expat
 from typing import TYPE_CHECKING, Any
 
-from prompt_toolkit.formatted_text import HTML
-
 from wijjit.logging_config import get_logger
 from wijjit.terminal.cell import Cell
 
@@ -131,6 +129,10 @@ def html_string_to_cells(
     if not html_str:
         return []
 
+    # Imported here: prompt_toolkit is expensive to import and most apps
+    # never render HTML content.
+    from prompt_toolkit.formatted_text import HTML
+
     try:
         # Parse HTML using prompt_toolkit
         html_obj = HTML(html_str)
@@ -368,6 +370,8 @@ def strip_html_tags(html_str: str) -> str:
     if not html_str:
         return ""
 
+    from prompt_toolkit.formatted_text import HTML
+
     try:
         html_obj = HTML(html_str)
         formatted_text = html_obj.__pt_formatted_text__()
@@ -124,8 +124,8 @@ class PaintContext:
         """
         from wijjit.terminal.cell import Cell
 
-        # Convert style to cell attributes
-        cell_attrs = style.to_cell_attrs()
+        # Intern the style once; every cell below shares the id
+        style_id = style.to_style_id()
 
         # Translate to absolute coordinates
         abs_x = self.bounds.x + x
@@ -157,12 +157,12 @@ class PaintContext:
                 if char_x < clip_x_start or char_x >= clip_x_end:
                     continue
 
-                cell = Cell(char=char, **cell_attrs)
+                cell = Cell(char, style_id=style_id)
                 self.buffer.set_cell(char_x, abs_y, cell)
         else:
             # No clipping - write all characters
             for i, char in enumerate(text):
-                cell = Cell(char=char, **cell_attrs)
+                cell = Cell(char, style_id=style_id)
                 self.buffer.set_cell(abs_x + i, abs_y, cell)
 
     def write_text_wrapped(
@@ -270,8 +270,8 @@ class PaintContext:
         """
         from wijjit.terminal.cell import Cell
 
-        # Convert style to cell attributes
-        cell_attrs = style.to_cell_attrs()
+        # Intern the style once; every cell below shares the id
+        style_id = style.to_style_id()
 
         # Translate to absolute coordinates
         abs_x = self.bounds.x + x
@@ -300,7 +300,7 @@ class PaintContext:
                 if col_abs_x < clip_x_start or col_abs_x >= clip_x_end:
                     continue
 
-                cell = Cell(char=char, **cell_attrs)
+                cell = Cell(char, style_id=style_id)
                 self.buffer.set_cell(col_abs_x, row_abs_y, cell)
 
     def _is_point_in_clip(self, abs_x: int, abs_y: int) -> bool:
@@ -399,7 +399,7 @@ class PaintContext:
         ...           'h': '-', 'v': '|'}
         >>> ctx.draw_border(0, 0, 20, 10, style, custom)
         """
-        from wijjit.terminal.cell import get_pooled_cell
+        from wijjit.terminal.cell import get_pooled_styled_cell
 
         # Default single-line box drawing characters
         if border_chars is None:
@@ -412,8 +412,8 @@ class PaintContext:
                 "v": "\u2502",  # │
             }
 
-        # Convert style to cell attributes
-        cell_attrs = style.to_cell_attrs()
+        # Intern the style once; every border cell shares the id
+        style_id = style.to_style_id()
 
         # Translate to absolute coordinates
         abs_x = self.bounds.x + x
@@ -421,36 +421,36 @@ class PaintContext:
 
         # OPTIMIZED: Use batch operations and cell pooling to reduce overhead
         # Pre-create cell objects from pool for reuse
-        h_cell = get_pooled_cell(char=border_chars["h"], **cell_attrs)
-        v_cell = get_pooled_cell(char=border_chars["v"], **cell_attrs)
+        h_cell = get_pooled_styled_cell(border_chars["h"], style_id)
+        v_cell = get_pooled_styled_cell(border_chars["v"], style_id)
 
         # Draw corners (from pool), respecting clip region
         if width >= 2 and height >= 2:
             # Top-left corner
             if self._is_point_in_clip(abs_x, abs_y):
                 self.buffer.set_cell(
-                    abs_x, abs_y, get_pooled_cell(char=border_chars["tl"], **cell_attrs)
+                    abs_x, abs_y, get_pooled_styled_cell(border_chars["tl"], style_id)
                 )
             # Top-right corner
             if self._is_point_in_clip(abs_x + width - 1, abs_y):
                 self.buffer.set_cell(
                     abs_x + width - 1,
                     abs_y,
-                    get_pooled_cell(char=border_chars["tr"], **cell_attrs),
+                    get_pooled_styled_cell(border_chars["tr"], style_id),
                 )
             # Bottom-left corner
             if self._is_point_in_clip(abs_x, abs_y + height - 1):
                 self.buffer.set_cell(
                     abs_x,
                     abs_y + height - 1,
-                    get_pooled_cell(char=border_chars["bl"], **cell_attrs),
+                    get_pooled_styled_cell(border_chars["bl"], style_id),
                 )
             # Bottom-right corner
             if self._is_point_in_clip(abs_x + width - 1, abs_y + height - 1):
                 self.buffer.set_cell(
                     abs_x + width - 1,
                     abs_y + height - 1,
-                    get_pooled_cell(char=border_chars["br"], **cell_attrs),
+                    get_pooled_styled_cell(border_chars["br"], style_id),
                 )
 
         # Draw horizontal edges, respecting clip region
@@ -203,6 +203,41 @@ class Style:
             "dim": self.dim if self.dim is not None else False,
         }
 
+    def to_style_id(self) -> int:
+        """Intern this style in the global cell style table.
+
+        Returns
+        -------
+        int
+            Style id suitable for ``Cell(char, style_id=...)``
+
+        Notes
+        -----
+        Unlike :meth:`to_cell_attrs`, this allocates nothing once a style has
+        been seen: the id is a dictionary lookup into the shared style table,
+        and the SGR sequence for it is precomputed there. Prefer this in loops
+        that create many cells with the same style.
+
+        Examples
+        --------
+        >>> from wijjit.terminal.cell import Cell
+        >>> style = Style(fg_color=(255, 0, 0), bold=True)
+        >>> cell = Cell('A', style_id=style.to_style_id())
+        >>> cell == Cell('A', fg_color=(255, 0, 0), bold=True)
+        True
+        """
+        from wijjit.terminal.cell import intern_style
+
+        return intern_style(
+            self.fg_color,
+            self.bg_color,
+            bool(self.bold),
+            bool(self.italic),
+            bool(self.underline),
+            bool(self.reverse),
+            bool(self.dim),
+        )
+
     def to_ansi(self) -> str:
         """Convert style to ANSI escape sequence prefix.
 
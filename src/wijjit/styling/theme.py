@@ -6,6 +6,8 @@ switching between visual themes (light, dark, custom, etc.).
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator, MutableMapping
+
 from wijjit.styling.style import Style
 
 
@@ -1594,6 +1596,59 @@ class HighContrastTheme(Theme):
         super().__init__("high_contrast", styles)
 
 
+class _ThemeRegistry(MutableMapping[str, Theme]):
+    """Theme mapping that constructs registered themes on first access.
+
+    Built-in themes are registered as factories and only instantiated when
+    looked up, so creating a ThemeManager does not build every theme's style
+    table. Membership tests, iteration and ``len`` never construct anything.
+    """
+
+    def __init__(self) -> None:
+        self._themes: dict[str, Theme] = {}
+        self._factories: dict[str, Callable[[], Theme]] = {}
+
+    def add_factory(self, name: str, factory: Callable[[], Theme]) -> None:
+        """Register a theme to be built on first access.
+
+        Parameters
+        ----------
+        name : str
+            Theme name
+        factory : callable
+            Zero-argument callable returning the theme
+        """
+        self._themes.pop(name, None)
+        self._factories[name] = factory
+
+    def __getitem__(self, name: str) -> Theme:
+        theme = self._themes.get(name)
+        if theme is None:
+            factory = self._factories.pop(name)  # KeyError if unknown
+            theme = self._themes[name] = factory()
+        return theme
+
+    def __setitem__(self, name: str, theme: Theme) -> None:
+        self._factories.pop(name, None)
+        self._themes[name] = theme
+
+    def __delitem__(self, name: str) -> None:
+        if name in self._themes:
+            del self._themes[name]
+        else:
+            del self._factories[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._themes or name in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._themes
+        yield from self._factories
+
+    def __len__(self) -> int:
+        return len(self._themes) + len(self._factories)
+
+
 class ThemeManager:
     """Manages theme registration and switching.
 
@@ -1602,8 +1657,9 @@ class ThemeManager:
 
     Attributes
     ----------
-    themes : dict of str to Theme
-        Registered themes by name
+    themes : MutableMapping of str to Theme
+        Registered themes by name. Built-in themes are constructed the first
+        time they are looked up (e.g. by ``set_theme``), not up front.
     current_theme : Theme
         Currently active theme
 
@@ -1629,16 +1685,30 @@ class ThemeManager:
     """
 
     def __init__(self) -> None:
-        self.themes: dict[str, Theme] = {}
-
-        # Register built-in themes
-        self.register_theme(DefaultTheme())
-        self.register_theme(DarkTheme())
-        self.register_theme(LightTheme())
-        self.register_theme(HighContrastTheme())
-
-        # Point to registered default theme so mutations persist
-        self.current_theme: Theme = self.themes["default"]
+        self.themes: _ThemeRegistry = _ThemeRegistry()
+
+        # Register built-in themes; each is built on first use
+        self.themes.add_factory("default", DefaultTheme)
+        self.themes.add_factory("dark", DarkTheme)
+        self.themes.add_factory("light", LightTheme)
+        self.themes.add_factory("high_contrast", HighContrastTheme)
+
+        # Resolved from the registry on first access so mutations to the
+        # active theme persist and no theme is built until it is needed
+        self._current_name = "default"
+        self._current_theme: Theme | None = None
+
+    @property
+    def current_theme(self) -> Theme:
+        """Currently active theme."""
+        if self._current_theme is None:
+            self._current_theme = self.themes[self._current_name]
+        return self._current_theme
+
+    @current_theme.setter
+    def current_theme(self, theme: Theme) -> None:
+        self._current_theme = theme
+        self._current_name = theme.name
 
     def register_theme(self, theme: Theme) -> None:
         """Register a theme.
@@ -1684,7 +1754,8 @@ class ThemeManager:
         """
         if theme_name not in self.themes:
             raise KeyError(f"Theme '{theme_name}' not found")
-        self.current_theme = self.themes[theme_name]
+        self._current_name = theme_name
+        self._current_theme = None
 
     def get_theme(self) -> Theme:
         """Get the currently active theme.
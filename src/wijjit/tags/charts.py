@@ -73,6 +73,8 @@ class SparklineExtension(Extension):
         border: str | None = None,
         border_style: str = "none",
         bind: bool = True,
+        capacity: int | None = None,
+        decimation: Literal["minmax", "lttb", "none"] = "minmax",
         **kwargs: Any,
     ) -> str:
         """Render the sparkline tag."""
@@ -106,6 +108,11 @@ class SparklineExtension(Extension):
             vnode.set_prop("color", color)
         vnode.set_prop("border", border_style)
         vnode.set_prop("bind", bind)
+        if capacity is not None:
+            vnode.set_prop(
+                "capacity", max(1, safe_int(capacity, default=1, name="capacity"))
+            )
+        vnode.set_prop("decimation", decimation)
         # set_layout auto-syncs width/height to props
         vnode.set_layout(
             width=safe_int(width, default=20, name="width"),
@@ -176,6 +183,7 @@ class BarChartExtension(Extension):
         border: str | None = None,
         border_style: str = "single",
         bind: bool = True,
+        capacity: int | None = None,
         **kwargs: Any,
     ) -> str:
         """Render the barchart tag."""
@@ -219,6 +227,10 @@ class BarChartExtension(Extension):
         vnode.set_prop("show_scrollbar", bool(show_scrollbar))
         vnode.set_prop("border", border_style)
         vnode.set_prop("bind", bind)
+        if capacity is not None:
+            vnode.set_prop(
+                "capacity", max(1, safe_int(capacity, default=1, name="capacity"))
+            )
         # set_layout auto-syncs width/height to props
         vnode.set_layout(
             width=safe_int(width, default=40, name="width"),
@@ -397,6 +409,8 @@ class LineChartExtension(Extension):
         border: str | None = None,
         border_style: str = "single",
         bind: bool = True,
+        capacity: int | None = None,
+        decimation: Literal["minmax", "lttb", "none"] = "minmax",
         **kwargs: Any,
     ) -> str:
         """Render the linechart tag."""
@@ -432,6 +446,11 @@ class LineChartExtension(Extension):
         vnode.set_prop("color", color)
         vnode.set_prop("border", border_style)
         vnode.set_prop("bind", bind)
+        if capacity is not None:
+            vnode.set_prop(
+                "capacity", max(1, safe_int(capacity, default=1, name="capacity"))
+            )
+        vnode.set_prop("decimation", decimation)
         # set_layout auto-syncs width/height to props
         vnode.set_layout(
             width=safe_int(width, default=60, name="width"),
@@ -15,6 +15,7 @@ from jinja2.parser import Parser
 from wijjit.core.overlay import LayerType
 from wijjit.core.render_context import get_render_context
 from wijjit.core.vdom import VNodeBuilder
+from wijjit.elements.data_source import as_data_source
 from wijjit.elements.display.modal import ModalElement
 from wijjit.elements.display.statusbar import StatusBar
 from wijjit.elements.display.tabbed_panel import TabPosition
@@ -104,7 +105,7 @@ class TableExtension(Extension):
             Jinja2 caller for body content
         id : str, optional
             Element identifier
-        data : list of dict, optional
+        data : list of dict, DataFrame, or DataSource, optional
             Table data
         columns : list, optional
             Column definitions
@@ -161,11 +162,13 @@ class TableExtension(Extension):
             except (KeyError, TypeError, AttributeError) as e:
                 logger.warning(f"Failed to restore state: {e}")
 
-        # Ensure data is a list
+        # Ensure data is a list; DataFrames, arrays and tables are wrapped in
+        # a DataSource so only visible rows are read
         if data is None:
             data = []
         elif not isinstance(data, list):
-            data = list(data)
+            source = as_data_source(data)
+            data = source if source is not None else list(data)
 
         # Ensure columns is a list
         if columns is None:
@@ -259,6 +262,9 @@ class TreeExtension(Extension):
         border_style: str = "single",
         title: str | None = None,
         indicator_style: str = "triangles_large",
+        children_loader: Any = None,
+        max_concurrent_loads: int = 4,
+        children_cache_size: int = 256,
         **kwargs: Any,
     ) -> str:
         """Render the tree tag.
@@ -303,6 +309,14 @@ class TreeExtension(Extension):
         indicator_style : str
             Indicator style: "triangles_large", "triangles", "circles", "squares",
             "brackets", or "minimal" (default: "triangles_large")
+        children_loader : callable, optional
+            ``loader(node) -> list[dict]`` (or a coroutine function) loading
+            the children of nodes marked ``has_children`` when they are first
+            expanded
+        max_concurrent_loads : int
+            Maximum number of loader calls in flight at once (default: 4)
+        children_cache_size : int
+            Number of loaded child lists to cache (default: 256)
         classes : str, optional
             CSS-like class names for styling
 
@@ -374,6 +388,7 @@ class TreeExtension(Extension):
 
         # Build VNode
         vnode = VNodeBuilder("TreeView", key=id)
+        vnode.set_prop("id", id)  # Set id as prop so state keys derive from it
         vnode.set_prop("data", data)
         vnode.set_prop("multiple", multiple)
         if selected_ids is not None:
@@ -391,6 +406,16 @@ class TreeExtension(Extension):
         if expanded is not None:
             vnode.set_prop("expanded", expanded)
         vnode.set_prop("bind", bind)
+        if children_loader is not None:
+            vnode.set_prop("children_loader", children_loader)
+            vnode.set_prop(
+                "max_concurrent_loads",
+                safe_int(max_concurrent_loads, default=4, name="max_concurrent_loads"),
+            )
+            vnode.set_prop(
+                "children_cache_size",
+                safe_int(children_cache_size, default=256, name="children_cache_size"),
+            )
         apply_common_attributes(vnode, kwargs)
         vnode.set_layout(width=width_spec, height=height_spec)
 
@@ -1620,6 +1645,88 @@ class TextExtension(Extension):
         return get_element_marker(context)
 
 
+def _resolve_panel_index(
+    state: Any,
+    selector: str | int | None,
+    bind: bool,
+    element_id: str,
+    property_name: str,
+) -> int:
+    """Resolve the active tab/page index of a panel before its body renders.
+
+    Parameters
+    ----------
+    state : State or None
+        Application state
+    selector : str or int or None
+        ``active_tab`` / ``current_page`` attribute: a bound state key or a
+        literal index
+    bind : bool
+        Whether a string ``selector`` is a state key
+    element_id : str
+        Panel element id
+    property_name : str
+        Suffix of the panel's auto-generated state key (``"active_tab"`` or
+        ``"page"``), where the element persists user navigation
+
+    Returns
+    -------
+    int
+        Index of the tab/page whose body should be evaluated
+    """
+    if isinstance(selector, str) and bind:
+        key = selector
+    else:
+        key = f"{element_id}:{property_name}"
+    try:
+        if state is not None and key in state:
+            return int(state[key])
+    except (KeyError, TypeError, AttributeError, ValueError) as e:
+        logger.warning(f"Failed to restore {property_name} state: {e}")
+    return selector if isinstance(selector, int) else 0
+
+
+def _defer_inactive_body(
+    context: Any,
+    parent: Any,
+    child_vnode: VNodeBuilder,
+    child_index: int,
+    index_prop: str,
+) -> bool:
+    """Skip an inactive tab/page body when its panel is lazy.
+
+    The child VNode is added without children and marked ``deferred``; the
+    renderer then carries the subtree from the previous frame over unchanged.
+
+    Parameters
+    ----------
+    context : LayoutContext
+        Current layout context
+    parent : VNodeBuilder or None
+        Enclosing TabbedPanel / Pager VNode
+    child_vnode : VNodeBuilder
+        TabContent / PageContent VNode being rendered
+    child_index : int
+        Index of this tab/page within the panel
+    index_prop : str
+        Parent prop holding the active index
+
+    Returns
+    -------
+    bool
+        True if the body was deferred and must not be evaluated
+    """
+    if parent is None or not parent.props.get("lazy", False):
+        return False
+    if parent.props.get(index_prop, 0) == child_index:
+        return False
+    child_vnode.set_prop("deferred", True)
+    context.push_vnode(child_vnode)
+    context.pop_vnode()
+    context.has_deferred_content = True
+    return True
+
+
 class TabExtension(Extension):
     """Jinja2 extension for {% tab %} tag (used within {% tabbedpanel %}).
 
@@ -1695,12 +1802,11 @@ class TabExtension(Extension):
 
         # Create a TabContent VNode to hold this tab's content
         # Use a unique key based on the tab index
+        parent = context.vnode_stack[-1] if context.vnode_stack else None
         tab_index = len(
             [
                 c
-                for c in (
-                    context.vnode_stack[-1].children if context.vnode_stack else []
-                )
+                for c in (parent.children if parent is not None else [])
                 if getattr(c, "type", None) == "TabContent"
             ]
         )
@@ -1709,6 +1815,12 @@ class TabExtension(Extension):
         tab_vnode = VNodeBuilder("TabContent", key=tab_key)
         tab_vnode.set_prop("label", label)
 
+        # Inactive tabs of a lazy panel keep last frame's subtree
+        if _defer_inactive_body(
+            context, parent, tab_vnode, tab_index, "active_tab_index"
+        ):
+            return ""
+
         # Push the tab VNode onto the stack to collect children
         context.push_vnode(tab_vnode)
 
@@ -1798,6 +1910,7 @@ class TabbedPanelExtension(Extension):
         border: str | None = None,
         border_style: str = "single",
         bind: bool = True,
+        lazy: bool = True,
         **kwargs: Any,
     ) -> str:
         """Render the tabbedpanel tag.
@@ -1823,6 +1936,10 @@ class TabbedPanelExtension(Extension):
             Border style: "single", "double", "rounded" (default: "single")
         bind : bool
             Whether to auto-bind active tab to state (default: True)
+        lazy : bool
+            Evaluate only the active tab's body (default: True). Inactive tabs
+            keep the elements from when they were last shown, frozen, and are
+            re-evaluated when activated.
 
         Returns
         -------
@@ -1867,8 +1984,16 @@ class TabbedPanelExtension(Extension):
         vnode.set_prop("tab_position", tab_pos)
         vnode.set_prop("border_style", border_style)
         vnode.set_prop("bind", bind)
+        vnode.set_prop("lazy", bool(lazy))
         apply_common_attributes(vnode, kwargs)
 
+        # Determine the active tab index before rendering the body, so that
+        # {% tab %} children of a lazy panel can skip their inactive bodies
+        active_tab_index = _resolve_panel_index(
+            state, active_tab, bind, id, "active_tab"
+        )
+        vnode.set_prop("active_tab_index", active_tab_index)
+
         # Push VNode to stack - TabExtension children will add TabContent VNodes
         context.push_vnode(vnode)
 
@@ -1878,23 +2003,7 @@ class TabbedPanelExtension(Extension):
         # Pop VNode from stack
         context.pop_vnode()
 
-        # Collect TabContent children from the VNode
-        # tab_vnodes = [c for c in vnode.children if c.type == "TabContent"]
-
-        # Determine initial active tab index
-        active_tab_index = 0
-        if isinstance(active_tab, int):
-            active_tab_index = active_tab
-        elif isinstance(active_tab, str) and bind:
-            # active_tab is a state key - try to restore from state
-            try:
-                if active_tab in state:
-                    active_tab_index = int(state[active_tab])
-            except (KeyError, TypeError, AttributeError, ValueError) as e:
-                logger.warning(f"Failed to restore active tab state: {e}")
-
         # Add remaining props to VNode
-        vnode.set_prop("active_tab_index", active_tab_index)
         if isinstance(active_tab, str) and bind:
             vnode.set_prop("active_tab_state_key", active_tab)
 
@@ -2235,12 +2344,11 @@ class PageExtension(Extension):
         context = render_ctx.layout_context
 
         # Create a PageContent VNode to hold this page's content
+        parent = context.vnode_stack[-1] if context.vnode_stack else None
         page_index = len(
             [
                 c
-                for c in (
-                    context.vnode_stack[-1].children if context.vnode_stack else []
-                )
+                for c in (parent.children if parent is not None else [])
                 if getattr(c, "type", None) == "PageContent"
             ]
         )
@@ -2249,6 +2357,12 @@ class PageExtension(Extension):
         page_vnode = VNodeBuilder("PageContent", key=page_key)
         page_vnode.set_prop("title", title)
 
+        # Inactive pages of a lazy pager keep last frame's subtree
+        if _defer_inactive_body(
+            context, parent, page_vnode, page_index, "current_page"
+        ):
+            return ""
+
         # Push the page VNode onto the stack to collect children
         context.push_vnode(page_vnode)
 
@@ -2340,6 +2454,7 @@ class PagerExtension(Extension):
         border: str | None = None,
         border_style: str = "single",
         bind: bool = True,
+        lazy: bool = True,
         **kwargs: Any,
     ) -> str:
         """Render the pager tag.
@@ -2371,6 +2486,10 @@ class PagerExtension(Extension):
             Border style: "single", "double", "rounded", "none" (default: "single")
         bind : bool
             Whether to auto-bind current page to state (default: True)
+        lazy : bool
+            Evaluate only the current page's body (default: True). Other pages
+            keep the elements from when they were last shown, frozen, and are
+            re-evaluated when shown again.
 
         Returns
         -------
@@ -2403,8 +2522,14 @@ class PagerExtension(Extension):
         vnode.set_prop("loop", bool(loop))
         vnode.set_prop("border_style", border_style)
         vnode.set_prop("bind", bind)
+        vnode.set_prop("lazy", bool(lazy))
         apply_common_attributes(vnode, kwargs)
 
+        # Determine the current page before rendering the body, so that
+        # {% page %} children of a lazy pager can skip their inactive bodies
+        current_page_index = _resolve_panel_index(state, current_page, bind, id, "page")
+        vnode.set_prop("current_page", current_page_index)
+
         # Push VNode to stack - PageExtension children will add PageContent VNodes
         context.push_vnode(vnode)
 
@@ -2414,20 +2539,7 @@ class PagerExtension(Extension):
         # Pop VNode from stack
         context.pop_vnode()
 
-        # Determine initial page index
-        current_page_index = 0
-        if isinstance(current_page, int):
-            current_page_index = current_page
-        elif isinstance(current_page, str) and bind:
-            # current_page is a state key - try to restore from state
-            try:
-                if current_page in state:
-                    current_page_index = int(state[current_page])
-            except (KeyError, TypeError, AttributeError, ValueError) as e:
-                logger.warning(f"Failed to restore current page state: {e}")
-
         # Add remaining props to VNode
-        vnode.set_prop("current_page", current_page_index)
         if isinstance(current_page, str) and bind:
             vnode.set_prop("page_state_key", current_page)
 
@@ -16,6 +16,7 @@ from jinja2.parser import Parser
 
 from wijjit.core.render_context import get_render_context
 from wijjit.core.vdom import VNodeBuilder
+from wijjit.elements.data_source import as_data_source
 from wijjit.layout.frames import BorderStyle, has_border
 from wijjit.logging_config import get_logger
 from wijjit.tags.layout import (
@@ -330,6 +331,9 @@ class SelectExtension(Extension):
             Medium
             High (disabled)
         {% endselect %}
+
+        Type-ahead navigation for long lists:
+        {% select id="tz" options=timezones type_ahead=True %}{% endselect %}
     """
 
     tags = {"select"}
@@ -376,6 +380,7 @@ class SelectExtension(Extension):
             BorderStyle | Literal["single", "double", "rounded"] | None
         ) = None,
         title: str | None = None,
+        type_ahead: bool = False,
         **kwargs: Any,
     ) -> str:
         """Render the select tag.
@@ -406,6 +411,8 @@ class SelectExtension(Extension):
             Border style: "single", "double", "rounded", or None (default: None)
         title : str, optional
             Title to display in top border (only when border_style is set)
+        type_ahead : bool
+            Jump to options by typing the start of their label (default: False)
         classes : str, optional
             CSS-like class names for styling
         tab_index : int, optional
@@ -519,6 +526,7 @@ class SelectExtension(Extension):
         vnode.set_prop("border_style", border_style)
         vnode.set_prop("title", title)
         vnode.set_prop("disabled_values", disabled_values)
+        vnode.set_prop("type_ahead", type_ahead)
         vnode.set_prop("action", action)
         vnode.set_prop("bind", bind)
         vnode.set_prop("focused", is_focused)
@@ -1813,8 +1821,9 @@ class DataGridExtension(Extension):
             Jinja2 caller for body content
         id : str, optional
             Element identifier
-        data : list of list of str, optional
-            2D grid data (rows x columns)
+        data : list of list of str, DataFrame, or DataSource, optional
+            2D grid data (rows x columns). DataFrames, NumPy arrays, Arrow
+            tables and DataSources are read lazily.
         columns : list of str or list of dict, optional
             Column definitions. Can be simple strings (headers) or dicts with
             "key", "label", and "width" keys.
@@ -1879,9 +1888,14 @@ class DataGridExtension(Extension):
             except (KeyError, TypeError, AttributeError) as e:
                 logger.warning(f"Failed to restore state for datagrid '{id}': {e}")
 
-        # Ensure data is a list
+        # Ensure data is a list; DataFrames, arrays and tables are wrapped in
+        # a DataSource so only visible rows are read
         if data is None:
             data = []
+        elif not isinstance(data, list):
+            source = as_data_source(data)
+            if source is not None:
+                data = source
 
         # Ensure columns is a list
         if columns is None:
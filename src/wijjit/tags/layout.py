@@ -311,6 +311,8 @@ class LayoutContext:
         Stack of VNodeBuilders being processed
     element_vnodes : dict
         Map of element ID -> VNodeBuilder for element lookup
+    has_deferred_content : bool
+        Whether any tab or page body was skipped because it is inactive
     """
 
     def __init__(self) -> None:
@@ -321,6 +323,10 @@ class LayoutContext:
         self.vnode_stack: list[Any] = []  # list[VNodeBuilder]
         self.element_vnodes: dict[str, Any] = {}  # id -> VNodeBuilder
 
+        # Set when an inactive {% tab %} / {% page %} body was not evaluated;
+        # the renderer then carries its previous subtree over unchanged.
+        self.has_deferred_content = False
+
     def generate_id(self, element_type: str) -> str:
         """Generate a unique ID for an element.
 
@@ -9,11 +9,13 @@ import os
 import re
 import sys
 import threading
-from typing import Any
+from functools import cache, lru_cache
+from typing import Any, NamedTuple
 
 from wcwidth import wcswidth, wcwidth  # type: ignore[import-untyped]
 
 from wijjit.logging_config import get_logger
+from wijjit.terminal.cell import DEFAULT_STYLE_ID, Cell, get_style, intern_style
 
 # Get logger for this module
 logger = get_logger(__name__)
@@ -39,6 +41,12 @@ ANSI_ESCAPE_PATTERN = re.compile(
     r"|\x1b\[[0-?]*[ -/]*[@-~]"  # CSI (incl. private/intermediate bytes)
 )
 
+# SGR codes as a capturing group, for splitting text into codes and plain runs.
+# Matches: \x1b[XXm, \x1b[XX;XXm, \x1b[XX;XX;XXm, etc.
+_SGR_SPLIT_PATTERN = re.compile(r"(\x1b\[[0-9;]*m)")
+# A single SGR code with its parameters captured
+_SGR_PARAMS_PATTERN = re.compile(r"\x1b\[([0-9;]*)m")
+
 # Characters that terminate ANSI escape sequences
 _ANSI_TERMINATORS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
 
@@ -415,6 +423,326 @@ ANSI_COLOR_TO_RGB: dict[int, tuple[int, int, int]] = {
 }
 
 
+# Legacy Windows console palette (dim colors at 128, white at 192). Used by the
+# ANSI-to-cell adapter for content produced by Rich and other libraries.
+ANSI_WINDOWS_COLOR_TO_RGB: dict[int, tuple[int, int, int]] = {
+    0: (0, 0, 0),  # Black
+    1: (128, 0, 0),  # Red
+    2: (0, 128, 0),  # Green
+    3: (128, 128, 0),  # Yellow
+    4: (0, 0, 128),  # Blue
+    5: (128, 0, 128),  # Magenta
+    6: (0, 128, 128),  # Cyan
+    7: (192, 192, 192),  # White
+    8: (128, 128, 128),  # Bright Black (Gray)
+    9: (255, 0, 0),  # Bright Red
+    10: (0, 255, 0),  # Bright Green
+    11: (255, 255, 0),  # Bright Yellow
+    12: (0, 0, 255),  # Bright Blue
+    13: (255, 0, 255),  # Bright Magenta
+    14: (0, 255, 255),  # Bright Cyan
+    15: (255, 255, 255),  # Bright White
+}
+
+# Named 16-color palettes accepted by ``parse_ansi_spans``. "putty" is the
+# ``ANSI_COLOR_TO_RGB`` table above.
+ANSI_PALETTES: dict[str, dict[int, tuple[int, int, int]]] = {
+    "putty": ANSI_COLOR_TO_RGB,
+    "windows": ANSI_WINDOWS_COLOR_TO_RGB,
+}
+
+# Tokenizer for ANSI-formatted text. Group 1 captures SGR parameters; every
+# other alternative is an escape sequence that has no meaning in a cell buffer
+# (OSC titles/hyperlinks, cursor movement and other CSI, lone ESC + one char)
+# and is dropped.
+_ANSI_TOKEN_PATTERN = re.compile(
+    r"\x1b\[([0-9;]*)m"  # SGR
+    r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC ... BEL/ST
+    r"|\x1b\[[0-?]*[ -/]*[@-~]"  # other CSI
+    r"|\x1b.?",  # any other escape
+    re.DOTALL,
+)
+
+# Bounded LRU size for parsed lines (see ``parse_ansi_spans``)
+ANSI_PARSE_CACHE_SIZE = 8192
+
+
+class AnsiSpan(NamedTuple):
+    """A run of visible characters sharing one interned cell style.
+
+    Attributes
+    ----------
+    start : int
+        Index of the first character in ``ParsedAnsi.text``
+    end : int
+        Index one past the last character
+    style_id : int
+        Style id in the global cell style table
+    """
+
+    start: int
+    end: int
+    style_id: int
+
+
+class ParsedAnsi(NamedTuple):
+    """Result of parsing an ANSI-formatted line.
+
+    Attributes
+    ----------
+    text : str
+        Visible characters with all escape sequences removed
+    spans : tuple of AnsiSpan
+        Contiguous, non-overlapping style runs covering ``text``. Adjacent
+        runs always have different styles.
+
+    Notes
+    -----
+    Instances are immutable and shared through the parse cache; do not try
+    to modify them.
+    """
+
+    text: str
+    spans: tuple[AnsiSpan, ...]
+
+    def style_at(self, index: int) -> int:
+        """Get the style id of the character at ``index``.
+
+        Parameters
+        ----------
+        index : int
+            Character index in ``text``
+
+        Returns
+        -------
+        int
+            Style id (the default style for out-of-range indices)
+        """
+        for span in self.spans:
+            if span.start <= index < span.end:
+                return span.style_id
+        return DEFAULT_STYLE_ID
+
+    def to_cells(self, start: int = 0, stop: int | None = None) -> list[Cell]:
+        """Build cells for a range of visible characters.
+
+        Parameters
+        ----------
+        start : int, optional
+            First character index (default: 0)
+        stop : int or None, optional
+            Character index to stop before (default: end of text)
+
+        Returns
+        -------
+        list of Cell
+            One cell per character in ``text[start:stop]``
+        """
+        text = self.text
+        if stop is None or stop > len(text):
+            stop = len(text)
+        cells: list[Cell] = []
+        if start >= stop:
+            return cells
+        append = cells.append
+        for span_start, span_end, style_id in self.spans:
+            if span_end <= start:
+                continue
+            if span_start >= stop:
+                break
+            for char in text[max(span_start, start) : min(span_end, stop)]:
+                append(Cell(char, style_id=style_id))
+        return cells
+
+
+def _apply_sgr(
+    params_str: str,
+    state: list[Any],
+    palette: dict[int, tuple[int, int, int]],
+) -> None:
+    """Apply SGR parameters to a mutable parse state.
+
+    Parameters
+    ----------
+    params_str : str
+        Semicolon-separated SGR parameters (empty string means reset)
+    state : list
+        ``[fg_color, bg_color, bold, italic, underline, reverse, dim]``,
+        modified in place
+    palette : dict
+        16-color palette used for basic, bright and low 256-color indices
+    """
+    if not params_str:
+        # \x1b[m is equivalent to reset
+        state[:] = [None, None, False, False, False, False, False]
+        return
+
+    params = [int(p) if p else 0 for p in params_str.split(";")]
+    n = len(params)
+    i = 0
+    while i < n:
+        code = params[i]
+
+        if code == 0:
+            # Reset all attributes
+            state[:] = [None, None, False, False, False, False, False]
+        elif code == 1:
+            state[2] = True
+        elif code == 2:
+            state[6] = True
+        elif code == 3:
+            state[3] = True
+        elif code == 4:
+            state[4] = True
+        elif code == 7:
+            state[5] = True
+        elif code == 22:
+            state[2] = False
+            state[6] = False
+        elif code == 23:
+            state[3] = False
+        elif code == 24:
+            state[4] = False
+        elif code == 27:
+            state[5] = False
+        elif 30 <= code <= 37:
+            # Standard foreground colors
+            state[0] = palette.get(code - 30)
+        elif code == 38 or code == 48:
+            # Extended color: 38;5;n / 38;2;r;g;b (48 for background)
+            slot = 0 if code == 38 else 1
+            if i + 1 < n and params[i + 1] == 5:
+                if i + 2 < n:
+                    state[slot] = _ansi_256_to_rgb(params[i + 2], palette)
+                    i += 2
+            elif i + 1 < n and params[i + 1] == 2:
+                if i + 4 < n:
+                    state[slot] = (params[i + 2], params[i + 3], params[i + 4])
+                    i += 4
+        elif code == 39:
+            # Default foreground
+            state[0] = None
+        elif 40 <= code <= 47:
+            # Standard background colors
+            state[1] = palette.get(code - 40)
+        elif code == 49:
+            # Default background
+            state[1] = None
+        elif 90 <= code <= 97:
+            # Bright foreground colors
+            state[0] = palette.get(code - 90 + 8)
+        elif 100 <= code <= 107:
+            # Bright background colors
+            state[1] = palette.get(code - 100 + 8)
+
+        i += 1
+
+
+@lru_cache(maxsize=ANSI_PARSE_CACHE_SIZE)
+def _parse_ansi_spans_cached(text: str, palette: str) -> ParsedAnsi:
+    """Parse an ANSI line into spans (memoized; see ``parse_ansi_spans``).
+
+    Parameters
+    ----------
+    text : str
+        Text containing at least one escape character
+    palette : str
+        Name of a palette in ``ANSI_PALETTES``
+
+    Returns
+    -------
+    ParsedAnsi
+        Visible text and style spans
+    """
+    colors = ANSI_PALETTES[palette]
+    state: list[Any] = [None, None, False, False, False, False, False]
+    style_id = DEFAULT_STYLE_ID
+    style_dirty = False
+
+    chunks: list[str] = []
+    spans: list[AnsiSpan] = []
+    length = 0
+    pos = 0
+
+    def emit(chunk: str) -> None:
+        nonlocal length, style_id, style_dirty
+        if style_dirty:
+            style_id = intern_style(*state)
+            style_dirty = False
+        end = length + len(chunk)
+        if spans and spans[-1].style_id == style_id and spans[-1].end == length:
+            spans[-1] = AnsiSpan(spans[-1].start, end, style_id)
+        else:
+            spans.append(AnsiSpan(length, end, style_id))
+        chunks.append(chunk)
+        length = end
+
+    for match in _ANSI_TOKEN_PATTERN.finditer(text):
+        if match.start() > pos:
+            emit(text[pos : match.start()])
+        pos = match.end()
+        params_str = match.group(1)
+        if params_str is not None:
+            _apply_sgr(params_str, state, colors)
+            style_dirty = True
+
+    if pos < len(text):
+        emit(text[pos:])
+
+    return ParsedAnsi("".join(chunks), tuple(spans))
+
+
+def parse_ansi_spans(text: str, palette: str = "putty") -> ParsedAnsi:
+    """Parse ANSI-formatted text into visible text plus style spans.
+
+    This is the single ANSI parser used by the cell renderer. Instead of one
+    attribute dict per character it returns compact runs of interned style
+    ids, which map straight onto ``Cell(char, style_id=...)``.
+
+    Parameters
+    ----------
+    text : str
+        Text containing ANSI escape codes (a single line)
+    palette : str, optional
+        Name of the 16-color palette in ``ANSI_PALETTES`` used for basic and
+        bright color codes (default: "putty")
+
+    Returns
+    -------
+    ParsedAnsi
+        Visible text and style spans
+
+    Notes
+    -----
+    Supports SGR reset, bold/dim/italic/underline/reverse and their resets
+    (22-27), basic and bright colors, 256-color and true-color fg/bg, and
+    default fg/bg (39/49). All non-SGR escape sequences (OSC, cursor
+    movement, erase, ...) are removed.
+
+    Results are kept in a bounded LRU cache keyed on the line string, so
+    re-rendering unchanged lines (scrolling, repaints) never re-parses them.
+    Text without any escape character takes a fast path and is not cached.
+
+    Examples
+    --------
+    >>> parsed = parse_ansi_spans("\\x1b[31mRed\\x1b[0m plain")
+    >>> parsed.text
+    'Red plain'
+    >>> [(s.start, s.end) for s in parsed.spans]
+    [(0, 3), (3, 9)]
+    """
+    if "\x1b" not in text:
+        if not text:
+            return ParsedAnsi("", ())
+        return ParsedAnsi(text, (AnsiSpan(0, len(text), DEFAULT_STYLE_ID),))
+    return _parse_ansi_spans_cached(text, palette)
+
+
+def clear_ansi_parse_cache() -> None:
+    """Clear the parsed-line cache used by ``parse_ansi_spans``."""
+    _parse_ansi_spans_cached.cache_clear()
+
+
 def parse_ansi_text(text: str) -> list[tuple[str, dict[str, Any]]]:
     """Parse ANSI-formatted text into characters with cell attributes.
 
@@ -434,145 +762,47 @@ def parse_ansi_text(text: str) -> list[tuple[str, dict[str, Any]]]:
         with keys: fg_color, bg_color, bold, italic, underline, reverse, dim.
         Colors are RGB tuples or None for default.
 
+    Notes
+    -----
+    This is a compatibility wrapper around :func:`parse_ansi_spans`, which
+    is cached and far cheaper for rendering; prefer it in new code.
+    Characters in the same span share one attribute dict.
+
     Examples
     --------
     >>> result = parse_ansi_text("\\x1b[31mRed\\x1b[0m")
     >>> result[0]  # 'R' with red color
     ('R', {'fg_color': (187, 0, 0), 'bg_color': None, 'bold': False, ...})
     """
-    if not text:
-        return []
-
-    # Current style state
-    fg_color: tuple[int, int, int] | None = None
-    bg_color: tuple[int, int, int] | None = None
-    bold = False
-    italic = False
-    underline = False
-    reverse = False
-    dim = False
-
+    parsed = parse_ansi_spans(text)
     result: list[tuple[str, dict[str, Any]]] = []
-
-    # Pattern to split text into ANSI codes and regular characters
-    ansi_pattern = re.compile(r"(\x1b\[[0-9;]*m)")
-    parts = ansi_pattern.split(text)
-
-    for part in parts:
-        if not part:
-            continue
-
-        if part.startswith("\x1b["):
-            # Parse ANSI escape code
-            match = re.match(r"\x1b\[([0-9;]*)m", part)
-            if match:
-                params_str = match.group(1)
-                if not params_str:
-                    # \x1b[m is equivalent to reset
-                    fg_color = None
-                    bg_color = None
-                    bold = italic = underline = reverse = dim = False
-                    continue
-
-                params = [int(p) if p else 0 for p in params_str.split(";")]
-                i = 0
-                while i < len(params):
-                    code = params[i]
-
-                    if code == 0:
-                        # Reset all attributes
-                        fg_color = None
-                        bg_color = None
-                        bold = italic = underline = reverse = dim = False
-                    elif code == 1:
-                        bold = True
-                    elif code == 2:
-                        dim = True
-                    elif code == 3:
-                        italic = True
-                    elif code == 4:
-                        underline = True
-                    elif code == 7:
-                        reverse = True
-                    elif code == 22:
-                        bold = False
-                        dim = False
-                    elif code == 23:
-                        italic = False
-                    elif code == 24:
-                        underline = False
-                    elif code == 27:
-                        reverse = False
-                    elif 30 <= code <= 37:
-                        # Standard foreground colors
-                        fg_color = ANSI_COLOR_TO_RGB.get(code - 30)
-                    elif code == 38:
-                        # Extended foreground color
-                        if i + 1 < len(params) and params[i + 1] == 5:
-                            # 256 color mode: 38;5;n
-                            if i + 2 < len(params):
-                                color_idx = params[i + 2]
-                                fg_color = _ansi_256_to_rgb(color_idx)
-                                i += 2
-                        elif i + 1 < len(params) and params[i + 1] == 2:
-                            # True color mode: 38;2;r;g;b
-                            if i + 4 < len(params):
-                                fg_color = (params[i + 2], params[i + 3], params[i + 4])
-                                i += 4
-                    elif code == 39:
-                        # Default foreground
-                        fg_color = None
-                    elif 40 <= code <= 47:
-                        # Standard background colors
-                        bg_color = ANSI_COLOR_TO_RGB.get(code - 40)
-                    elif code == 48:
-                        # Extended background color
-                        if i + 1 < len(params) and params[i + 1] == 5:
-                            # 256 color mode: 48;5;n
-                            if i + 2 < len(params):
-                                color_idx = params[i + 2]
-                                bg_color = _ansi_256_to_rgb(color_idx)
-                                i += 2
-                        elif i + 1 < len(params) and params[i + 1] == 2:
-                            # True color mode: 48;2;r;g;b
-                            if i + 4 < len(params):
-                                bg_color = (params[i + 2], params[i + 3], params[i + 4])
-                                i += 4
-                    elif code == 49:
-                        # Default background
-                        bg_color = None
-                    elif 90 <= code <= 97:
-                        # Bright foreground colors
-                        fg_color = ANSI_COLOR_TO_RGB.get(code - 90 + 8)
-                    elif 100 <= code <= 107:
-                        # Bright background colors
-                        bg_color = ANSI_COLOR_TO_RGB.get(code - 100 + 8)
-
-                    i += 1
-        else:
-            # Regular text - add each character with current style
-            for char in part:
-                attrs = {
-                    "fg_color": fg_color,
-                    "bg_color": bg_color,
-                    "bold": bold,
-                    "italic": italic,
-                    "underline": underline,
-                    "reverse": reverse,
-                    "dim": dim,
-                }
-                result.append((char, attrs))
-
+    for span_start, span_end, style_id in parsed.spans:
+        style = get_style(style_id)
+        attrs = {
+            "fg_color": style.fg_color,
+            "bg_color": style.bg_color,
+            "bold": style.bold,
+            "italic": style.italic,
+            "underline": style.underline,
+            "reverse": style.reverse,
+            "dim": style.dim,
+        }
+        result.extend((char, attrs) for char in parsed.text[span_start:span_end])
     return result
 
 
-def _ansi_256_to_rgb(color_idx: int) -> tuple[int, int, int]:
+def _ansi_256_to_rgb(
+    color_idx: int,
+    palette: dict[int, tuple[int, int, int]] = ANSI_COLOR_TO_RGB,
+) -> tuple[int, int, int]:
     """Convert ANSI 256-color index to RGB.
 
     Parameters
     ----------
     color_idx : int
         Color index (0-255)
+    palette : dict, optional
+        16-color palette used for indices 0-15 (default: ANSI_COLOR_TO_RGB)
 
     Returns
     -------
@@ -581,7 +811,7 @@ def _ansi_256_to_rgb(color_idx: int) -> tuple[int, int, int]:
     """
     if color_idx < 16:
         # Standard colors
-        return ANSI_COLOR_TO_RGB.get(color_idx, (187, 187, 187))
+        return palette.get(color_idx, (187, 187, 187))
     elif color_idx < 232:
         # 216 color cube: 16 + 36*r + 6*g + b
         color_idx -= 16
@@ -595,6 +825,71 @@ def _ansi_256_to_rgb(color_idx: int) -> tuple[int, int, int]:
         return (gray, gray, gray)
 
 
+# Bounded LRU sizes for the display-width engine below. Entries are keyed on
+# the full string, so these bound memory regardless of content size.
+WIDTH_CACHE_SIZE = 16384
+CLIP_CACHE_SIZE = 4096
+WRAP_CACHE_SIZE = 4096
+
+
+@cache
+def _char_width(char: str) -> int:
+    """Get the display width of one character, cached per codepoint.
+
+    Parameters
+    ----------
+    char : str
+        Single character
+
+    Returns
+    -------
+    int
+        Column width; non-printable characters count as 1
+    """
+    width = wcwidth(char)
+    # wcwidth returns -1 for non-printable, treat as width 1
+    return width if width >= 0 else 1
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _display_width(clean: str) -> int:
+    """Get the display width of escape-free, non-ASCII text (memoized).
+
+    Parameters
+    ----------
+    clean : str
+        Text without ANSI codes
+
+    Returns
+    -------
+    int
+        Display width in terminal columns
+    """
+    width = wcswidth(clean)
+    # wcswidth returns -1 if string contains non-printable characters
+    return width if width >= 0 else len(clean)
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _visible_length_ansi(text: str) -> int:
+    """Get the visible width of text containing escape codes (memoized).
+
+    Parameters
+    ----------
+    text : str
+        Text containing at least one escape character
+
+    Returns
+    -------
+    int
+        Visible display width
+    """
+    clean = strip_ansi(text)
+    if clean.isascii() and clean.isprintable():
+        return len(clean)
+    return _display_width(clean)
+
+
 def visible_length(text: str) -> int:
     """Get the visible display width of text (excluding ANSI codes).
 
@@ -610,11 +905,18 @@ def visible_length(text: str) -> int:
     -------
     int
         Visible display width of the text in terminal columns
+
+    Notes
+    -----
+    Printable ASCII without escape codes takes a fast path (``len``). Other
+    strings are measured once and memoized in a bounded LRU keyed on the
+    string, so repeated measurement of the same labels/lines is a lookup.
     """
-    clean = strip_ansi(text)
-    width = wcswidth(clean)
-    # wcswidth returns -1 if string contains non-printable characters
-    return width if width >= 0 else len(clean)
+    if "\x1b" in text:
+        return _visible_length_ansi(text)
+    if text.isascii() and text.isprintable():
+        return len(text)
+    return _display_width(text)
 
 
 def clip_to_width(text: str, width: int, ellipsis: str = "...") -> str:
@@ -636,6 +938,12 @@ def clip_to_width(text: str, width: int, ellipsis: str = "...") -> str:
     -------
     str
         Clipped text with ANSI codes preserved
+
+    Notes
+    -----
+    Text that already fits is returned without scanning. Printable ASCII
+    without escape codes is clipped by slicing; everything else goes through
+    a memoized scan using cached per-codepoint widths.
     """
     if width <= 0:
         return ""
@@ -644,6 +952,39 @@ def clip_to_width(text: str, width: int, ellipsis: str = "...") -> str:
     if current_length <= width:
         return text
 
+    if (
+        "\x1b" not in text
+        and text.isascii()
+        and text.isprintable()
+        and ellipsis.isascii()
+        and ellipsis.isprintable()
+    ):
+        # Fast path: one column per character
+        ellipsis_len = len(ellipsis)
+        target_width = width - ellipsis_len if ellipsis_len <= width else width
+        return text[:target_width] + ellipsis
+
+    return _clip_to_width_scan(text, width, ellipsis)
+
+
+@lru_cache(maxsize=CLIP_CACHE_SIZE)
+def _clip_to_width_scan(text: str, width: int, ellipsis: str) -> str:
+    """Clip text that is known to overflow ``width`` (memoized).
+
+    Parameters
+    ----------
+    text : str
+        Text to clip (wider than ``width``)
+    width : int
+        Maximum visible width (positive)
+    ellipsis : str
+        Ellipsis to append
+
+    Returns
+    -------
+    str
+        Clipped text with ANSI codes preserved
+    """
     # Need to clip - iterate through preserving ANSI codes
     visible_count = 0
     result = []
@@ -658,12 +999,9 @@ def clip_to_width(text: str, width: int, ellipsis: str = "...") -> str:
             result.append(text[i:end])
             i = end
         else:
-            # Regular character - use wcwidth for proper display width
+            # Regular character - use cached wcwidth for proper display width
             char = text[i]
-            char_width = wcwidth(char)
-            # wcwidth returns -1 for non-printable, treat as width 1
-            if char_width < 0:
-                char_width = 1
+            char_width = _char_width(char)
             # Don't add character if it would overflow target width
             if visible_count + char_width > target_width:
                 break
@@ -672,7 +1010,7 @@ def clip_to_width(text: str, width: int, ellipsis: str = "...") -> str:
             i += 1
 
     output = "".join(result)
-    if current_length > width and ellipsis:
+    if ellipsis:
         output += ellipsis
 
     # IMPORTANT: Preserve trailing ANSI codes (especially RESET) from the clipped portion
@@ -695,6 +1033,21 @@ def clip_to_width(text: str, width: int, ellipsis: str = "...") -> str:
     return output
 
 
+def clear_width_caches() -> None:
+    """Clear the memoized width, clip and wrap results.
+
+    Notes
+    -----
+    Only needed to release memory; cached results never go stale because
+    they are keyed on the full input string.
+    """
+    _display_width.cache_clear()
+    _visible_length_ansi.cache_clear()
+    _clip_to_width_scan.cache_clear()
+    _wrap_analysis.cache_clear()
+    _wrap_text_cached.cache_clear()
+
+
 # Module-level color mode setting (None = check env var, True = no color, False = use color)
 _no_color: bool | None = None
 # Lock for thread-safe access to global color/unicode settings
@@ -1012,13 +1365,178 @@ def wrap_text(text: str, width: int) -> list[str]:
     if not text:
         return [""]
 
-    # Calculate visible length
-    vis_len = visible_length(text)
-
-    # If text fits within width, return as-is
-    if vis_len <= width:
+    # Fast path: text fits within width, return as-is
+    if visible_length(text) <= width:
         return [text]
 
+    return list(_wrap_text_cached(text, width))
+
+
+class _WrapAnalysis(NamedTuple):
+    """Width-independent wrapping data for one line (see ``_wrap_analysis``).
+
+    Attributes
+    ----------
+    visible : str
+        Visible characters (escape codes removed)
+    raw_ends : tuple of int or None
+        ``raw_ends[k]`` is the index in the raw text just past visible
+        character ``k``; None when the text has no escape codes (identity)
+    last_boundary : tuple of int
+        ``last_boundary[k]`` is the index of the last wrap boundary at or
+        before visible character ``k``, or -1
+    unit_width : bool
+        True if every visible character is one column wide (printable ASCII)
+    """
+
+    visible: str
+    raw_ends: tuple[int, ...] | None
+    last_boundary: tuple[int, ...]
+    unit_width: bool
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def _wrap_analysis(text: str) -> _WrapAnalysis | None:
+    """Compute and cache the break opportunities of a line.
+
+    Parameters
+    ----------
+    text : str
+        Line to analyse (may contain ANSI codes)
+
+    Returns
+    -------
+    _WrapAnalysis or None
+        Analysis reusable for any width, or None if the line contains escape
+        sequences that ``strip_ansi`` and the segment scanner treat
+        differently (e.g. OSC), in which case the generic algorithm is used.
+
+    Notes
+    -----
+    This is what makes re-wrapping on resize cheap: the boundary scan and
+    escape-code bookkeeping depend only on the text, so a width change only
+    re-runs the linear segment walk over these cached arrays.
+    """
+    raw_ends: tuple[int, ...] | None
+    if "\x1b" in text:
+        chars: list[str] = []
+        ends: list[int] = []
+        pos = 0
+        while pos < len(text):
+            if text[pos : pos + 2] == "\x1b[":
+                pos = _find_ansi_sequence_end(text, pos)
+            else:
+                chars.append(text[pos])
+                pos += 1
+                ends.append(pos)
+        visible = "".join(chars)
+        if visible != strip_ansi(text):
+            return None
+        raw_ends = tuple(ends)
+    else:
+        visible = text
+        raw_ends = None
+
+    last_boundary: list[int] = []
+    last = -1
+    for index, char in enumerate(visible):
+        if is_wrap_boundary(char):
+            last = index
+        last_boundary.append(last)
+
+    return _WrapAnalysis(
+        visible,
+        raw_ends,
+        tuple(last_boundary),
+        visible.isascii() and visible.isprintable(),
+    )
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def _wrap_text_cached(text: str, width: int) -> tuple[str, ...]:
+    """Wrap a line that does not fit in ``width`` (memoized).
+
+    Parameters
+    ----------
+    text : str
+        Line to wrap (wider than ``width``)
+    width : int
+        Maximum width for each segment (positive)
+
+    Returns
+    -------
+    tuple of str
+        Wrapped segments
+    """
+    analysis = _wrap_analysis(text)
+    if analysis is None:
+        return tuple(_wrap_text_scan(text, width))
+
+    visible, raw_ends, last_boundary, unit_width = analysis
+    count = len(visible)
+
+    def raw_end(k: int) -> int:
+        # Raw index just past visible char k
+        return k + 1 if raw_ends is None else raw_ends[k]
+
+    segments: list[str] = []
+    raw_pos = 0  # start of remaining text in the raw string
+    k = 0  # index of the first visible char of the remaining text
+
+    while raw_pos < len(text):
+        # Does the remaining text fit?
+        if unit_width:
+            fits = count - k <= width
+        else:
+            fits = _display_width(visible[k:]) <= width if k < count else True
+        if fits:
+            segments.append(text[raw_pos:])
+            break
+
+        # Last boundary among the first `width` visible chars of the remainder
+        boundary = last_boundary[min(k + width, count) - 1]
+        soft_break = boundary >= k and boundary + 1 < count
+        target = boundary - k + 1 if soft_break else width
+
+        if k + target > count:
+            # Fewer chars than columns left (wide chars): take everything
+            segments.append(text[raw_pos:])
+            break
+
+        cut = raw_end(k + target - 1)
+        segments.append(text[raw_pos:cut])
+        raw_pos = cut
+        k += target
+
+        if soft_break:
+            # Remove leading spaces from continuation (we wrapped at a word boundary)
+            while raw_pos < len(text) and text[raw_pos].isspace():
+                raw_pos += 1
+                k += 1
+
+    return tuple(segments) if segments else ("",)
+
+
+def _wrap_text_scan(text: str, width: int) -> list[str]:
+    """Wrap a line by rescanning the remainder after every segment.
+
+    Parameters
+    ----------
+    text : str
+        Line to wrap
+    width : int
+        Maximum width for each segment
+
+    Returns
+    -------
+    list of str
+        Wrapped segments
+
+    Notes
+    -----
+    Generic fallback for lines whose escape sequences cannot be indexed by
+    ``_wrap_analysis``.
+    """
     # Text needs wrapping
     segments = []
     remaining = text
@@ -1120,16 +1638,12 @@ def dim_text(text: str, dim_factor: float = 0.6) -> str:
     if not text:
         return text
 
-    # Pattern to match ANSI color codes
-    # Matches: \x1b[XXm, \x1b[XX;XXm, \x1b[XX;XX;XXm, etc.
-    ansi_pattern = re.compile(r"(\x1b\[[0-9;]*m)")
-
-    parts = ansi_pattern.split(text)
+    parts = _SGR_SPLIT_PATTERN.split(text)
     result = []
     has_ansi = False
 
     for part in parts:
-        if ansi_pattern.match(part):
+        if _SGR_SPLIT_PATTERN.match(part):
             # This is an ANSI code - try to dim it
             dimmed_code = _dim_ansi_code(part, dim_factor)
             result.append(dimmed_code)
@@ -1162,7 +1676,7 @@ def _dim_ansi_code(code: str, dim_factor: float) -> str:
         Dimmed ANSI code
     """
     # Extract the numeric part
-    match = re.match(r"\x1b\[([0-9;]*)m", code)
+    match = _SGR_PARAMS_PATTERN.match(code)
     if not match:
         return code
 
@@ -4,11 +4,408 @@ This module provides the core data structures for cell-based terminal rendering,
 which enables efficient diff rendering, styling, and dirty region tracking.
 """
 
-from dataclasses import dataclass
-from typing import Any
+import threading
+from typing import Any, NamedTuple
+
+from wijjit.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bit layout of the packed text-attribute mask used as part of the style key.
+_BOLD = 1
+_ITALIC = 2
+_UNDERLINE = 4
+_REVERSE = 8
+_DIM = 16
+
+RESET_SGR = "\x1b[0m"
+
+# Number of distinct styles the global table stores. Past it, new styles are
+# returned uncached (see StyleTable).
+MAX_STYLES = 32768
+
+
+class CellStyle(NamedTuple):
+    """Interned style record shared by every cell that uses it.
+
+    Attributes
+    ----------
+    style_id : int
+        Small integer id of this style in the global style table
+    fg_color : tuple of (int, int, int) or None
+        Foreground RGB color
+    bg_color : tuple of (int, int, int) or None
+        Background RGB color
+    bold : bool
+        Bold attribute
+    italic : bool
+        Italic attribute
+    underline : bool
+        Underline attribute
+    reverse : bool
+        Reverse video attribute
+    dim : bool
+        Dim attribute
+    sgr : str
+        Precomputed SGR escape sequence that switches the terminal to this
+        style. For the default (unstyled) style this is a reset sequence.
+    is_default : bool
+        True if this style has no colors and no attributes set
+    """
+
+    style_id: int
+    fg_color: tuple[int, int, int] | None
+    bg_color: tuple[int, int, int] | None
+    bold: bool
+    italic: bool
+    underline: bool
+    reverse: bool
+    dim: bool
+    sgr: str
+    is_default: bool
+
+
+def _build_sgr(
+    fg_color: tuple[int, int, int] | None,
+    bg_color: tuple[int, int, int] | None,
+    mask: int,
+) -> str:
+    """Format the SGR sequence for a style (called once per distinct style).
+
+    Parameters
+    ----------
+    fg_color : tuple of (int, int, int) or None
+        Foreground color
+    bg_color : tuple of (int, int, int) or None
+        Background color
+    mask : int
+        Packed text attribute bitmask
+
+    Returns
+    -------
+    str
+        ANSI escape sequence, or a reset sequence for the default style
+    """
+    codes = []
+
+    # Text attributes
+    if mask & _BOLD:
+        codes.append("1")
+    if mask & _DIM:
+        codes.append("2")
+    if mask & _ITALIC:
+        codes.append("3")
+    if mask & _UNDERLINE:
+        codes.append("4")
+    if mask & _REVERSE:
+        codes.append("7")
+
+    # Foreground color (true color RGB)
+    if fg_color is not None:
+        r, g, b = fg_color
+        codes.append(f"38;2;{r};{g};{b}")
+
+    # Background color (true color RGB)
+    if bg_color is not None:
+        r, g, b = bg_color
+        codes.append(f"48;2;{r};{g};{b}")
+
+    if codes:
+        return f"\x1b[{';'.join(codes)}m"
+
+    # No styling - emit reset to clear any previous style
+    return RESET_SGR
+
+
+class UncachedStyleId(int):
+    """Style id of a style created after the style table filled up.
+
+    Its integer value is negative and unique, so it never collides with a
+    table id, and the style record travels with the id instead of living in
+    the table. The record is freed together with the last cell using it.
+
+    Attributes
+    ----------
+    style : CellStyle
+        Style record for this id
+    """
+
+    style: CellStyle
+
+
+def _style_of(style_id: int) -> CellStyle:
+    """Resolve a style id from the global table or an uncached id.
+
+    Parameters
+    ----------
+    style_id : int
+        Table id or :class:`UncachedStyleId`
+
+    Returns
+    -------
+    CellStyle
+        Style record
+    """
+    if style_id >= 0:
+        return _styles[style_id]
+    assert isinstance(style_id, UncachedStyleId)
+    return style_id.style
+
+
+class StyleTable:
+    """Flyweight table mapping distinct cell styles to small integer ids.
+
+    Each distinct ``(fg_color, bg_color, attributes)`` combination is stored
+    exactly once together with its precomputed SGR string. Cells only hold the
+    integer id, so comparing two cells' styles is a single int compare and
+    emitting a style is a list lookup.
+
+    Parameters
+    ----------
+    max_styles : int, optional
+        Number of distinct styles the table stores (default: MAX_STYLES)
+
+    Attributes
+    ----------
+    max_styles : int
+        Number of distinct styles the table stores
+
+    Notes
+    -----
+    Ids are stable for the lifetime of the process and are never reused:
+    cells, screen buffers and render caches hold them, so no style can be
+    evicted. To keep the table bounded when colors are computed (gradients,
+    heat maps, color images), it stores at most ``max_styles`` styles and
+    logs a warning when it fills up. After that, styles not already in the
+    table are returned as :class:`UncachedStyleId` values: exact, but not
+    shared, so they cost a little memory per cell and compare by record
+    rather than by id. Id 0 is always the default (unstyled) style.
+
+    Interning is thread-safe: lookups of existing styles are lock-free and
+    only the insertion of a new style takes a lock.
+
+    Examples
+    --------
+    >>> table = StyleTable()
+    >>> sid = table.intern((255, 0, 0), None, bold=True)
+    >>> table.get(sid).sgr
+    '\\x1b[1;38;2;255;0;0m'
+    >>> table.intern((255, 0, 0), None, bold=True) == sid
+    True
+    """
+
+    def __init__(self, max_styles: int = MAX_STYLES) -> None:
+        """Initialize the table with the default style at id 0."""
+        self.max_styles = max_styles
+        self._ids: dict[tuple[Any, ...], int] = {}
+        self._styles: list[CellStyle] = []
+        self._lock = threading.Lock()
+        self._overflowed = False
+        self._uncached_count = 0
+        self.intern(None, None)
+
+    def __len__(self) -> int:
+        """Return the number of interned styles."""
+        return len(self._styles)
+
+    @property
+    def styles(self) -> list[CellStyle]:
+        """Get the list of interned styles, indexed by style id.
+
+        Returns
+        -------
+        list of CellStyle
+            Interned styles (do not mutate)
+        """
+        return self._styles
+
+    def intern(
+        self,
+        fg_color: tuple[int, int, int] | None = None,
+        bg_color: tuple[int, int, int] | None = None,
+        bold: bool = False,
+        italic: bool = False,
+        underline: bool = False,
+        reverse: bool = False,
+        dim: bool = False,
+    ) -> int:
+        """Get the id for a style, registering it if not seen before.
+
+        Parameters
+        ----------
+        fg_color : tuple of (int, int, int) or None, optional
+            Foreground color
+        bg_color : tuple of (int, int, int) or None, optional
+            Background color
+        bold : bool, optional
+            Bold attribute
+        italic : bool, optional
+            Italic attribute
+        underline : bool, optional
+            Underline attribute
+        reverse : bool, optional
+            Reverse attribute
+        dim : bool, optional
+            Dim attribute
+
+        Returns
+        -------
+        int
+            Style id (an :class:`UncachedStyleId` once the table is full)
+        """
+        # Colors may arrive as lists (e.g. from config); keys must be hashable
+        if fg_color is not None and fg_color.__class__ is not tuple:
+            fg_color = tuple(fg_color)  # type: ignore[assignment]
+        if bg_color is not None and bg_color.__class__ is not tuple:
+            bg_color = tuple(bg_color)  # type: ignore[assignment]
+        mask = (
+            (_BOLD if bold else 0)
+            | (_ITALIC if italic else 0)
+            | (_UNDERLINE if underline else 0)
+            | (_REVERSE if reverse else 0)
+            | (_DIM if dim else 0)
+        )
+        key = (fg_color, bg_color, mask)
+        style_id = self._ids.get(key)
+        if style_id is not None:
+            return style_id
+
+        with self._lock:
+            # Another thread may have registered it while we waited
+            style_id = self._ids.get(key)
+            if style_id is not None:
+                return style_id
+
+            full = len(self._styles) >= self.max_styles
+            if full:
+                if not self._overflowed:
+                    self._overflowed = True
+                    logger.warning(
+                        "Style table is full (%d styles); further styles are "
+                        "not cached",
+                        self.max_styles,
+                    )
+                self._uncached_count += 1
+                style_id = UncachedStyleId(-self._uncached_count)
+            else:
+                style_id = len(self._styles)
+            style = CellStyle(
+                style_id=int(style_id),
+                fg_color=fg_color,
+                bg_color=bg_color,
+                bold=bool(mask & _BOLD),
+                italic=bool(mask & _ITALIC),
+                underline=bool(mask & _UNDERLINE),
+                reverse=bool(mask & _REVERSE),
+                dim=bool(mask & _DIM),
+                sgr=_build_sgr(fg_color, bg_color, mask),
+                is_default=fg_color is None and bg_color is None and mask == 0,
+            )
+            if isinstance(style_id, UncachedStyleId):
+                style_id.style = style
+                return style_id
+            self._styles.append(style)
+            # Publish the id only after the style record exists
+            self._ids[key] = style_id
+            return style_id
+
+    def get(self, style_id: int) -> CellStyle:
+        """Get the style record for an id.
+
+        Parameters
+        ----------
+        style_id : int
+            Style id returned by :meth:`intern`
+
+        Returns
+        -------
+        CellStyle
+            Interned style record
+        """
+        if isinstance(style_id, UncachedStyleId):
+            return style_id.style
+        return self._styles[style_id]
+
+
+# Global style table shared by all cells
+_style_table = StyleTable()
+_styles = _style_table.styles
+
+DEFAULT_STYLE_ID = 0
+
+
+def intern_style(
+    fg_color: tuple[int, int, int] | None = None,
+    bg_color: tuple[int, int, int] | None = None,
+    bold: bool = False,
+    italic: bool = False,
+    underline: bool = False,
+    reverse: bool = False,
+    dim: bool = False,
+) -> int:
+    """Get the global style id for a combination of colors and attributes.
+
+    Parameters
+    ----------
+    fg_color : tuple of (int, int, int) or None, optional
+        Foreground color
+    bg_color : tuple of (int, int, int) or None, optional
+        Background color
+    bold : bool, optional
+        Bold attribute
+    italic : bool, optional
+        Italic attribute
+    underline : bool, optional
+        Underline attribute
+    reverse : bool, optional
+        Reverse attribute
+    dim : bool, optional
+        Dim attribute
+
+    Returns
+    -------
+    int
+        Style id in the global style table
+
+    Examples
+    --------
+    >>> intern_style() == DEFAULT_STYLE_ID
+    True
+    >>> intern_style((255, 0, 0)) == intern_style((255, 0, 0))
+    True
+    """
+    return _style_table.intern(
+        fg_color, bg_color, bold, italic, underline, reverse, dim
+    )
+
+
+def get_style(style_id: int) -> CellStyle:
+    """Get the interned style record for a global style id.
+
+    Parameters
+    ----------
+    style_id : int
+        Style id
+
+    Returns
+    -------
+    CellStyle
+        Interned style record
+    """
+    return _style_of(style_id)
+
+
+def get_style_table() -> StyleTable:
+    """Get the global style table.
+
+    Returns
+    -------
+    StyleTable
+        The process-wide style table used by :class:`Cell`
+    """
+    return _style_table
 
 
-@dataclass(slots=True)
 class Cell:
     """A single terminal cell with character and styling attributes.
 
@@ -16,6 +413,10 @@ class Cell:
     colors and text attributes. Forms the foundation of the cell-based
     rendering system.
 
+    Cells are flyweights: the colors and text attributes live in the global
+    :class:`StyleTable` and each cell only stores its character and a small
+    integer ``style_id``.
+
     Parameters
     ----------
     char : str
@@ -34,11 +435,17 @@ class Cell:
         Reverse video (swap fg/bg colors) attribute (default: False)
     dim : bool, optional
         Dim/faint text attribute (default: False)
+    style_id : int or None, optional
+        Pre-interned style id (from :func:`intern_style` or
+        ``Style.to_style_id()``). When given, the color and attribute
+        arguments are ignored. This is the fast path for hot rendering loops.
 
     Attributes
     ----------
     char : str
         The character to display
+    style_id : int
+        Id of this cell's style in the global style table
     fg_color : tuple of (int, int, int) or None
         Foreground color in RGB
     bg_color : tuple of (int, int, int) or None
@@ -53,19 +460,15 @@ class Cell:
         Reverse video attribute
     dim : bool
         Dim attribute
-    _style_mask : int
-        Pre-computed bitmask of style attributes for fast equality comparison.
-        Computed in __post_init__. Bit layout: bold=1, italic=2, underline=4,
-        reverse=8, dim=16.
 
     Notes
     -----
     RGB color values should be in the range 0-255. The terminal emulator
     will handle conversion to its native color format.
 
-    The _style_mask field is an optimization for equality comparison. Instead
-    of comparing 5 boolean fields individually, we compare a single integer.
-    This reduces comparison overhead in hot rendering paths.
+    Assigning a style attribute (e.g. ``cell.fg_color = ...``) re-interns the
+    modified style and updates ``style_id``; the shared style record itself
+    is never mutated.
 
     Examples
     --------
@@ -84,29 +487,126 @@ class Cell:
     True
     """
 
-    char: str
-    fg_color: tuple[int, int, int] | None = None
-    bg_color: tuple[int, int, int] | None = None
-    bold: bool = False
-    italic: bool = False
-    underline: bool = False
-    reverse: bool = False
-    dim: bool = False
-    # Pre-computed style mask for fast equality comparison (computed in __post_init__)
-    _style_mask: int = 0
-
-    def __post_init__(self) -> None:
-        """Compute style mask after initialization."""
-        # Pack boolean style attributes into a single integer bitmask
-        # This enables O(1) comparison of all style flags
-        object.__setattr__(
-            self,
-            "_style_mask",
-            (self.bold)
-            | (self.italic << 1)
-            | (self.underline << 2)
-            | (self.reverse << 3)
-            | (self.dim << 4),
+    __slots__ = ("char", "style_id")
+
+    def __init__(
+        self,
+        char: str,
+        fg_color: tuple[int, int, int] | None = None,
+        bg_color: tuple[int, int, int] | None = None,
+        bold: bool = False,
+        italic: bool = False,
+        underline: bool = False,
+        reverse: bool = False,
+        dim: bool = False,
+        *,
+        style_id: int | None = None,
+    ) -> None:
+        self.char = char
+        if style_id is None:
+            if (
+                fg_color is None
+                and bg_color is None
+                and not (bold or italic or underline or reverse or dim)
+            ):
+                style_id = DEFAULT_STYLE_ID
+            else:
+                style_id = _style_table.intern(
+                    fg_color, bg_color, bold, italic, underline, reverse, dim
+                )
+        self.style_id = style_id
+
+    @property
+    def style(self) -> CellStyle:
+        """Get the interned style record for this cell.
+
+        Returns
+        -------
+        CellStyle
+            Shared style record
+        """
+        return _style_of(self.style_id)
+
+    @property
+    def fg_color(self) -> tuple[int, int, int] | None:
+        """Foreground RGB color or None."""
+        return _style_of(self.style_id).fg_color
+
+    @fg_color.setter
+    def fg_color(self, value: tuple[int, int, int] | None) -> None:
+        self._restyle(fg_color=value)
+
+    @property
+    def bg_color(self) -> tuple[int, int, int] | None:
+        """Background RGB color or None."""
+        return _style_of(self.style_id).bg_color
+
+    @bg_color.setter
+    def bg_color(self, value: tuple[int, int, int] | None) -> None:
+        self._restyle(bg_color=value)
+
+    @property
+    def bold(self) -> bool:
+        """Bold attribute."""
+        return _style_of(self.style_id).bold
+
+    @bold.setter
+    def bold(self, value: bool) -> None:
+        self._restyle(bold=value)
+
+    @property
+    def italic(self) -> bool:
+        """Italic attribute."""
+        return _style_of(self.style_id).italic
+
+    @italic.setter
+    def italic(self, value: bool) -> None:
+        self._restyle(italic=value)
+
+    @property
+    def underline(self) -> bool:
+        """Underline attribute."""
+        return _style_of(self.style_id).underline
+
+    @underline.setter
+    def underline(self, value: bool) -> None:
+        self._restyle(underline=value)
+
+    @property
+    def reverse(self) -> bool:
+        """Reverse video attribute."""
+        return _style_of(self.style_id).reverse
+
+    @reverse.setter
+    def reverse(self, value: bool) -> None:
+        self._restyle(reverse=value)
+
+    @property
+    def dim(self) -> bool:
+        """Dim attribute."""
+        return _style_of(self.style_id).dim
+
+    @dim.setter
+    def dim(self, value: bool) -> None:
+        self._restyle(dim=value)
+
+    def _restyle(self, **changes: Any) -> None:
+        """Re-intern this cell's style with some attributes replaced.
+
+        Parameters
+        ----------
+        **changes
+            Style attributes to replace (``fg_color``, ``bold``, ...)
+        """
+        current = _style_of(self.style_id)
+        self.style_id = _style_table.intern(
+            changes.get("fg_color", current.fg_color),
+            changes.get("bg_color", current.bg_color),
+            changes.get("bold", current.bold),
+            changes.get("italic", current.italic),
+            changes.get("underline", current.underline),
+            changes.get("reverse", current.reverse),
+            changes.get("dim", current.dim),
         )
 
     def __eq__(self, other: object) -> bool:
@@ -124,28 +624,41 @@ class Cell:
 
         Notes
         -----
-        This optimized comparison uses pre-computed style masks to reduce
-        the number of comparisons from 8 to 4 (char, style_mask, fg, bg).
-        This is critical for diff rendering performance as it's called
-        for every cell during buffer comparison.
-
-        Comparison order is optimized for early exit:
-        1. char - most likely to differ between cells
-        2. _style_mask - single int comparison for 5 boolean fields
-        3. fg_color - often differs for styled content
-        4. bg_color - least likely to differ
+        Because styles are interned, two cells are equal exactly when their
+        characters and style ids are equal (uncached styles, created once the
+        style table is full, are compared by record). This is critical for diff
+        rendering performance as it's called for every cell during buffer
+        comparison.
         """
-        if not isinstance(other, Cell):
+        if other.__class__ is not Cell and not isinstance(other, Cell):
             return False
+        if self.style_id == other.style_id:
+            return self.char == other.char
+        # Uncached styles (see StyleTable) are not shared, so compare records
+        return (
+            self.style_id < 0
+            and other.style_id < 0
+            and self.char == other.char
+            and _style_of(self.style_id)[1:] == _style_of(other.style_id)[1:]
+        )
+
+    # Cells are mutable (char and style can be reassigned), so unhashable
+    __hash__ = None  # type: ignore[assignment]
 
-        # Optimized comparison order with pre-computed style mask
+    def __repr__(self) -> str:
+        """Return a readable representation including the resolved style."""
+        style = _style_of(self.style_id)
         return (
-            self.char == other.char
-            and self._style_mask == other._style_mask
-            and self.fg_color == other.fg_color
-            and self.bg_color == other.bg_color
+            f"Cell(char={self.char!r}, fg_color={style.fg_color!r}, "
+            f"bg_color={style.bg_color!r}, bold={style.bold!r}, "
+            f"italic={style.italic!r}, underline={style.underline!r}, "
+            f"reverse={style.reverse!r}, dim={style.dim!r})"
         )
 
+    def __copy__(self) -> "Cell":
+        """Create a shallow copy (equivalent to :meth:`clone`)."""
+        return Cell(self.char, style_id=self.style_id)
+
     def to_ansi(self) -> str:
         """Convert cell to ANSI escape sequence string.
 
@@ -157,7 +670,8 @@ class Cell:
         Notes
         -----
         This generates the ANSI sequence needed to render this cell in a
-        terminal. Used by the diff renderer to output styled text.
+        terminal. Used by the diff renderer to output styled text. The SGR
+        prefix comes straight from the style table.
 
         Examples
         --------
@@ -166,36 +680,10 @@ class Cell:
         >>> '\\x1b[' in ansi  # Contains ANSI codes
         True
         """
-        codes = []
-
-        # Text attributes
-        if self.bold:
-            codes.append("1")
-        if self.dim:
-            codes.append("2")
-        if self.italic:
-            codes.append("3")
-        if self.underline:
-            codes.append("4")
-        if self.reverse:
-            codes.append("7")
-
-        # Foreground color (true color RGB)
-        if self.fg_color is not None:
-            r, g, b = self.fg_color
-            codes.append(f"38;2;{r};{g};{b}")
-
-        # Background color (true color RGB)
-        if self.bg_color is not None:
-            r, g, b = self.bg_color
-            codes.append(f"48;2;{r};{g};{b}")
-
-        # Build ANSI sequence
-        if codes:
-            ansi_codes = ";".join(codes)
-            return f"\x1b[{ansi_codes}m{self.char}\x1b[0m"
-
-        return self.char
+        style = _style_of(self.style_id)
+        if style.is_default:
+            return self.char
+        return f"{style.sgr}{self.char}{RESET_SGR}"
 
     def get_style_codes(self) -> str:
         """Get ANSI style codes for this cell without character or reset.
@@ -209,7 +697,8 @@ class Cell:
         -----
         This is used by the diff renderer to emit style changes without
         resetting after each cell. The reset is handled at end of styled
-        regions or end of lines.
+        regions or end of lines. The sequence is precomputed once per
+        distinct style, so this is a table lookup.
 
         Examples
         --------
@@ -218,37 +707,7 @@ class Cell:
         >>> codes
         '\\x1b[1;38;2;255;0;0m'
         """
-        codes = []
-
-        # Text attributes
-        if self.bold:
-            codes.append("1")
-        if self.dim:
-            codes.append("2")
-        if self.italic:
-            codes.append("3")
-        if self.underline:
-            codes.append("4")
-        if self.reverse:
-            codes.append("7")
-
-        # Foreground color (true color RGB)
-        if self.fg_color is not None:
-            r, g, b = self.fg_color
-            codes.append(f"38;2;{r};{g};{b}")
-
-        # Background color (true color RGB)
-        if self.bg_color is not None:
-            r, g, b = self.bg_color
-            codes.append(f"48;2;{r};{g};{b}")
-
-        # Build ANSI sequence (no char, no reset)
-        if codes:
-            ansi_codes = ";".join(codes)
-            return f"\x1b[{ansi_codes}m"
-
-        # No styling - emit reset to clear any previous style
-        return "\x1b[0m"
+        return _style_of(self.style_id).sgr
 
     def clone(self) -> "Cell":
         """Create a deep copy of this cell.
@@ -258,16 +717,7 @@ class Cell:
         Cell
             New cell with identical attributes
         """
-        return Cell(
-            char=self.char,
-            fg_color=self.fg_color,
-            bg_color=self.bg_color,
-            bold=self.bold,
-            italic=self.italic,
-            underline=self.underline,
-            reverse=self.reverse,
-            dim=self.dim,
-        )
+        return Cell(self.char, style_id=self.style_id)
 
 
 class CellPool:
@@ -301,12 +751,12 @@ class CellPool:
 
     def __init__(self) -> None:
         """Initialize the cell pool with common cells."""
-        # Cache for common cells
-        self._cache: dict[tuple[Any, ...], Cell] = {}
+        # Cache for common cells, keyed by (char, style_id)
+        self._cache: dict[tuple[str, int], Cell] = {}
 
         # Pre-create most common cells
         self._space = Cell(" ")
-        self._cache[(" ", None, None, False, False, False, False, False)] = self._space
+        self._cache[(" ", DEFAULT_STYLE_ID)] = self._space
 
     def get_space(
         self,
@@ -346,24 +796,9 @@ class CellPool:
         if not any([fg_color, bg_color, bold, italic, underline, reverse, dim]):
             return self._space
 
-        # Check cache
-        key = (" ", fg_color, bg_color, bold, italic, underline, reverse, dim)
-        if key in self._cache:
-            return self._cache[key]
-
-        # Create and cache
-        cell = Cell(
-            " ",
-            fg_color=fg_color,
-            bg_color=bg_color,
-            bold=bold,
-            italic=italic,
-            underline=underline,
-            reverse=reverse,
-            dim=dim,
+        return self.get_char(
+            " ", fg_color, bg_color, bold, italic, underline, reverse, dim
         )
-        self._cache[key] = cell
-        return cell
 
     def get_char(
         self,
@@ -410,23 +845,31 @@ class CellPool:
         repeated glyphs. For unique characters, creating cells directly
         may be more efficient.
         """
-        # Check cache
-        key = (char, fg_color, bg_color, bold, italic, underline, reverse, dim)
-        if key in self._cache:
-            return self._cache[key]
-
-        # Create and cache
-        cell = Cell(
-            char,
-            fg_color=fg_color,
-            bg_color=bg_color,
-            bold=bold,
-            italic=italic,
-            underline=underline,
-            reverse=reverse,
-            dim=dim,
+        style_id = _style_table.intern(
+            fg_color, bg_color, bold, italic, underline, reverse, dim
         )
-        self._cache[key] = cell
+        return self.get_styled_char(char, style_id)
+
+    def get_styled_char(self, char: str, style_id: int) -> Cell:
+        """Get a cell for a character and a pre-interned style id.
+
+        Parameters
+        ----------
+        char : str
+            Character to display
+        style_id : int
+            Style id from :func:`intern_style`
+
+        Returns
+        -------
+        Cell
+            Cached or new cell
+        """
+        key = (char, style_id)
+        cell = self._cache.get(key)
+        if cell is None:
+            cell = Cell(char, style_id=style_id)
+            self._cache[key] = cell
         return cell
 
     def clear(self) -> None:
@@ -438,7 +881,7 @@ class CellPool:
         grows too large in long-running applications.
         """
         self._cache.clear()
-        self._cache[(" ", None, None, False, False, False, False, False)] = self._space
+        self._cache[(" ", DEFAULT_STYLE_ID)] = self._space
 
 
 # Global cell pool instance for convenience
@@ -491,3 +934,21 @@ def get_pooled_cell(
     return _global_pool.get_char(
         char, fg_color, bg_color, bold, italic, underline, reverse, dim
     )
+
+
+def get_pooled_styled_cell(char: str, style_id: int) -> Cell:
+    """Get a cell for a pre-interned style id from the global pool.
+
+    Parameters
+    ----------
+    char : str
+        Character to display
+    style_id : int
+        Style id from :func:`intern_style` or ``Style.to_style_id()``
+
+    Returns
+    -------
+    Cell
+        Cached or new cell
+    """
+    return _global_pool.get_styled_char(char, style_id)
@@ -11,11 +11,9 @@ import sys
 import threading
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cache
 from typing import Any, Union
 
-from prompt_toolkit.input import create_input
-from prompt_toolkit.keys import Keys as PTKeys
-
 from wijjit.logging_config import get_logger
 from wijjit.terminal.mouse import MouseEvent, MouseEventParser, MouseTrackingMode
 
@@ -222,65 +220,133 @@ SINGLE_CHAR_KEYS = {
 }
 
 
-# Map prompt_toolkit keys to our Key objects
-PROMPT_TOOLKIT_KEY_MAP = {
-    PTKeys.Up: Keys.UP,
-    PTKeys.Down: Keys.DOWN,
-    PTKeys.Left: Keys.LEFT,
-    PTKeys.Right: Keys.RIGHT,
-    PTKeys.Home: Keys.HOME,
-    PTKeys.End: Keys.END,
-    PTKeys.PageUp: Keys.PAGE_UP,
-    PTKeys.PageDown: Keys.PAGE_DOWN,
-    PTKeys.Delete: Keys.DELETE,
-    PTKeys.Enter: Keys.ENTER,
-    PTKeys.ControlM: Keys.ENTER,  # Ctrl+M is Enter (carriage return)
-    PTKeys.Tab: Keys.TAB,
-    PTKeys.ControlI: Keys.TAB,  # Ctrl+I is Tab
-    PTKeys.BackTab: Keys.BACKTAB,
-    PTKeys.Escape: Keys.ESCAPE,
-    PTKeys.Backspace: Keys.BACKSPACE,
-    PTKeys.ControlC: Keys.CTRL_C,
-    PTKeys.ControlD: Keys.CTRL_D,
-    PTKeys.ControlZ: Keys.CTRL_Z,
-    PTKeys.ControlAt: Keys.CTRL_SPACE,  # Ctrl+Space (Ctrl+@ = NUL)
-    # Control+navigation keys
-    PTKeys.ControlHome: Key("ctrl+home", KeyType.SPECIAL),
-    PTKeys.ControlEnd: Key("ctrl+end", KeyType.SPECIAL),
-    PTKeys.ControlLeft: Key("ctrl+left", KeyType.SPECIAL),
-    PTKeys.ControlRight: Key("ctrl+right", KeyType.SPECIAL),
-    # Shift+navigation keys
-    PTKeys.ShiftUp: Key("shift+up", KeyType.SPECIAL),
-    PTKeys.ShiftDown: Key("shift+down", KeyType.SPECIAL),
-    PTKeys.ShiftLeft: Key("shift+left", KeyType.SPECIAL),
-    PTKeys.ShiftRight: Key("shift+right", KeyType.SPECIAL),
-    PTKeys.ShiftHome: Key("shift+home", KeyType.SPECIAL),
-    PTKeys.ShiftEnd: Key("shift+end", KeyType.SPECIAL),
-    PTKeys.ShiftPageUp: Key("shift+pageup", KeyType.SPECIAL),
-    PTKeys.ShiftPageDown: Key("shift+pagedown", KeyType.SPECIAL),
-    # Control+Shift+navigation keys
-    PTKeys.ControlShiftUp: Key("ctrl+shift+up", KeyType.SPECIAL),
-    PTKeys.ControlShiftDown: Key("ctrl+shift+down", KeyType.SPECIAL),
-    PTKeys.ControlShiftLeft: Key("ctrl+shift+left", KeyType.SPECIAL),
-    PTKeys.ControlShiftRight: Key("ctrl+shift+right", KeyType.SPECIAL),
-    PTKeys.ControlShiftHome: Key("ctrl+shift+home", KeyType.SPECIAL),
-    PTKeys.ControlShiftEnd: Key("ctrl+shift+end", KeyType.SPECIAL),
-    PTKeys.ControlShiftPageUp: Key("ctrl+shift+pageup", KeyType.SPECIAL),
-    PTKeys.ControlShiftPageDown: Key("ctrl+shift+pagedown", KeyType.SPECIAL),
-    # Function keys
-    PTKeys.F1: Keys.F1,
-    PTKeys.F2: Keys.F2,
-    PTKeys.F3: Keys.F3,
-    PTKeys.F4: Keys.F4,
-    PTKeys.F5: Keys.F5,
-    PTKeys.F6: Keys.F6,
-    PTKeys.F7: Keys.F7,
-    PTKeys.F8: Keys.F8,
-    PTKeys.F9: Keys.F9,
-    PTKeys.F10: Keys.F10,
-    PTKeys.F11: Keys.F11,
-    PTKeys.F12: Keys.F12,
-}
+# prompt_toolkit is imported on first use: pulling it in at module import
+# costs more than the rest of the terminal layer combined, and short-lived
+# tools (e.g. ``render_inline``) never read keyboard input.
+
+
+def create_input(*args: Any, **kwargs: Any) -> Any:
+    """Create a prompt_toolkit input object for the current platform.
+
+    Thin wrapper around :func:`prompt_toolkit.input.create_input` that
+    defers importing prompt_toolkit until an ``InputHandler`` is created.
+
+    Returns
+    -------
+    prompt_toolkit.input.Input
+        Platform-appropriate input object
+    """
+    from prompt_toolkit.input import create_input as _create_input
+
+    return _create_input(*args, **kwargs)
+
+
+@cache
+def _prompt_toolkit_keys() -> Any:
+    """Return prompt_toolkit's ``Keys`` enum, importing it on first call.
+
+    Returns
+    -------
+    type
+        The ``prompt_toolkit.keys.Keys`` enum
+    """
+    from prompt_toolkit.keys import Keys as PTKeys
+
+    return PTKeys
+
+
+@cache
+def _prompt_toolkit_key_map() -> dict[Any, Key]:
+    """Build the prompt_toolkit key -> ``Key`` mapping on first use.
+
+    Returns
+    -------
+    dict
+        Mapping of prompt_toolkit keys to our Key objects
+    """
+    from prompt_toolkit.keys import Keys as PTKeys
+
+    return {
+        PTKeys.Up: Keys.UP,
+        PTKeys.Down: Keys.DOWN,
+        PTKeys.Left: Keys.LEFT,
+        PTKeys.Right: Keys.RIGHT,
+        PTKeys.Home: Keys.HOME,
+        PTKeys.End: Keys.END,
+        PTKeys.PageUp: Keys.PAGE_UP,
+        PTKeys.PageDown: Keys.PAGE_DOWN,
+        PTKeys.Delete: Keys.DELETE,
+        PTKeys.Enter: Keys.ENTER,
+        PTKeys.ControlM: Keys.ENTER,  # Ctrl+M is Enter (carriage return)
+        PTKeys.Tab: Keys.TAB,
+        PTKeys.ControlI: Keys.TAB,  # Ctrl+I is Tab
+        PTKeys.BackTab: Keys.BACKTAB,
+        PTKeys.Escape: Keys.ESCAPE,
+        PTKeys.Backspace: Keys.BACKSPACE,
+        PTKeys.ControlC: Keys.CTRL_C,
+        PTKeys.ControlD: Keys.CTRL_D,
+        PTKeys.ControlZ: Keys.CTRL_Z,
+        PTKeys.ControlAt: Keys.CTRL_SPACE,  # Ctrl+Space (Ctrl+@ = NUL)
+        # Control+navigation keys
+        PTKeys.ControlHome: Key("ctrl+home", KeyType.SPECIAL),
+        PTKeys.ControlEnd: Key("ctrl+end", KeyType.SPECIAL),
+        PTKeys.ControlLeft: Key("ctrl+left", KeyType.SPECIAL),
+        PTKeys.ControlRight: Key("ctrl+right", KeyType.SPECIAL),
+        # Shift+navigation keys
+        PTKeys.ShiftUp: Key("shift+up", KeyType.SPECIAL),
+        PTKeys.ShiftDown: Key("shift+down", KeyType.SPECIAL),
+        PTKeys.ShiftLeft: Key("shift+left", KeyType.SPECIAL),
+        PTKeys.ShiftRight: Key("shift+right", KeyType.SPECIAL),
+        PTKeys.ShiftHome: Key("shift+home", KeyType.SPECIAL),
+        PTKeys.ShiftEnd: Key("shift+end", KeyType.SPECIAL),
+        PTKeys.ShiftPageUp: Key("shift+pageup", KeyType.SPECIAL),
+        PTKeys.ShiftPageDown: Key("shift+pagedown", KeyType.SPECIAL),
+        # Control+Shift+navigation keys
+        PTKeys.ControlShiftUp: Key("ctrl+shift+up", KeyType.SPECIAL),
+        PTKeys.ControlShiftDown: Key("ctrl+shift+down", KeyType.SPECIAL),
+        PTKeys.ControlShiftLeft: Key("ctrl+shift+left", KeyType.SPECIAL),
+        PTKeys.ControlShiftRight: Key("ctrl+shift+right", KeyType.SPECIAL),
+        PTKeys.ControlShiftHome: Key("ctrl+shift+home", KeyType.SPECIAL),
+        PTKeys.ControlShiftEnd: Key("ctrl+shift+end", KeyType.SPECIAL),
+        PTKeys.ControlShiftPageUp: Key("ctrl+shift+pageup", KeyType.SPECIAL),
+        PTKeys.ControlShiftPageDown: Key("ctrl+shift+pagedown", KeyType.SPECIAL),
+        # Function keys
+        PTKeys.F1: Keys.F1,
+        PTKeys.F2: Keys.F2,
+        PTKeys.F3: Keys.F3,
+        PTKeys.F4: Keys.F4,
+        PTKeys.F5: Keys.F5,
+        PTKeys.F6: Keys.F6,
+        PTKeys.F7: Keys.F7,
+        PTKeys.F8: Keys.F8,
+        PTKeys.F9: Keys.F9,
+        PTKeys.F10: Keys.F10,
+        PTKeys.F11: Keys.F11,
+        PTKeys.F12: Keys.F12,
+    }
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``PROMPT_TOOLKIT_KEY_MAP`` lazily (PEP 562).
+
+    Parameters
+    ----------
+    name : str
+        Attribute being looked up
+
+    Returns
+    -------
+    Any
+        The key map for ``PROMPT_TOOLKIT_KEY_MAP``
+
+    Raises
+    ------
+    AttributeError
+        For any other name
+    """
+    if name == "PROMPT_TOOLKIT_KEY_MAP":
+        return _prompt_toolkit_key_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class InputHandler:
@@ -585,7 +651,7 @@ class InputHandler:
                 # the whole event as a ";"-delimited string in a single KeyPress
                 # (e.g. "LEFT;MOUSE_DOWN;13;6") rather than a vt100 escape
                 # sequence, so no byte buffering or lookahead is needed.
-                if key_press.key == PTKeys.WindowsMouseEvent:
+                if key_press.key == _prompt_toolkit_keys().WindowsMouseEvent:
                     mouse_event = self.mouse_parser.parse_windows(key_press.data)
                     if mouse_event:
                         return mouse_event
@@ -645,8 +711,9 @@ class InputHandler:
             logger.debug(f"Processing key: {key_press.key!r}, data: {key_press.data!r}")
 
             # Check if it's a mapped special key first
-            if key_press.key in PROMPT_TOOLKIT_KEY_MAP:
-                mapped_key = PROMPT_TOOLKIT_KEY_MAP[key_press.key]
+            key_map = _prompt_toolkit_key_map()
+            if key_press.key in key_map:
+                mapped_key = key_map[key_press.key]
 
                 # Return Escape key (Alt detection handled earlier via lookahead)
                 if mapped_key == Keys.ESCAPE:
@@ -848,7 +915,7 @@ class InputHandler:
                 # the whole event as a ";"-delimited string in a single KeyPress
                 # (e.g. "LEFT;MOUSE_DOWN;13;6") rather than a vt100 escape
                 # sequence, so no byte buffering or lookahead is needed.
-                if key_press.key == PTKeys.WindowsMouseEvent:
+                if key_press.key == _prompt_toolkit_keys().WindowsMouseEvent:
                     mouse_event = self.mouse_parser.parse_windows(key_press.data)
                     if mouse_event:
                         return mouse_event
@@ -908,8 +975,9 @@ class InputHandler:
             logger.debug(f"Processing key: {key_press.key!r}, data: {key_press.data!r}")
 
             # Check if it's a mapped special key first
-            if key_press.key in PROMPT_TOOLKIT_KEY_MAP:
-                mapped_key = PROMPT_TOOLKIT_KEY_MAP[key_press.key]
+            key_map = _prompt_toolkit_key_map()
+            if key_press.key in key_map:
+                mapped_key = key_map[key_press.key]
 
                 # Return Escape key (Alt detection handled earlier via lookahead)
                 if mapped_key == Keys.ESCAPE:
@@ -632,28 +632,20 @@ class DiffRenderer:
             return ""
 
         commands = []
-        current_style = None
+        current_style: int | None = None
 
         for cell in row:
-            # Extract style signature for comparison
-            style_sig = (
-                cell.fg_color,
-                cell.bg_color,
-                cell.bold,
-                cell.italic,
-                cell.underline,
-                cell.reverse,
-                cell.dim,
-            )
-
-            if style_sig != current_style:
+            # Interned style ids compare as plain ints
+            style_id = cell.style_id
+
+            if style_id != current_style:
                 # Style changed, emit reset first to clear previous attributes,
-                # then emit new style codes and character
+                # then emit the precomputed style codes and character
                 if current_style is not None:
                     commands.append("\x1b[0m")
-                commands.append(cell.get_style_codes())
+                commands.append(cell.style.sgr)
                 commands.append(cell.char)
-                current_style = style_sig
+                current_style = style_id
             else:
                 # Same style, just write char
                 commands.append(cell.char)
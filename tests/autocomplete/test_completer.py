@@ -1,5 +1,6 @@
 """Tests for completer classes."""
 
+import asyncio
 from unittest.mock import Mock
 
 import pytest
@@ -27,6 +28,7 @@ class TestCompleterConfig:
         assert config.max_suggestions == 10
         assert config.select_on_tab is True
         assert config.close_on_blur is True
+        assert config.debounce == 0.0
 
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -64,6 +66,11 @@ class TestCompleterConfig:
         with pytest.raises(ValueError, match="max_suggestions must be >= 1"):
             CompleterConfig(max_suggestions=0)
 
+    def test_invalid_debounce(self):
+        """Test that negative debounce raises ValueError."""
+        with pytest.raises(ValueError, match="debounce must be >= 0"):
+            CompleterConfig(debounce=-0.1)
+
 
 class TestWordCompleter:
     """Tests for WordCompleter class."""
@@ -214,6 +221,98 @@ class TestAsyncCompleter:
         await completer.get_suggestions_async("test", context={"key": "value"})
         assert received_context == {"key": "value"}
 
+    @pytest.mark.asyncio
+    async def test_cache_reuses_results(self):
+        """Test cached prefixes do not call the callback again."""
+        calls = []
+
+        async def my_callback(prefix, context):
+            calls.append(prefix)
+            return [f"{prefix}{i}" for i in range(3)]
+
+        completer = AsyncCompleter(my_callback, cache_size=2, max_suggestions=2)
+        assert completer.cached_suggestions("a") is None
+        assert await completer.get_suggestions_async("a") == ["a0", "a1"]
+        assert await completer.get_suggestions_async("a") == ["a0", "a1"]
+        assert completer.cached_suggestions("a") == ["a0", "a1"]
+        assert calls == ["a"]
+
+        # Least recently used prefixes are evicted
+        await completer.get_suggestions_async("b")
+        await completer.get_suggestions_async("c")
+        assert completer.cached_suggestions("a") is None
+
+        completer.clear_cache()
+        assert completer.cached_suggestions("c") is None
+
+    @pytest.mark.asyncio
+    async def test_monotonic_narrows_cached_results(self):
+        """Test longer prefixes are filtered locally when monotonic."""
+        calls = []
+        words = ["Apple", "apricot", "banana", "grape"]
+
+        async def my_callback(prefix, context):
+            calls.append(prefix)
+            return [w for w in words if w.lower().startswith(prefix.lower())]
+
+        completer = AsyncCompleter(my_callback, cache_size=8, monotonic=True)
+        assert await completer.get_suggestions_async("a") == ["Apple", "apricot"]
+        assert await completer.get_suggestions_async("APR") == ["apricot"]
+        assert calls == ["a"]
+
+        plain = AsyncCompleter(my_callback, cache_size=8)
+        await plain.get_suggestions_async("a")
+        await plain.get_suggestions_async("ap")
+        assert calls == ["a", "a", "ap"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_query(self):
+        """Test concurrent requests for one prefix call the callback once."""
+        calls = []
+        release = asyncio.Event()
+
+        async def my_callback(prefix, context):
+            calls.append(prefix)
+            await release.wait()
+            return [prefix]
+
+        completer = AsyncCompleter(my_callback)
+        first = asyncio.create_task(completer.get_suggestions_async("a"))
+        second = asyncio.create_task(completer.get_suggestions_async("a"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == ["a"]
+        assert await second == ["a"]
+        assert calls == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_query_cancelled_with_last_waiter(self):
+        """Test the shared query survives until every waiter is cancelled."""
+        cancelled = asyncio.Event()
+        release = asyncio.Event()
+
+        async def my_callback(prefix, context):
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return [prefix]
+
+        completer = AsyncCompleter(my_callback)
+        first = asyncio.create_task(completer.get_suggestions_async("a"))
+        second = asyncio.create_task(completer.get_suggestions_async("a"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert completer._pending == {}
+
 
 class TestStateCompleter:
     """Tests for StateCompleter class."""
@@ -0,0 +1,189 @@
+"""Tests for CompletionIndex and indexed completers."""
+
+from unittest.mock import Mock
+
+from wijjit.autocomplete.completer import StateCompleter, WordCompleter
+from wijjit.autocomplete.index import CompletionIndex
+from wijjit.autocomplete.utils import filter_suggestions
+
+HOSTS = [
+    "web-01.prod",
+    "db-01.prod",
+    "Web-02.dev",
+    "cache.prod",
+    "webhook.dev",
+    42,
+    "db-02.dev",
+]
+
+
+class TestCompletionIndex:
+    """Tests for CompletionIndex queries."""
+
+    def test_matches_linear_filter(self):
+        """Test prefix and substring results equal filter_suggestions."""
+        for case_sensitive in (False, True):
+            index = CompletionIndex(HOSTS, case_sensitive=case_sensitive)
+            for query in ("w", "web", "WEB", "db-0", "prod", ".dev", "x", "o"):
+                for anywhere in (False, True):
+                    expected = filter_suggestions(
+                        HOSTS,
+                        query,
+                        case_sensitive=case_sensitive,
+                        match_anywhere=anywhere,
+                    )
+                    assert index.search(query, match_anywhere=anywhere) == expected, (
+                        query,
+                        anywhere,
+                        case_sensitive,
+                    )
+
+    def test_limit(self):
+        """Test limit keeps the first matches in word list order."""
+        index = CompletionIndex(HOSTS)
+
+        assert index.prefix("db", limit=1) == ["db-01.prod"]
+        assert index.substring("dev", limit=2) == ["Web-02.dev", "webhook.dev"]
+
+    def test_one_match_per_word(self):
+        """Test a word with repeated occurrences is returned once."""
+        index = CompletionIndex(["aaaa", "baab"])
+
+        assert index.substring("a") == ["aaaa", "baab"]
+        assert index.fuzzy("a") == ["aaaa", "baab"]
+
+    def test_empty_query(self):
+        """Test empty queries match nothing."""
+        index = CompletionIndex(HOSTS)
+
+        assert index.prefix("") == []
+        assert index.substring("") == []
+        assert index.fuzzy("") == []
+
+    def test_fuzzy_ranking(self):
+        """Test fuzzy tiers: prefix, then contiguous, then gapped."""
+        index = CompletionIndex(
+            ["data_grid", "dialog", "grids", "my_datagrid", "datagrid", "grid"]
+        )
+
+        assert index.fuzzy("grid") == [
+            "grid",
+            "grids",
+            "data_grid",
+            "my_datagrid",
+            "datagrid",
+        ]
+        # Gapped matches: fewest skipped characters, then earlier match
+        assert index.fuzzy("dgrid") == ["datagrid", "my_datagrid", "data_grid"]
+
+    def test_fuzzy_limit_stops_at_full_tier(self):
+        """Test a full tier is returned without searching later tiers."""
+        index = CompletionIndex(["grid", "grids", "data_grid", "gr_id"])
+
+        assert index.fuzzy("grid", limit=2) == ["grid", "grids"]
+        assert index.fuzzy("grid", limit=3) == ["grid", "grids", "data_grid"]
+        assert index.fuzzy("grid", limit=4) == [
+            "grid",
+            "grids",
+            "data_grid",
+            "gr_id",
+        ]
+
+    def test_fuzzy_shrinks_gapped_match(self):
+        """Test a gapped match is scored by its shortest window."""
+        index = CompletionIndex(["a-x-b", "a--b-c", "a----ab-c"])
+
+        # "a----ab-c" is matched from its first "a" but only skips one
+        assert index.fuzzy("abc") == ["a----ab-c", "a--b-c"]
+
+    def test_fuzzy_escapes_query(self):
+        """Test regex metacharacters in queries match literally."""
+        index = CompletionIndex(["a.b", "axb", "c++"])
+
+        assert index.fuzzy("a.") == ["a.b"]
+        assert index.fuzzy("++") == ["c++"]
+
+    def test_sync_appends_incrementally(self):
+        """Test sync only indexes words appended to the list."""
+        words = ["alpha", "beta"]
+        index = CompletionIndex(words)
+        assert index.prefix("a") == ["alpha"]
+
+        words.append("apex")
+        index.extend = Mock(wraps=index.extend)
+        index.sync(words)
+
+        index.extend.assert_called_once_with(["apex"])
+        assert index.prefix("a") == ["alpha", "apex"]
+        assert index.substring("pe") == ["apex"]
+
+    def test_sync_rebuilds_on_other_changes(self):
+        """Test sync rebuilds when earlier words change."""
+        words = ["alpha", "beta", "gamma"]
+        index = CompletionIndex(words)
+        index.prefix("a")
+
+        words[0] = "omega"
+        index.sync(words)
+
+        assert index.prefix("a") == []
+        assert index.substring("ga") == ["omega", "gamma"]
+        index.sync(["gamma"])
+        assert len(index) == 1
+
+    def test_many_appends_keep_prefix_order(self):
+        """Test bulk and single appends keep prefix results in list order."""
+        index = CompletionIndex(["host-1"])
+        index.prefix("host")
+        index.extend(f"host-{i}" for i in range(2, 100))
+        index.extend(["host-0"])
+
+        results = index.prefix("host")
+        assert results[0] == "host-1"
+        assert results[-1] == "host-0"
+        assert len(results) == 100
+
+
+class TestIndexedCompleters:
+    """Tests for completers backed by CompletionIndex."""
+
+    def test_word_completer_fuzzy(self):
+        """Test fuzzy config ranks WordCompleter results."""
+        completer = WordCompleter(
+            ["data_grid", "datagrid", "dialog"], fuzzy=True, max_suggestions=1
+        )
+
+        assert completer.get_suggestions("dgrid") == ["datagrid"]
+
+    def test_word_completer_sees_replaced_words(self):
+        """Test reassigning words is picked up."""
+        completer = WordCompleter(["apple"])
+        assert completer.get_suggestions("a") == ["apple"]
+
+        completer.words = ["avocado", "banana"]
+        assert completer.get_suggestions("a") == ["avocado"]
+
+    def test_case_sensitivity_change_rebuilds(self):
+        """Test changing case_sensitive after indexing is honoured."""
+        completer = WordCompleter(["Apple", "apricot"])
+        assert completer.get_suggestions("a") == ["Apple", "apricot"]
+
+        completer.config.case_sensitive = True
+        assert completer.get_suggestions("a") == ["apricot"]
+
+    def test_state_completer_tracks_state(self):
+        """Test StateCompleter follows appended and replaced state lists."""
+        app = Mock()
+        app.state.hosts = ["web-1", "db-1"]
+        completer = StateCompleter("hosts")
+        completer.bind_app(app)
+        assert completer.get_suggestions("web") == ["web-1"]
+        index = completer._index
+
+        app.state.hosts = app.state.hosts + ["web-2"]
+        assert completer.get_suggestions("web") == ["web-1", "web-2"]
+        assert completer._index is index
+
+        app.state.hosts = ["db-2"]
+        assert completer.get_suggestions("web") == []
+        assert completer.get_suggestions("db") == ["db-2"]
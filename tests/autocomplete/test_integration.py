@@ -4,6 +4,8 @@ Tests the integration of autocomplete with TextInput element, template tags,
 wiring manager, and the Wijjit application.
 """
 
+import asyncio
+
 import pytest
 
 from wijjit import Wijjit
@@ -366,6 +368,53 @@ class TestAsyncCompleterErrorHandling:
         assert elem._autocomplete_state.is_open is True
 
 
+class TestAsyncCompleterDebounce:
+    """Test debounced and cached async suggestion fetching."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_typing_queries_once(self):
+        """Only the last prefix of a burst is queried after the debounce."""
+        from wijjit.autocomplete.completer import AsyncCompleter
+
+        calls = []
+
+        async def callback(prefix: str, context: dict | None = None) -> list[str]:
+            calls.append(prefix)
+            return [f"{prefix}-result"]
+
+        completer = AsyncCompleter(callback, debounce=0.05)
+        elem = TextInput(id="test", value="", completer=completer)
+
+        for prefix in ("a", "ap", "app"):
+            elem._update_suggestions(prefix, 0, len(prefix))
+            await asyncio.sleep(0.01)
+        await elem._suggestion_task
+
+        assert calls == ["app"]
+        assert elem._autocomplete_state.suggestions == ["app-result"]
+
+    @pytest.mark.asyncio
+    async def test_cached_results_shown_immediately(self):
+        """Cached prefixes skip both the debounce and the callback."""
+        from wijjit.autocomplete.completer import AsyncCompleter
+
+        calls = []
+
+        async def callback(prefix: str, context: dict | None = None) -> list[str]:
+            calls.append(prefix)
+            return ["apple", "apricot", "avocado"]
+
+        completer = AsyncCompleter(callback, cache_size=16, monotonic=True, debounce=10)
+        await completer.get_suggestions_async("a")
+        elem = TextInput(id="test", value="ap", completer=completer)
+
+        elem._update_suggestions("ap", 0, 2)
+
+        assert elem._suggestion_task is None
+        assert elem._autocomplete_state.suggestions == ["apple", "apricot"]
+        assert calls == ["a"]
+
+
 class TestCallbackCompleterIntegration:
     """Test CallbackCompleter integration."""
 
@@ -0,0 +1,396 @@
+"""Startup benchmarks for Wijjit.
+
+Short-lived CLI commands built on the inline renderer pay Wijjit's import and
+first-render cost on every invocation, so these benchmarks measure startup in
+a fresh interpreter (a warm ``sys.modules`` would hide all of it):
+
+- cold ``import wijjit``
+- cold ``from wijjit import render_inline`` plus the first inline render
+- time-to-first-frame of a ``Wijjit`` app driven by ``WijjitHarness``
+
+Each measurement runs a child process with ``-X importtime``; its report is
+parsed to attribute the cost to individual modules, and the slowest modules
+are included in the failure message when a budget is exceeded.
+
+The default budgets are about 1.5x the times measured on a typical
+development machine, so a regression of that size fails. They can be
+overridden with environment variables (milliseconds):
+
+- ``WIJJIT_BUDGET_IMPORT_MS`` (default 110)
+- ``WIJJIT_BUDGET_INLINE_MS`` (default 1100)
+- ``WIJJIT_BUDGET_FIRST_FRAME_MS`` (default 1250)
+- ``WIJJIT_BUDGET_SCALE`` multiplies every budget (default 1.0); slow CI
+  runners set it above 1 rather than raising the defaults
+
+Run with:
+    pytest tests/benchmarks/test_startup.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import textwrap
+from dataclasses import dataclass
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+# Number of cold processes per measurement; the median is compared to budget
+ROUNDS = 3
+
+# Default budgets in milliseconds: ~1.5x the measured cold times (about 73,
+# 720 and 835 ms)
+IMPORT_BUDGET_MS = 110
+INLINE_BUDGET_MS = 1100
+FIRST_FRAME_BUDGET_MS = 1250
+
+# Modules that must not be imported just to render inline output
+HEAVY_OPTIONAL_MODULES = ("rich", "pygments.lexers", "prompt_toolkit", "PIL")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``python -X importtime`` output.
+
+    Attributes
+    ----------
+    module : str
+        Fully qualified module name
+    self_us : int
+        Time spent executing the module body itself, in microseconds
+    cumulative_us : int
+        Time including the module's own imports, in microseconds
+    depth : int
+        Nesting level in the import tree (0 = imported by the script)
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class StartupSample:
+    """Result of one cold-process startup measurement.
+
+    Attributes
+    ----------
+    timings : dict of str to float
+        Phase timings reported by the child process, in milliseconds
+    imports : list of ImportRecord
+        Parsed ``-X importtime`` report
+    modules : list of str
+        ``sys.modules`` keys at the end of the child process
+    """
+
+    timings: dict[str, float]
+    imports: list[ImportRecord]
+    modules: list[str]
+
+
+def parse_importtime(report: str) -> list[ImportRecord]:
+    """Parse the stderr of ``python -X importtime``.
+
+    Parameters
+    ----------
+    report : str
+        Raw stderr text; non-importtime lines are ignored
+
+    Returns
+    -------
+    list of ImportRecord
+        One record per imported module, in report order
+    """
+    records = []
+    for line in report.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(
+                    module=module,
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=max(0, (len(indent) - 1) // 2),
+                )
+            )
+    return records
+
+
+def attribute_cost(
+    records: list[ImportRecord], top: int = 10
+) -> list[tuple[str, float]]:
+    """Rank modules by their own import cost.
+
+    Parameters
+    ----------
+    records : list of ImportRecord
+        Parsed importtime report
+    top : int, optional
+        Number of modules to return (default: 10)
+
+    Returns
+    -------
+    list of (str, float)
+        ``(module, self_ms)`` pairs, most expensive first
+    """
+    ranked = sorted(records, key=lambda r: r.self_us, reverse=True)
+    return [(r.module, r.self_us / 1000) for r in ranked[:top]]
+
+
+def budget_ms(name: str, default: float) -> float:
+    """Read a startup budget from the environment.
+
+    Parameters
+    ----------
+    name : str
+        Environment variable holding the budget in milliseconds
+    default : float
+        Budget used when the variable is unset
+
+    Returns
+    -------
+    float
+        Budget in milliseconds, scaled by ``WIJJIT_BUDGET_SCALE``
+    """
+    scale = float(os.environ.get("WIJJIT_BUDGET_SCALE", "1.0"))
+    return float(os.environ.get(name, default)) * scale
+
+
+def run_cold(script: str) -> StartupSample:
+    """Run a script in a fresh interpreter with ``-X importtime``.
+
+    The script must print a JSON object of phase timings (milliseconds) as
+    its last stdout line; the harness appends the final ``sys.modules``.
+
+    Parameters
+    ----------
+    script : str
+        Python source to execute
+
+    Returns
+    -------
+    StartupSample
+        Timings, import report and loaded modules
+    """
+    wrapper = (
+        textwrap.dedent(script)
+        + "\nimport json as _json, sys as _sys\n"
+        + "print(_json.dumps(sorted(_sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", wrapper],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=False,
+    )
+    if result.returncode != 0:
+        pytest.fail(f"startup script failed:\n{result.stderr[-4000:]}")
+    *_, timings_line, modules_line = result.stdout.strip().splitlines()
+    return StartupSample(
+        timings=json.loads(timings_line),
+        imports=parse_importtime(result.stderr),
+        modules=json.loads(modules_line),
+    )
+
+
+def measure(benchmark, script: str, phase: str) -> tuple[float, StartupSample]:
+    """Run ``script`` cold ``ROUNDS`` times and return the median of ``phase``.
+
+    Parameters
+    ----------
+    benchmark
+        Pytest-benchmark fixture; records wall time per cold process
+    script : str
+        Script passed to :func:`run_cold`
+    phase : str
+        Key of the child-reported timing to aggregate
+
+    Returns
+    -------
+    tuple of (float, StartupSample)
+        Median phase time in milliseconds and the slowest sample (used for
+        cost attribution)
+    """
+    samples: list[StartupSample] = []
+
+    def run_once():
+        samples.append(run_cold(script))
+
+    # Warm the filesystem/bytecode caches so the first round is not an outlier
+    run_cold(script)
+    benchmark.pedantic(run_once, rounds=ROUNDS, iterations=1)
+
+    values = [s.timings[phase] for s in samples]
+    slowest = max(samples, key=lambda s: s.timings[phase])
+    median = statistics.median(values)
+    benchmark.extra_info[f"{phase}_ms"] = median
+    benchmark.extra_info["top_modules"] = attribute_cost(slowest.imports)
+    return median, slowest
+
+
+def assert_within_budget(
+    phase: str, elapsed: float, budget: float, sample: StartupSample
+) -> None:
+    """Fail with a per-module cost breakdown when ``elapsed`` exceeds ``budget``.
+
+    Parameters
+    ----------
+    phase : str
+        Human-readable name of the measured phase
+    elapsed : float
+        Measured median time in milliseconds
+    budget : float
+        Allowed time in milliseconds
+    sample : StartupSample
+        Sample whose import report is used for attribution
+    """
+    if elapsed <= budget:
+        return
+    breakdown = "\n".join(
+        f"  {ms:8.1f} ms  {module}"
+        for module, ms in attribute_cost(sample.imports, top=15)
+    )
+    pytest.fail(
+        f"{phase} took {elapsed:.1f} ms (budget {budget:.0f} ms). "
+        f"Most expensive modules:\n{breakdown}"
+    )
+
+
+class TestImportTimeParsing:
+    """The importtime parser and cost attribution used by the budgets."""
+
+    REPORT = textwrap.dedent("""\
+        import time: self [us] | cumulative | imported package
+        import time:       120 |        120 |     _io
+        import time:       300 |        420 |   io
+        import time:      2500 |       2920 | wijjit
+        WARNING something unrelated
+        """)
+
+    def test_parse_importtime(self):
+        records = parse_importtime(self.REPORT)
+
+        assert [r.module for r in records] == ["_io", "io", "wijjit"]
+        assert records[2] == ImportRecord("wijjit", 2500, 2920, 0)
+        assert records[0].depth == 2
+
+    def test_attribute_cost_orders_by_self_time(self):
+        ranked = attribute_cost(parse_importtime(self.REPORT), top=2)
+
+        assert ranked == [("wijjit", 2.5), ("io", 0.3)]
+
+    def test_budget_scale(self, monkeypatch):
+        monkeypatch.setenv("WIJJIT_BUDGET_IMPORT_MS", "100")
+        monkeypatch.setenv("WIJJIT_BUDGET_SCALE", "2.5")
+
+        assert budget_ms("WIJJIT_BUDGET_IMPORT_MS", 300) == 250
+
+
+class TestStartupBudget:
+    """Cold-process startup measurements checked against budgets."""
+
+    def test_import_wijjit(self, benchmark):
+        """Benchmark cold ``import wijjit``.
+
+        Parameters
+        ----------
+        benchmark
+            Pytest-benchmark fixture
+        """
+        script = """
+            import json, time
+            t0 = time.perf_counter()
+            import wijjit
+            t1 = time.perf_counter()
+            print(json.dumps({"import": (t1 - t0) * 1000}))
+        """
+        elapsed, sample = measure(benchmark, script, "import")
+
+        assert not [m for m in sample.modules if m.startswith("wijjit.")]
+        assert_within_budget(
+            "import wijjit",
+            elapsed,
+            budget_ms("WIJJIT_BUDGET_IMPORT_MS", IMPORT_BUDGET_MS),
+            sample,
+        )
+
+    def test_first_render_inline(self, benchmark):
+        """Benchmark cold import plus the first ``render_inline`` call.
+
+        Parameters
+        ----------
+        benchmark
+            Pytest-benchmark fixture
+        """
+        script = """
+            import json, time
+            t0 = time.perf_counter()
+            from wijjit import render_inline
+            t1 = time.perf_counter()
+            output = render_inline(
+                "{% frame title='Status' width=40 %}Build {{ result }}{% endframe %}",
+                width=60,
+                print_output=False,
+                result="passed",
+            )
+            t2 = time.perf_counter()
+            assert "passed" in output
+            print(json.dumps({
+                "import": (t1 - t0) * 1000,
+                "render": (t2 - t1) * 1000,
+                "total": (t2 - t0) * 1000,
+            }))
+        """
+        elapsed, sample = measure(benchmark, script, "total")
+
+        loaded = [m for m in HEAVY_OPTIONAL_MODULES if m in sample.modules]
+        assert not loaded, f"render_inline imported heavy optional modules: {loaded}"
+        assert_within_budget(
+            "first render_inline",
+            elapsed,
+            budget_ms("WIJJIT_BUDGET_INLINE_MS", INLINE_BUDGET_MS),
+            sample,
+        )
+
+    def test_time_to_first_frame(self, benchmark):
+        """Benchmark cold import to first rendered frame of a Wijjit app.
+
+        Parameters
+        ----------
+        benchmark
+            Pytest-benchmark fixture
+        """
+        script = """
+            import json, time
+            t0 = time.perf_counter()
+            from wijjit.testing import WijjitHarness, app_from_template
+            app = app_from_template(
+                "{% frame title='Login' width=40 height=8 %}"
+                "{% textinput id='user' %}{% endtextinput %}"
+                "{% button action='go' %}Go{% endbutton %}"
+                "{% endframe %}"
+            )
+            with WijjitHarness(app, size=(80, 24)) as harness:
+                harness.assert_text("Login")
+                t1 = time.perf_counter()
+            print(json.dumps({"first_frame": (t1 - t0) * 1000}))
+        """
+        elapsed, sample = measure(benchmark, script, "first_frame")
+
+        assert_within_budget(
+            "time to first frame",
+            elapsed,
+            budget_ms("WIJJIT_BUDGET_FIRST_FRAME_MS", FIRST_FRAME_BUDGET_MS),
+            sample,
+        )
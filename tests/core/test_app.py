@@ -366,6 +366,187 @@ class TestNavigation:
         assert app.handler_registry.current_view == "view2"
 
 
+class TestViewKeepAlive:
+    """Element trees of visited views are retained for back-navigation."""
+
+    TEMPLATE = "{% textinput id='%s' %}{% endtextinput %}"
+
+    def _app(self, **config):
+        app = Wijjit(**config)
+
+        @app.view("a", default=True)
+        def view_a():
+            return {"template": self.TEMPLATE.replace("%s", "name")}
+
+        @app.view("b")
+        def view_b():
+            return {"template": self.TEMPLATE.replace("%s", "other")}
+
+        @app.view("c", keep_alive=False)
+        def view_c():
+            return {"template": self.TEMPLATE.replace("%s", "third")}
+
+        return app
+
+    def _input(self, app, element_id):
+        return next(el for el in app.positioned_elements if el.id == element_id)
+
+    def test_back_navigation_reuses_elements(self):
+        from wijjit.testing.harness import WijjitHarness
+
+        app = self._app()
+        with WijjitHarness(app, size=(40, 10)) as harness:
+            harness.press("tab").type("hello").press("left").press("left").tick()
+            first = self._input(app, "name")
+            assert (first.value, first.cursor_pos) == ("hello", 3)
+
+            app.navigate("b")
+            harness.tick()
+            app.navigate("a")
+            harness.tick()
+
+            assert self._input(app, "name") is first
+            assert first.cursor_pos == 3
+
+    def test_keep_alive_false_recreates_elements(self):
+        from wijjit.testing.harness import WijjitHarness
+
+        app = self._app()
+        with WijjitHarness(app, size=(40, 10)) as harness:
+            app.navigate("c")
+            harness.tick()
+            third = self._input(app, "third")
+            app.navigate("a")
+            harness.tick()
+            app.navigate("c")
+            harness.tick()
+
+            assert self._input(app, "third") is not third
+            assert "c" not in app.renderer._retained_views
+
+    def test_view_cache_size_evicts_least_recent(self):
+        from wijjit.testing.harness import WijjitHarness
+
+        app = self._app(view_cache_size=1)
+        with WijjitHarness(app, size=(40, 10)) as harness:
+            first = self._input(app, "name")
+            unmounted = []
+            first.on_unmount = lambda: unmounted.append(first)
+            app.navigate("b")
+            harness.tick()
+            app.navigate("c")
+            harness.tick()
+
+            assert list(app.renderer._retained_views) == ["b"]
+            assert unmounted == [first]
+
+            app.navigate("a")
+            harness.tick()
+            assert self._input(app, "name") is not first
+
+    def test_view_cache_disabled(self):
+        app = self._app(view_cache_size=0)
+
+        @app.view("d")
+        def view_d():
+            return {"template": "D"}
+
+        app.navigate("d")
+
+        assert not app.renderer._retained_views
+
+
+class TestMemoizedViews:
+    """Memoized views are re-evaluated only when their inputs change."""
+
+    def _app(self, **options):
+        app = Wijjit(initial_state={"query": "a", "other": 0})
+        calls = []
+
+        @app.view("report", default=True, **options)
+        def report(page=1):
+            calls.append((app.state.query, page))
+            return {"template": f"{app.state.query}:{page}:{len(calls)}"}
+
+        return app, calls
+
+    def _evaluate(self, app, **params):
+        view = app.views["report"]
+        return app.view_router.evaluate_render(view, params).template
+
+    def test_reuses_result_until_read_key_changes(self):
+        app, calls = self._app(memoize=True)
+
+        assert self._evaluate(app) == "a:1:1"
+        app.state.other = 1
+        assert self._evaluate(app) == "a:1:1"
+        app.state.query = "b"
+        assert self._evaluate(app) == "b:1:2"
+        assert self._evaluate(app, page=2) == "b:2:3"
+        assert len(calls) == 3
+
+    def test_invalidate_view(self):
+        app, calls = self._app(memoize=True)
+        self._evaluate(app)
+        app.needs_render = False
+
+        app.invalidate_view("report")
+
+        assert app.needs_render
+        assert self._evaluate(app) == "a:1:2"
+        with pytest.raises(ValueError):
+            app.invalidate_view("missing")
+
+    def test_unmemoized_view_runs_every_render(self):
+        app, calls = self._app()
+        self._evaluate(app)
+        self._evaluate(app)
+
+        assert len(calls) == 2
+
+    def test_background_serves_stale_result_while_refreshing(self):
+        import asyncio
+
+        app, calls = self._app(background=True)
+
+        async def scenario():
+            assert self._evaluate(app) == "a:1:1"
+            app.state.query = "b"
+            app.needs_render = False
+            # Stale result is served while the view runs on a worker thread
+            assert self._evaluate(app) == "a:1:1"
+            while app.view_router._refreshing:
+                await asyncio.sleep(0.01)
+            return self._evaluate(app)
+
+        assert asyncio.run(scenario()) == "b:1:2"
+        assert app.needs_render
+        assert len(calls) == 2
+
+    def test_background_error_raised_on_next_render(self):
+        import asyncio
+
+        app = Wijjit(initial_state={"fail": False})
+
+        @app.view("report", default=True, background=True)
+        def report():
+            if app.state.fail:
+                raise RuntimeError("query failed")
+            return "ok"
+
+        async def scenario():
+            view = app.views["report"]
+            app.view_router.evaluate_render(view)
+            app.state.fail = True
+            app.view_router.evaluate_render(view)
+            while app.view_router._refreshing:
+                await asyncio.sleep(0.01)
+            with pytest.raises(RuntimeError, match="query failed"):
+                app.view_router.evaluate_render(view)
+
+        asyncio.run(scenario())
+
+
 class TestEventHandlers:
     """Tests for event handler registration."""
 
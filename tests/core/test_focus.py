@@ -469,3 +469,78 @@ class TestTabIndex:
         assert elem1_new.focused
         assert not elem2_new.focused
         assert not elem3_new.focused
+
+
+class TestIncrementalFocusOrder:
+    """Tests for reusing the focus order across renders."""
+
+    def test_unchanged_elements_keep_order_list(self):
+        """Same elements and tab indices do not rebuild the order."""
+        manager = FocusManager()
+        elems = [FocusableElement(f"e{i}") for i in range(3)]
+        manager.set_elements(elems)
+        order = manager.elements
+
+        manager.set_elements(list(elems))
+
+        assert manager.elements is order
+
+    def test_unchanged_elements_do_not_refocus(self):
+        """Focus hooks are not re-run when nothing changed."""
+        manager = FocusManager()
+        elems = [FocusableElement(f"e{i}") for i in range(3)]
+        manager.set_elements(elems)
+        manager.focus_element(elems[1])
+        calls = []
+        elems[1].on_blur = lambda: calls.append("blur")
+
+        manager.set_elements(elems)
+
+        assert calls == []
+        assert manager.get_focused_element() is elems[1]
+
+    def test_tab_index_change_resorts(self):
+        """Changing a tab index re-sorts the order."""
+        manager = FocusManager()
+        elems = [FocusableElement(f"e{i}") for i in range(3)]
+        manager.set_elements(elems)
+
+        elems[2].tab_index = 1
+        manager.set_elements(elems)
+
+        assert manager.elements == [elems[2], elems[0], elems[1]]
+
+    def test_remounted_element_keeps_focus_by_id(self):
+        """A replaced element with the same id keeps focus."""
+        manager = FocusManager()
+        elems = [FocusableElement(f"e{i}") for i in range(3)]
+        manager.set_elements(elems)
+        manager.focus_element(elems[2])
+
+        replacement = FocusableElement("e2")
+        manager.set_elements([FocusableElement("new"), elems[0], replacement])
+
+        assert manager.get_focused_element() is replacement
+
+    def test_focus_by_id(self):
+        """Elements can be focused by id."""
+        manager = FocusManager()
+        elems = [FocusableElement(f"e{i}") for i in range(3)]
+        manager.set_elements(elems)
+
+        assert manager.focus_by_id("e1")
+        assert manager.get_focused_element() is elems[1]
+        assert not manager.focus_by_id("missing")
+
+    def test_lookup_after_direct_assignment(self):
+        """Lookups stay correct when elements is assigned directly."""
+        manager = FocusManager()
+        elems = [FocusableElement(f"e{i}") for i in range(3)]
+        manager.set_elements(elems)
+
+        manager.elements = [elems[2], elems[0]]
+
+        assert manager.index_of(elems[0]) == 1
+        assert manager.index_of(elems[1]) is None
+        assert manager.focus_by_id("e2")
+        assert manager.current_index == 0
@@ -371,13 +371,11 @@ Inner content
             # Create a template file with layout tags
             template_path = os.path.join(tmpdir, "test_layout.tui")
             with open(template_path, "w") as f:
-                f.write(
-                    """
+                f.write("""
 {% frame title="Hello" width=40 height=10 %}
   Welcome, {{ name }}!
 {% endframe %}
-"""
-                )
+""")
 
             renderer = Renderer(template_dir=tmpdir)
             output, elements, layout_ctx = renderer.render_with_layout(
@@ -400,15 +398,13 @@ Inner content
             # Create template with variables and loops
             template_path = os.path.join(tmpdir, "dynamic.tui")
             with open(template_path, "w") as f:
-                f.write(
-                    """
+                f.write("""
 {% frame width=50 height=15 %}
   {% for item in items %}
     - {{ item }}
   {% endfor %}
 {% endframe %}
-"""
-                )
+""")
 
             renderer = Renderer(template_dir=tmpdir)
             context = {"title": "My List", "items": ["Apple", "Banana", "Cherry"]}
@@ -465,6 +461,64 @@ Inner content
             assert "Inline Content" in buffer_text2
 
 
+class TestTemplateCaching:
+    """Tests for the string-template LRU and the on-disk bytecode cache."""
+
+    def test_string_template_lru_is_bounded(self):
+        renderer = Renderer(string_template_cache_size=2)
+        renderer.render_string("A")
+        renderer.render_string("B")
+        renderer.render_string("A")
+        renderer.render_string("C")
+
+        assert list(renderer._string_templates) == ["A", "C"]
+
+    def test_string_template_cache_disabled(self):
+        renderer = Renderer(string_template_cache_size=0)
+
+        assert renderer.render_string("{{ 1 + 1 }}") == "2"
+        assert len(renderer._string_templates) == 0
+
+    def test_bytecode_cache_shared_across_renderers(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "bcc"
+        renderer = Renderer(bytecode_cache_dir=str(cache_dir))
+        assert renderer.render_string("Hi {{ name }}", {"name": "A"}) == "Hi A"
+        assert len(list(cache_dir.iterdir())) == 1
+
+        second = Renderer(bytecode_cache_dir=str(cache_dir))
+        compiled = []
+        monkeypatch.setattr(second.env, "compile", lambda *a, **kw: compiled.append(a))
+
+        assert second.render_string("Hi {{ name }}", {"name": "B"}) == "Hi B"
+        assert compiled == []
+
+    def test_bytecode_cache_dir_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("WIJJIT_TEMPLATE_BYTECODE_CACHE_DIR", str(tmp_path))
+
+        renderer = Renderer()
+
+        assert renderer.bytecode_cache_dir == str(tmp_path)
+        assert renderer.env.bytecode_cache is not None
+
+    def test_precompile_templates(self, tmp_path):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        (templates / "ok.tui").write_text("{% frame %}ok{% endframe %}")
+        (templates / "bad.tui").write_text("{% frame %}")
+        (templates / "notes.md").write_text("{% not a template")
+        cache_dir = tmp_path / "bcc"
+
+        renderer = Renderer(
+            template_dir=str(templates), bytecode_cache_dir=str(cache_dir)
+        )
+        results = dict(renderer.precompile_templates())
+
+        assert set(results) == {"ok.tui", "bad.tui"}
+        assert results["ok.tui"] is None
+        assert results["bad.tui"] is not None
+        assert len(list(cache_dir.iterdir())) == 1
+
+
 class TestRootFrameAutoScroll:
     """Tests for root frame auto-scroll functionality."""
 
@@ -1,10 +1,12 @@
 """Tests for state management."""
 
+import asyncio
+import threading
 from unittest.mock import Mock
 
 import pytest
 
-from wijjit.core.state import State
+from wijjit.core.state import MISSING, State
 
 
 class TestState:
@@ -439,6 +441,106 @@ class TestState:
         assert state["data_values"] == 123
 
 
+class TestTrackReads:
+    """Tests for State.track_reads()."""
+
+    def test_records_keys_and_values(self):
+        state = State({"a": 1, "b": 2, "c": 3})
+
+        with state.track_reads() as reads:
+            _ = state.a + state["b"]
+            _ = "missing" in state
+            _ = state.get("c")
+
+        assert reads == {"a": 1, "b": 2, "missing": MISSING, "c": 3}
+
+    def test_reads_outside_block_not_recorded(self):
+        state = State({"a": 1})
+        with state.track_reads() as reads:
+            pass
+        _ = state.a
+
+        assert reads == {}
+
+    def test_other_state_not_recorded(self):
+        state = State({"a": 1})
+        other = State({"b": 2})
+
+        with state.track_reads() as reads:
+            _ = other.b
+
+        assert reads == {}
+
+    def test_iteration_reads_every_key(self):
+        state = State({"a": 1, "b": 2})
+
+        with state.track_reads() as reads:
+            list(state)
+
+        assert set(reads) == {"a", "b"}
+
+
+class TestPost:
+    """Tests for thread-safe State.post() / post_many()."""
+
+    def test_applied_immediately_without_loop(self):
+        state = State({"a": 1})
+        callback = Mock()
+        state.on_change(callback)
+
+        state.post("a", 2)
+
+        assert state["a"] == 2
+        callback.assert_called_once_with("a", 1, 2)
+
+    def test_coalesced_on_loop(self):
+        state = State({"count": 0, "other": 0})
+        callback = Mock()
+        state.on_change(callback)
+
+        def worker():
+            for i in range(1, 1001):
+                state.post("count", i)
+            state.post_many({"other": 1}, count=1000)
+
+        async def scenario():
+            state.bind_loop(asyncio.get_running_loop())
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            # Nothing is applied on the posting thread
+            assert state["count"] == 0
+            await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+
+        assert state["count"] == 1000
+        assert state["other"] == 1
+        assert sorted(call.args for call in callback.call_args_list) == [
+            ("count", 0, 1000),
+            ("other", 0, 1),
+        ]
+
+    def test_flush_posts_applies_pending(self):
+        state = State({"a": 1})
+
+        async def scenario():
+            state.bind_loop(asyncio.get_running_loop())
+            state.post("a", 5)
+            state.flush_posts()
+            return state["a"]
+
+        assert asyncio.run(scenario()) == 5
+
+    def test_reserved_key_rejected(self):
+        state = State()
+
+        with pytest.raises(ValueError):
+            state.post("items", [])
+        with pytest.raises(ValueError):
+            state.post_many(keys=1)
+
+
 class TestReentrancyGuard:
     """Tests for the re-entrant change-notification depth guard."""
 
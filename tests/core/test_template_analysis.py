@@ -0,0 +1,135 @@
+"""Tests for template analysis and static-subtree hoisting."""
+
+import pytest
+from jinja2 import TemplateSyntaxError
+
+from wijjit.core.renderer import Renderer
+
+STATIC_FRAME = """{% vstack %}
+{% frame title="Static" height=5 %}
+{% vstack %}
+Hello world
+{% text %}fixed{% endtext %}
+{% endvstack %}
+{% endframe %}
+{% frame title="Dynamic" height=3 %}{{ count }}{% endframe %}
+{% for i in range(2) %}{% text %}row{% endtext %}{% endfor %}
+{% endvstack %}
+"""
+
+
+def render_text(renderer, template, context):
+    """Render a template and return the screen text."""
+    renderer.render_with_layout(template, context, 40, 15)
+    return renderer.get_buffer_as_text()
+
+
+class TestTemplateAnalysis:
+    """Tests for Renderer.analyze_template()."""
+
+    def test_uses_layout(self):
+        renderer = Renderer()
+
+        assert renderer.analyze_template("{% button %}OK{% endbutton %}").uses_layout
+        assert not renderer.analyze_template("Hello {{ name }}").uses_layout
+        # Tag names in comments and raw blocks are not tags
+        assert not renderer.analyze_template(
+            "{# {% frame %} #}{% raw %}{% vstack %}{% endraw %}"
+        ).uses_layout
+
+    def test_variables_and_state_keys(self):
+        analysis = Renderer().analyze_template(
+            "{{ title }} {{ state.count }} {{ state['name'] }}"
+            "{% for item in items %}{{ item }}{% endfor %}"
+        )
+
+        assert analysis.variables == {"title", "state", "items"}
+        assert analysis.state_keys == {"count", "name"}
+
+    def test_counts_static_subtrees(self):
+        analysis = Renderer().analyze_template(STATIC_FRAME)
+
+        # The first frame and the text inside the loop; the second frame
+        # reads a variable
+        assert analysis.static_subtrees == 2
+
+    def test_inputs_and_variable_attributes_are_not_static(self):
+        renderer = Renderer()
+
+        assert (
+            renderer.analyze_template(
+                '{% frame title=title %}Hi{% endframe %}{% button id="b" %}'
+                "OK{% endbutton %}"
+            ).static_subtrees
+            == 0
+        )
+
+    def test_cached_per_source(self):
+        renderer = Renderer(string_template_cache_size=1)
+        first = renderer.analyze_template("{{ a }}")
+
+        assert renderer.analyze_template("{{ a }}") is first
+        renderer.analyze_template("{{ b }}")
+        assert renderer.analyze_template("{{ a }}") is not first
+
+    def test_syntax_error(self):
+        with pytest.raises(TemplateSyntaxError):
+            Renderer().analyze_template("{% frame %}")
+
+
+class TestStaticSubtrees:
+    """Tests for reuse of frozen VNodes of static subtrees."""
+
+    def test_static_subtree_reused_across_renders(self):
+        renderer = Renderer()
+        renderer.render_with_layout(STATIC_FRAME, {"count": 1}, 40, 15)
+        first = renderer._last_vnode_tree
+        renderer.render_with_layout(STATIC_FRAME, {"count": 2}, 40, 15)
+        second = renderer._last_vnode_tree
+
+        assert second.children[0] is first.children[0]
+        assert second.children[1] is not first.children[1]
+        assert [child.key for child in second.children] == [
+            child.key for child in first.children
+        ]
+
+    def test_output_matches_uncached_render(self):
+        cached = Renderer()
+        uncached = Renderer(static_subtree_cache_size=0)
+
+        for count in range(3):
+            cached._last_base_buffer = None
+            uncached._last_base_buffer = None
+            expected = render_text(uncached, STATIC_FRAME, {"count": count})
+            assert render_text(cached, STATIC_FRAME, {"count": count}) == expected
+        assert "Hello world" in expected
+        assert "2" in expected
+
+    def test_generated_ids_follow_preceding_content(self):
+        template = (
+            "{% vstack %}{% for i in range(n) %}{% text %}{{ i }}{% endtext %}"
+            '{% endfor %}{% frame title="F" %}static{% endframe %}{% endvstack %}'
+        )
+        cached = Renderer()
+        uncached = Renderer(static_subtree_cache_size=0)
+
+        for n in (1, 3, 1):
+            ids = [
+                sorted(e.id for e in elements if e.id)
+                for _, elements, _ in (
+                    renderer.render_with_layout(template, {"n": n}, 40, 10)
+                    for renderer in (cached, uncached)
+                )
+            ]
+            assert ids[0] == ids[1]
+            assert f"text_{n}" in ids[0]
+
+    def test_clear_cache_drops_subtrees(self):
+        renderer = Renderer()
+        renderer.render_with_layout(STATIC_FRAME, {"count": 1}, 40, 15)
+        first = renderer._last_vnode_tree.children[0]
+        renderer.clear_cache()
+        renderer.render_with_layout(STATIC_FRAME, {"count": 1}, 40, 15)
+
+        assert renderer._last_vnode_tree.children[0] is not first
+        assert renderer._last_vnode_tree.children[0] == first
@@ -7,6 +7,7 @@ from wijjit.core.vdom import (
     VNode,
     VNodeBuilder,
     is_ephemeral_prop,
+    retain_deferred_children,
 )
 
 
@@ -186,3 +187,39 @@ class TestEphemeralProps:
     def test_ephemeral_props_is_frozenset(self):
         """EPHEMERAL_PROPS should be a frozenset."""
         assert isinstance(EPHEMERAL_PROPS, frozenset)
+
+
+class TestRetainDeferredChildren:
+    """Tests for carrying frozen subtrees over to deferred VNodes."""
+
+    def _panel(self, tab0_children, tab1_children, deferred):
+        tabs = [
+            VNode.create(
+                "TabContent",
+                key=f"_tab_{i}",
+                props={"deferred": True} if i in deferred else {},
+                children=children,
+            )
+            for i, children in enumerate((tab0_children, tab1_children))
+        ]
+        panel = VNode.create("TabbedPanel", key="tp", children=tabs)
+        return VNode.create("VStack", children=[panel])
+
+    def test_deferred_tab_keeps_previous_children(self):
+        body = [VNode.create("TextInput", key="b")]
+        old = self._panel([VNode.create("TextInput", key="a")], body, {1})
+        old = retain_deferred_children(None, old)
+        shown = self._panel([VNode.create("TextInput", key="a")], body, set())
+        new = self._panel([VNode.create("TextInput", key="a")], [], {1})
+
+        result = retain_deferred_children(shown, new)
+
+        tab1 = result.children[0].children[1]
+        assert tab1.children == tuple(body)
+        assert tab1.get_prop("deferred") is True
+
+    def test_unchanged_tree_returned_as_is(self):
+        tree = self._panel([VNode.create("TextInput", key="a")], [], set())
+
+        assert retain_deferred_children(tree, tree) is tree
+        assert retain_deferred_children(None, tree) is tree
@@ -0,0 +1,166 @@
+"""Tests for ElementWiringManager callback wiring and state sync."""
+
+from types import SimpleNamespace
+
+from wijjit.core.state import State
+from wijjit.core.wiring import ElementWiringManager
+from wijjit.elements.display.tree import Tree
+from wijjit.elements.input.button import Button
+from wijjit.elements.input.checkbox import Checkbox
+from wijjit.elements.input.radio import Radio
+from wijjit.elements.input.text import TextInput
+
+
+def make_manager():
+    """Create a wiring manager with a minimal app that records actions."""
+    dispatched = []
+    app = SimpleNamespace(
+        _dispatch_action=lambda aid, **kwargs: dispatched.append(aid),
+        overlay_manager=None,
+        needs_render=False,
+    )
+    return ElementWiringManager(app), dispatched
+
+
+class TestWireOnce:
+    """Callbacks are wired once per element, not on every render."""
+
+    def test_callbacks_not_reallocated_between_renders(self):
+        manager, _ = make_manager()
+        state = State({"name": "Ada"})
+        text = TextInput(id="name")
+        button = Button(label="Go", action="go")
+
+        manager.wire_elements([text, button], state)
+        on_change = text.on_change
+        on_activate = button.on_activate
+        manager.wire_elements([text, button], state)
+
+        assert text.on_change is on_change
+        assert button.on_activate is on_activate
+
+    def test_bound_value_synced_every_render(self):
+        manager, _ = make_manager()
+        state = State({"name": "Ada"})
+        text = TextInput(id="name")
+
+        manager.wire_elements([text], state)
+        assert text.value == "Ada"
+
+        state["name"] = "Grace"
+        manager.wire_elements([text], state)
+
+        assert text.value == "Grace"
+
+    def test_two_way_binding_writes_state(self):
+        manager, _ = make_manager()
+        state = State({"agree": False})
+        checkbox = Checkbox(id="agree", label="Agree")
+
+        manager.wire_elements([checkbox], state)
+        checkbox.toggle()
+
+        assert state["agree"] is True
+
+    def test_changing_wiring_attr_rewires(self):
+        manager, dispatched = make_manager()
+        state = State()
+        button = Button(label="Go", action="go")
+
+        manager.wire_elements([button], state)
+        button.action = "stop"
+        manager.wire_elements([button], state)
+        button.on_activate(None)
+
+        assert dispatched == ["stop"]
+
+    def test_invalidate_wiring_rewires(self):
+        manager, _ = make_manager()
+        state = State()
+        button = Button(label="Go", action="go")
+
+        manager.wire_elements([button], state)
+        on_activate = button.on_activate
+        button.invalidate_wiring()
+        manager.wire_elements([button], state)
+
+        assert button.on_activate is not on_activate
+
+    def test_new_state_object_rewires(self):
+        manager, _ = make_manager()
+        first = State({"name": "Ada"})
+        second = State({"name": "Grace"})
+        text = TextInput(id="name")
+
+        manager.wire_elements([text], first)
+        manager.wire_elements([text], second)
+        text.on_change("Grace", "Lin")
+
+        assert second["name"] == "Lin"
+        assert first["name"] == "Ada"
+
+
+class TestRadioRegrouping:
+    """Radio groups are rebuilt only when the set of radios changes."""
+
+    def test_groups_kept_when_radios_unchanged(self):
+        manager, _ = make_manager()
+        state = State()
+        a1 = Radio(name="a", label="A1", value="1")
+        a2 = Radio(name="a", label="A2", value="2")
+
+        manager.wire_elements([a1, a2], state)
+        group = a1.radio_group
+        manager.wire_elements([a1, a2], state)
+
+        assert a1.radio_group is group
+        assert a2.radio_group is group
+
+    def test_groups_rebuilt_when_radio_added(self):
+        manager, _ = make_manager()
+        state = State()
+        a1 = Radio(name="a", label="A1", value="1")
+        a2 = Radio(name="a", label="A2", value="2")
+
+        manager.wire_elements([a1], state)
+        manager.wire_elements([a1, a2], state)
+
+        assert a1.radio_group == [a1, a2]
+        assert a2.radio_group == [a1, a2]
+
+    def test_radio_binding_uses_current_value(self):
+        manager, _ = make_manager()
+        state = State({"size": "s"})
+        radio = Radio(name="size", label="Medium", value="m")
+
+        manager.wire_elements([radio], state)
+        radio.value = "l"
+        radio.on_change(False, True)
+
+        assert state["size"] == "l"
+
+
+class TestTreeWiring:
+    """Tree expansion persistence follows its expand_state_key."""
+
+    def test_changing_expand_state_key_rewires(self):
+        manager, _ = make_manager()
+        data = {
+            "id": "root",
+            "label": "Root",
+            "children": [
+                {"id": "a", "label": "A", "children": [{"id": "a1", "label": "A1"}]},
+                {"id": "b", "label": "B", "children": [{"id": "b1", "label": "B1"}]},
+            ],
+        }
+        state = State({"tree_a": ["a"], "tree_b": ["b"]})
+        tree = Tree(id="tree", data=data)
+        tree.expand_state_key = "tree_a"
+
+        manager.wire_elements([tree], state)
+        assert tree.expanded_nodes == {"a"}
+
+        tree.expand_state_key = "tree_b"
+        manager.wire_elements([tree], state)
+
+        assert tree.expanded_nodes == {"b"}
@@ -0,0 +1,240 @@
+"""Tests for streaming chart data: ring buffers, decimation and append APIs."""
+
+import random
+
+import pytest
+
+from wijjit.elements.display.barchart import BarChart
+from wijjit.elements.display.chart_utils import (
+    RingBuffer,
+    decimate_minmax,
+    lttb,
+    plot_points,
+)
+from wijjit.elements.display.linechart import LineChart
+from wijjit.elements.display.sparkline import Sparkline
+from wijjit.layout.bounds import Bounds
+from wijjit.rendering.paint_context import PaintContext
+from wijjit.styling.resolver import StyleResolver
+from wijjit.styling.theme import DefaultTheme
+from wijjit.terminal.screen_buffer import ScreenBuffer
+
+
+def render(element, width, height):
+    """Render an element into a fresh buffer and return the buffer."""
+    buffer = ScreenBuffer(width, height)
+    ctx = PaintContext(
+        buffer, StyleResolver(DefaultTheme()), Bounds(0, 0, width, height)
+    )
+    element.render_to(ctx)
+    return buffer
+
+
+class TestRingBuffer:
+    """Tests for the segment-tree backed RingBuffer."""
+
+    def test_append_evicts_oldest(self):
+        buf = RingBuffer(3, [1, 5, 2])
+        buf.append(4)
+
+        assert buf.to_list() == [5.0, 2.0, 4.0]
+        assert len(buf) == 3
+        assert buf[0] == 5.0
+        assert buf[-1] == 4.0
+
+    def test_running_min_max_after_eviction(self):
+        buf = RingBuffer(2, [9, 1])
+        buf.append(3)
+
+        assert (buf.min(), buf.max()) == (1.0, 3.0)
+        buf.append(2)
+        assert (buf.min(), buf.max()) == (2.0, 3.0)
+
+    def test_range_minmax_matches_scan(self):
+        rng = random.Random(7)
+        buf = RingBuffer(37)
+        reference = []
+        for _ in range(100):
+            value = rng.uniform(-100, 100)
+            buf.append(value)
+            reference = (reference + [value])[-37:]
+        for _ in range(200):
+            start = rng.randrange(len(reference))
+            stop = rng.randrange(start + 1, len(reference) + 1)
+            chunk = reference[start:stop]
+            assert buf.range_minmax(start, stop) == (min(chunk), max(chunk))
+
+    def test_bulk_extend_keeps_tail(self):
+        buf = RingBuffer(4)
+        buf.extend(range(10))
+
+        assert buf.to_list() == [6.0, 7.0, 8.0, 9.0]
+        assert (buf.min(), buf.max()) == (6.0, 9.0)
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+        buf = RingBuffer(2)
+        with pytest.raises(ValueError):
+            buf.min()
+        with pytest.raises(IndexError):
+            buf[0]
+        buf.append(1)
+        with pytest.raises(ValueError):
+            buf.range_minmax(0, 2)
+
+    def test_clear(self):
+        buf = RingBuffer(3, [1, 2, 3])
+        buf.clear()
+        buf.append(7)
+
+        assert buf.to_list() == [7.0]
+        assert buf.max() == 7.0
+
+    def test_slicing(self):
+        buf = RingBuffer(4, range(6))
+
+        assert buf[1:3] == [3.0, 4.0]
+        assert buf[::-2] == [5.0, 3.0]
+        assert 4.0 in buf
+
+
+class TestDecimation:
+    """Tests for min/max and LTTB decimation."""
+
+    def test_minmax_preserves_spike(self):
+        values = [0.0] * 1000
+        values[503] = 50.0
+        buf = RingBuffer(1000, values)
+
+        for series in (values, buf):
+            columns = decimate_minmax(series, 10)
+            assert len(columns) == 10
+            assert columns[5] == (0.0, 0.0, 50.0, 0.0)
+            assert max(hi for _, _, hi, _ in columns) == 50.0
+
+    def test_lttb_keeps_endpoints_and_count(self):
+        values = [float(i % 17) for i in range(500)]
+        sampled = lttb(values, 40)
+
+        assert len(sampled) == 40
+        assert sampled[0] == (0, values[0])
+        assert sampled[-1] == (499, values[-1])
+        indices = [i for i, _ in sampled]
+        assert indices == sorted(indices)
+
+    def test_lttb_short_series_unchanged(self):
+        assert lttb([1.0, 2.0], 10) == [(0, 1.0), (1, 2.0)]
+
+    def test_plot_points_sparse_maps_every_point(self):
+        points = plot_points([0, 10, 5], 20, 8, 0, 10)
+
+        assert points == [(0, 7), (9, 0), (19, 3)]
+
+    def test_plot_points_dense_is_bounded_by_width(self):
+        values = RingBuffer(100_000, range(100_000))
+
+        minmax = plot_points(values, 40, 8, values.min(), values.max())
+        sampled = plot_points(values, 40, 8, 0, 99_999, decimation="lttb")
+
+        assert len(minmax) == 4 * 40
+        assert len(sampled) == 40
+        assert len(plot_points(list(range(100)), 40, 8, 0, 99, "none")) == 100
+
+
+class TestStreamingCharts:
+    """Tests for append/extend on Sparkline, LineChart and BarChart."""
+
+    def test_sparkline_capacity(self):
+        sparkline = Sparkline(data=[1, 2], capacity=3)
+        sparkline.extend([3, 4])
+        sparkline.append(5)
+
+        assert isinstance(sparkline.values, RingBuffer)
+        assert sparkline.values.to_list() == [3.0, 4.0, 5.0]
+
+    def test_sparkline_unbounded_append(self):
+        sparkline = Sparkline(data=[1])
+        sparkline.append(2)
+
+        assert sparkline.values == [1.0, 2.0]
+
+    def test_dense_sparkline_renders_spike(self):
+        sparkline = Sparkline(capacity=200_000, width=10, height=1)
+        sparkline.extend([0.0] * 200_000)
+        sparkline.append(1.0)
+        sparkline.extend([0.0] * 5)
+
+        for style in ("line", "dot"):
+            sparkline.style = style
+            sparkline.show_minmax = True
+            buffer = render(sparkline, 10, 1)
+            assert any(buffer.get_cell(x, 0).char != " " for x in range(10))
+
+    def test_dense_sparkline_bars_and_markers_skip_full_scan(self, monkeypatch):
+        sparkline = Sparkline(capacity=100_000, width=10, height=2, style="bar")
+        sparkline.extend([1.0] * 100_000)
+        sparkline.append(9.0)
+        sparkline.show_minmax = True
+
+        def no_iteration(self):
+            raise AssertionError("rendering iterated the whole buffer")
+
+        monkeypatch.setattr(RingBuffer, "__iter__", no_iteration)
+        buffer = render(sparkline, 10, 2)
+
+        # The spike in the last column is a full bar topped by the max marker
+        assert buffer.get_cell(9, 0).char == "^"
+        assert buffer.get_cell(9, 1).char != " "
+        assert buffer.get_cell(0, 0).char == " "
+        assert buffer.get_cell(0, 1).char == "_"
+
+    def test_sparse_sparkline_markers(self):
+        sparkline = Sparkline(data=[3, 1, 2, 5, 4], width=9, height=2)
+        sparkline.show_minmax = True
+        buffer = render(sparkline, 9, 2)
+
+        # Five points across nine columns: index i is drawn at column 2*i
+        assert buffer.get_cell(2, 1).char == "_"
+        assert buffer.get_cell(6, 0).char == "^"
+
+    def test_linechart_append_labels(self):
+        chart = LineChart(data=[1, 2])
+        chart.append(3)
+        chart.append(4, label="Q4")
+        chart.append(10, series="other")
+
+        assert chart.series["data"] == [1.0, 2.0, 3.0, 4.0]
+        assert chart.series["other"] == [10.0]
+        assert chart.labels == ["0", "1", "2", "Q4"]
+
+    def test_linechart_capacity_trims_labels(self):
+        chart = LineChart(capacity=2)
+        chart.extend([1, 2, 3])
+
+        assert chart.series["data"].to_list() == [2.0, 3.0]
+        assert list(chart.labels) == ["1", "2"]
+
+    def test_linechart_dense_render(self):
+        chart = LineChart(capacity=50_000, width=30, height=8)
+        chart.extend(float(i % 100) for i in range(50_000))
+        chart.extend([0.0, 500.0], series="spikes")
+
+        buffer = render(chart, 30, 8)
+        # The spike reaches the top row of the plot area (inside the border)
+        top_row = [buffer.get_cell(x, 1).char for x in range(7, 29)]
+        assert any(char not in (" ", "\u2800") for char in top_row)
+
+    def test_barchart_append(self):
+        chart = BarChart(data=[("A", 1)], capacity=2, height=5)
+        chart.append(2, label="Longer label")
+        chart.append(3)
+
+        assert chart.values.to_list() == [2.0, 3.0]
+        assert list(chart.labels) == ["Longer label", "2"]
+        assert chart.label_width == 13
+        assert chart.scroll_manager.state.content_size == 2
+
+        buffer = render(chart, 40, 5)
+        text = "".join(buffer.get_cell(x, 1).char for x in range(40))
+        assert "Longer" in text
@@ -10,17 +10,24 @@ This module tests all chart visualization elements including:
 - HeatMap
 """
 
+import random
+
+import pytest
+
 from wijjit.elements.base import ElementType
+from wijjit.elements.display import chart_utils
 from wijjit.elements.display.barchart import BarChart
 from wijjit.elements.display.chart_utils import (
     BrailleCanvas,
     calculate_axis_ticks,
+    create_braille_canvas,
     extract_values,
     format_axis_value,
     get_block_char,
     get_gradient_color,
     get_threshold_color,
     normalize_data,
+    pack_braille,
     scale_value,
 )
 from wijjit.elements.display.columnchart import ColumnChart
@@ -210,6 +217,93 @@ class TestBrailleCanvas:
         assert canvas.get_pixel(0, 0) is False
         assert canvas.get_pixel(5, 5) is False
 
+    def test_bulk_drawing(self):
+        """Test polyline, point-set and fill helpers."""
+        canvas = BrailleCanvas(4, 2)
+
+        canvas.draw_polyline([(0, 0), (3, 3), (7, 0)])
+        canvas.set_pixels([(1, 7), (99, 99)])
+        canvas.fill_below_points([(6, 5), (6, 6)])
+
+        assert canvas.get_pixel(2, 2) and canvas.get_pixel(5, 2)
+        assert canvas.get_pixel(1, 7)
+        assert [canvas.get_pixel(6, y) for y in range(4, 8)] == [
+            False,
+            True,
+            True,
+            True,
+        ]
+
+    def test_create_canvas_falls_back_without_numpy(self, monkeypatch):
+        """Test the factory picks the pure-Python canvas without NumPy."""
+        monkeypatch.setattr(chart_utils, "get_numpy", lambda: None)
+
+        canvas = create_braille_canvas(3, 2)
+
+        assert type(canvas) is BrailleCanvas
+        with pytest.raises(ImportError):
+            create_braille_canvas(3, 2, backend="numpy")
+
+
+class TestNumpyBrailleCanvas:
+    """The NumPy canvas draws the same pixels as the pure-Python one."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def draw_both(self, draw, width=6, height=3):
+        """Apply ``draw`` to both backends and return their lines."""
+        lines = []
+        for backend in ("python", "numpy"):
+            canvas = create_braille_canvas(width, height, backend=backend)
+            draw(canvas)
+            lines.append(canvas.to_lines())
+        return lines
+
+    def test_axis_aligned_and_diagonal_lines_match(self):
+        python, numpy = self.draw_both(
+            lambda c: c.draw_polyline([(0, 0), (11, 0), (11, 11), (0, 0), (0, 5)])
+        )
+        assert python == numpy
+
+    def test_line_breaks_ties_like_bresenham(self):
+        python, numpy = self.draw_both(
+            lambda c: c.draw_line(13, 17, 29, 3), width=16, height=5
+        )
+        assert python == numpy
+
+    def test_random_polylines_match(self):
+        rng = random.Random(1234)
+        for _ in range(300):
+            points = [
+                (rng.randint(-4, 35), rng.randint(-4, 23))
+                for _ in range(rng.randint(1, 6))
+            ]
+            python, numpy = self.draw_both(
+                lambda c, points=points: c.draw_polyline(points), width=16, height=5
+            )
+            assert python == numpy, points
+
+    def test_points_fill_and_unset_match(self):
+        def draw(canvas):
+            canvas.set_pixels([(0, 0), (3, 7), (20, 20), (-1, 2)])
+            canvas.fill_below_points([(5, 4), (5, 9), (8, -3)])
+            canvas.unset_pixel(5, 11)
+
+        python, numpy = self.draw_both(draw)
+        assert python == numpy
+
+    def test_pack_braille_pads_partial_blocks(self):
+        np = pytest.importorskip("numpy")
+        mask = np.zeros((5, 3), dtype=bool)
+        mask[4, 2] = True
+
+        lines = pack_braille(mask)
+
+        assert len(lines) == 2 and len(lines[1]) == 2
+        assert lines[1] == chr(0x2800) + chr(0x2801)
+
 
 class TestSparkline:
     """Tests for Sparkline element."""
@@ -7,6 +7,8 @@ import pytest
 from tests.helpers import render_element
 from wijjit.elements.input.checkbox import Checkbox, CheckboxGroup
 from wijjit.layout.bounds import Bounds
+from wijjit.layout.engine import ElementNode
+from wijjit.terminal import ansi
 from wijjit.terminal.ansi import supports_unicode
 from wijjit.terminal.input import Key, Keys, KeyType
 from wijjit.terminal.mouse import MouseButton, MouseEvent, MouseEventType
@@ -123,6 +125,16 @@ class TestCheckbox:
         checkbox = Checkbox(label="Option", value="opt1", checked=True)
         assert checkbox.value == "opt1"
 
+    def test_cached_width_follows_unicode_mode(self, monkeypatch):
+        """Switching the box glyph re-measures instead of reusing the cache."""
+        checkbox = Checkbox(label="Option")
+
+        monkeypatch.setattr(ansi, "_unicode_mode", "force")
+        assert ElementNode(checkbox).calculate_constraints().preferred_width == 8
+
+        monkeypatch.setattr(ansi, "_unicode_mode", "disable")
+        assert ElementNode(checkbox).calculate_constraints().preferred_width == 10
+
 
 class TestCheckboxGroup:
     """Tests for CheckboxGroup element."""
@@ -0,0 +1,235 @@
+"""Tests for columnar data sources and their use in Table and DataGrid."""
+
+import pytest
+
+from tests.helpers import render_element
+from wijjit.elements.data_source import (
+    DataFrameSource,
+    DataSource,
+    NumpySource,
+    as_data_source,
+)
+from wijjit.elements.display.table import Table
+from wijjit.elements.input.datagrid import DataGrid
+
+
+class CountingSource(DataSource):
+    """In-memory source that records which rows were read."""
+
+    def __init__(self, rows, columns, **kwargs):
+        super().__init__(**kwargs)
+        self.rows = rows
+        self._columns = columns
+        self.fetched = []
+
+    @property
+    def row_count(self):
+        return len(self.rows)
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def get_value(self, row, col):
+        self.fetched.append(row)
+        return self.rows[row][col]
+
+
+def make_source(n=1000, **kwargs):
+    rows = [(f"item{i}", i, (i * 7) % 10) for i in range(n)]
+    return CountingSource(rows, ["name", "id", "score"], **kwargs)
+
+
+class TestDataSource:
+    """Tests for the DataSource base class."""
+
+    def test_get_rows_formats_and_caches(self):
+        source = make_source()
+
+        assert source.get_rows(2, 4) == [["item2", "2", "4"], ["item3", "3", "1"]]
+        fetched = len(source.fetched)
+        source.get_rows(2, 4)
+
+        assert len(source.fetched) == fetched
+
+    def test_get_rows_clamps_range(self):
+        source = make_source(n=3)
+
+        assert len(source.get_rows(-5, 100)) == 3
+        assert source.get_rows(5, 10) == []
+
+    def test_cache_is_bounded(self):
+        source = make_source(cache_rows=10)
+        for start in range(0, 100, 5):
+            source.get_rows(start, start + 5)
+
+        assert len(source._row_cache) == 10
+
+    def test_custom_formatter(self):
+        source = make_source(formatter=lambda v: f"<{v}>")
+
+        assert source.get_cell(1, 1) == "<1>"
+
+    def test_get_record_and_column_index(self):
+        source = make_source()
+
+        assert source.get_record(5) == {"name": "item5", "id": 5, "score": 5}
+        assert source.column_index("score") == 2
+        assert source.column_index("missing") is None
+
+    def test_argsort_is_stable(self):
+        source = make_source(n=20)
+
+        order = source.argsort(2)
+        scores = [source.rows[i][2] for i in order]
+
+        assert scores == sorted(scores)
+        assert order[:2] == [0, 10]
+        assert source.argsort(2, descending=True)[:2] == [7, 17]
+
+    def test_iter_rows_does_not_fill_cache(self):
+        source = make_source(n=50)
+
+        assert len(list(source.iter_rows(chunk_size=8))) == 50
+        assert len(source._row_cache) == 0
+
+    def test_as_data_source(self):
+        source = make_source()
+
+        assert as_data_source(source) is source
+        assert as_data_source([["a"]]) is None
+        assert as_data_source(None) is None
+
+
+class TestTableWithSource:
+    """Tests for Table reading rows from a DataSource."""
+
+    def test_columns_inferred_from_source(self):
+        table = Table(data=make_source())
+
+        assert [c["key"] for c in table.columns] == ["name", "id", "score"]
+
+    def test_only_visible_rows_read(self):
+        source = make_source(n=100_000)
+        table = Table(data=source, height=10)
+
+        render_element(table, 60, 10)
+
+        assert table.scroll_manager.state.content_size == 100_000
+        assert max(source.fetched) < 10
+
+    def test_sort_uses_row_order(self):
+        source = make_source(n=20)
+        table = Table(data=source, columns=["name", "score"], sortable=True)
+
+        table.sort_by_column("score")
+
+        assert table._visible_values(0, 2) == [["item0", "0"], ["item10", "0"]]
+        assert table._row_record(1)["name"] == "item10"
+
+    def test_assign_source(self):
+        table = Table(data=[{"a": 1}], columns=["a"])
+        table.data = make_source(n=30)
+
+        assert table._row_count() == 30
+        assert table.scroll_manager.state.content_size == 30
+
+
+class TestDataGridWithSource:
+    """Tests for DataGrid reading rows from a DataSource."""
+
+    def test_rows_read_on_demand(self):
+        source = make_source(n=100_000)
+        grid = DataGrid(data=source, height=15)
+
+        render_element(grid, 60, 15)
+
+        assert [c["label"] for c in grid.columns] == ["name", "id", "score"]
+        assert grid.scroll_manager.state.content_size == 100_000
+        assert grid.get_cell(99_999, 0) == "item99999"
+        assert len(set(source.fetched)) < 20
+
+    def test_edit_goes_to_overlay(self):
+        source = make_source(n=100)
+        grid = DataGrid(data=source)
+        changes = []
+        grid.on_cell_change = lambda *args: changes.append(args)
+
+        grid.set_cell(5, 0, "renamed")
+
+        assert grid.get_cell(5, 0) == "renamed"
+        assert grid._get_rows(5, 6) == [["renamed", "5", "5"]]
+        assert source.get_cell(5, 0) == "item5"
+        assert changes == [(5, 0, "item5", "renamed")]
+        assert grid._source is source
+
+    def test_structural_edit_materializes(self):
+        grid = DataGrid(data=make_source(n=3))
+        grid.set_cell(0, 0, "first")
+
+        grid.add_row(["new", "9", "9"])
+
+        assert grid._source is None
+        assert grid.data == [
+            ["first", "0", "0"],
+            ["item1", "1", "7"],
+            ["item2", "2", "4"],
+            ["new", "9", "9"],
+        ]
+
+    def test_navigation_does_not_materialize(self):
+        grid = DataGrid(data=make_source(n=500))
+
+        grid._move_cursor(1000, 0)
+
+        assert grid.cursor_row == 499
+        assert grid._source is not None
+
+    def test_data_change_gets_lazy_view(self):
+        source = make_source(n=100_000)
+        grid = DataGrid(data=source)
+        seen = []
+        grid.on_data_change = lambda rows: seen.append(
+            (len(rows), rows[5], rows[-1][0], list(rows[:1]))
+        )
+
+        grid.set_cell(5, 0, "renamed")
+        grid.set_data(make_source(n=50))
+
+        assert grid._source is not None
+        assert len(set(source.fetched)) < 20
+        assert seen == [
+            (100_000, ["renamed", "5", "5"], "item99999", [["item0", "0", "0"]]),
+            (50, ["item5", "5", "5"], "item49", [["item0", "0", "0"]]),
+        ]
+
+
+class TestPandasSource:
+    """Tests for the pandas adapter (requires pandas)."""
+
+    def test_dataframe_adapter(self):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"name": ["b", "a", "c"], "n": [2, 1, 3]}, index=[7, 8, 9])
+
+        source = as_data_source(df)
+
+        assert isinstance(source, DataFrameSource)
+        assert source.columns == ["name", "n"]
+        assert source.get_rows(0, 2) == [["b", "2"], ["a", "1"]]
+        assert source.argsort(1) == [1, 0, 2]
+        assert source == DataFrameSource(df)
+
+
+class TestNumpySource:
+    """Tests for the NumPy adapter (requires numpy)."""
+
+    def test_structured_array_adapter(self):
+        np = pytest.importorskip("numpy")
+        arr = np.array([("b", 2), ("a", 1), ("c", 2)], dtype=[("k", "U1"), ("v", "i4")])
+
+        source = as_data_source(arr)
+
+        assert isinstance(source, NumpySource)
+        assert source.columns == ["k", "v"]
+        assert source.get_rows(0, 2) == [["b", "2"], ["a", "1"]]
+        assert source.argsort(1, descending=True) == [0, 2, 1]
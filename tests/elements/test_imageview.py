@@ -8,16 +8,27 @@ This module tests the ImageView element including:
 - Braille mode rendering
 - Sizing calculations (width-only, height-only, both, fill, %)
 - Error handling (missing file, corrupted image)
+- Shared off-thread render cache
 """
 
+import asyncio
+import gc
+import threading
 from io import BytesIO
 from unittest.mock import patch
 
 import pytest
 
 from tests.helpers import render_element
-from wijjit.elements.display.image import PIL_AVAILABLE, ImageView
+from wijjit.elements.display.image import (
+    PIL_AVAILABLE,
+    ImageRenderCache,
+    ImageView,
+    clear_image_cache,
+    image_source_key,
+)
 from wijjit.layout.bounds import Bounds
+from wijjit.terminal.cell import Cell
 
 
 class TestImageViewInitialization:
@@ -354,3 +365,128 @@ class TestImageViewErrorHandling:
         iv = ImageView(src=None)
         loaded = iv._load_image()
         assert loaded is None
+
+
+def make_rows(char="x"):
+    """Build a one-row cell grid."""
+    return [[Cell(char=char)]]
+
+
+class TestImageRenderCache:
+    """Test the shared image render cache."""
+
+    def test_sync_miss_renders_once(self):
+        cache = ImageRenderCache()
+        calls = []
+
+        def render():
+            calls.append(1)
+            return make_rows()
+
+        first = cache.request("k", render)
+        second = cache.request("k", render)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_lru_eviction(self):
+        cache = ImageRenderCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.request(key, make_rows)
+        cache.get("a")
+        cache.request("c", make_rows)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_background_render_notifies_waiters(self):
+        cache = ImageRenderCache()
+        release = threading.Event()
+        calls = []
+        ready = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def render():
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+            return make_rows("y")
+
+        def on_ready():
+            loop.call_soon_threadsafe(ready.set)
+
+        assert cache.request("k", render, on_ready) is None
+        assert cache.request("k", render) is None
+        assert cache.is_pending("k")
+        release.set()
+        await asyncio.wait_for(ready.wait(), 5)
+
+        assert cache.get("k")[0][0].char == "y"
+        assert not cache.is_pending("k")
+        assert len(calls) == 1
+        assert calls[0].startswith("wijjit-image")
+
+    def test_source_keys(self, tmp_path):
+        path = tmp_path / "img.png"
+        path.write_bytes(b"abc")
+
+        assert image_source_key(None) is None
+        assert image_source_key(b"abc") == image_source_key(b"ab" + b"c")
+        assert image_source_key(b"abc") != image_source_key(b"abd")
+        assert image_source_key(str(path)) == image_source_key(path)
+        assert image_source_key(str(path))[2] is not None
+
+    def test_collected_source_is_forgotten(self):
+        class FakeImage:
+            pass
+
+        cache = ImageRenderCache()
+        src = FakeImage()
+        key = image_source_key(src)
+        cache.track_source(src, key)
+        cache.request((key, 1, 1), make_rows)
+
+        del src
+        gc.collect()
+
+        assert cache.get((key, 1, 1)) is None
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="PIL not available")
+class TestImageViewSharedCache:
+    """ImageViews share decoded and resized renders."""
+
+    def setup_method(self):
+        clear_image_cache()
+
+    def test_views_share_render(self):
+        from PIL import Image
+
+        buf = BytesIO()
+        Image.new("RGB", (10, 20), (10, 20, 30)).save(buf, format="PNG")
+        data = buf.getvalue()
+
+        first = ImageView(src=data, width=5)
+        second = ImageView(src=bytes(data), width=5)
+        render_element(first, width=10, height=10)
+        render_element(second, width=10, height=10)
+
+        assert first._cached_render is second._cached_render
+
+    @pytest.mark.asyncio
+    async def test_loading_placeholder_until_ready(self):
+        from PIL import Image
+
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        iv = ImageView(src=Image.new("RGB", (10, 20), (200, 0, 0)), width=5)
+        iv._request_render = lambda: loop.call_soon_threadsafe(ready.set)
+
+        output = render_element(iv, width=20, height=10)
+        assert "Loading" in output
+
+        await asyncio.wait_for(ready.wait(), 5)
+        output = render_element(iv, width=20, height=10)
+        assert "Loading" not in output
+        assert iv._cached_render
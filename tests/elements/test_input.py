@@ -952,6 +952,130 @@ class TestSelect:
         assert select.selected_values == {"A", "B"}
 
 
+def type_keys(select, text):
+    """Send each character of text to a select."""
+    for char in text:
+        select.handle_key(Key(char, KeyType.CHARACTER, char))
+
+
+class TestSelectSearchIndex:
+    """Tests for Select's option index, find_options() and type-ahead."""
+
+    TIMEZONES = [
+        "Europe/Berlin",
+        "America/New_York",
+        "Europe/Paris",
+        "Asia/Tokyo",
+        "europe/lisbon",
+        "America/Chicago",
+    ]
+
+    def test_find_options(self):
+        """Prefix and substring searches ignore case and keep option order."""
+        select = Select(options=self.TIMEZONES + [{"value": "x", "label": "STRASSE"}])
+
+        assert select.find_options("europe") == [0, 2, 4]
+        assert select.find_options("Europe/P") == [2]
+        assert select.find_options("o", match_anywhere=True) == [0, 1, 2, 3, 4, 5]
+        assert select.find_options("straße", match_anywhere=True) == [6]
+        assert select.find_options("") == []
+        assert select.find_options("Pacific") == []
+
+    def test_index_rebuilt_when_options_change(self):
+        """Lookups follow the options after they are replaced."""
+        select = Select(options=["Red", "Green"], value="Green")
+        assert select.find_options("gr") == [1]
+
+        select.options = ["Grey", "Blue", "Green"]
+
+        assert select.find_options("gr") == [0, 2]
+        assert select._find_option_index("Green") == 2
+        assert select._find_option_index("Red") == -1
+
+    def test_find_option_index_first_duplicate_and_unhashable(self):
+        """The first option with a value wins, even for unhashable values."""
+        select = Select(
+            options=[
+                {"value": "a", "label": "First"},
+                {"value": ["x"], "label": "List"},
+                {"value": "a", "label": "Second"},
+            ]
+        )
+
+        assert select._find_option_index("a") == 0
+        assert select._find_option_index(["x"]) == 1
+        assert select._find_option_index("b") == -1
+
+    def test_skip_disabled_wraps_around(self):
+        """Skipping disabled options wraps past either end of the list."""
+        select = Select(options=list("ABCDE"), disabled_values=["A", "D", "E"])
+
+        assert select._skip_disabled_options(3, 1) == 1
+        assert select._skip_disabled_options(0, -1) == 2
+        assert select._skip_disabled_options(2, 1) == 2
+
+        # Changing the disabled values in place is picked up
+        select.disabled_values.add("B")
+        assert select._skip_disabled_options(3, 1) == 2
+
+        select.disabled_values = list("ABCDE")
+        assert select._skip_disabled_options(1, 1) == 1
+
+    def test_type_ahead_jumps_to_prefix(self):
+        """Typed text moves the highlight to the next matching option."""
+        select = Select(options=self.TIMEZONES, type_ahead=True)
+        highlights = []
+        select.on_highlight_change = highlights.append
+
+        type_keys(select, "asia")
+
+        assert select.highlighted_index == 3
+        assert highlights == [1, 3]
+
+    def test_type_ahead_repeated_character_cycles(self):
+        """Repeating one character cycles through the options it starts."""
+        select = Select(
+            options=self.TIMEZONES, disabled_values=["Europe/Paris"], type_ahead=True
+        )
+
+        visited = []
+        for _ in range(3):
+            type_keys(select, "e")
+            visited.append(select.highlighted_index)
+
+        assert visited == [4, 0, 4]
+
+    def test_type_ahead_timeout_starts_new_query(self, monkeypatch):
+        """A pause longer than the timeout starts a new query."""
+        clock = [100.0]
+        monkeypatch.setattr(
+            "wijjit.elements.input.select.time.monotonic", lambda: clock[0]
+        )
+        select = Select(options=self.TIMEZONES, type_ahead=True)
+
+        type_keys(select, "am")
+        assert select.highlighted_index == 1
+        clock[0] += 5
+        type_keys(select, "as")
+
+        assert select.highlighted_index == 3
+
+    def test_type_ahead_scrolls_and_is_opt_in(self):
+        """Type-ahead scrolls the match into view; it is off by default."""
+        options = [f"host-{i:05d}" for i in range(50_000)]
+        select = Select(options=options, visible_rows=5, type_ahead=True)
+
+        type_keys(select, "host-04321")
+
+        assert select.highlighted_index == 4321
+        start, end = select.scroll_manager.get_visible_range()
+        assert start <= 4321 < end
+
+        plain = Select(options=options)
+        assert not plain.handle_key(Key("h", KeyType.CHARACTER, "h"))
+        assert plain.highlighted_index == 0
+
+
 class TestTextInputCallbacks:
     """Tests for TextInput event callbacks."""
 
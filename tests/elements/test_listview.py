@@ -386,3 +386,100 @@ class TestListView:
         # Dividers should be between item groups (after details)
         output = render_element(listview, width=50, height=20)
         assert isinstance(output, str)
+
+
+class TestListViewVirtualization:
+    """Tests for rendering only the visible window of a ListView."""
+
+    ITEMS = [
+        "Plain",
+        ("Two", "a\nb"),
+        {"label": "Dict", "details": "c"},
+        ("Empty", ""),
+        "Last",
+    ]
+
+    def test_rendered_lines(self):
+        """Test the materialized lines follow item heights and dividers."""
+        listview = ListView(
+            items=self.ITEMS,
+            bullet="dash",
+            show_dividers=True,
+            dim_details=False,
+            border_style="none",
+            show_scrollbar=False,
+            width=10,
+        )
+        divider = listview.rendered_lines[1]
+
+        assert set(divider) <= {"─", "-"} and len(divider) == 10
+        assert listview.rendered_lines == [
+            "- Plain",
+            divider,
+            "- Two",
+            "  a",
+            "  b",
+            divider,
+            "- Dict",
+            "  c",
+            divider,
+            "- Empty",
+            divider,
+            "- Last",
+        ]
+        assert listview.scroll_manager.state.content_size == 12
+
+    def test_any_window_matches_full_render(self):
+        """Test every window of lines equals the same slice of all lines."""
+        for dividers in (False, True):
+            listview = ListView(
+                items=self.ITEMS * 3, show_dividers=dividers, border_style="none"
+            )
+            width = listview._get_content_width()
+            lines = list(listview._iter_lines(0, listview._count_lines(), width))
+            assert len(lines) == listview._count_lines()
+            for start in range(len(lines)):
+                for end in range(start, len(lines) + 1):
+                    assert (
+                        list(listview._iter_lines(start, end, width))
+                        == lines[start:end]
+                    )
+
+    def test_large_list_renders_visible_items_only(self):
+        """Test a large list only renders the items in view."""
+        items = [f"host-{i}" for i in range(100_000)]
+        items[50_000] = ("host-50000", "rack 7\nrow 2")
+        listview = ListView(items=items, width=30, height=10, bullet="number")
+        listview.set_bounds(Bounds(0, 0, 30, 10))
+
+        assert listview._items is None
+        assert listview.scroll_manager.state.content_size == 100_002
+
+        listview.scroll_manager.scroll_to(50_000)
+        output = render_element(listview, width=30, height=10)
+
+        assert "50001. host-50000" in output
+        assert "rack 7" in output
+        assert "50002. host-50001" in output
+        assert len(listview._line_cache) <= 8
+        assert listview._items is None
+
+    def test_toggling_dividers_updates_content_size(self):
+        """Test the scroll size follows show_dividers at paint time."""
+        listview = ListView(items=["a", "b", "c"], width=20, height=10)
+        listview.set_bounds(Bounds(0, 0, 20, 10))
+        assert listview.scroll_manager.state.content_size == 3
+
+        listview.show_dividers = True
+        output = render_element(listview, width=20, height=10)
+
+        assert listview.scroll_manager.state.content_size == 5
+        assert output.count("──") + output.count("--") >= 2
+
+    def test_label_with_dashes_uses_label_style(self):
+        """Test labels containing dashes are not styled as dividers."""
+        listview = ListView(items=["a --- b"], border_style="none")
+        kind, text = next(listview._iter_lines(0, 1, 20))
+
+        assert kind == "label"
+        assert text.endswith("a --- b")
@@ -638,3 +638,40 @@ CLOSING_LINE
 
         # The closing text sits below the button (was drawn above it before fix).
         assert closing > button
+
+
+class TestPagerLazyBodies:
+    """Only the current page's body is evaluated by the template."""
+
+    TEMPLATE = """
+{%- pager id="pg" width=50 height=12 %}
+{% page title="One" %}{{ mark("one") }}First page{% endpage %}
+{% page title="Two" %}{{ mark("two") }}Second page{% endpage %}
+{% endpager -%}
+"""
+
+    def test_only_current_page_evaluated(self):
+        from wijjit import Wijjit
+        from wijjit.testing.harness import WijjitHarness
+
+        calls = []
+
+        def mark(name):
+            calls.append(name)
+            return ""
+
+        app = Wijjit()
+        app.renderer.env.globals["mark"] = mark
+        app.view("main", default=True)(lambda: {"template": self.TEMPLATE})
+
+        with WijjitHarness(app, size=(60, 16)) as harness:
+            harness.tick()
+            assert "two" not in calls
+            harness.assert_text("First page")
+
+            pager = next(el for el in app.positioned_elements if el.id == "pg")
+            pager.next_page()
+            harness.tick()
+
+            assert "two" in calls
+            harness.assert_text("Second page")
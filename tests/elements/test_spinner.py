@@ -11,6 +11,8 @@ This module tests the Spinner element including:
 from tests.helpers import render_element
 from wijjit.elements.display.spinner import SPINNER_FRAMES, Spinner
 from wijjit.layout.bounds import Bounds
+from wijjit.layout.engine import ElementNode
+from wijjit.terminal import ansi
 from wijjit.terminal.ansi import strip_ansi
 
 
@@ -454,6 +456,16 @@ class TestSpinner:
         assert output.startswith(spinner._get_current_frame())
         assert label in output
 
+    def test_cached_width_follows_unicode_mode(self, monkeypatch):
+        """Falling back to wider ASCII frames re-measures the spinner."""
+        spinner = Spinner(style="bouncing")
+
+        monkeypatch.setattr(ansi, "_unicode_mode", "force")
+        assert ElementNode(spinner).calculate_constraints().preferred_width == 1
+
+        monkeypatch.setattr(ansi, "_unicode_mode", "disable")
+        assert ElementNode(spinner).calculate_constraints().preferred_width == 3
+
     def test_multiple_frame_advances(self):
         """Test advancing frames multiple times.
 
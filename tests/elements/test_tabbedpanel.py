@@ -641,3 +641,75 @@ class TestTabbedPanelWheelScroll:
         result = await panel.handle_mouse(event)
         assert result is True
         assert frame.keys == [Keys.UP, Keys.UP, Keys.UP]
+
+
+class TestTabbedPanelLazyBodies:
+    """Only the active tab's body is evaluated by the template."""
+
+    TEMPLATE = """
+{%- tabbedpanel id="tp" width=50 height=12 lazy=lazy %}
+{% tab label="One" %}{{ mark("one") }}{% textinput id="a" %}{% endtextinput %}{% endtab %}
+{% tab label="Two" %}{{ mark("two") }}{% textinput id="b" %}{% endtextinput %}{% endtab %}
+{% endtabbedpanel -%}
+"""
+
+    def _app(self, calls, lazy=True):
+        from wijjit import Wijjit
+
+        def mark(name):
+            calls.append(name)
+            return ""
+
+        app = Wijjit()
+        app.renderer.env.globals["mark"] = mark
+        app.view("main", default=True)(
+            lambda: {"template": self.TEMPLATE, "data": {"lazy": lazy}}
+        )
+        return app
+
+    def _element(self, app, element_id):
+        return next(el for el in app.positioned_elements if el.id == element_id)
+
+    def test_inactive_tab_not_evaluated(self):
+        from wijjit.testing.harness import WijjitHarness
+
+        calls = []
+        app = self._app(calls)
+        with WijjitHarness(app, size=(60, 16)) as harness:
+            harness.tick()
+
+            assert "two" not in calls
+            assert "one" in calls
+
+            self._element(app, "tp").switch_to_tab(1)
+            calls.clear()
+            harness.tick()
+
+            assert calls == ["two"]
+            harness.assert_text("[Two]")
+
+    def test_inactive_tab_elements_frozen(self):
+        from wijjit.testing.harness import WijjitHarness
+
+        calls = []
+        app = self._app(calls)
+        with WijjitHarness(app, size=(60, 16)) as harness:
+            first = self._element(app, "a")
+            first.value = "kept"
+            self._element(app, "tp").switch_to_tab(1)
+            harness.tick()
+            self._element(app, "tp").switch_to_tab(0)
+            harness.tick()
+
+            assert self._element(app, "a") is first
+            assert first.value == "kept"
+
+    def test_lazy_false_evaluates_every_tab(self):
+        from wijjit.testing.harness import WijjitHarness
+
+        calls = []
+        app = self._app(calls, lazy=False)
+        with WijjitHarness(app, size=(60, 16)) as harness:
+            harness.tick()
+
+        assert "one" in calls and "two" in calls
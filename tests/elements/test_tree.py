@@ -1,5 +1,8 @@
 """Tests for Tree display element."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
 from tests.helpers import render_element
@@ -1222,3 +1225,361 @@ class TestTreeBorderedViewport:
         assert tree.highlighted_index == 8
         start, end = tree.scroll_manager.get_visible_range()
         assert start <= tree.highlighted_index < end
+
+
+class TestTreeLazyChildren:
+    """Tests for loading children on expand via children_loader."""
+
+    @staticmethod
+    def make_tree():
+        calls = []
+
+        def loader(node):
+            calls.append(node["id"])
+            if node["id"] == "empty":
+                return []
+            return [
+                {"label": "Folder", "value": f"{node['id']}/f", "has_children": True},
+                {"label": "File", "value": f"{node['id']}/file"},
+            ]
+
+        data = {
+            "label": "Root",
+            "value": "root",
+            "children": [
+                {"label": "Lazy", "value": "lazy", "has_children": True},
+                {"label": "Empty", "value": "empty", "has_children": True},
+            ],
+        }
+        return Tree(data=data, children_loader=loader), calls
+
+    def test_lazy_node_shows_indicator_without_loading(self):
+        tree, calls = self.make_tree()
+        tree.expand_node("root")
+
+        assert [n["has_children"] for n in tree.nodes] == [True, True, True]
+        assert calls == []
+
+    def test_expand_loads_children_once(self):
+        tree, calls = self.make_tree()
+        tree.expand_node("root")
+        tree.expand_node("lazy")
+        tree.collapse_node("lazy")
+        tree.expand_node("lazy")
+
+        labels = [n["node"]["label"] for n in tree.nodes]
+        assert labels == ["Root", "Lazy", "Folder", "File", "Empty"]
+        assert calls == ["lazy"]
+
+    def test_empty_result_becomes_leaf(self):
+        tree, _ = self.make_tree()
+        tree.expand_node("root")
+        tree.expand_node("empty")
+
+        empty = next(n for n in tree.nodes if n["node"]["id"] == "empty")
+        assert empty["has_children"] is False
+
+    def test_loader_error_treated_as_no_children(self):
+        def loader(node):
+            raise OSError("boom")
+
+        tree = Tree(
+            data={"label": "Root", "value": "root", "has_children": True},
+            children_loader=loader,
+        )
+        tree.expand_node("root")
+
+        assert len(tree.nodes) == 1
+        assert tree.nodes[0]["has_children"] is False
+
+    @pytest.mark.asyncio
+    async def test_expand_with_event_loop_shows_placeholder(self):
+        tree, calls = self.make_tree()
+        rendered = []
+        tree._request_render = lambda: rendered.append(True)
+        tree.expand_node("root")
+        tree.expand_node("lazy")
+
+        labels = [n["node"]["label"] for n in tree.nodes]
+        assert labels == ["Root", "Lazy", "Loading…", "Empty"]
+
+        await tree._loading["lazy"]
+
+        labels = [n["node"]["label"] for n in tree.nodes]
+        assert labels == ["Root", "Lazy", "Folder", "File", "Empty"]
+        assert calls == ["lazy"]
+        assert rendered == [True]
+
+
+class TestTreeAsyncChildren:
+    """Tests for async loaders, load limits, cancellation and caching."""
+
+    DATA = {
+        "label": "Root",
+        "value": "root",
+        "children": [
+            {"label": "A", "value": "a", "has_children": True},
+            {"label": "B", "value": "b", "has_children": True},
+        ],
+    }
+
+    @staticmethod
+    def labels(tree):
+        return [n["node"]["label"] for n in tree.nodes]
+
+    def test_coroutine_loader_without_event_loop(self):
+        async def loader(node):
+            return [{"label": f"{node['id']}-child", "value": "c"}]
+
+        tree = Tree(data=self.DATA, children_loader=loader)
+        tree.expand_node("root")
+        tree.expand_node("a")
+
+        assert self.labels(tree) == ["Root", "A", "a-child", "B"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_limited(self):
+        running = []
+        peak = []
+        release = asyncio.Event()
+
+        async def loader(node):
+            running.append(node["id"])
+            peak.append(len(running))
+            await release.wait()
+            running.remove(node["id"])
+            return [{"label": "Child", "value": f"{node['id']}/c"}]
+
+        tree = Tree(data=self.DATA, children_loader=loader, max_concurrent_loads=1)
+        tree.expand_node("root")
+        tree.expand_node("a")
+        tree.expand_node("b")
+        await asyncio.sleep(0)
+
+        assert running == ["a"]
+        release.set()
+        await asyncio.gather(*tree._loading.values())
+
+        assert max(peak) == 1
+        assert self.labels(tree) == ["Root", "A", "Child", "B", "Child"]
+
+    @pytest.mark.asyncio
+    async def test_collapse_cancels_load(self):
+        calls = []
+        release = asyncio.Event()
+
+        async def loader(node):
+            calls.append(node["id"])
+            await release.wait()
+            return [{"label": "Child", "value": "c"}]
+
+        tree = Tree(data=self.DATA, children_loader=loader)
+        tree.expand_node("root")
+        tree.expand_node("a")
+        task = tree._loading["a"]
+        await asyncio.sleep(0)
+
+        tree.collapse_node("root")
+        await asyncio.sleep(0)
+
+        assert task.done()
+        assert tree._loading == {}
+
+        # Expanding the ancestor again retries the still-expanded node
+        tree.expand_node("root")
+        release.set()
+        await tree._loading["a"]
+
+        assert calls == ["a", "a"]
+        assert self.labels(tree) == ["Root", "A", "Child", "B"]
+
+    def test_data_reset_clears_loaded_children(self):
+        version = [1]
+
+        def loader(node):
+            return [{"label": f"v{version[0]}", "value": f"v{version[0]}"}]
+
+        tree = Tree(data=self.DATA, children_loader=loader)
+        tree.expand_node("root")
+        tree.expand_node("a")
+        assert self.labels(tree) == ["Root", "A", "v1", "B"]
+
+        version[0] = 2
+        tree.set_data(self.DATA)
+
+        assert self.labels(tree) == ["Root", "A", "v2", "B"]
+
+    @pytest.mark.asyncio
+    async def test_data_reset_cancels_in_flight_loads(self):
+        release = asyncio.Event()
+
+        async def loader(node):
+            await release.wait()
+            return [{"label": "Stale", "value": "stale"}]
+
+        tree = Tree(data=self.DATA, children_loader=loader)
+        tree.expand_node("root")
+        tree.expand_node("a")
+        task = tree._loading["a"]
+        await asyncio.sleep(0)
+
+        tree.data = {"label": "Root", "value": "root", "children": []}
+        await asyncio.sleep(0)
+
+        assert task.done()
+        assert tree._loading == {}
+        assert tree._children_cache == {}
+
+    def test_failed_load_not_cached(self):
+        calls = []
+
+        def loader(node):
+            calls.append(node["id"])
+            if len(calls) == 1:
+                raise OSError("unreachable")
+            return [{"label": "Child", "value": "c"}]
+
+        tree = Tree(data=self.DATA, children_loader=loader)
+        tree.expand_node("root")
+        tree.expand_node("a")
+        assert self.labels(tree) == ["Root", "A", "B"]
+
+        tree.refresh_node("a")
+
+        assert self.labels(tree) == ["Root", "A", "Child", "B"]
+
+    def test_refresh_node_reloads(self):
+        version = [1]
+
+        def loader(node):
+            return [{"label": f"v{version[0]}", "value": f"v{version[0]}"}]
+
+        tree = Tree(data=self.DATA, children_loader=loader)
+        tree.expand_node("root")
+        tree.expand_node("a")
+        version[0] = 2
+        tree.refresh_node("a")
+
+        assert self.labels(tree) == ["Root", "A", "v2", "B"]
+        assert tree._find_node_by_id(tree.data, "v1") is None
+
+    def test_expansion_restored_from_state(self):
+        from wijjit.core.state import State
+        from wijjit.core.wiring import ElementWiringManager
+
+        def loader(node):
+            if node["id"] == "a":
+                return [{"id": "deep", "label": "Deep", "has_children": True}]
+            return [{"label": "Leaf", "value": "leaf"}]
+
+        app = SimpleNamespace(needs_render=False)
+        state = State({"tree:expanded": ["root", "a", "deep"]})
+        tree = Tree(id="tree", data=self.DATA, children_loader=loader)
+        ElementWiringManager(app).wire_elements([tree], state)
+
+        assert self.labels(tree) == ["Root", "A", "Deep", "Leaf", "B"]
+
+        tree.collapse_node("a")
+        assert sorted(state["tree:expanded"]) == ["deep", "root"]
+
+    def test_expanded_argument(self):
+        tree = Tree(data=self.DATA, expanded=["root"])
+        assert self.labels(tree) == ["Root", "A", "B"]
+
+        bound = Tree(id="t", data=self.DATA, expanded="open_nodes")
+        assert bound.expand_state_key == "open_nodes"
+
+
+class TestTreeIncrementalFlattening:
+    """Tests for the node index and row splicing on expand/collapse."""
+
+    @staticmethod
+    def make_tree(**kwargs):
+        data = {
+            "label": "Root",
+            "value": "root",
+            "children": [
+                {
+                    "label": "A",
+                    "value": "a",
+                    "children": [
+                        {"label": "A1", "value": "a1"},
+                        {"label": "A2", "value": "a2"},
+                    ],
+                },
+                {
+                    "label": "B",
+                    "value": "b",
+                    "children": [{"label": "B1", "value": "b1"}],
+                },
+            ],
+        }
+        tree = Tree(data=data, **kwargs)
+        tree.expand_node("root")
+        return tree
+
+    def test_find_node_uses_index(self):
+        tree = self.make_tree()
+
+        assert tree._node_index["b1"]["label"] == "B1"
+        assert tree._find_node_by_id(tree.data, "a2")["label"] == "A2"
+        assert tree._find_node_by_id(tree.data, "missing") is None
+
+    def test_expand_splices_rows(self):
+        tree = self.make_tree()
+        before = list(tree.nodes)
+
+        tree.expand_node("a")
+
+        labels = [row["node"]["label"] for row in tree.nodes]
+        assert labels == ["Root", "A", "A1", "A2", "B"]
+        # Rows outside the expanded subtree are reused, not rebuilt
+        assert tree.nodes[0] is before[0]
+        assert tree.nodes[4] is before[2]
+
+    def test_collapse_removes_subtree_rows(self):
+        tree = self.make_tree()
+        tree.expand_node("a")
+        tree.expand_node("b")
+
+        tree.collapse_node("a")
+
+        labels = [row["node"]["label"] for row in tree.nodes]
+        assert labels == ["Root", "A", "B", "B1"]
+        assert tree.scroll_manager.state.content_size == 4
+
+    def test_expanding_hidden_node_keeps_rows(self):
+        tree = self.make_tree()
+        tree.collapse_node("root")
+
+        tree.expand_node("a")
+        assert len(tree.nodes) == 1
+
+        tree.expand_node("root")
+        labels = [row["node"]["label"] for row in tree.nodes]
+        assert labels == ["Root", "A", "A1", "A2", "B"]
+
+    def test_prefixes_computed_from_ancestry(self):
+        tree = self.make_tree()
+        tree.expand_node("a")
+        tree.expand_node("b")
+
+        prefixes = [tree._get_tree_prefix(row) for row in tree.nodes]
+
+        assert prefixes == [
+            "",
+            "├─ ",
+            "│  ├─ ",
+            "│  └─ ",
+            "└─ ",
+            "   └─ ",
+        ]
+        assert all("parent_lines" not in row for row in tree.nodes)
+
+    def test_set_data_reindexes(self):
+        tree = self.make_tree()
+
+        tree.data = {"label": "New", "value": "new"}
+
+        assert tree._find_node_by_id(tree.data, "a") is None
+        assert tree._find_node_by_id(tree.data, "new")["label"] == "New"
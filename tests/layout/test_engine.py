@@ -136,6 +136,109 @@ class TestElementNode:
         assert elements[0] is element
 
 
+class CountingElement(MockElement):
+    """Mock element with cacheable intrinsic size that counts measurements."""
+
+    layout_attrs = frozenset({"mock_width", "mock_height"})
+
+    def __init__(self, width: int = 10, height: int = 1, id: str = None):
+        super().__init__(width, height, id)
+        self.measure_count = 0
+
+    def get_intrinsic_size(self) -> tuple[int, int]:
+        """Get intrinsic size, counting calls.
+
+        Returns
+        -------
+        tuple[int, int]
+            (width, height) tuple
+        """
+        self.measure_count += 1
+        return (self.mock_width, self.mock_height)
+
+
+class TestConstraintCaching:
+    """Tests for per-element constraint caching across layout passes."""
+
+    def test_constraints_reused_across_nodes(self):
+        """A fresh node for an unchanged element reuses cached constraints."""
+        element = CountingElement(width=20, height=3)
+
+        first = ElementNode(element).calculate_constraints()
+        second = ElementNode(element).calculate_constraints()
+
+        assert element.measure_count == 1
+        assert second is first
+
+    def test_layout_attr_assignment_invalidates(self):
+        """Assigning a declared layout attribute re-measures the element."""
+        element = CountingElement(width=20, height=3)
+        ElementNode(element).calculate_constraints()
+
+        element.mock_width = 25
+        constraints = ElementNode(element).calculate_constraints()
+
+        assert element.measure_count == 2
+        assert constraints.preferred_width == 25
+
+    def test_other_attr_assignment_keeps_cache(self):
+        """Non-layout attributes (focus, hover) do not invalidate."""
+        element = CountingElement(width=20, height=3)
+        ElementNode(element).calculate_constraints()
+
+        element.focused = True
+        element.hovered = True
+        ElementNode(element).calculate_constraints()
+
+        assert element.measure_count == 1
+
+    def test_invalidate_layout(self):
+        """invalidate_layout() forces a re-measure."""
+        element = CountingElement(width=20, height=3)
+        ElementNode(element).calculate_constraints()
+
+        element.invalidate_layout()
+        ElementNode(element).calculate_constraints()
+
+        assert element.measure_count == 2
+
+    def test_spec_change_remeasures(self):
+        """A different node size spec is not served from the cache."""
+        element = CountingElement(width=20, height=3)
+        ElementNode(element).calculate_constraints()
+
+        constraints = ElementNode(element, width=30).calculate_constraints()
+
+        assert constraints.preferred_width == 30
+        assert constraints.preferred_height == 3
+        assert element.measure_count == 2
+
+    def test_undeclared_override_is_not_cached(self):
+        """Overriding get_intrinsic_size without layout_attrs disables caching."""
+        assert MockElement.layout_attrs is None
+        assert not MockElement().layout_cacheable
+        assert Element.layout_attrs == frozenset()
+
+    def test_cached_sibling_not_remeasured_in_engine(self):
+        """Only the changed element is re-measured on the next layout pass."""
+        changed = CountingElement(width=10, height=1)
+        stable = CountingElement(width=30, height=4)
+
+        def build():
+            root = VStack()
+            root.add_child(ElementNode(changed))
+            root.add_child(ElementNode(stable))
+            return root
+
+        LayoutEngine(build(), 80, 24).layout()
+        changed.mock_height = 2
+        LayoutEngine(build(), 80, 24).layout()
+
+        assert changed.measure_count == 2
+        assert stable.measure_count == 1
+        assert stable.bounds.y == 2
+
+
 class TestVStack:
     """Tests for VStack container."""
 
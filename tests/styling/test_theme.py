@@ -635,6 +635,44 @@ class TestThemeManager:
         assert style.fg_color == (123, 45, 67)
         assert style.bold is True
 
+    def test_builtin_themes_built_on_first_use(self):
+        """Test built-in themes are only constructed when looked up.
+
+        Returns
+        -------
+        None
+        """
+        manager = ThemeManager()
+
+        # Listed without being constructed
+        assert manager.list_themes() == ["default", "dark", "light", "high_contrast"]
+        assert "dark" in manager.themes
+        assert manager.themes._themes == {}
+
+        manager.set_theme("dark")
+        assert list(manager.themes._themes) == []
+        assert isinstance(manager.get_theme(), DarkTheme)
+        assert list(manager.themes._themes) == ["dark"]
+
+        # Same instance on repeated lookups
+        assert manager.themes["dark"] is manager.get_theme()
+
+    def test_register_theme_replaces_builtin(self):
+        """Test registering a theme overrides a not-yet-built built-in.
+
+        Returns
+        -------
+        None
+        """
+        manager = ThemeManager()
+        custom = Theme("dark", {"button": Style(bold=True)})
+
+        manager.register_theme(custom)
+        manager.set_theme("dark")
+
+        assert manager.get_theme() is custom
+        assert manager.list_themes().count("dark") == 1
+
 
 class TestThemeConsistency:
     """Test that all themes have consistent style coverage."""
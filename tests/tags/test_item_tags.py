@@ -67,6 +67,21 @@ class TestSelectItem:
         labels = [o["label"] for o in select.options]
         assert labels == ["Z"]
 
+    def test_type_ahead(self):
+        app = Wijjit()
+        app.view("main", default=True)(
+            lambda: {
+                "template": '{% select id="s" type_ahead=True %}'
+                "Apple\nBanana\nCherry{% endselect %}"
+            }
+        )
+        with WijjitHarness(app, size=(60, 20)) as h:
+            h.tick(frames=1)
+            h.press("tab").type("ch").tick(frames=1)
+            select = _first(app, "Select")
+            assert select.type_ahead
+            assert select.highlighted_index == 2
+
 
 class TestTreeItem:
     def test_flat_items(self):
@@ -5,11 +5,16 @@ from wijjit.terminal.ansi import (
     ANSICursor,
     ANSIScreen,
     ANSIStyle,
+    clear_ansi_parse_cache,
+    clear_width_caches,
     clip_to_width,
     colorize,
+    parse_ansi_spans,
+    parse_ansi_text,
     strip_ansi,
     visible_length,
 )
+from wijjit.terminal.cell import DEFAULT_STYLE_ID, get_style
 
 
 class TestANSIColor:
@@ -261,3 +266,111 @@ class TestColorize:
         """Test colorize with no styling returns original text."""
         result = colorize("Hello")
         assert result == "Hello"
+
+
+class TestParseAnsiSpans:
+    """Tests for the span-based, cached ANSI parser."""
+
+    def test_plain_text_single_default_span(self):
+        """Test that text without escapes is one default-style span."""
+        parsed = parse_ansi_spans("hello")
+        assert parsed.text == "hello"
+        assert len(parsed.spans) == 1
+        assert parsed.spans[0].start == 0
+        assert parsed.spans[0].end == 5
+        assert parsed.spans[0].style_id == DEFAULT_STYLE_ID
+
+    def test_empty_text(self):
+        """Test that empty text has no spans."""
+        parsed = parse_ansi_spans("")
+        assert parsed.text == ""
+        assert parsed.spans == ()
+
+    def test_spans_follow_sgr_changes(self):
+        """Test that each SGR change starts a new span."""
+        parsed = parse_ansi_spans("\x1b[1;31mErr\x1b[0m: \x1b[32mok")
+        assert parsed.text == "Err: ok"
+        assert [(s.start, s.end) for s in parsed.spans] == [(0, 3), (3, 5), (5, 7)]
+
+        bold_red = get_style(parsed.spans[0].style_id)
+        assert bold_red.bold is True
+        assert bold_red.fg_color == (187, 0, 0)
+        assert parsed.spans[1].style_id == DEFAULT_STYLE_ID
+
+    def test_redundant_codes_merge_spans(self):
+        """Test that codes which do not change the style do not split spans."""
+        parsed = parse_ansi_spans("\x1b[31mab\x1b[31mcd")
+        assert len(parsed.spans) == 1
+        assert parsed.spans[0].end == 4
+
+    def test_attribute_resets(self):
+        """Test SGR 22/39/49 resets."""
+        parsed = parse_ansi_spans("\x1b[1;31;44mA\x1b[22;39;49mB")
+        assert parsed.spans[1].style_id == DEFAULT_STYLE_ID
+
+    def test_extended_colors(self):
+        """Test 256-color and true-color codes."""
+        parsed = parse_ansi_spans("\x1b[38;5;196;48;2;1;2;3mX")
+        style = get_style(parsed.spans[0].style_id)
+        assert style.fg_color == (255, 0, 0)
+        assert style.bg_color == (1, 2, 3)
+
+    def test_non_sgr_sequences_removed(self):
+        """Test that OSC and cursor sequences are dropped."""
+        parsed = parse_ansi_spans("\x1b]0;title\x07a\x1b[2Kb\x1b[?25lc")
+        assert parsed.text == "abc"
+
+    def test_palette_selection(self):
+        """Test that the palette name selects basic color RGB values."""
+        putty = parse_ansi_spans("\x1b[31mX")
+        windows = parse_ansi_spans("\x1b[31mX", palette="windows")
+        assert get_style(putty.spans[0].style_id).fg_color == (187, 0, 0)
+        assert get_style(windows.spans[0].style_id).fg_color == (128, 0, 0)
+
+    def test_results_are_cached(self):
+        """Test that parsing the same line twice returns the cached result."""
+        clear_ansi_parse_cache()
+        line = "\x1b[33mcached line\x1b[0m"
+        assert parse_ansi_spans(line) is parse_ansi_spans(line)
+
+    def test_to_cells_range(self):
+        """Test building cells for a sub-range of the visible text."""
+        parsed = parse_ansi_spans("ab\x1b[1mcd\x1b[0mef")
+        cells = parsed.to_cells(1, 5)
+        assert "".join(c.char for c in cells) == "bcde"
+        assert [c.bold for c in cells] == [False, True, True, False]
+
+    def test_parse_ansi_text_compat(self):
+        """Test that parse_ansi_text still returns per-character dicts."""
+        result = parse_ansi_text("\x1b[31mRe\x1b[0md")
+        assert [c for c, _ in result] == ["R", "e", "d"]
+        assert result[0][1]["fg_color"] == (187, 0, 0)
+        assert result[2][1]["fg_color"] is None
+        assert result[2][1]["bold"] is False
+
+
+class TestWidthEngine:
+    """Tests for the memoized width helpers."""
+
+    def test_ascii_fast_path_matches_len(self):
+        """Test that printable ASCII width is its length."""
+        assert visible_length("hello world") == 11
+
+    def test_non_printable_ascii(self):
+        """Test that NUL is zero width and tabs fall back to length."""
+        assert visible_length("a\x00b") == 2
+        assert visible_length("a\tb") == 3
+
+    def test_wide_characters(self):
+        """Test that CJK characters count two columns."""
+        assert visible_length("\x1b[31m中文\x1b[0m") == 4
+
+    def test_clip_wide_characters(self):
+        """Test clipping wide characters never splits a glyph."""
+        assert clip_to_width("中文字", 5, ellipsis="") == "中文"
+
+    def test_clear_width_caches(self):
+        """Test that clearing caches keeps results identical."""
+        before = clip_to_width("\x1b[1mlong bold text\x1b[0m", 8)
+        clear_width_caches()
+        assert clip_to_width("\x1b[1mlong bold text\x1b[0m", 8) == before
@@ -1,6 +1,16 @@
 """Tests for Cell class."""
 
-from wijjit.terminal.cell import Cell
+import logging
+
+from wijjit.styling.style import Style
+from wijjit.terminal import cell as cell_module
+from wijjit.terminal.cell import (
+    DEFAULT_STYLE_ID,
+    Cell,
+    StyleTable,
+    get_style,
+    intern_style,
+)
 
 
 class TestCell:
@@ -315,3 +325,163 @@ class TestCell:
         cell = Cell("D", dim=True)
         ansi = cell.to_ansi()
         assert "2" in ansi  # Dim code
+
+
+class TestStyleInterning:
+    """Tests for the flyweight style table backing Cell."""
+
+    def test_unstyled_cell_uses_default_style(self):
+        """Test that plain cells share the default style id.
+
+        Returns
+        -------
+        None
+        """
+        assert Cell("A").style_id == DEFAULT_STYLE_ID
+        assert Cell("A").get_style_codes() == "\x1b[0m"
+
+    def test_identical_styles_share_id(self):
+        """Test that equal styles are interned to the same id.
+
+        Returns
+        -------
+        None
+        """
+        a = Cell("A", fg_color=(1, 2, 3), bold=True)
+        b = Cell("B", fg_color=(1, 2, 3), bold=True)
+        c = Cell("C", fg_color=(1, 2, 3))
+
+        assert a.style_id == b.style_id
+        assert a.style_id != c.style_id
+        assert a.style is b.style
+
+    def test_list_colors_are_normalized(self):
+        """Test that list colors intern to the same id as tuple colors.
+
+        Returns
+        -------
+        None
+        """
+        assert intern_style([10, 20, 30]) == intern_style((10, 20, 30))
+        assert get_style(intern_style([10, 20, 30])).fg_color == (10, 20, 30)
+
+    def test_style_id_constructor(self):
+        """Test constructing a cell from a pre-interned style id.
+
+        Returns
+        -------
+        None
+        """
+        style = Style(fg_color=(255, 0, 0), bold=True)
+        cell = Cell("X", style_id=style.to_style_id())
+
+        assert cell == Cell("X", **style.to_cell_attrs())
+        assert cell.fg_color == (255, 0, 0)
+        assert cell.bold is True
+
+    def test_precomputed_sgr(self):
+        """Test that style codes come from the table's precomputed SGR.
+
+        Returns
+        -------
+        None
+        """
+        cell = Cell("A", fg_color=(255, 0, 0), bg_color=(0, 0, 255), dim=True)
+
+        assert cell.get_style_codes() == "\x1b[2;38;2;255;0;0;48;2;0;0;255m"
+        assert cell.to_ansi() == "\x1b[2;38;2;255;0;0;48;2;0;0;255mA\x1b[0m"
+
+    def test_attribute_assignment_reinterns(self):
+        """Test that assigning a style attribute re-interns the style.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The shared style record must never be mutated, otherwise every
+        other cell with the same style would change too.
+        """
+        shared = Cell("A", fg_color=(100, 100, 100))
+        cell = shared.clone()
+        cell.fg_color = (50, 50, 50)
+        cell.bold = True
+
+        assert shared.fg_color == (100, 100, 100)
+        assert shared.bold is False
+        assert cell == Cell("A", fg_color=(50, 50, 50), bold=True)
+
+    def test_separate_table(self):
+        """Test that a standalone table starts with only the default style.
+
+        Returns
+        -------
+        None
+        """
+        table = StyleTable()
+        assert len(table) == 1
+        assert table.get(0).is_default
+
+        sid = table.intern((1, 1, 1), underline=True)
+        assert sid == 1
+        assert table.intern((1, 1, 1), underline=True) == sid
+        assert table.get(sid).underline is True
+        assert len(table) == 2
+
+    def test_table_is_bounded(self, caplog):
+        """Test that styles past max_styles stay exact but are not stored.
+
+        Parameters
+        ----------
+        caplog : pytest.LogCaptureFixture
+            Captured log records
+
+        Returns
+        -------
+        None
+        """
+        table = StyleTable(max_styles=3)
+        exact = table.intern((1, 2, 3))
+        table.intern((4, 5, 6))
+        assert len(table) == 3
+
+        with caplog.at_level(logging.WARNING, logger="wijjit"):
+            for red in range(256):
+                sid = table.intern((red, 7, 9), bold=True)
+                style = table.get(sid)
+                assert (style.fg_color, style.bold) == ((red, 7, 9), True)
+                assert style.sgr == f"\x1b[1;38;2;{red};7;9m"
+
+        assert len(table) == 3
+        assert table.intern((1, 2, 3)) == exact
+        assert sum("Style table is full" in r.message for r in caplog.records) == 1
+
+    def test_full_global_table_round_trips_colors(self, monkeypatch):
+        """Test that cells keep exact colors once the global table is full.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.MonkeyPatch
+            Used to shrink the global table's limit
+
+        Returns
+        -------
+        None
+        """
+        monkeypatch.setattr(cell_module._style_table, "max_styles", 0)
+
+        cell = Cell("x", fg_color=(3, 141, 59), bg_color=(200, 1, 2))
+        assert cell.fg_color == (3, 141, 59)
+        assert cell.bg_color == (200, 1, 2)
+        assert cell.style_id < 0
+
+        cell.italic = True
+        assert (cell.fg_color, cell.italic) == ((3, 141, 59), True)
+
+        # Equal styles compare equal even though uncached ids differ
+        twin = Cell("x", fg_color=(3, 141, 59), bg_color=(200, 1, 2), italic=True)
+        assert twin.style_id != cell.style_id
+        assert twin == cell
+        assert twin != Cell("x", fg_color=(3, 141, 60), bg_color=(200, 1, 2))
+        assert twin.get_style_codes() == "\x1b[3;38;2;3;141;59;48;2;200;1;2m"
@@ -1,10 +1,11 @@
 """Tests for helper utilities."""
 
+import os
 from pathlib import Path
 
 import pytest
 
-from wijjit.helpers import load_filesystem_tree
+from wijjit.helpers import FilesystemTreeLoader, load_filesystem_tree
 
 
 class TestLoadFilesystemTree:
@@ -303,3 +304,112 @@ class TestLoadFilesystemTree:
         # Should produce same result
         assert tree1["label"] == tree2["label"]
         assert tree1["value"] == tree2["value"]
+
+
+class TestFilesystemTreeLoader:
+    """Tests for the lazy FilesystemTreeLoader."""
+
+    def test_root_node_is_unloaded(self, tmp_path):
+        """The root node is marked expandable without scanning it."""
+        loader = FilesystemTreeLoader()
+
+        root = loader.root_node(tmp_path)
+
+        assert root == {
+            "label": tmp_path.name,
+            "value": str(tmp_path),
+            "type": "folder",
+            "has_children": True,
+        }
+
+    def test_root_node_validates_path(self, tmp_path):
+        """Missing paths and files are rejected."""
+        (tmp_path / "file.txt").write_text("x")
+        loader = FilesystemTreeLoader()
+
+        with pytest.raises(FileNotFoundError):
+            loader.root_node(tmp_path / "missing")
+        with pytest.raises(NotADirectoryError):
+            loader.root_node(tmp_path / "file.txt")
+
+    def test_children_are_one_level_deep(self, tmp_path):
+        """Only the requested directory is listed; folders stay unloaded."""
+        (tmp_path / "b.txt").write_text("hello")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "deep.txt").write_text("x")
+        (tmp_path / ".hidden").write_text("x")
+        loader = FilesystemTreeLoader()
+
+        children = loader(loader.root_node(tmp_path))
+
+        assert children == [
+            {
+                "label": "sub",
+                "value": str(tmp_path / "sub"),
+                "type": "folder",
+                "has_children": True,
+            },
+            {
+                "label": "b.txt",
+                "value": str(tmp_path / "b.txt"),
+                "type": "file",
+                "size": "5 B",
+            },
+        ]
+
+    def test_listing_cached_until_mtime_changes(self, tmp_path, monkeypatch):
+        """Unchanged directories are not scanned again."""
+        (tmp_path / "a.txt").write_text("x")
+        loader = FilesystemTreeLoader()
+        scans = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            scans.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        loader.list_children(str(tmp_path))
+        loader.list_children(str(tmp_path))
+        assert len(scans) == 1
+
+        (tmp_path / "b.txt").write_text("x")
+        stat = tmp_path.stat()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        labels = [c["label"] for c in loader.list_children(str(tmp_path))]
+
+        assert labels == ["a.txt", "b.txt"]
+        assert len(scans) == 2
+
+    def test_invalidate_forces_rescan(self, tmp_path):
+        """invalidate() drops the cached listing."""
+        loader = FilesystemTreeLoader(include_metadata=False)
+        (tmp_path / "a.txt").write_text("x")
+        loader.list_children(str(tmp_path))
+
+        loader.invalidate(str(tmp_path))
+
+        assert str(tmp_path) not in loader._cache
+        assert loader.list_children(str(tmp_path)) == [
+            {"label": "a.txt", "value": str(tmp_path / "a.txt"), "type": "file"}
+        ]
+
+    def test_lazy_tree_integration(self, tmp_path):
+        """A Tree using the loader lists folders only when expanded."""
+        from wijjit.elements.display.tree import Tree
+
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "inner.txt").write_text("x")
+        loader = FilesystemTreeLoader()
+        tree = Tree(data=loader.root_node(tmp_path), children_loader=loader)
+
+        tree.expand_node(str(tmp_path))
+        assert [n["node"]["label"] for n in tree.nodes] == [tmp_path.name, "sub"]
+
+        tree.expand_node(str(tmp_path / "sub"))
+        assert [n["node"]["label"] for n in tree.nodes] == [
+            tmp_path.name,
+            "sub",
+            "inner.txt",
+        ]
@@ -5,6 +5,13 @@ importable directly from ``wijjit`` (not only via deep module paths), and
 ``__all__`` must stay consistent with what the package actually exposes.
 """
 
+import pkgutil
+import re
+import subprocess
+import sys
+
+import pytest
+
 import wijjit
 
 
@@ -95,3 +102,92 @@ class TestDialogReexports:
     def test_dialog_classes_in_all(self):
         for name in ("ConfirmDialog", "AlertDialog", "TextInputDialog"):
             assert name in wijjit.__all__
+
+
+class TestLazyImports:
+    """Re-exports resolve on first access instead of at ``import wijjit``."""
+
+    def test_import_does_not_load_submodules(self):
+        code = (
+            "import sys, wijjit; "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith(('wijjit.', 'rich', 'pygments', 'prompt_toolkit'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_core_import_skips_heavy_optional_dependencies(self):
+        code = (
+            "import sys; from wijjit import Wijjit, render_inline; "
+            "print(sorted(m for m in ('rich', 'pygments.lexers', 'prompt_toolkit') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_core_and_wiring_skip_image_support(self):
+        code = (
+            "import sys, types, wijjit.core; "
+            "from wijjit.core.state import State; "
+            "from wijjit.core.wiring import ElementWiringManager; "
+            "from wijjit.elements.input.button import Button; "
+            "app = types.SimpleNamespace(_dispatch_action=None, needs_render=False); "
+            "ElementWiringManager(app).wire_elements([Button('Go')], State()); "
+            "print(sorted(m for m in ('PIL', 'wijjit.elements.display.image') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="no_such_name"):
+            wijjit.no_such_name  # noqa: B018
+
+    def test_dir_lists_lazy_exports(self):
+        names = dir(wijjit)
+        for name in wijjit.__all__:
+            assert name in names
+
+
+def _public_submodules():
+    return sorted(
+        info.name
+        for info in pkgutil.walk_packages(wijjit.__path__, "wijjit.")
+        if not any(part.startswith("_") for part in info.name.split("."))
+    )
+
+
+class TestStandaloneSubmoduleImports:
+    """Every public submodule imports on its own in a fresh interpreter.
+
+    ``import wijjit`` loads nothing eagerly, so a submodule imported first
+    must resolve its own dependencies without relying on import order.
+    """
+
+    @pytest.mark.parametrize("module", _public_submodules())
+    def test_import_in_fresh_process(self, module):
+        result = subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        missing = re.search(r"No module named '([^']+)'", result.stderr)
+        if result.returncode and missing and not missing[1].startswith("wijjit"):
+            pytest.skip(f"optional dependency {missing[1]} is not installed")
+        assert result.returncode == 0, result.stderr
@@ -222,3 +222,26 @@ class TestWrapText:
 
         for segment in result:
             assert visible_length(segment.strip()) <= 12
+
+    def test_rewrap_at_new_width_reuses_analysis(self):
+        """Test that re-wrapping a line at another width gives fresh results."""
+        text = f"{ANSIColor.GREEN}alpha beta gamma delta{ANSIColor.RESET} epsilon"
+
+        wide = wrap_text(text, 12)
+        narrow = wrap_text(text, 8)
+
+        assert wide != narrow
+        assert wrap_text(text, 12) == wide
+        assert "".join(wide).replace(" ", "") == "".join(narrow).replace(" ", "")
+
+    def test_cached_result_is_a_fresh_list(self):
+        """Test that mutating a returned list does not corrupt the cache."""
+        text = "one two three four five six"
+        first = wrap_text(text, 10)
+        first.append("junk")
+        assert "junk" not in wrap_text(text, 10)
+
+    def test_wide_characters_wrap_by_character_count(self):
+        """Test wrapping text with wide characters and trailing codes."""
+        text = f"文中,{ANSIStyle.RESET}"
+        assert wrap_text(text, 3) == ["文中,", ANSIStyle.RESET]
@@ -23,6 +23,7 @@ def test_tokenize_keys_click_without_coord_not_greedily_joined():
     # a preceding complete ``click:X,Y``.
     assert _tokenize_keys("click:1,2,type:9") == ["click:1,2", "type:9"]
 
+
 GOOD = """
 {% frame title="CLI" width=30 height=5 %}
   {% button id="ok" action="go" %}Go{% endbutton %}
@@ -95,3 +96,49 @@ def test_validate_with_context_file(tmp_path, capsys):
     out = capsys.readouterr().out
     assert code == 0
     assert "undefined-variable" not in out
+
+
+def test_precompile_warms_bytecode_cache(tmp_path, capsys, monkeypatch):
+    from wijjit.core.renderer import Renderer
+
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "ok.tui").write_text(GOOD, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    monkeypatch.chdir(tmp_path)
+
+    # Precompile through a relative path ...
+    code = main(["precompile", "templates", "--cache-dir", str(cache_dir)])
+    out = capsys.readouterr().out
+    assert code == 0
+    assert "Precompiled 1 of 1" in out
+    cached = {p: p.stat().st_mtime_ns for p in cache_dir.iterdir()}
+    assert len(cached) == 1
+
+    # ... and load through an absolute one: the warmed entry is reused.
+    renderer = Renderer(
+        template_dir=str(templates.resolve()), bytecode_cache_dir=str(cache_dir)
+    )
+    compiled = []
+    compile_source = renderer.env.compile
+
+    def counting_compile(*args, **kwargs):
+        compiled.append(args)
+        return compile_source(*args, **kwargs)
+
+    monkeypatch.setattr(renderer.env, "compile", counting_compile)
+    renderer.env.get_template("ok.tui")
+
+    assert compiled == []
+    assert {p: p.stat().st_mtime_ns for p in cache_dir.iterdir()} == cached
+
+
+def test_precompile_reports_failures(tmp_path, capsys, monkeypatch):
+    monkeypatch.setenv("WIJJIT_TEMPLATE_BYTECODE_CACHE_DIR", str(tmp_path / "c"))
+    (tmp_path / "bad.wij").write_text("{% frame %}", encoding="utf-8")
+
+    code = main(["precompile", str(tmp_path)])
+    captured = capsys.readouterr()
+
+    assert code == 1
+    assert "FAILED bad.wij" in captured.err